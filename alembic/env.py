@@ -80,6 +80,14 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # 테스트 등 호출자가 연결을 넘겨준 경우 그 연결에서 바로 마이그레이션합니다.
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     # --- Custom: Ensure database exists before connecting ---
     create_database_if_not_exists(settings.DATABASE_URL)
     # --- End Custom ---
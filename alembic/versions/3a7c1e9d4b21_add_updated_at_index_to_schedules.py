@@ -0,0 +1,29 @@
+"""Add updated_at index to schedules for incremental executor reload
+
+Revision ID: 3a7c1e9d4b21
+Revises: 0b93d1b45ec0
+Create Date: 2026-10-19 09:12:40.118274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a7c1e9d4b21'
+down_revision: Union[str, Sequence[str], None] = '0b93d1b45ec0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 스케줄 실행기는 틱마다 전체 테이블을 읽지 않고 updated_at 이후 변경분만 조회합니다.
+    op.create_index('idx_schedules_updated_at', 'schedules', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_schedules_updated_at', table_name='schedules')
@@ -0,0 +1,54 @@
+"""Add minute/hour/day telemetry rollup tables
+
+Revision ID: 5b9c0e2f7a14
+Revises: 7d2e4f1a9c53
+Create Date: 2026-10-19 13:41:09.662017
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b9c0e2f7a14'
+down_revision: Union[str, Sequence[str], None] = '7d2e4f1a9c53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROLLUP_TABLES = ('telemetry_rollup_1m', 'telemetry_rollup_1h', 'telemetry_rollup_1d')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name in ROLLUP_TABLES:
+        op.create_table(
+            table_name,
+            sa.Column('device_id', sa.BigInteger(), nullable=False),
+            sa.Column('metric_name', sa.String(length=100), nullable=False),
+            sa.Column('component_name', sa.String(length=100), nullable=False),
+            sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False, comment='버킷 시작 시각 (UTC 기준 절삭)'),
+            sa.Column('system_unit_id', sa.BigInteger(), nullable=False),
+            sa.Column('row_count', sa.Integer(), nullable=False, comment='병합된 원본 텔레메트리 행 수'),
+            sa.Column('sample_count', sa.BigInteger(), nullable=False, comment='원본 행 sample_count의 합 (가중치)'),
+            sa.Column('min_value', sa.Float(), nullable=False),
+            sa.Column('max_value', sa.Float(), nullable=False),
+            sa.Column('sum_value', sa.Float(), nullable=False, comment='Σ sample_count × avg_value'),
+            sa.Column('sum_sq_value', sa.Float(), nullable=False, comment='Σ sample_count × (std_dev² + avg_value²)'),
+            sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+            sa.ForeignKeyConstraint(['device_id'], ['devices.id'], ),
+            sa.ForeignKeyConstraint(['system_unit_id'], ['system_units.id'], ),
+            sa.PrimaryKeyConstraint('device_id', 'metric_name', 'component_name', 'bucket_start')
+        )
+        op.create_index(
+            f'idx_{table_name}_unit_metric_bucket', table_name,
+            ['system_unit_id', 'metric_name', 'bucket_start'], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in reversed(ROLLUP_TABLES):
+        op.drop_index(f'idx_{table_name}_unit_metric_bucket', table_name=table_name)
+        op.drop_table(table_name)
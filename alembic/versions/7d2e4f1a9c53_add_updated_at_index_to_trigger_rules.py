@@ -0,0 +1,29 @@
+"""Add updated_at index to trigger_rules for incremental engine reload
+
+Revision ID: 7d2e4f1a9c53
+Revises: 3a7c1e9d4b21
+Create Date: 2026-10-19 11:03:27.540912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2e4f1a9c53'
+down_revision: Union[str, Sequence[str], None] = '3a7c1e9d4b21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 트리거 엔진은 평가 시점에 updated_at 이후 변경분만 조회하여 역색인을 갱신합니다.
+    op.create_index('idx_trigger_rules_updated_at', 'trigger_rules', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_trigger_rules_updated_at', table_name='trigger_rules')
@@ -0,0 +1,31 @@
+"""Add (captured_at, id) keyset indexes to telemetry_data for streaming export
+
+Revision ID: 9e4a2c7b1f86
+Revises: 5b9c0e2f7a14
+Create Date: 2026-10-19 14:12:08.331470
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4a2c7b1f86'
+down_revision: Union[str, Sequence[str], None] = '5b9c0e2f7a14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 내보내기는 (captured_at, id) > (:ts, :id) 조건으로 페이지를 넘기므로, 같은 순서의 인덱스가 필요합니다.
+    op.create_index('idx_telemetry_captured_at_id', 'telemetry_data', ['captured_at', 'id'], unique=False)
+    op.create_index('idx_telemetry_system_unit_captured_at_id', 'telemetry_data', ['system_unit_id', 'captured_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_telemetry_system_unit_captured_at_id', table_name='telemetry_data')
+    op.drop_index('idx_telemetry_captured_at_id', table_name='telemetry_data')
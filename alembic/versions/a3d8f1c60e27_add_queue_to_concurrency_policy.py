@@ -0,0 +1,31 @@
+"""Add QUEUE to concurrency_policy enum
+
+Revision ID: a3d8f1c60e27
+Revises: f4a7c2e9b513
+Create Date: 2026-10-19 15:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d8f1c60e27'
+down_revision: Union[str, Sequence[str], None] = 'f4a7c2e9b513'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 8b7d829af95f에서 새로 만든 DB는 이미 QUEUE를 갖고 있지만, 그 이전부터 타입이 있던 DB에는 없습니다.
+    # 스케줄 실행기/트리거 엔진이 집행하는 QUEUE(선행 실행 완료 후 순차 실행) 정책을 모든 DB에 맞춥니다.
+    op.execute("ALTER TYPE concurrency_policy ADD VALUE IF NOT EXISTS 'QUEUE'")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 8b7d829af95f가 만든 타입에는 원래부터 QUEUE가 있으므로 값을 제거하지 않습니다.
+    pass
@@ -0,0 +1,62 @@
+"""Add device_metric_latest table for per-device current metric values
+
+Revision ID: c3f8d51e0a27
+Revises: 9e4a2c7b1f86
+Create Date: 2026-10-19 15:02:44.918305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8d51e0a27'
+down_revision: Union[str, Sequence[str], None] = '9e4a2c7b1f86'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('device_metric_latest',
+    sa.Column('device_id', sa.BigInteger(), nullable=False),
+    sa.Column('component_name', sa.String(length=100), nullable=False),
+    sa.Column('metric_name', sa.String(length=100), nullable=False),
+    sa.Column('unit', sa.String(length=20), nullable=True, comment='측정 단위'),
+    sa.Column('avg_value', sa.Float(), nullable=False),
+    sa.Column('min_value', sa.Float(), nullable=False),
+    sa.Column('max_value', sa.Float(), nullable=False),
+    sa.Column('std_dev', sa.Float(), nullable=False),
+    sa.Column('slope', sa.Float(), nullable=False),
+    sa.Column('sample_count', sa.Integer(), nullable=False),
+    sa.Column('captured_at', postgresql.TIMESTAMP(timezone=True), nullable=False, comment='최신값의 측정 시각'),
+    sa.Column('snapshot_id', sa.String(length=255), nullable=False, comment='최신값이 속한 스냅샷 ID'),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('system_unit_id', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['device_id'], ['devices.id'], ),
+    sa.ForeignKeyConstraint(['system_unit_id'], ['system_units.id'], ),
+    sa.PrimaryKeyConstraint('device_id', 'component_name', 'metric_name')
+    )
+    op.create_index(op.f('ix_device_metric_latest_system_unit_id'), 'device_metric_latest', ['system_unit_id'], unique=False)
+
+    # 기존 원본에서 항목별 최신 1행으로 초기 적재합니다.
+    op.execute("""
+        INSERT INTO device_metric_latest (
+            device_id, component_name, metric_name, system_unit_id, unit,
+            avg_value, min_value, max_value, std_dev, slope, sample_count, captured_at, snapshot_id
+        )
+        SELECT DISTINCT ON (device_id, component_name, metric_name)
+            device_id, component_name, metric_name, system_unit_id, unit,
+            avg_value, min_value, max_value, std_dev, slope, sample_count, captured_at, snapshot_id
+        FROM telemetry_data
+        ORDER BY device_id, component_name, metric_name, captured_at DESC, id DESC
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_device_metric_latest_system_unit_id'), table_name='device_metric_latest')
+    op.drop_table('device_metric_latest')
@@ -0,0 +1,158 @@
+"""Partition telemetry_data by captured_at with BRIN time index
+
+Revision ID: e6b1a94d2c38
+Revises: c3f8d51e0a27
+Create Date: 2026-10-19 16:20:51.204733
+
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b1a94d2c38'
+down_revision: Union[str, Sequence[str], None] = 'c3f8d51e0a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    "id, snapshot_id, metric_name, component_name, unit, avg_value, min_value, max_value, std_dev, slope, "
+    "sample_count, captured_at, extra_stats, created_at, updated_at, device_id, system_unit_id"
+)
+
+
+def _period_start(ts: datetime, interval: str) -> datetime:
+    day = ts.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return day - timedelta(days=day.weekday()) if interval == "week" else day
+
+
+def _columns(id_default: str):
+    return [
+        sa.Column('id', sa.BigInteger(), server_default=sa.text(id_default), nullable=False),
+        sa.Column('snapshot_id', sa.String(length=255), nullable=False, comment='이미지 및 Action 데이터와 동기화를 위한 고유 키'),
+        sa.Column('metric_name', sa.String(length=100), nullable=False, comment='측정 항목명 (temp, co2 등)'),
+        sa.Column('component_name', sa.String(length=100), nullable=False, comment='데이터가 발생한 부품 인스턴스 명칭'),
+        sa.Column('unit', sa.String(length=20), nullable=True, comment='측정 단위'),
+        sa.Column('avg_value', sa.Float(), nullable=False),
+        sa.Column('min_value', sa.Float(), nullable=False),
+        sa.Column('max_value', sa.Float(), nullable=False),
+        sa.Column('std_dev', sa.Float(), nullable=False, comment='안정성 지표'),
+        sa.Column('slope', sa.Float(), nullable=False, comment='추세(기울기) 지표'),
+        sa.Column('sample_count', sa.Integer(), nullable=False),
+        sa.Column('captured_at', postgresql.TIMESTAMP(timezone=True), nullable=False, comment='센서에서 실제 측정된 시각'),
+        sa.Column('extra_stats', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('device_id', sa.BigInteger(), nullable=False),
+        sa.Column('system_unit_id', sa.BigInteger(), nullable=False),
+    ]
+
+
+def _add_foreign_keys() -> None:
+    op.create_foreign_key('telemetry_data_device_id_fkey', 'telemetry_data', 'devices', ['device_id'], ['id'])
+    op.create_foreign_key('telemetry_data_system_unit_id_fkey', 'telemetry_data', 'system_units', ['system_unit_id'], ['id'])
+    op.create_foreign_key('telemetry_data_snapshot_id_fkey', 'telemetry_data', 'observation_snapshots', ['snapshot_id'], ['id'])
+
+
+def _id_sequence(bind) -> str:
+    """기존 id 시퀀스를 새 테이블로 넘기기 위해 소유 관계를 해제합니다. (없으면 새로 만듦)"""
+    seq = bind.execute(sa.text("SELECT pg_get_serial_sequence('telemetry_data', 'id')")).scalar()
+    if seq is None:
+        seq = 'telemetry_data_id_seq'
+        op.execute(f"CREATE SEQUENCE IF NOT EXISTS {seq}")
+    op.execute(f"ALTER SEQUENCE {seq} OWNED BY NONE")
+    return seq
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    interval = settings.TELEMETRY_PARTITION_INTERVAL
+
+    # 1. 파티션 테이블의 id는 단독으로 유니크할 수 없으므로 메타데이터의 DB 외래 키를 제거합니다.
+    op.execute("ALTER TABLE telemetry_metadata DROP CONSTRAINT IF EXISTS telemetry_metadata_telemetry_data_id_fkey")
+
+    seq = _id_sequence(bind)
+
+    # 2. 새 부모 테이블 (인덱스/제약은 데이터 복사 후에 생성)
+    op.create_table(
+        'telemetry_data_partitioned',
+        *_columns(f"nextval('{seq}'::regclass)"),
+        postgresql_partition_by='RANGE (captured_at)',
+    )
+    op.execute("CREATE TABLE telemetry_data_default PARTITION OF telemetry_data_partitioned DEFAULT")
+
+    # 3. 기존 데이터 구간 ~ 미래 PREMAKE 구간까지 파티션 생성
+    oldest = bind.execute(sa.text("SELECT min(captured_at) FROM telemetry_data")).scalar()
+    now = datetime.now(timezone.utc)
+    step = timedelta(days=7 if interval == "week" else 1)
+    start = _period_start(oldest or now, interval)
+    horizon = _period_start(now, interval) + step * (settings.TELEMETRY_PARTITION_PREMAKE + 1)
+    while start < horizon:
+        end = start + step
+        op.execute(
+            f"CREATE TABLE telemetry_data_p{start:%Y%m%d} PARTITION OF telemetry_data_partitioned "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        start = end
+
+    # 4. 데이터 이전 후 기존 테이블 교체
+    op.execute(f"INSERT INTO telemetry_data_partitioned ({COLUMNS}) SELECT {COLUMNS} FROM telemetry_data")
+    op.drop_table('telemetry_data')
+    op.rename_table('telemetry_data_partitioned', 'telemetry_data')
+    op.execute(f"SELECT setval('{seq}', COALESCE((SELECT max(id) FROM telemetry_data), 0) + 1, false)")
+    op.execute(f"ALTER SEQUENCE {seq} OWNED BY telemetry_data.id")
+
+    # 5. 부모에 만든 제약/인덱스는 모든 파티션(이후 생성분 포함)에 전파됩니다.
+    op.create_primary_key('telemetry_data_pkey', 'telemetry_data', ['id', 'captured_at'])
+    op.create_unique_constraint(
+        '_device_component_metric_time_uc', 'telemetry_data', ['device_id', 'component_name', 'metric_name', 'captured_at']
+    )
+    op.create_index('idx_telemetry_device_time', 'telemetry_data', ['device_id', 'captured_at'], unique=False)
+    op.create_index('idx_telemetry_system_unit_captured_at_id', 'telemetry_data', ['system_unit_id', 'captured_at', 'id'], unique=False)
+    op.create_index('idx_telemetry_snapshot_id', 'telemetry_data', ['snapshot_id'], unique=False)
+    op.create_index('idx_telemetry_captured_at_brin', 'telemetry_data', ['captured_at'], unique=False, postgresql_using='brin')
+    _add_foreign_keys()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    seq = _id_sequence(bind)
+
+    op.create_table('telemetry_data_unpartitioned', *_columns(f"nextval('{seq}'::regclass)"))
+    op.execute(f"INSERT INTO telemetry_data_unpartitioned ({COLUMNS}) SELECT {COLUMNS} FROM telemetry_data")
+    # 부모를 DROP하면 모든 파티션이 함께 삭제됩니다.
+    op.drop_table('telemetry_data')
+    op.rename_table('telemetry_data_unpartitioned', 'telemetry_data')
+    op.execute(f"ALTER SEQUENCE {seq} OWNED BY telemetry_data.id")
+
+    op.create_primary_key('telemetry_data_pkey', 'telemetry_data', ['id'])
+    op.create_unique_constraint(
+        '_device_component_metric_time_uc', 'telemetry_data', ['device_id', 'component_name', 'metric_name', 'captured_at']
+    )
+    op.create_index(op.f('ix_telemetry_data_id'), 'telemetry_data', ['id'], unique=False)
+    op.create_index(op.f('ix_telemetry_data_device_id'), 'telemetry_data', ['device_id'], unique=False)
+    op.create_index(op.f('ix_telemetry_data_system_unit_id'), 'telemetry_data', ['system_unit_id'], unique=False)
+    op.create_index(op.f('ix_telemetry_data_created_at'), 'telemetry_data', ['created_at'], unique=False)
+    op.create_index(op.f('ix_telemetry_data_captured_at'), 'telemetry_data', ['captured_at'], unique=False)
+    op.create_index(op.f('ix_telemetry_data_metric_name'), 'telemetry_data', ['metric_name'], unique=False)
+    op.create_index(op.f('ix_telemetry_data_component_name'), 'telemetry_data', ['component_name'], unique=False)
+    op.create_index('idx_telemetry_device_time', 'telemetry_data', ['device_id', 'created_at'], unique=False)
+    op.create_index('idx_telemetry_system_unit_time', 'telemetry_data', ['system_unit_id', 'created_at'], unique=False)
+    op.create_index('idx_telemetry_snapshot_id', 'telemetry_data', ['snapshot_id'], unique=False)
+    op.create_index('idx_telemetry_captured_at_id', 'telemetry_data', ['captured_at', 'id'], unique=False)
+    op.create_index('idx_telemetry_system_unit_captured_at_id', 'telemetry_data', ['system_unit_id', 'captured_at', 'id'], unique=False)
+    _add_foreign_keys()
+
+    # 파티션 운영 중 분리(detach)된 테이블의 행은 되돌리지 않습니다. 메타데이터 고아 행을 정리한 뒤 외래 키를 복원합니다.
+    op.execute("DELETE FROM telemetry_metadata m WHERE NOT EXISTS (SELECT 1 FROM telemetry_data t WHERE t.id = m.telemetry_data_id)")
+    op.create_foreign_key(
+        'telemetry_metadata_telemetry_data_id_fkey', 'telemetry_metadata', 'telemetry_data', ['telemetry_data_id'], ['id']
+    )
@@ -0,0 +1,86 @@
+"""Add command_dispatches and command_deliveries for command fan-out
+
+Revision ID: f4a7c2e9b513
+Revises: e6b1a94d2c38
+Create Date: 2026-10-19 17:05:12.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a7c2e9b513'
+down_revision: Union[str, Sequence[str], None] = 'e6b1a94d2c38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+target_type_enum = postgresql.ENUM('SYSTEM_UNIT', 'PRODUCT_LINE', 'ORGANIZATION', name='command_target_type')
+dispatch_status_enum = postgresql.ENUM('PENDING', 'RUNNING', 'COMPLETED', 'CANCELLED', name='command_dispatch_status')
+delivery_status_enum = postgresql.ENUM('QUEUED', 'SENT', 'ACKED', 'FAILED', 'TIMEOUT', name='command_delivery_status')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    for enum_type in (target_type_enum, dispatch_status_enum, delivery_status_enum):
+        enum_type.create(bind, checkfirst=True)
+
+    op.create_table('command_dispatches',
+    sa.Column('id', sa.BigInteger(), nullable=False),
+    sa.Column('target_type', postgresql.ENUM(name='command_target_type', create_type=False), nullable=False),
+    sa.Column('target_id', sa.BigInteger(), nullable=False),
+    sa.Column('action', sa.String(length=100), nullable=False, comment='명령 종류 (예: FIRMWARE_UPDATE)'),
+    sa.Column('parameters', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('status', postgresql.ENUM(name='command_dispatch_status', create_type=False), nullable=False),
+    sa.Column('rate_per_second', sa.Float(), nullable=False, comment='초당 최대 발행 수'),
+    sa.Column('max_in_flight', sa.Integer(), nullable=False, comment='응답 대기 중인 최대 명령 수'),
+    sa.Column('ack_timeout_seconds', sa.Integer(), nullable=False),
+    sa.Column('total_count', sa.Integer(), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('user_id', sa.BigInteger(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_command_dispatches_id'), 'command_dispatches', ['id'], unique=False)
+    op.create_index(op.f('ix_command_dispatches_status'), 'command_dispatches', ['status'], unique=False)
+    op.create_index(op.f('ix_command_dispatches_user_id'), 'command_dispatches', ['user_id'], unique=False)
+
+    op.create_table('command_deliveries',
+    sa.Column('id', sa.BigInteger(), nullable=False),
+    sa.Column('dispatch_id', sa.BigInteger(), nullable=False),
+    sa.Column('correlation_id', sa.String(length=32), nullable=False),
+    sa.Column('status', postgresql.ENUM(name='command_delivery_status', create_type=False), nullable=False),
+    sa.Column('sent_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('acked_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('latency_ms', sa.Float(), nullable=True, comment='발행부터 응답 수신까지 (ms)'),
+    sa.Column('response', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('device_id', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['dispatch_id'], ['command_dispatches.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['device_id'], ['devices.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('correlation_id')
+    )
+    op.create_index('idx_command_deliveries_dispatch_status', 'command_deliveries', ['dispatch_id', 'status'], unique=False)
+    op.create_index(op.f('ix_command_deliveries_device_id'), 'command_deliveries', ['device_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_command_deliveries_device_id'), table_name='command_deliveries')
+    op.drop_index('idx_command_deliveries_dispatch_status', table_name='command_deliveries')
+    op.drop_table('command_deliveries')
+    op.drop_index(op.f('ix_command_dispatches_user_id'), table_name='command_dispatches')
+    op.drop_index(op.f('ix_command_dispatches_status'), table_name='command_dispatches')
+    op.drop_index(op.f('ix_command_dispatches_id'), table_name='command_dispatches')
+    op.drop_table('command_dispatches')
+
+    bind = op.get_bind()
+    for enum_type in (delivery_status_enum, dispatch_status_enum, target_type_enum):
+        enum_type.drop(bind, checkfirst=True)
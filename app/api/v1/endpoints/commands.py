@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.orm import Session
+from typing import Any
+
+from app.dependencies import get_db, get_active_context, ActiveContext, PermissionChecker
+from app.domains.inter_domain.policies.command_fanout.command_fanout_policy_provider import command_fanout_policy_provider
+from app.domains.services.command_fanout.schemas.command_fanout_command import CommandFanoutRequest
+from app.domains.services.command_fanout.schemas.command_fanout_query import CommandDispatchProgress
+
+router = APIRouter()
+
+@router.post("/fanout", status_code=status.HTTP_202_ACCEPTED)
+def create_command_fanout(
+    *,
+    db: Session = Depends(get_db),
+    active_context: ActiveContext = Depends(get_active_context),
+    _permission: None = Depends(PermissionChecker(required_permission="system_units:manage")),
+    request_in: CommandFanoutRequest
+) -> Any:
+    """
+    ### [Fleet Command] 대상 집합 명령 팬아웃
+
+    유닛/제품군/조직에 속한 활성 기기 전체에 명령을 발행하는 작업을 등록합니다.
+    - **발행**: 리더 워커가 `rate_per_second`, `max_in_flight`에 맞춰 `ares4/{uuid}/commands`로 나눠 발행합니다.
+    - **추적**: 각 명령에 correlation_id가 붙으며, 기기의 `commands/response/{uuid}` 응답으로 ACK/지연이 기록됩니다.
+    - **보안**: 'system_units:manage' 권한이 필요합니다.
+    """
+    # 대상 기기 수만큼 전달 행을 적재하므로 동기 엔드포인트로 두어 스레드풀에서 실행합니다.
+    return command_fanout_policy_provider.create_dispatch(db=db, active_context=active_context, request=request_in)
+
+@router.get("/fanout/{dispatch_id}", response_model=CommandDispatchProgress)
+def read_command_fanout_progress(
+    dispatch_id: int,
+    db: Session = Depends(get_db),
+    active_context: ActiveContext = Depends(get_active_context),
+    _permission: None = Depends(PermissionChecker(required_permission="system_units:manage")),
+) -> Any:
+    """
+    팬아웃 작업의 상태별 전달 건수(QUEUED/SENT/ACKED/FAILED/TIMEOUT)와 응답 지연(p50/p95/max)을 조회합니다.
+    """
+    return command_fanout_policy_provider.get_progress(db=db, active_context=active_context, dispatch_id=dispatch_id)
+
+@router.post("/fanout/{dispatch_id}/cancel", status_code=status.HTTP_200_OK)
+def cancel_command_fanout(
+    dispatch_id: int,
+    db: Session = Depends(get_db),
+    active_context: ActiveContext = Depends(get_active_context),
+    _permission: None = Depends(PermissionChecker(required_permission="system_units:manage")),
+) -> Any:
+    """
+    아직 발행되지 않은 전달의 발행을 중단합니다. 이미 발행된 명령은 회수하지 않습니다.
+    """
+    return command_fanout_policy_provider.cancel_dispatch(db=db, active_context=active_context, dispatch_id=dispatch_id)
@@ -1,12 +1,14 @@
 from fastapi import APIRouter, Request, Depends, HTTPException, status, Body
 from sqlalchemy.orm import Session
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from app.dependencies import get_db, get_current_user
+from app.core.config import settings
+from app.dependencies import get_db, get_current_user, get_active_context, ActiveContext, PermissionChecker
 from app.core.exceptions import AuthenticationError, AppLogicError, ValidationError, NotFoundError, PermissionDeniedError
 from app.domains.inter_domain.policies.factory_enrollment.factory_enrollment_policy_provider import factory_enrollment_policy_provider
 from app.domains.inter_domain.policies.system_unit.system_unit_policy_provider import system_unit_policy_provider
 from app.domains.inter_domain.system_unit_assignment.system_unit_assignment_query_provider import system_unit_assignment_query_provider
+from app.domains.services.device_management.schemas.device_command import FactoryBulkEnrollRequest
 
 # [타입 힌팅용 임포트]
 from app.models.objects.user import User
@@ -15,6 +17,24 @@ from app.models.relationships.system_unit_assignment import SystemUnitAssignment
 
 router = APIRouter()
 
+TRUSTED_FACTORY_IPS = ["127.0.0.1", "10.1.1.63"]
+
+def resolve_client_ip(request: Request) -> Optional[str]:
+    """
+    신뢰망 판단에 쓸 실제 요청자 IP. 본문의 자기 보고 IP는 위조할 수 있으므로 쓰지 않습니다.
+    직접 연결한 상대가 FACTORY_TRUSTED_PROXY_IPS의 프록시일 때만 X-Forwarded-For를 오른쪽부터 읽어
+    프록시가 아닌 첫 주소를 요청자로 봅니다.
+    """
+    peer = request.client.host if request.client else None
+    trusted_proxies = {ip.strip() for ip in settings.FACTORY_TRUSTED_PROXY_IPS.split(",") if ip.strip()}
+    if peer not in trusted_proxies:
+        return peer
+    forwarded = [ip.strip() for ip in request.headers.get("X-Forwarded-For", "").split(",") if ip.strip()]
+    for ip in reversed(forwarded):
+        if ip not in trusted_proxies:
+            return ip
+    return peer
+
 # ---------------------------------------------------------
 # 1. 기기 자동 등록 (기존 로직 유지)
 # ---------------------------------------------------------
@@ -25,7 +45,6 @@ async def factory_auto_enroll(
 ):
     body: Dict[str, Any] = await request.json()
     target_ip = body.get("reported_ip")
-    TRUSTED_FACTORY_IPS = ["127.0.0.1", "10.1.1.63"] 
 
     policy = factory_enrollment_policy_provider.get_policy()
 
@@ -42,6 +61,43 @@ async def factory_auto_enroll(
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error: {e}")
     
+# ---------------------------------------------------------
+# 1-1. 생산 로트 일괄 등록 (Vault 작업 병렬 처리)
+# ---------------------------------------------------------
+@router.post("/bulk-enroll")
+async def factory_bulk_enroll(
+    request: Request,
+    body: FactoryBulkEnrollRequest,
+    db: Session = Depends(get_db),
+    active_context: ActiveContext = Depends(get_active_context),
+    _permission: None = Depends(PermissionChecker(required_permission="factory:enroll"))
+):
+    """
+    ### 생산 로트 일괄 등록
+    - **보안**: 'factory:enroll' 권한이 필요하며, 신뢰망 판단은 실제 연결 주소(신뢰 프록시 뒤라면 X-Forwarded-For)로 합니다.
+      본문의 `reported_ip`는 감사 기록에만 남습니다.
+    """
+    policy = factory_enrollment_policy_provider.get_policy()
+
+    try:
+        return await policy.execute_bulk_factory_enrollment(
+            db=db,
+            client_ip=resolve_client_ip(request),
+            cpu_serials=body.cpu_serials,
+            trusted_ips=TRUSTED_FACTORY_IPS,
+            actor_user=active_context.user,
+            reported_ip=body.reported_ip,
+            lot_id=body.lot_id,
+            target_unit_name=body.target_unit_name,
+            auto_activate=body.auto_activate,
+        )
+    except AuthenticationError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error: {e}")
+
 # ---------------------------------------------------------
 # 2. 사용자 기기 점유 (QR 스캔)
 # ---------------------------------------------------------
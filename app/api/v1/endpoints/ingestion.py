@@ -1,11 +1,12 @@
 import json
 import logging
 from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, status
 
 # 프로젝트의 공통 의존성 (dependencies.py) 임포트
-from app.dependencies import get_db
+from app.dependencies import get_db, get_async_db
 from app.domains.action_authorization.policies.batch_ingestion.batch_ingestion_policy import batch_ingestion_policy
 from app.domains.inter_domain.batch_tracker.batch_status_query_provider import batch_status_query_provider
 
@@ -15,7 +16,7 @@ logger = logging.getLogger(__name__)
 @router.post("/batch", status_code=status.HTTP_202_ACCEPTED)
 async def ingest_batch_data(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     device_uuid: str = Form(...),
     telemetry_json: str = Form(...), 
     images: List[UploadFile] = File(...)
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect, status
+from typing import Any, List, Optional, Tuple
+
+from app.database import SessionLocal
+from app.dependencies import get_current_user
+from app.models.objects.user import User
+from app.core.config import settings
+from app.domains.inter_domain.policies.realtime_subscription.realtime_subscription_policy_provider import realtime_subscription_policy_provider
+from app.domains.services.realtime.managers.realtime_hub import RealtimeConnection, realtime_hub
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+@router.post("/ws-ticket", status_code=status.HTTP_200_OK)
+async def issue_realtime_ticket(
+    user_info: Tuple[User, str, Optional[str]] = Depends(get_current_user)
+) -> Any:
+    """
+    ### [Realtime] WebSocket 접속 티켓 발급
+
+    브라우저 WebSocket은 DPoP 헤더를 붙일 수 없으므로, 인증된 요청으로 짧게 유효한 1회성 티켓을 받아
+    `/realtime/ws?ticket=...`로 접속합니다.
+    """
+    current_user, _, _ = user_info
+    return realtime_subscription_policy_provider.issue_ticket(actor_user=current_user)
+
+def _redeem(ticket: str) -> Optional[int]:
+    with SessionLocal() as db:
+        user = realtime_subscription_policy_provider.redeem_ticket(db, ticket=ticket)
+        return user.id if user else None
+
+def _authorize(user_id: int, device_uuids: List[str]) -> Tuple[List[str], List[str]]:
+    with SessionLocal() as db:
+        return realtime_subscription_policy_provider.authorize_devices(db, user_id=user_id, device_uuids=device_uuids)
+
+async def _reauthorize_loop(connection: RealtimeConnection, user_id: int) -> None:
+    """
+    구독 중인 기기의 권한을 주기적으로 다시 확인합니다.
+    할당 해제/소유권 이전/계정 비활성화로 권한이 회수된 기기는 구독에서 빼고 `revoked`로 알립니다.
+    """
+    interval = settings.REALTIME_REAUTHORIZE_INTERVAL_SECONDS
+    while not connection.closed:
+        await asyncio.sleep(interval)
+        if not connection.devices:
+            continue
+        try:
+            _, denied = await asyncio.to_thread(_authorize, user_id, sorted(connection.devices))
+        except Exception as e:
+            logger.warning(f"Realtime re-authorization failed for user {user_id}: {e}")
+            continue
+        revoked = [device_uuid for device_uuid in denied if device_uuid in connection.devices]
+        if revoked:
+            await realtime_hub.unsubscribe(connection, revoked)
+            connection.send_control({"type": "revoked", "devices": revoked})
+            logger.info(f"🔒 Realtime subscriptions revoked for user {user_id}: {len(revoked)} devices")
+
+@router.websocket("/ws")
+async def realtime_websocket(websocket: WebSocket, ticket: str = Query(...)):
+    """
+    ### [Realtime] 기기 상태 스트림
+
+    - 구독: `{"action": "subscribe", "devices": ["<uuid>", ...]}` → `{"type": "subscribed", "devices": [...], "denied": [...]}`
+    - 해제: `{"action": "unsubscribe", "devices": [...]}`
+    - 수신: `{"type": "state", "updates": {"<uuid>": {...}}}` (구독 직후 현재 상태 1회, 이후 갱신될 때마다 묶어서 전송)
+    - 회수: `{"type": "revoked", "devices": [...]}` (주기적 권한 재확인에서 권한이 사라진 기기는 자동으로 구독 해제)
+    """
+    if not settings.REALTIME_WS_ENABLED or not realtime_hub.is_running:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        return
+
+    user_id = await asyncio.to_thread(_redeem, ticket)
+    if user_id is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    connection = realtime_hub.connect(websocket, user_id=user_id)
+    if connection is None:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        return
+
+    reauthorize_task = asyncio.create_task(_reauthorize_loop(connection, user_id))
+    try:
+        while not connection.closed:
+            message = await websocket.receive_json()
+            action = message.get("action") if isinstance(message, dict) else None
+            devices = message.get("devices") if isinstance(message, dict) else None
+            if action not in ("subscribe", "unsubscribe") or not isinstance(devices, list):
+                connection.send_control({"type": "error", "detail": "Expected {action: subscribe|unsubscribe, devices: [...]}."})
+                continue
+
+            if action == "subscribe":
+                requested = [str(d) for d in devices[:settings.REALTIME_MAX_DEVICES_PER_CONNECTION]]
+                allowed, denied = await asyncio.to_thread(_authorize, user_id, requested)
+                subscribed = await realtime_hub.subscribe(connection, allowed)
+                connection.send_control({"type": "subscribed", "devices": subscribed, "denied": denied})
+            else:
+                await realtime_hub.unsubscribe(connection, [str(d) for d in devices])
+                connection.send_control({"type": "unsubscribed", "devices": devices})
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.warning(f"Realtime websocket closed for user {user_id}: {e}")
+    finally:
+        reauthorize_task.cancel()
+        await realtime_hub.disconnect(connection)
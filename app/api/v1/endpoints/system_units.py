@@ -6,7 +6,8 @@ from app.dependencies import get_db, get_active_context, ActiveContext, Permissi
 
 # 우리가 함께 만든 Policy와 Schema (해당 파일들에 존재함을 확인)
 from app.domains.inter_domain.policies.system_unit.system_unit_policy_provider import system_unit_policy_provider
-from app.domains.services.system_unit.schemas.system_unit_command import DeviceBindingRequest
+from app.domains.inter_domain.policies.blueprint_rollout.blueprint_rollout_policy_provider import blueprint_rollout_policy_provider
+from app.domains.services.system_unit.schemas.system_unit_command import DeviceBindingRequest, BlueprintRolloutRequest
 
 router = APIRouter()
 
@@ -37,6 +38,31 @@ async def bind_device_to_unit(
     
     return result
 
+@router.post("/blueprint-rollout", status_code=status.HTTP_200_OK)
+def rollout_blueprint_wiring(
+    *,
+    db: Session = Depends(get_db),
+    active_context: ActiveContext = Depends(get_active_context),
+    _permission: None = Depends(PermissionChecker(required_permission="system_units:manage")),
+    request_in: BlueprintRolloutRequest
+) -> Any:
+    """
+    ### [Fleet Rollout] 설계도 배선 일괄 재배포
+    
+    설계도의 핀맵 레시피를 해당 설계도로 제작된 기기들(또는 지정한 기기들)에 한 번에 다시 깔아줍니다.
+    - **우회**: 기기별 고장(FAULTY) 핀은 설계도의 가용 핀 풀에서 대체합니다.
+    - **원자성**: 전체 기기를 한 트랜잭션으로 처리하며, 실패 시 아무 기기도 바뀌지 않습니다.
+    - **결과**: 처리/재배선 기기 수와, 우회할 가용 핀이 없어 기존 배선을 유지한 기기 ID(`failed_device_ids`)를 반환합니다. 이 경우 `status`는 `partial`입니다.
+    - **보안**: 'system_units:manage' 권한이 필요합니다.
+    """
+    # 대량 DB 쓰기이므로 동기 엔드포인트로 두어 스레드풀에서 실행합니다. (이벤트 루프 차단 방지)
+    return blueprint_rollout_policy_provider.rollout(
+        db=db,
+        actor_user=active_context.user,
+        blueprint_id=request_in.blueprint_id,
+        device_ids=request_in.device_ids
+    )
+
 @router.post("/{unit_id}/unbind-owner", status_code=status.HTTP_200_OK)
 async def unbind_unit_owner(
     unit_id: int,
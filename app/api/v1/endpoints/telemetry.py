@@ -1,17 +1,23 @@
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Any
 
-from app.dependencies import get_db, get_active_context, ActiveContext
-from app.domains.services.telemetry.schemas.telemetry_query import TelemetryFilter
+from app.dependencies import get_db, get_async_db, get_active_context, ActiveContext
+from app.domains.services.telemetry.schemas.telemetry_query import (
+    TelemetryFilter, TelemetryExportFilter, TelemetryLatestFilter, TelemetrySeriesRead, DeviceMetricLatestRead,
+    TelemetryQueryDataRead,
+)
+from app.domains.services.telemetry.managers.export_encoders import MEDIA_TYPES, FILE_EXTENSIONS
 from app.domains.inter_domain.policies.telemetry.telemetry_policy_provider import telemetry_policy_provider
 
 router = APIRouter()
 
-@router.get("/data", response_model=List[Any], status_code=status.HTTP_200_OK)
+@router.get("/data", response_model=List[TelemetryQueryDataRead], status_code=status.HTTP_200_OK)
 async def get_telemetry_data(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     active_context: ActiveContext = Depends(get_active_context),
     filters: TelemetryFilter = Depends()
 ) -> Any:
@@ -24,10 +30,82 @@ async def get_telemetry_data(
     - **보안**: 타인의 데이터나 소유권 이전 전후의 데이터는 원천적으로 차단됩니다.
     - **무결성**: 오직 읽기 전용이며, 기기 이외의 주체에 의한 데이터 조작은 불가합니다.
     """
-    # Inter-Domain Provider 호출
-    return telemetry_policy_provider.fetch_data(
+    # Inter-Domain Provider 호출 (AsyncSession: DB 대기 중 다른 요청이 진행될 수 있음)
+    return await telemetry_policy_provider.fetch_data_async(
+        db=db,
+        actor_user=active_context.user,
+        filters=filters,
+        active_role_id=active_context.active_role_id
+    )
+
+@router.get("/series", response_model=TelemetrySeriesRead, status_code=status.HTTP_200_OK)
+async def get_telemetry_series(
+    *,
+    db: Session = Depends(get_db),
+    active_context: ActiveContext = Depends(get_active_context),
+    filters: TelemetryFilter = Depends()
+) -> Any:
+    """
+    ### 차트용 텔레메트리 시계열 조회 (다운샘플링)
+
+    - **해상도 선택**: `resolution=auto`(기본)이면 조회 구간과 `points` 예산에 맞춰 raw / 1m / 1h / 1d 중 하나를 고릅니다.
+    - **롤업**: 1m/1h/1d는 수신 시점에 증분 갱신되는 롤업 테이블에서 읽으며, 버킷별 min/max/avg/std를 반환합니다.
+    - **다운샘플링**: `downsample=lttb|minmax`를 주면 한 단계 촘촘한 해상도로 읽은 뒤 시리즈(기기/부품/항목)별로 `points`개 이하만 남깁니다.
+    - **기간 격리**: `/data`와 동일하게 일반 Role은 소유 기간의 데이터만 조회됩니다.
+    - `start_time`을 생략하면 최근 24시간을 조회합니다. `skip`/`limit`는 사용되지 않습니다.
+    """
+    return telemetry_policy_provider.fetch_series(
+        db=db,
+        actor_user=active_context.user,
+        filters=filters,
+        active_role_id=active_context.active_role_id
+    )
+
+@router.get("/latest", response_model=List[DeviceMetricLatestRead], status_code=status.HTTP_200_OK)
+async def get_latest_telemetry(
+    *,
+    db: Session = Depends(get_db),
+    active_context: ActiveContext = Depends(get_active_context),
+    filters: TelemetryLatestFilter = Depends()
+) -> Any:
+    """
+    ### 기기별 측정 항목 최신값 조회 (플릿 개요)
+
+    - `device_metric_latest` 테이블에서 (기기, 부품, 항목)별 마지막 값을 한 번에 읽습니다.
+    - 수신 경로에서 `captured_at`이 더 최신일 때만 갱신되므로, 지연 도착한 과거 데이터가 현재값을 덮지 않습니다.
+    - **기간 격리**: `/data`와 동일하게 일반 Role은 소유 기간 중 측정된 값만 조회됩니다.
+    """
+    return telemetry_policy_provider.fetch_latest(
+        db=db,
+        actor_user=active_context.user,
+        filters=filters,
+        active_role_id=active_context.active_role_id
+    )
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+def export_telemetry_data(
+    *,
+    db: Session = Depends(get_db),
+    active_context: ActiveContext = Depends(get_active_context),
+    filters: TelemetryExportFilter = Depends()
+) -> StreamingResponse:
+    """
+    ### 텔레메트리 스트리밍 내보내기 (NDJSON / CSV / Arrow)
+
+    - **형식**: `format=ndjson`(기본) | `csv` | `arrow`(Arrow IPC 스트림)
+    - **키셋 페이지네이션**: `(captured_at, id)` 순으로 정렬되며 offset을 사용하지 않습니다.
+      전송이 끊기면 마지막으로 받은 행의 `captured_at`, `id`를 `after_captured_at`, `after_id`로 넘겨 이어받습니다.
+    - **메모리**: 서버 사이드 커서로 읽은 행을 배치 단위로 인코딩해 즉시 전송하므로, 결과 전체를 메모리에 올리지 않습니다.
+    - **기간 격리**: `/data`와 동일하게 일반 Role은 소유 기간의 데이터만 내보낼 수 있습니다.
+    """
+    stream = telemetry_policy_provider.export_data(
         db=db,
         actor_user=active_context.user,
         filters=filters,
         active_role_id=active_context.active_role_id
-    )
\ No newline at end of file
+    )
+    return StreamingResponse(
+        stream,
+        media_type=MEDIA_TYPES[filters.format],
+        headers={"Content-Disposition": f'attachment; filename="telemetry.{FILE_EXTENSIONS[filters.format]}"'},
+    )
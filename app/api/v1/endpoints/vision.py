@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.orm import Session
+from typing import Any, List
+
+from app.dependencies import get_db, get_active_context, ActiveContext
+from app.domains.services.vision_feature.schemas.vision_feature_query import VisionSimilarityQuery, SimilarFeatureRead
+from app.domains.inter_domain.policies.vision.vision_policy_provider import vision_policy_provider
+
+router = APIRouter()
+
+@router.post("/similar", response_model=List[SimilarFeatureRead], status_code=status.HTTP_200_OK)
+def search_similar_features(
+    *,
+    db: Session = Depends(get_db),
+    active_context: ActiveContext = Depends(get_active_context),
+    query_in: VisionSimilarityQuery
+) -> Any:
+    """
+    ### 시각 특징 유사도 검색 (top-k 코사인)
+
+    - 기준은 `query_vector`(임베딩) 또는 이미 저장된 `feature_id` 중 하나로 지정합니다. (`feature_id` 자신은 결과에서 제외)
+    - `model_version`별 벡터 색인에서 검색하며, 색인은 검색 직전에 DB의 새 특징값을 따라잡습니다.
+    - **조회 범위**: 시스템 관리자/`telemetry:read_all` 권한이 없으면 `system_unit_ids`를 명시해야 하며, 현재 할당된 유닛만 검색됩니다.
+    """
+    return vision_policy_provider.search_similar(db=db, active_context=active_context, query=query_in)
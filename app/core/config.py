@@ -6,15 +6,46 @@ class Settings(BaseSettings):
     # --- Core Settings ---
     PROJECT_NAME: str = "Ares4 Server v2"
     API_V1_STR: str = "/api/v1"
+    # lifespan 시작 시 미리 생성할 레지스트리 컴포넌트 (쉼표 구분, 비우면 모두 첫 사용 시 생성)
+    REGISTRY_WARM_UP_COMPONENTS: str = "redis,redis_text,vault_hmac,vault_certificate_command"
 
     # --- Database Settings ---
     DATABASE_URL: str
+    ASYNC_DATABASE_URL: Optional[str] = None # 비어 있으면 DATABASE_URL의 드라이버를 postgresql+asyncpg로 바꿔 사용
+    DATABASE_REPLICA_URLS: str = "" # 읽기 복제본 URL 목록 (쉼표 구분, 비어 있으면 모든 조회가 primary)
+    DATABASE_REPLICA_MAX_LAG_SECONDS: float = 5.0 # 이보다 지연된 복제본은 건너뛰고 다른 복제본/primary에서 읽음
+    DATABASE_REPLICA_LAG_CHECK_SECONDS: float = 2.0 # 복제본별 지연 측정 결과 재사용 시간
+
+    # --- Database Pool Settings ---
+    DB_PROCESS_ROLE: str = "api" # api | listener | health_checker | image_worker | script (역할별 기본 풀 크기, app/core/db_pool.py)
+    DB_POOL_SIZE: Optional[int] = None # 비어 있으면 역할 기본값
+    DB_MAX_OVERFLOW: Optional[int] = None # 비어 있으면 역할 기본값
+    DB_POOL_TIMEOUT: float = 10.0 # 풀이 가득 찼을 때 연결을 기다리는 최대 시간(초), 넘으면 TimeoutError
+    DB_POOL_RECYCLE: int = 1800 # 이보다 오래된 연결은 체크아웃 시 새로 맺음(초)
+    DB_POOL_PRE_PING: bool = True # 체크아웃 시 끊긴 연결을 감지해 교체
+    DB_STATEMENT_TIMEOUT_MS: int = 30000 # 쿼리 최대 실행 시간 (0이면 미적용)
+    DB_PGBOUNCER_MODE: bool = False # PgBouncer transaction pooling 뒤에서 실행 (시작 파라미터/prepared statement 캐시 미사용)
+    DB_SLOW_CHECKOUT_MS: float = 200.0 # 풀 체크아웃 대기가 이보다 길면 호출 위치와 함께 경고 로그
+
+    # --- Query Stats Settings ---
+    QUERY_STATS_ENABLED: bool = True # 요청/수집 메시지 단위 쿼리 수·DB 시간·반복 쿼리 집계 (/health/db-queries)
+    QUERY_STATS_HEADERS: bool = False # 디버그용: 응답 헤더(X-DB-Query-Count 등)로 노출
+    QUERY_REPEAT_WARN_THRESHOLD: int = 10 # 한 요청에서 같은 쿼리가 이 횟수 이상 반복되면 N+1 경고 로그
 
     # --- Redis Settings ---
     REDIS_HOST: str
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
 
+    # --- Leader Election Settings ---
+    LEADER_ELECTION_ENABLED: bool = True # 여러 API 워커 중 리더 1곳만 싱글턴 루프(MQTT 퍼블리셔, 거버넌스, 파티션, 스케줄러)를 실행
+    LEADER_ELECTION_KEY: str = "ares4:leader:api"
+    LEADER_LEASE_SECONDS: float = 15.0 # 리더 프로세스가 죽었을 때 인계까지 걸리는 최대 시간
+    LEADER_RENEW_INTERVAL_SECONDS: float = 5.0 # 임대 연장/후보 폴링 주기 (정상 종료 시 인계 지연)
+    MQTT_PUBLISH_RELAY_KEY: str = "ares4:mqtt:publish_relay" # 리더가 아닌 워커의 MQTT 발행 요청 큐 (Redis 리스트)
+    MQTT_PUBLISH_RELAY_MAX_AGE_SECONDS: float = 60.0 # 이보다 오래 대기한 명령은 발행하지 않고 폐기
+    MQTT_PUBLISH_RELAY_MAX_LENGTH: int = 10000
+
     # --- JWT Settings ---
     JWT_SECRET_KEYS: str # List[str]에서 str으로 다시 변경
     JWT_ALGORITHM: str = "HS256"
@@ -42,10 +73,15 @@ class Settings(BaseSettings):
     # --- EMQX Webhook Settings ---
     EMQX_WEBHOOK_SECRET: str
     ARES4_HMAC_KEY: str
+    HMAC_LEGACY_JSON_ENABLED: bool = True # 원문 서명을 못 하는 구형 펌웨어용 canonical-JSON 재직렬화 검증 허용
+    HMAC_KEY_CACHE_SIZE: int = 10000 # 장치별로 미리 준비한 HMAC 키 객체 캐시 크기 (LRU)
     
     # --- Storage Settings ---
     UPLOAD_DIR: str = "/app/uploads"
     
+    # --- Image Worker Settings ---
+    IMAGE_WORKER_BATCH_SIZE: int = 16 # 워커가 큐에서 한 번에 꺼내 한 트랜잭션으로 기록하는 이미지 작업 수
+
     # --- Vault Settings ---
     VAULT_ADDR: str
     VAULT_APPROLE_ROLE_ID: Optional[str] = None
@@ -54,11 +90,114 @@ class Settings(BaseSettings):
     VAULT_PKI_LISTENER_ROLE: str = "ares-server-role"
     VAULT_SERVER_CERT_TTL: str = "720h" # 서버 MQTT 클라이언트 인증서 유효기간 (예: 30일)
 
+    # --- Factory Enrollment Settings ---
+    FACTORY_ENROLL_VAULT_CONCURRENCY: int = 8 # 일괄 등록 시 동시에 진행할 Vault 호출(HMAC 저장 + 인증서 발급) 수
+    FACTORY_BULK_ENROLL_MAX_SERIALS: int = 500 # 일괄 등록 1회 요청의 최대 시리얼 수
+    FACTORY_TRUSTED_PROXY_IPS: str = "" # 공장망 앞단 리버스 프록시 IP (쉼표 구분). 이 주소에서 온 요청만 X-Forwarded-For를 신뢰
+    DEVICE_CERT_POOL_SIZE: int = 0 # 선발급 장치 인증서 풀 크기 (0이면 비활성, API 워커 프로세스마다 별도 풀)
+    DEVICE_CERT_POOL_MAX_AGE_HOURS: int = 24 # 풀에서 이보다 오래 대기한 인증서는 폐기 (유효기간 손실 방지)
+    DEVICE_CERT_POOL_REFILL_CONCURRENCY: int = 2 # 풀 보충 시 동시 발급 수
+
+    # --- Batch Progress Settings ---
+    BATCH_PROGRESS_FLUSH_INTERVAL_SECONDS: float = 5.0 # Redis 진행 카운터를 batch_trackings에 일괄 반영하는 주기 (리더 워커)
+    BATCH_PROGRESS_FLUSH_MAX_BATCHES: int = 500 # 1회 반영(트랜잭션)에 싣는 배치 수
+    BATCH_PROGRESS_COUNTER_TTL_SECONDS: int = 604800 # 카운터 보관 기간 (7일). 만료 후에는 DB 값을 읽습니다.
+
     # --- Health Checker Settings ---
     DEVICE_HEALTH_CHECK_INTERVAL_SECONDS: int = 60
     DEVICE_TIMEOUT_SECONDS: int = 60 # 60 seconds, adjusted based on 10-second telemetry
     REDIS_DEVICE_LAST_SEEN_ZSET_KEY: str = "device_last_seen"
 
+    # --- Scheduler Settings ---
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_TICK_SECONDS: float = 1.0
+    SCHEDULER_RELOAD_INTERVAL_SECONDS: int = 30 # updated_at 기준 증분 리로드 주기
+    SCHEDULER_RELOAD_OVERLAP_SECONDS: int = 60 # 늦게 커밋된 트랜잭션을 놓치지 않기 위한 재조회 구간
+    SCHEDULER_RECONCILE_INTERVAL_SECONDS: int = 600 # 하드 삭제 감지를 위한 ID 대사 주기
+    SCHEDULER_MISFIRE_GRACE_SECONDS: int = 120 # 1회성 작업의 지각 발화 허용 범위
+    SCHEDULER_DEFAULT_TIMEZONE: str = "UTC"
+    SCHEDULER_RUN_COMPLETION_BATCH: int = 500 # 틱마다 반영하는 실행 완료 보고 최대 건수
+    SCHEDULER_MAX_QUEUED_FIRES: int = 100 # QUEUE 정책 스케줄별 대기 발화 상한 (넘치면 가장 오래된 발화부터 버림)
+    SCHEDULER_QUEUE_RETRY_SECONDS: int = 5 # 대기 발화 발행이 실패했을 때 다시 시도하기까지의 간격
+
+    # --- Command Fan-out Settings ---
+    COMMAND_FANOUT_ENABLED: bool = True
+    COMMAND_FANOUT_TICK_SECONDS: float = 0.5 # 발행 루프 주기 (틱마다 토큰만큼 QUEUED 전달을 꺼내 발행)
+    COMMAND_FANOUT_DEFAULT_RATE_PER_SECOND: float = 50.0 # 작업별 기본 초당 발행 수
+    COMMAND_FANOUT_MAX_RATE_PER_SECOND: float = 500.0 # 작업별 요청 가능한 최대 초당 발행 수
+    COMMAND_FANOUT_GLOBAL_RATE_PER_SECOND: float = 1000.0 # 모든 작업을 합친 브로커 발행 상한
+    COMMAND_FANOUT_DEFAULT_MAX_IN_FLIGHT: int = 200 # 작업별 응답 대기(SENT) 최대 수
+    COMMAND_FANOUT_DEFAULT_ACK_TIMEOUT_SECONDS: int = 60 # 이 시간 안에 응답이 없으면 TIMEOUT 처리
+    COMMAND_FANOUT_ACK_FLUSH_INTERVAL_SECONDS: float = 1.0 # 리스너가 모은 응답을 DB에 일괄 반영하는 주기
+    COMMAND_FANOUT_ACK_FLUSH_MAX_BATCH: int = 1000 # 이만큼 쌓이면 주기를 기다리지 않고 반영
+
+    # --- Realtime Gateway Settings ---
+    REALTIME_WS_ENABLED: bool = True
+    REALTIME_WS_TICKET_TTL_SECONDS: int = 30 # WebSocket 접속용 1회성 티켓 유효기간
+    REALTIME_COALESCE_INTERVAL_SECONDS: float = 0.25 # 연결별 전송 주기. 그 사이 같은 기기의 갱신은 최신값 1건으로 합칩니다.
+    REALTIME_SEND_TIMEOUT_SECONDS: float = 5.0 # 전송이 이보다 오래 걸리는 느린 연결은 끊습니다.
+    REALTIME_MAX_DEVICES_PER_CONNECTION: int = 200
+    REALTIME_MAX_CONNECTIONS: int = 5000 # API 워커 프로세스당 최대 WebSocket 연결 수
+    REALTIME_REAUTHORIZE_INTERVAL_SECONDS: float = 60.0 # 구독 중인 기기의 권한을 다시 확인하는 주기 (회수된 기기는 구독 해제)
+    REALTIME_STATE_REQUEST_WINDOW_SECONDS: float = 0.5 # client/request_state 응답 재사용 창 (그 사이 텔레메트리가 오면 즉시 무효화)
+    REALTIME_STATS_LOG_INTERVAL_SECONDS: int = 300 # 리스너의 상태 요청 합치기/응답 수집 카운터 로그 주기
+    REALTIME_STATE_DELTA_CACHE_DEVICES: int = 50000 # 리스너가 마지막으로 쓴 메트릭 값을 기억하는 기기 수 (넘치면 해당 기기는 전체 다시 쓰기)
+
+    # --- Trigger Engine Settings ---
+    TRIGGER_ENGINE_ENABLED: bool = True
+    TRIGGER_RELOAD_INTERVAL_SECONDS: int = 30 # updated_at 기준 증분 리로드 주기
+    TRIGGER_RELOAD_OVERLAP_SECONDS: int = 60
+    TRIGGER_RECONCILE_INTERVAL_SECONDS: int = 600
+    TRIGGER_DEFAULT_COOLDOWN_SECONDS: int = 60 # CONTINUOUS/INTERVAL 규칙의 재발화 최소 간격
+    TRIGGER_MAX_QUEUE_PER_SLOT: int = 16 # QUEUE 정책 대기열 상한 (유닛+대상 단위)
+    TRIGGER_METRIC_STALE_SECONDS: int = 900 # 이보다 오래된 최신값은 조건 평가에서 무시
+    TRIGGER_COMPLETION_MARKER_TTL_SECONDS: int = 86400 # 기기 완료 응답 표식 보관 시간 (실행을 가진 엔진이 회수)
+    TRIGGER_INPUT_QUEUE_MAX_LENGTH: int = 100000 # 리더 엔진이 평가할 입력 대기열 상한 (넘치면 오래된 입력부터 버림)
+    TRIGGER_INPUT_BATCH: int = 500 # 한 번에 꺼내 한 트랜잭션으로 평가하는 입력 수
+    TRIGGER_POLL_INTERVAL_SECONDS: float = 0.5 # 대기열이 비었을 때 다음 확인까지의 간격 (타임아웃/완료 회수도 이 주기로 수행)
+
+    # --- Vision Index Settings ---
+    VECTOR_INDEX_DIR: str = "/app/uploads/vector_index" # model_version별 memmap 행렬 + id 사이드카 저장 위치
+    VECTOR_INDEX_QUERY_BLOCK_ROWS: int = 65536 # 질의 시 한 번에 내적하는 행 수 (메모리 상한)
+    VECTOR_INDEX_MAX_TOP_K: int = 100
+    VECTOR_INDEX_SYNC_TRAILING_IDS: int = 10000 # 동기화 시 워터마크 아래로 다시 읽는 id 구간 (늦게 커밋된 작은 id 보정)
+    VECTOR_INDEX_SYNC_INTERVAL_SECONDS: int = 300 # 리더가 색인을 DB와 맞추는 주기 (검색 요청은 색인을 쓰지 않음, VECTOR_INDEX_DIR는 워커들이 공유하는 볼륨이어야 함)
+    VECTOR_INDEX_POSSESSION_OVERFETCH: int = 4 # 소유 기간으로 걸러낼 때 top_k의 몇 배를 후보로 먼저 뽑을지
+    VECTOR_INDEX_MAX_CANDIDATES: int = 5000 # 소유 기간 필터링 시 후보를 늘려 가며 다시 뽑을 때의 상한
+
+    # --- RL Dataset Export Settings ---
+    RL_EXPORT_DIR: str = "/app/uploads/datasets"
+    RL_EXPORT_SHARD_ROWS: int = 50000 # 샤드(.npy 묶음) 1개당 스냅샷 수
+    RL_EXPORT_FETCH_SIZE: int = 10000 # 서버 사이드 커서 1회 fetch 행 수
+
+    # --- Telemetry Rollup Settings ---
+    TELEMETRY_LATEST_ENABLED: bool = True # 수신 경로에서 device_metric_latest 최신값 테이블을 함께 갱신
+    TELEMETRY_ROLLUP_ENABLED: bool = True # 수신 경로에서 1m/1h/1d 롤업을 같은 트랜잭션으로 갱신
+    TELEMETRY_RAW_INTERVAL_SECONDS: int = 10 # 원본 텔레메트리의 명목 간격 (쿼리 플래너 추정용)
+    TELEMETRY_SERIES_DEFAULT_POINTS: int = 500 # 시리즈당 포인트 예산 기본값
+    TELEMETRY_SERIES_DEFAULT_RANGE_HOURS: int = 24 # start_time 미지정 시 조회 구간
+    TELEMETRY_SERIES_MAX_ROWS: int = 50000 # 한 번의 시계열 응답에 담는 최대 행 수
+    TELEMETRY_DOWNSAMPLE_OVERSAMPLE: int = 4 # 다운샘플링 시 예산의 몇 배 해상도로 읽은 뒤 줄일지
+
+    # --- Telemetry Partition Settings ---
+    TELEMETRY_PARTITION_INTERVAL: str = "day" # day | week (마이그레이션 시 초기 파티션도 이 주기로 생성)
+    TELEMETRY_PARTITION_PREMAKE: int = 7 # 미리 만들어 둘 미래 파티션 수
+    TELEMETRY_PARTITION_MAINTENANCE_INTERVAL_SECONDS: int = 3600
+    TELEMETRY_PARTITION_LOCK_TIMEOUT_MS: int = 5000 # DDL이 수신 트랜잭션을 오래 막지 않도록 하는 잠금 대기 상한
+    TELEMETRY_RETENTION_DAYS: int = 0 # 원본 보존 기간 (0이면 무기한). 롤업/최신값 테이블은 영향받지 않음
+    TELEMETRY_RETENTION_MODE: str = "detach" # detach: 분리 후 테이블 보존(아카이브 대상) | drop: 즉시 삭제
+
+    # --- Telemetry Archive Settings ---
+    TELEMETRY_ARCHIVE_DIR: str = "/app/uploads/telemetry_archive" # 파티션별 Arrow 파일 + manifest.json (여러 호스트면 모든 API/워커가 마운트한 공유 볼륨이어야 함)
+    TELEMETRY_ARCHIVE_AFTER_DAYS: int = 0 # 이 기간이 지난 파티션을 파일로 옮기고 DB에서 삭제 (0이면 비활성)
+    TELEMETRY_ARCHIVE_COMPRESSION: str = "zstd" # zstd | lz4
+    TELEMETRY_ARCHIVE_BATCH_ROWS: int = 65536 # 파일 내 RecordBatch 1개당 행 수 (= 서버 사이드 커서 fetch 크기)
+    TELEMETRY_ARCHIVE_READ_ENABLED: bool = True # 조회/내보내기에서 아카이브 구간을 함께 읽음
+
+    # --- Telemetry Export Settings ---
+    TELEMETRY_EXPORT_PAGE_ROWS: int = 100000 # 키셋 페이지 1개(쿼리 1회)당 행 수
+    TELEMETRY_EXPORT_FETCH_SIZE: int = 5000 # 서버 사이드 커서 1회 fetch 행 수 (= 인코딩 배치 크기)
+
     # --- Email Settings ---
     MAIL_USERNAME: str
     MAIL_PASSWORD: str
@@ -0,0 +1,223 @@
+# --- DB Connection Pool ---
+# 이 파일은 프로세스 역할별 커넥션 풀 설정과 풀 계측(체크아웃 대기/오버플로/타임아웃)을 담당합니다.
+# API, MQTT 리스너, 헬스 체커, 이미지 워커는 각자 엔진을 만들므로 DB_PROCESS_ROLE로 풀 크기를 나눠 잡습니다.
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple, Type
+from uuid import uuid4
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.core.config import settings
+from app.core import query_stats
+
+logger = logging.getLogger(__name__)
+
+# 역할별 기본 (pool_size, max_overflow). DB_POOL_SIZE / DB_MAX_OVERFLOW가 지정되면 그 값을 사용합니다.
+# 프로세스 수 × (pool_size + max_overflow)가 Postgres(또는 PgBouncer)의 max_connections를 넘지 않게 잡아야 합니다.
+ROLE_POOL_DEFAULTS: Dict[str, Tuple[int, int]] = {
+    "api": (10, 20),           # 수집 버스트(배치/웹훅)를 받는 프로세스
+    "listener": (5, 10),       # MQTT 메시지 처리
+    "health_checker": (2, 2),  # 주기 점검 1건씩
+    "image_worker": (2, 3),    # 큐에서 1건씩 처리
+    "script": (2, 0),          # 일회성 스크립트 (아카이브, 내보내기 등)
+}
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_SKIP_FILES = {os.path.abspath(__file__), os.path.join(_PROJECT_ROOT, "app", "database.py")}
+
+def _is_app_frame(filename: str) -> bool:
+    path = os.path.abspath(filename)
+    return path.startswith(_PROJECT_ROOT + os.sep) and "site-packages" not in path and path not in _SKIP_FILES
+
+def _call_site() -> str:
+    """풀 체크아웃을 일으킨 애플리케이션 코드 위치 (SQLAlchemy/드라이버/이 모듈 프레임은 건너뜀)."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        if _is_app_frame(frame.f_code.co_filename):
+            return f"{frame.f_code.co_filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+
+    # async 엔진의 체크아웃은 greenlet 안에서 일어나므로, await를 건 코루틴 쪽 스택에서 찾습니다.
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        for frame in reversed(task.get_stack()):
+            if _is_app_frame(frame.f_code.co_filename):
+                return f"{frame.f_code.co_filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+    return "unknown"
+
+class PoolMonitor:
+    """
+    엔진별 커넥션 풀 지표 수집기.
+    - 체크아웃 대기 시간(최근 N건 분위수/최대), 타임아웃(풀 고갈), 신규 연결, 무효화 횟수
+    - DB_SLOW_CHECKOUT_MS를 넘는 대기는 획득한 호출 위치와 함께 경고 로그로 남깁니다.
+    """
+    def __init__(self, *, slow_checkout_ms: float, window: int = 1024):
+        self.slow_checkout_ms = slow_checkout_ms
+        self._lock = threading.Lock()
+        self._pools: Dict[str, Pool] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._waits: Dict[str, Deque[float]] = {}
+        self._window = window
+
+    def register(self, name: str, engine: Engine) -> None:
+        self._pools[name] = engine.pool
+        self._stats[name] = {
+            "checkouts": 0, "connects": 0, "invalidations": 0, "timeouts": 0,
+            "slow_checkouts": 0, "peak_checked_out": 0, "wait_ms_max": 0.0,
+        }
+        self._waits[name] = deque(maxlen=self._window)
+
+        @event.listens_for(engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            self._bump(name, "connects")
+
+        @event.listens_for(engine, "invalidate")
+        def _on_invalidate(dbapi_connection, connection_record, exception):
+            self._bump(name, "invalidations")
+
+        @event.listens_for(engine, "engine_disposed")
+        def _on_disposed(disposed_engine):
+            # dispose()는 같은 클래스로 풀을 다시 만들므로 지표 대상도 새 풀로 교체합니다.
+            self._pools[name] = disposed_engine.pool
+
+    def _bump(self, name: str, key: str) -> None:
+        with self._lock:
+            self._stats[name][key] += 1
+
+    def record_checkout(self, name: str, pool: Pool, wait_ms: float) -> None:
+        checked_out = pool.checkedout()
+        with self._lock:
+            stats = self._stats[name]
+            stats["checkouts"] += 1
+            stats["peak_checked_out"] = max(stats["peak_checked_out"], checked_out)
+            stats["wait_ms_max"] = max(stats["wait_ms_max"], wait_ms)
+            self._waits[name].append(wait_ms)
+            if wait_ms >= self.slow_checkout_ms:
+                stats["slow_checkouts"] += 1
+        if wait_ms >= self.slow_checkout_ms:
+            logger.warning(
+                f"🐢 Slow DB pool checkout: {wait_ms:.0f}ms (pool={name}, {pool.status()}) at {_call_site()}"
+            )
+
+    def record_timeout(self, name: str, pool: Pool, wait_ms: float) -> None:
+        self._bump(name, "timeouts")
+        logger.error(
+            f"❌ DB pool exhausted: gave up after {wait_ms:.0f}ms (pool={name}, {pool.status()}) at {_call_site()}"
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """풀별 현재 상태와 누적 지표. (/health/db-pool 응답)"""
+        pools = {}
+        with self._lock:
+            for name, pool in self._pools.items():
+                waits = sorted(self._waits[name])
+                current = {"status": pool.status()}
+                if isinstance(pool, QueuePool):
+                    current.update(
+                        size=pool.size(), checked_in=pool.checkedin(),
+                        checked_out=pool.checkedout(), overflow=pool.overflow(),
+                    )
+                pools[name] = {
+                    **current,
+                    **self._stats[name],
+                    "wait_ms_p50": _percentile(waits, 0.50),
+                    "wait_ms_p95": _percentile(waits, 0.95),
+                    "wait_ms_p99": _percentile(waits, 0.99),
+                }
+        return {"role": settings.DB_PROCESS_ROLE, "slow_checkout_ms": self.slow_checkout_ms, "pools": pools}
+
+def _percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    return round(sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))], 3)
+
+pool_monitor = PoolMonitor(slow_checkout_ms=settings.DB_SLOW_CHECKOUT_MS)
+
+def monitored_pool_class(base: Type[Pool], name: str) -> Type[Pool]:
+    """
+    체크아웃 대기 시간을 재는 풀 클래스. SQLAlchemy는 체크아웃 '이전' 이벤트가 없으므로
+    큐에서 연결을 꺼내는(_do_get) 구간을 감쌉니다. 오버플로 연결 생성 시간도 대기에 포함됩니다.
+    engine.dispose()의 재생성도 같은 클래스를 쓰므로 계측이 유지됩니다.
+    """
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = base._do_get(self)
+        except PoolTimeoutError:
+            pool_monitor.record_timeout(name, self, (time.perf_counter() - started) * 1000)
+            raise
+        pool_monitor.record_checkout(name, self, (time.perf_counter() - started) * 1000)
+        return connection
+
+    return type(f"Monitored{base.__name__}", (base,), {"_do_get": _do_get})
+
+def pool_size_for_role(role: str) -> Tuple[int, int]:
+    size, overflow = ROLE_POOL_DEFAULTS.get(role, ROLE_POOL_DEFAULTS["script"])
+    if settings.DB_POOL_SIZE is not None:
+        size = settings.DB_POOL_SIZE
+    if settings.DB_MAX_OVERFLOW is not None:
+        overflow = settings.DB_MAX_OVERFLOW
+    return size, overflow
+
+def engine_options(name: str, url: str, *, is_async: bool = False) -> Dict[str, Any]:
+    """
+    create_engine / create_async_engine에 넘길 풀·연결 옵션.
+    PgBouncer(transaction pooling) 모드에서는
+    - 시작 파라미터(options/server_settings)를 쓰지 않고 statement_timeout을 트랜잭션마다 SET LOCAL로 적용하고,
+    - asyncpg의 prepared statement 캐시를 끄고 이름을 매번 새로 지어 백엔드 연결이 바뀌어도 충돌하지 않게 합니다.
+    (세션 범위 상태를 쓰지 않도록 advisory lock은 이미 트랜잭션 범위(pg_try_advisory_xact_lock)만 사용합니다.)
+    """
+    size, overflow = pool_size_for_role(settings.DB_PROCESS_ROLE)
+    connect_args: Dict[str, Any] = {}
+    timeout_ms = settings.DB_STATEMENT_TIMEOUT_MS
+
+    # 연결 옵션은 Postgres 드라이버(psycopg2/asyncpg) 전용입니다.
+    if make_url(url).get_backend_name() == "postgresql":
+        if is_async and settings.DB_PGBOUNCER_MODE:
+            connect_args.update(
+                statement_cache_size=0,
+                prepared_statement_cache_size=0,
+                prepared_statement_name_func=lambda: f"__asyncpg_{uuid4()}__",
+            )
+        elif is_async and timeout_ms > 0:
+            connect_args["server_settings"] = {"statement_timeout": str(timeout_ms)}
+        elif not settings.DB_PGBOUNCER_MODE and timeout_ms > 0:
+            connect_args["options"] = f"-c statement_timeout={timeout_ms}"
+
+    return {
+        "poolclass": monitored_pool_class(AsyncAdaptedQueuePool if is_async else QueuePool, name),
+        "pool_size": size,
+        "max_overflow": overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_use_lifo": True,  # 유휴 연결이 pool_recycle/PgBouncer server_idle_timeout으로 자연스럽게 정리되도록
+        "connect_args": connect_args,
+    }
+
+def instrument(name: str, engine: Engine) -> Engine:
+    """풀 지표·쿼리 통계 등록 + PgBouncer 모드의 트랜잭션 단위 statement_timeout 적용. (async 엔진은 sync_engine을 전달)"""
+    pool_monitor.register(name, engine)
+    if settings.QUERY_STATS_ENABLED:
+        query_stats.install(engine)
+
+    timeout_ms = int(settings.DB_STATEMENT_TIMEOUT_MS)
+    if settings.DB_PGBOUNCER_MODE and timeout_ms > 0 and engine.dialect.name == "postgresql":
+        @event.listens_for(engine, "begin")
+        def _set_statement_timeout(conn):
+            conn.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout_ms}")
+
+    return engine
@@ -0,0 +1,127 @@
+# --- Leader Election ---
+# 이 파일은 여러 API 워커(uvicorn/gunicorn) 중 하나만 싱글턴 백그라운드 루프(MQTT 퍼블리셔, 인증서 로테이션,
+# 거버넌스 점검, 파티션 유지보수, 스케줄 실행기, 트리거 엔진)를 돌리도록 Redis 임대(lease) 락으로 리더를 선출합니다.
+
+import asyncio
+import logging
+import os
+import socket
+import time
+from typing import Awaitable, Callable, Optional
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+# 내가 보유한 락일 때만 임대를 연장/해제합니다. (다른 워커가 이미 가져간 락을 건드리지 않도록)
+_RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+class LeaderElector:
+    """
+    Redis `SET NX PX` 기반 리더 선출기.
+    - 리더는 renew_interval마다 임대를 lease_seconds로 연장하고, 연장에 실패하거나(락을 잃음)
+      마지막 연장 이후 lease_seconds - renew_interval이 지나도록 Redis에 닿지 못하면 스스로 강등합니다.
+      (임대가 만료되어 다른 워커가 리더가 되기 전에 싱글턴 루프를 멈출 여유를 renew_interval만큼 둡니다)
+    - 후보는 renew_interval마다 락 획득을 시도합니다. 리더가 정상 종료하면 락을 즉시 해제하므로
+      다음 폴링(renew_interval 이내)에 인계되고, 리더 프로세스가 죽으면 임대 만료(lease_seconds) 후 인계됩니다.
+    on_elected / on_demoted는 이벤트 루프에서 호출되는 코루틴 함수입니다.
+    """
+    def __init__(
+        self,
+        redis_client,
+        *,
+        key: str,
+        lease_seconds: float,
+        renew_interval_seconds: float,
+        on_elected: Callable[[], Awaitable[None]],
+        on_demoted: Callable[[], Awaitable[None]],
+    ):
+        self.redis = redis_client
+        self.key = key
+        self.lease_ms = int(lease_seconds * 1000)
+        self.renew_interval = renew_interval_seconds
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.identity = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self.is_leader = False
+        self._last_renewed = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """선출 루프를 멈추고, 리더였다면 싱글턴 루프를 정리한 뒤 락을 해제해 즉시 인계합니다."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.is_leader:
+            await self._demote("shutdown")
+            try:
+                await asyncio.to_thread(self.redis.eval, _RELEASE_SCRIPT, 1, self.key, self.identity)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to release leader lock {self.key}: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if self.is_leader:
+                    # 연장 호출이 멈춰도 강등 시각을 넘기지 않도록 남은 시간만큼만 기다립니다.
+                    renewed = await asyncio.wait_for(
+                        asyncio.to_thread(self.redis.eval, _RENEW_SCRIPT, 1, self.key, self.identity, self.lease_ms),
+                        timeout=max(self._demote_deadline() - time.monotonic(), 0.001),
+                    )
+                    if renewed:
+                        self._last_renewed = time.monotonic()
+                    else:
+                        await self._demote("lease lost")
+                else:
+                    acquired = await asyncio.to_thread(self.redis.set, self.key, self.identity, nx=True, px=self.lease_ms)
+                    if acquired:
+                        self._last_renewed = time.monotonic()
+                        await self._elect()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ Leader election check failed ({self.key}): {e!r}")
+                # 다음 확인(renew_interval 뒤)까지 기다리면 임대가 만료될 수 있으므로 그 전에 물러납니다.
+                if self.is_leader and time.monotonic() >= self._demote_deadline():
+                    await self._demote("lease about to expire while Redis was unreachable")
+            await asyncio.sleep(self.renew_interval)
+
+    def _demote_deadline(self) -> float:
+        """연장에 실패하는 리더가 강등해야 하는 시각. (임대 만료 시각 - renew_interval)"""
+        return self._last_renewed + self.lease_ms / 1000 - self.renew_interval
+
+    async def _elect(self) -> None:
+        self.is_leader = True
+        logger.info(f"👑 Elected leader for {self.key} ({self.identity})")
+        try:
+            await self.on_elected()
+        except Exception as e:
+            # 싱글턴 루프를 띄우지 못한 워커가 락을 쥐고 있지 않도록 내려놓습니다.
+            logger.error(f"❌ Leader startup failed, releasing {self.key}: {e}", exc_info=True)
+            await self._demote("startup failed")
+            await asyncio.to_thread(self.redis.eval, _RELEASE_SCRIPT, 1, self.key, self.identity)
+
+    async def _demote(self, reason: str) -> None:
+        self.is_leader = False
+        logger.warning(f"🔻 Leadership of {self.key} released ({reason})")
+        try:
+            await self.on_demoted()
+        except Exception as e:
+            logger.error(f"❌ Error while stopping leader-only tasks: {e}", exc_info=True)
@@ -4,6 +4,7 @@ import paho.mqtt.client as mqtt
 import ssl
 import time
 from app.core.config import settings
+from app.core.registry import app_registry
 
 logger = logging.getLogger(__name__)
 
@@ -80,8 +81,14 @@ class MqttPersistentPublisher:
             logger.error(f"MQTT Publisher: An error occurred while publishing: {e}", exc_info=True)
             return False
 
-# Create a global instance for re-use
-mqtt_publisher_instance = MqttPersistentPublisher()
+    def close(self):
+        self.client.loop_stop()
+        self.client.disconnect()
+
+# Create a global instance for re-use (브로커 연결은 첫 발행 시점에 시작합니다)
+mqtt_publisher_instance = app_registry.register(
+    "mqtt_status_publisher", MqttPersistentPublisher, close=lambda publisher: publisher.close()
+)
 
 # Expose a simple function for convenience
 def publish_device_status(user_email: str, device_uuid: str, status_payload: dict):
@@ -0,0 +1,160 @@
+# --- Query Stats ---
+# 이 파일은 요청(또는 수집 메시지) 단위의 SQL 실행 통계와 N+1 감지를 담당합니다.
+# provider/policy 계층을 거치며 생기는 lazy load 반복(예: system_unit.devices, role.permissions)을
+# 같은 쿼리 지문(fingerprint)의 반복 횟수로 드러냅니다.
+
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_PARAM = r"(?:%\(\w+\)s|\$\d+|\?|:\w+)"
+# IN (...) 확장 파라미터 개수가 달라도 같은 쿼리로 봅니다.
+_PARAM_LIST = re.compile(rf"\(\s*{_PARAM}(?:\s*,\s*{_PARAM})+\s*\)")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+def fingerprint(statement: str) -> str:
+    """파라미터/리터럴을 지운 정규화된 SQL. 같은 지문의 반복은 루프 안의 조회(N+1)를 뜻합니다."""
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _PARAM_LIST.sub("(?)", normalized)
+    return _LITERAL.sub("?", normalized)
+
+class QueryStats:
+    """한 작업 단위(HTTP 요청, MQTT 메시지 등)에서 실행된 쿼리 수, DB 시간, 지문별 횟수."""
+    __slots__ = ("label", "count", "total_ms", "fingerprints")
+
+    def __init__(self, label: str):
+        self.label = label
+        self.count = 0
+        self.total_ms = 0.0
+        self.fingerprints: Counter = Counter()
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold번 이상 실행된 지문 목록 (많은 순)."""
+        return [(fp, n) for fp, n in self.fingerprints.most_common() if n >= threshold]
+
+# 현재 호출 흐름에서 활성화된 집계 단위들. 중첩되면(테스트 예산 검사 안의 요청 등) 모든 단위에 기록합니다.
+_active: ContextVar[Tuple[QueryStats, ...]] = ContextVar("query_stats", default=())
+
+@contextmanager
+def track_queries(label: str, *, record: bool = True) -> Iterator[QueryStats]:
+    """이 범위에서 실행되는 SQL을 집계합니다. record=True면 종료 시 라벨별 지표에 반영하고 N+1을 경고합니다."""
+    stats = QueryStats(label)
+    token = _active.set(_active.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+        if record:
+            query_metrics.record(stats)
+
+class QueryMetrics:
+    """라벨(라우트 템플릿, MQTT 토픽 종류)별 누적 쿼리 지표. (/health/db-queries 응답)"""
+    def __init__(self, *, repeat_threshold: int):
+        self.repeat_threshold = repeat_threshold
+        self._lock = threading.Lock()
+        self._by_label: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, stats: QueryStats) -> None:
+        repeated = stats.repeated(self.repeat_threshold)
+        with self._lock:
+            entry = self._by_label.setdefault(stats.label, {
+                "units": 0, "queries": 0, "db_ms": 0.0, "max_queries": 0, "n_plus_one": 0, "last_repeated": None,
+            })
+            entry["units"] += 1
+            entry["queries"] += stats.count
+            entry["db_ms"] += stats.total_ms
+            entry["max_queries"] = max(entry["max_queries"], stats.count)
+            if repeated:
+                entry["n_plus_one"] += 1
+                entry["last_repeated"] = {"count": repeated[0][1], "statement": repeated[0][0][:300]}
+        if repeated:
+            fp, n = repeated[0]
+            logger.warning(f"🔁 Possible N+1 in {stats.label}: {n}x {fp[:200]} (total {stats.count} queries)")
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "repeat_threshold": self.repeat_threshold,
+                "labels": {
+                    label: {
+                        **entry,
+                        "db_ms": round(entry["db_ms"], 3),
+                        "avg_queries": round(entry["queries"] / entry["units"], 2),
+                        "avg_db_ms": round(entry["db_ms"] / entry["units"], 3),
+                    }
+                    for label, entry in self._by_label.items()
+                },
+            }
+
+query_metrics = QueryMetrics(repeat_threshold=settings.QUERY_REPEAT_WARN_THRESHOLD)
+
+_installed: Set[int] = set()
+
+def install(engine: Engine) -> None:
+    """엔진(async 엔진은 sync_engine)에 실행 시간 계측 리스너를 붙입니다. 활성 집계 단위가 없으면 아무것도 하지 않습니다."""
+    if id(engine) in _installed:
+        return
+    _installed.add(id(engine))
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if _active.get():
+            context._query_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        active = _active.get()
+        started = getattr(context, "_query_started", None)
+        if not active or started is None:
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        fp = fingerprint(statement)
+        for stats in active:
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            stats.fingerprints[fp] += 1
+
+class QueryStatsMiddleware:
+    """
+    HTTP 요청마다 쿼리를 집계하는 ASGI 미들웨어. 라벨은 매칭된 라우트 템플릿(`GET /api/v1/telemetry/data`)이며,
+    expose_headers=True(디버그)면 응답에 X-DB-Query-Count / X-DB-Time-Ms / X-DB-Max-Repeat 헤더를 붙입니다.
+    스트리밍 응답은 헤더 전송 이후의 쿼리가 헤더에는 빠지고 지표에만 반영됩니다.
+    """
+    def __init__(self, app, *, expose_headers: bool = False):
+        self.app = app
+        self.expose_headers = expose_headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries(f"{scope['method']} (unmatched)") as stats:
+            async def send_with_stats(message):
+                if message["type"] == "http.response.start":
+                    route = scope.get("route")
+                    if route is not None:
+                        stats.label = f"{scope['method']} {route.path}"
+                    if self.expose_headers:
+                        headers = MutableHeaders(scope=message)
+                        headers.append("X-DB-Query-Count", str(stats.count))
+                        headers.append("X-DB-Time-Ms", f"{stats.total_ms:.1f}")
+                        top = stats.fingerprints.most_common(1)
+                        headers.append("X-DB-Max-Repeat", str(top[0][1] if top else 0))
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
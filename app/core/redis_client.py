@@ -1,6 +1,22 @@
 import redis
 from app.core.config import get_settings
+from app.core.registry import app_registry
 
-def get_redis_client():
+def _create_redis_client(*, decode_responses: bool = False) -> redis.Redis:
     settings = get_settings()
-    return redis.Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=settings.REDIS_DB)
+    return redis.Redis(
+        host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=settings.REDIS_DB, decode_responses=decode_responses
+    )
+
+# 프로세스 공용 클라이언트 (커넥션 풀 공유). 첫 사용 시 생성됩니다.
+redis_client = app_registry.register("redis", _create_redis_client, close=lambda client: client.close())
+# 응답을 str로 디코딩하는 클라이언트 (JSON 문자열을 다루는 캐시용)
+redis_text_client = app_registry.register(
+    "redis_text", lambda: _create_redis_client(decode_responses=True), close=lambda client: client.close()
+)
+
+def get_redis_client() -> redis.Redis:
+    return app_registry.get("redis")
+
+def get_redis_text_client() -> redis.Redis:
+    return app_registry.get("redis_text")
@@ -1,14 +1,113 @@
-from typing import Optional
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
 
 # Forward declaration to avoid circular imports
 class CommandDispatchRepository:
     pass
 
+class LazyComponent:
+    """
+    레지스트리 컴포넌트의 지연 프록시. 속성에 처음 접근할 때 팩토리를 실행해 실제 인스턴스를 만들고,
+    이후 호출은 그 인스턴스로 그대로 전달합니다. 모듈 수준 싱글턴 이름(예: vault_hmac_repository)을
+    유지한 채로 import 시점의 네트워크 연결(Vault 로그인, 브로커 접속 등)을 없애기 위해 사용합니다.
+    """
+    __slots__ = ("_registry", "_name")
+
+    def __init__(self, registry: "AppRegistry", name: str):
+        object.__setattr__(self, "_registry", registry)
+        object.__setattr__(self, "_name", name)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._registry.get(self._name), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._registry.get(self._name), attr, value)
+
+    def __repr__(self) -> str:
+        state = "ready" if self._registry.is_initialized(self._name) else "lazy"
+        return f"<LazyComponent {self._name} ({state})>"
+
 class AppRegistry:
     """
     애플리케이션의 생명주기 동안 관리되는 주요 컴포넌트 인스턴스를 저장하는 전역 레지스트리입니다.
     의존성 주입(Dependency Injection)을 중앙에서 관리하는 역할을 합니다.
+
+    외부 서비스에 연결하는 컴포넌트(Vault, Redis, MQTT 퍼블리셔)는 register()로 팩토리만 등록하고,
+    첫 사용 시점 또는 lifespan의 warm_up()에서 생성합니다. 생성에 실패하면 저장하지 않으므로 다음 사용 때 다시 시도합니다.
     """
     command_dispatch_repository: Optional[CommandDispatchRepository] = None
 
+    def __init__(self):
+        self._lock = threading.RLock()  # 팩토리 안에서 다른 컴포넌트를 조회할 수 있도록 재진입 허용
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._closers: Dict[str, Callable[[Any], None]] = {}
+        self._proxies: Dict[str, LazyComponent] = {}
+        self._instances: Dict[str, Any] = {}
+        self._order: List[str] = []
+
+    def register(self, name: str, factory: Callable[[], Any], *, close: Optional[Callable[[Any], None]] = None) -> LazyComponent:
+        """팩토리를 등록하고 지연 프록시를 반환합니다. 같은 이름을 다시 등록하면 기존 프록시를 돌려줍니다."""
+        with self._lock:
+            if name not in self._factories:
+                self._factories[name] = factory
+                if close is not None:
+                    self._closers[name] = close
+                self._proxies[name] = LazyComponent(self, name)
+            return self._proxies[name]
+
+    def get(self, name: str) -> Any:
+        """컴포넌트 인스턴스를 반환합니다. 아직 없으면 이 자리에서 생성합니다."""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        with self._lock:
+            instance = self._instances.get(name)
+            if instance is None:
+                if name not in self._factories:
+                    raise KeyError(f"Component '{name}' is not registered.")
+                instance = self._factories[name]()
+                self._instances[name] = instance
+                self._order.append(name)
+                logger.info(f"🧩 Component initialized: {name}")
+            return instance
+
+    def is_initialized(self, name: str) -> bool:
+        return name in self._instances
+
+    def warm_up(self, names: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+        """
+        lifespan 시작 시 컴포넌트를 미리 생성합니다. (생략하면 등록된 전부)
+        실패는 로그만 남기고 넘어가며, 해당 컴포넌트는 첫 사용 때 다시 생성을 시도합니다.
+        """
+        results: Dict[str, bool] = {}
+        for name in list(names if names is not None else self._factories):
+            try:
+                self.get(name)
+                results[name] = True
+            except Exception as e:
+                logger.error(f"❌ Component warm-up failed: {name}: {e}")
+                results[name] = False
+        return results
+
+    def shutdown(self) -> None:
+        """생성된 컴포넌트를 생성 역순으로 정리합니다. 이후 접근하면 다시 생성됩니다."""
+        with self._lock:
+            for name in reversed(self._order):
+                instance = self._instances.pop(name, None)
+                closer = self._closers.get(name)
+                if instance is None or closer is None:
+                    continue
+                try:
+                    closer(instance)
+                except Exception as e:
+                    logger.warning(f"⚠️ Component shutdown failed: {name}: {e}")
+            self._order.clear()
+
+    def snapshot(self) -> Dict[str, bool]:
+        """등록된 컴포넌트별 생성 여부."""
+        return {name: name in self._instances for name in self._factories}
+
 app_registry = AppRegistry()
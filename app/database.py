@@ -1,10 +1,173 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase, object_mapper
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import create_engine, text, Delete, Insert, Select, Update
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase, object_mapper
 from app.core.config import settings
+from app.core.db_pool import engine_options, instrument
 from datetime import datetime
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+logger = logging.getLogger(__name__)
+
+engine = instrument("primary", create_engine(settings.DATABASE_URL, **engine_options("primary", settings.DATABASE_URL)))
+replica_engines: List[Engine] = [
+    instrument(f"replica-{i}", create_engine(url, **engine_options(f"replica-{i}", url)))
+    for i, url in enumerate(u.strip() for u in settings.DATABASE_REPLICA_URLS.split(",") if u.strip())
+]
+
+# 복제 지연(초). 복구(replica) 모드가 아니거나 WAL 재생이 따라잡은 상태면 0입니다.
+# (쓰기가 없는 동안 pg_last_xact_replay_timestamp()가 멈춰 지연이 커 보이는 것을 막기 위해 LSN을 먼저 비교)
+_REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+class ReplicaRouter:
+    """
+    읽기 복제본 선택기: 라운드 로빈으로 고르되, 지연이 max_lag_seconds를 넘거나 연결할 수 없는 복제본은 건너뜁니다.
+    지연 측정 결과는 check_interval_seconds 동안 재사용하며, 사용 가능한 복제본이 없으면 primary를 반환합니다.
+    """
+    def __init__(self, primary: Engine, replicas: List[Engine], *, max_lag_seconds: float, check_interval_seconds: float):
+        self.primary = primary
+        self.replicas = replicas
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._status: Dict[Engine, Tuple[float, bool]] = {}
+
+    def pick(self) -> Engine:
+        start = next(self._counter)
+        for i in range(len(self.replicas)):
+            replica = self.replicas[(start + i) % len(self.replicas)]
+            if self._is_healthy(replica):
+                return replica
+        return self.primary
+
+    def _is_healthy(self, replica: Engine) -> bool:
+        cached = self._status.get(replica)
+        if cached and time.monotonic() - cached[0] < self.check_interval_seconds:
+            return cached[1]
+        with self._lock:
+            cached = self._status.get(replica)
+            if cached and time.monotonic() - cached[0] < self.check_interval_seconds:
+                return cached[1]
+            lag = self._measure_lag(replica)
+            healthy = lag is not None and lag <= self.max_lag_seconds
+            if not healthy:
+                logger.warning(f"⚠️ Read replica {replica.url.host} skipped (lag={lag}). Falling back.")
+            self._status[replica] = (time.monotonic(), healthy)
+            return healthy
+
+    def _measure_lag(self, replica: Engine) -> Optional[float]:
+        if replica.dialect.name != "postgresql":
+            return 0.0  # 로컬 테스트용 SQLite 파일 등은 지연 개념이 없습니다.
+        try:
+            with replica.connect() as conn:
+                return float(conn.execute(_REPLICA_LAG_SQL).scalar() or 0)
+        except Exception as e:
+            logger.warning(f"⚠️ Read replica {replica.url.host} lag check failed: {e}")
+            return None
+
+replica_router = ReplicaRouter(
+    engine,
+    replica_engines,
+    max_lag_seconds=settings.DATABASE_REPLICA_MAX_LAG_SECONDS,
+    check_interval_seconds=settings.DATABASE_REPLICA_LAG_CHECK_SECONDS,
+)
+
+# 현재 호출 흐름이 복제본에서 읽어도 되는 조회(*_query provider 등)인지 표시
+_replica_reads: ContextVar[bool] = ContextVar("replica_reads", default=False)
+_REPLICA_READS_INFO = "replica_reads"
+_WROTE_INFO = "wrote_primary"
+
+@contextmanager
+def replica_reads() -> Iterator[None]:
+    """
+    이 범위 안의 SELECT를 읽기 복제본으로 보냅니다. 데코레이터(@replica_reads())로도 사용할 수 있습니다.
+    같은 세션에서 이미 쓰기가 일어났다면 read-your-writes를 위해 primary에서 읽습니다.
+    """
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+class RoutingSession(Session):
+    """
+    [Read/Write Routing] 쓰기와 일반 조회는 primary로, replica_reads 범위(또는 ReplicaSessionLocal 세션)의
+    단순 SELECT는 복제본으로 보냅니다. 세션에서 한 번이라도 쓰기(flush/DML)가 일어나면 이후 조회는
+    세션이 닫힐 때까지 primary에 고정됩니다. (요청 단위 read-your-writes)
+    명시적으로 bind를 지정한 세션(테스트의 트랜잭션 연결 등)은 라우팅하지 않습니다.
+    """
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.bind is not None:
+            return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+        if self._flushing or isinstance(clause, (Insert, Update, Delete)):
+            self.info[_WROTE_INFO] = True
+            return engine
+        if (
+            replica_router.replicas
+            and not self.info.get(_WROTE_INFO)
+            and (_replica_reads.get() or self.info.get(_REPLICA_READS_INFO))
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+        ):
+            return replica_router.pick()
+        return engine
+
+    def close(self) -> None:
+        self.info.pop(_WROTE_INFO, None)
+        super().close()
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, class_=RoutingSession)
+# 요청 범위 밖에서 오래 읽기만 하는 작업(스트리밍 내보내기, 데이터셋 추출 등)용 세션
+ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False, class_=RoutingSession, info={_REPLICA_READS_INFO: True})
+
+def _asyncpg_url(url: str) -> str:
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+def _async_database_url() -> str:
+    return settings.ASYNC_DATABASE_URL or _asyncpg_url(settings.DATABASE_URL)
+
+# [Async] async 엔드포인트의 핫패스(웹훅 인증/ACL, 텔레메트리 조회, 배치 수신)용 asyncpg 엔진.
+# DB 대기 동안 이벤트 루프를 양보하므로 느린 쿼리 하나가 워커의 다른 요청을 멈추지 않습니다.
+# 커밋 후 속성 접근이 암묵적 I/O(lazy load)를 일으키지 않도록 expire_on_commit=False를 사용합니다.
+async_engine = create_async_engine(_async_database_url(), **engine_options("async", _async_database_url(), is_async=True))
+instrument("async", async_engine.sync_engine)
+# 동기 복제본과 같은 서버를 가리키는 asyncpg 엔진과, 동기 엔진 → AsyncSession이 쓰는 sync_engine 매핑
+async_replica_engines: List[AsyncEngine] = [
+    create_async_engine(url, **engine_options(f"async-replica-{i}", url, is_async=True))
+    for i, url in enumerate(_asyncpg_url(r.url.render_as_string(hide_password=False)) for r in replica_engines)
+]
+async_replica_binds: Dict[Engine, Engine] = {
+    replica: instrument(f"async-replica-{i}", async_replica.sync_engine)
+    for i, (replica, async_replica) in enumerate(zip(replica_engines, async_replica_engines))
+}
+
+class AsyncRoutingSession(RoutingSession):
+    """
+    AsyncSession 내부(sync_session_class)에서 쓰는 RoutingSession. 라우팅 규칙과 복제본 상태는 동기 세션과 공유하고,
+    고른 서버에 해당하는 asyncpg 엔진을 반환합니다. (복제본 지연 측정은 check 주기마다 한 번 동기 연결로 수행)
+    """
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.bind is not None:
+            return super().get_bind(mapper=mapper, clause=clause, **kw)
+        return async_replica_binds.get(super().get_bind(mapper=mapper, clause=clause, **kw), async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    class_=AsyncSession, sync_session_class=AsyncRoutingSession, autoflush=False, expire_on_commit=False
+)
 
 class Base(DeclarativeBase):
     def as_dict(self):
@@ -5,7 +5,7 @@ from typing import Tuple, Optional
 import copy 
 from pydantic import BaseModel, ConfigDict
 
-from app.database import SessionLocal
+from app.database import SessionLocal, AsyncSessionLocal
 from app.core import security
 from app.core.redis_client import get_redis_client
 from app.models.objects.user import User as DBUser
@@ -37,6 +37,11 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    """async 엔드포인트용 AsyncSession. (동기 전용 provider는 `await db.run_sync(...)`로 같은 트랜잭션에서 호출)"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
 async def get_current_user(
     request: Request, 
     db: Session = Depends(get_db), 
@@ -1,6 +1,6 @@
 import logging
 from typing import List, Dict, Any, Tuple
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import UploadFile
 
 # --- Inter-Domain Providers (정보 징집 및 집행) ---
@@ -18,7 +18,7 @@ logger = logging.getLogger("BatchIngestionPolicy")
 class BatchIngestionPolicy:
     async def handle_batch(
         self, 
-        db: Session, 
+        db: AsyncSession, 
         *, 
         device_uuid: str, 
         telemetry_data: List[Dict[str, Any]], 
@@ -27,10 +27,11 @@ class BatchIngestionPolicy:
         """
         [Ares Aegis] 배치 통합 지휘 로직
         - 정보를 소집하고 심판의 판결을 받은 뒤, 각 엔진(Bulk/Queue)에 분배하고 장부를 기록합니다.
+        - AsyncSession: 장치 조회와 텔레메트리 벌크 업서트는 비동기로, 나머지 동기 provider는 run_sync로 같은 트랜잭션에서 수행합니다.
         """
         try:
             # 1. 정보 징집 (Data Gathering)
-            device = device_management_query_provider.get_device_by_uuid(db, current_uuid=device_uuid)
+            device = await device_management_query_provider.get_device_by_identifier_async(db, identifier=device_uuid)
 
             # 2. 판단 요청 (Validation)
             # 심판(Validator)에게 이 거대한 보따리를 받아도 될지 판결을 의뢰합니다.
@@ -45,11 +46,11 @@ class BatchIngestionPolicy:
 
             # 3. [중요] 배치 장부 개설 (Command)
             # 워커들이 보고할 수 있도록 Batch ID를 먼저 생성하고 DB에 등록합니다.
-            batch_id = batch_status_command_provider.register_new_batch(
-                db, 
+            batch_id = await db.run_sync(lambda sync_db: batch_status_command_provider.register_new_batch(
+                sync_db, 
                 device_id=device.id, 
                 total_count=len(image_files)
-            )
+            ))
 
             logger.info(f"🏰 [Batch Authorized] Device: {device_uuid} | Batch ID: {batch_id} | Processing...")
 
@@ -57,7 +58,7 @@ class BatchIngestionPolicy:
             # 8,000건의 데이터를 단 한 번의 SQL 쿼리로 격파합니다.
             inserted_count = 0
             if telemetry_data:
-                inserted_count = telemetry_command_provider.bulk_upsert_telemetry_data(
+                inserted_count = await telemetry_command_provider.bulk_upsert_telemetry_data_async(
                     db=db,
                     device_id=device.id,
                     telemetry_list=telemetry_data
@@ -75,18 +76,19 @@ class BatchIngestionPolicy:
                 }
                 
                 # 이미지 부서(Policy)의 입구로 전달하여 큐에 투척
-                success, _ = image_ingestion_policy.ingest(
-                    db=db,
+                file_data = await img.read()
+                success, _ = await db.run_sync(lambda sync_db: image_ingestion_policy.ingest(
+                    db=sync_db,
                     payload=img_payload,
-                    file_data=await img.read()
-                )
+                    file_data=file_data
+                ))
                 if success:
                     queued_images += 1
 
             # 6. 감사 로그 기록 (Audit)
             # 성문의 기록관에게 배치가 공식적으로 시작되었음을 남깁니다.
-            audit_command_provider.log(
-                db=db,
+            await db.run_sync(lambda sync_db: audit_command_provider.log(
+                db=sync_db,
                 event_type="BATCH_INGESTION_STARTED",
                 description=f"Batch {batch_id} started. Telemetry: {inserted_count}, Images: {queued_images}",
                 target_device=device,
@@ -95,11 +97,11 @@ class BatchIngestionPolicy:
                     "telemetry_count": inserted_count,
                     "image_count": queued_images
                 }
-            )
+            ))
 
             # 7. 최종 확정 (Commit)
             # 장부 개설 + 텔레메트리 저장 + 감사 로그를 단 하나의 트랜잭션으로 묶어 확정합니다.
-            db.commit() 
+            await db.commit()
 
             logger.info(f"✅ [Batch Success] Batch ID: {batch_id} | Telemetry: {inserted_count} | Images: {queued_images}")
 
@@ -112,7 +114,7 @@ class BatchIngestionPolicy:
 
         except Exception as e:
             # 하나라도 실패하면 장부 개설부터 텔레메트리까지 모두 없던 일로 돌립니다.
-            db.rollback()
+            await db.rollback()
             logger.error(f"🔥 [Batch Fatal] Distribution failed: {e}", exc_info=True)
             return False, str(e), {}
 
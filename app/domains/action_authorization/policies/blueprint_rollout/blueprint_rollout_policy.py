@@ -0,0 +1,83 @@
+import logging
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional
+
+from app.core.exceptions import NotFoundError, AppLogicError
+from app.models.objects.user import User
+
+# --- Inter-Domain Providers ---
+from app.domains.inter_domain.hardware_blueprint.hardware_blueprint_query_provider import hardware_blueprint_query_provider
+from app.domains.inter_domain.device_management.device_query_provider import device_management_query_provider
+from app.domains.inter_domain.device_component_management.device_component_command_provider import device_component_command_provider
+from app.domains.inter_domain.audit.audit_command_provider import audit_command_provider
+
+logger = logging.getLogger(__name__)
+
+class BlueprintRolloutPolicy:
+    """
+    [Fleet Rollout] 하드웨어 설계도의 핀 배선 레시피를 해당 설계도로 제작된 기기들에 일괄 재배포합니다.
+    기기별 고장 핀 우회를 적용하며, 전체 기기를 한 트랜잭션으로 처리해 일부만 바뀐 상태를 남기지 않습니다.
+    결과에는 처리 진행 상황(처리/전체 기기 수)과 우회할 핀이 없어 건너뛴 기기 ID가 담깁니다.
+    """
+
+    def rollout(
+        self, db: Session, *, actor_user: User, blueprint_id: int, device_ids: Optional[List[int]] = None
+    ) -> Dict[str, Any]:
+        try:
+            # 1. 설계도와 대상 기기 확인
+            if not hardware_blueprint_query_provider.get_blueprint_by_id(db, id=blueprint_id):
+                raise NotFoundError("HardwareBlueprint", f"ID {blueprint_id}")
+
+            target_ids = device_management_query_provider.get_device_ids_by_blueprint(
+                db, blueprint_id=blueprint_id, device_ids=device_ids
+            )
+            if device_ids is not None and len(target_ids) != len(set(device_ids)):
+                missing = sorted(set(device_ids) - set(target_ids))
+                raise AppLogicError(f"Devices {missing} are not active devices of blueprint {blueprint_id}.")
+            if not target_ids:
+                return {
+                    "status": "success", "blueprint_id": blueprint_id, "device_count": 0, "rewired_device_count": 0,
+                    "failed_device_ids": [], "processed_device_count": 0
+                }
+
+            # 2. 레시피와 우회용 핀 풀은 한 번만 읽어 모든 기기에 공유
+            recipe = hardware_blueprint_query_provider.get_blueprint_recipe(db, blueprint_id=blueprint_id)
+            pin_pool = hardware_blueprint_query_provider.get_valid_pin_pool(db, blueprint_id=blueprint_id)
+
+            progress = {"processed_device_count": 0}
+
+            def report(done: int, total: int) -> None:
+                progress["processed_device_count"] = done
+                logger.info(f"📦 Blueprint {blueprint_id} rollout: {done}/{total} devices processed")
+
+            # 3. 일괄 실체화 (Component Domain)
+            summary = device_component_command_provider.bulk_reinitialize_by_recipe(
+                db,
+                device_ids=target_ids,
+                recipe=recipe,
+                pin_pool=pin_pool,
+                actor_user=actor_user,
+                on_progress=report
+            )
+
+            # 4. 기록 및 확정 (일부 기기를 건너뛰었으면 partial)
+            result_status = "partial" if summary["failed_device_ids"] else "success"
+            if summary["failed_device_ids"]:
+                logger.warning(f"⚠️ Blueprint {blueprint_id} rollout skipped devices without spare pins: {summary['failed_device_ids']}")
+            audit_command_provider.log(
+                db=db,
+                event_type="BLUEPRINT_ROLLOUT_SUCCESS" if result_status == "success" else "BLUEPRINT_ROLLOUT_PARTIAL",
+                description=f"Blueprint {blueprint_id} recipe rolled out to {summary['rewired_device_count']}/{summary['device_count']} devices",
+                actor_user=actor_user,
+                details={"blueprint_id": blueprint_id, **summary}
+            )
+
+            db.commit()
+            return {"status": result_status, "blueprint_id": blueprint_id, **progress, **summary}
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"❌ Blueprint Rollout Failure: {str(e)}")
+            raise e
+
+blueprint_rollout_policy = BlueprintRolloutPolicy()
@@ -0,0 +1,120 @@
+import logging
+from datetime import datetime, timezone
+from sqlalchemy.orm import Session
+from typing import Any, Dict
+
+from app.core.config import settings
+from app.core.exceptions import NotFoundError, AppLogicError, ForbiddenError
+from app.dependencies import ActiveContext
+from app.models.events_logs.command_delivery import CommandDispatchStatus
+from app.domains.services.command_fanout.schemas.command_fanout_command import CommandFanoutRequest, CommandDispatchCreate
+from app.domains.services.command_fanout.schemas.command_fanout_query import CommandDispatchProgress
+
+# --- Inter-Domain Providers ---
+from app.domains.inter_domain.command_fanout.command_fanout_command_provider import command_fanout_command_provider
+from app.domains.inter_domain.command_fanout.command_fanout_query_provider import command_fanout_query_provider
+from app.domains.inter_domain.audit.audit_command_provider import audit_command_provider
+
+logger = logging.getLogger(__name__)
+
+class CommandFanoutPolicy:
+    """
+    [Fleet Command] 대상 집합(유닛/제품군/조직)의 기기 전체에 명령을 발행하는 팬아웃 작업을 생성/조회/취소합니다.
+    실제 발행은 리더 워커의 CommandFanoutEngine이 속도·in-flight 한도에 맞춰 수행합니다.
+    - 시스템 관리자가 아닌 컨텍스트에서는 현재 조직 소유 기기만 대상이 되며, 자신이 만든 작업만 조회/취소할 수 있습니다.
+    """
+
+    def create_dispatch(self, db: Session, *, active_context: ActiveContext, request: CommandFanoutRequest) -> Dict[str, Any]:
+        actor_user = active_context.user
+        try:
+            # 1. 대상 기기 확정 (조직 컨텍스트면 해당 조직 소유 기기로 한정)
+            owner_org_id = None if active_context.type == "SYSTEM_ADMINISTRATOR" else active_context.org_id
+            if active_context.type != "SYSTEM_ADMINISTRATOR" and owner_org_id is None:
+                raise ForbiddenError("Command fan-out requires an organization or system administrator context.")
+
+            device_ids = command_fanout_query_provider.get_target_device_ids(
+                db, target_type=request.target_type, target_id=request.target_id, owner_organization_id=owner_org_id
+            )
+            if not device_ids:
+                raise AppLogicError(f"No active devices found for {request.target_type.value} {request.target_id}.")
+
+            # 2. 발행 파라미터 (요청값을 서버 상한으로 제한)
+            rate = min(
+                request.rate_per_second or settings.COMMAND_FANOUT_DEFAULT_RATE_PER_SECOND,
+                settings.COMMAND_FANOUT_MAX_RATE_PER_SECOND
+            )
+            obj_in = CommandDispatchCreate(
+                target_type=request.target_type,
+                target_id=request.target_id,
+                action=request.action,
+                parameters=request.parameters,
+                rate_per_second=rate,
+                max_in_flight=request.max_in_flight or settings.COMMAND_FANOUT_DEFAULT_MAX_IN_FLIGHT,
+                ack_timeout_seconds=request.ack_timeout_seconds or settings.COMMAND_FANOUT_DEFAULT_ACK_TIMEOUT_SECONDS,
+                total_count=len(device_ids),
+                user_id=actor_user.id
+            )
+
+            # 3. 작업 + 기기별 전달 생성 (Command Fan-out Domain)
+            dispatch = command_fanout_command_provider.create_dispatch(db, obj_in=obj_in, device_ids=device_ids)
+
+            # 4. 기록 및 확정
+            audit_command_provider.log(
+                db=db,
+                event_type="COMMAND_FANOUT_CREATED",
+                description=f"Command fan-out {dispatch.id} ({request.action}) queued for {len(device_ids)} devices",
+                actor_user=actor_user,
+                details={
+                    "dispatch_id": dispatch.id,
+                    "target_type": request.target_type.value,
+                    "target_id": request.target_id,
+                    "action": request.action,
+                    "device_count": len(device_ids),
+                    "rate_per_second": obj_in.rate_per_second,
+                    "max_in_flight": obj_in.max_in_flight
+                }
+            )
+
+            db.commit()
+            return {"status": "queued", "dispatch_id": dispatch.id, "device_count": len(device_ids)}
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"❌ Command Fan-out Failure: {str(e)}")
+            raise e
+
+    def get_progress(self, db: Session, *, active_context: ActiveContext, dispatch_id: int) -> CommandDispatchProgress:
+        progress = command_fanout_query_provider.get_progress(db, dispatch_id=dispatch_id)
+        if not progress:
+            raise NotFoundError("CommandDispatch", dispatch_id)
+        self._ensure_access(active_context, progress)
+        return progress
+
+    def cancel_dispatch(self, db: Session, *, active_context: ActiveContext, dispatch_id: int) -> Dict[str, Any]:
+        """남은 QUEUED 전달의 발행을 멈춥니다. 이미 발행된 명령은 회수하지 않습니다."""
+        progress = self.get_progress(db, active_context=active_context, dispatch_id=dispatch_id)
+        if progress.status not in (CommandDispatchStatus.PENDING.value, CommandDispatchStatus.RUNNING.value):
+            raise AppLogicError(f"Command fan-out {dispatch_id} is already {progress.status}.")
+        try:
+            command_fanout_command_provider.mark_finished(
+                db, dispatch_id=dispatch_id, status=CommandDispatchStatus.CANCELLED, now=datetime.now(timezone.utc)
+            )
+            audit_command_provider.log(
+                db=db,
+                event_type="COMMAND_FANOUT_CANCELLED",
+                description=f"Command fan-out {dispatch_id} cancelled",
+                actor_user=active_context.user,
+                details={"dispatch_id": dispatch_id, "counts": progress.counts}
+            )
+            db.commit()
+            return {"status": "cancelled", "dispatch_id": dispatch_id}
+        except Exception as e:
+            db.rollback()
+            logger.error(f"❌ Command Fan-out Cancel Failure: {str(e)}")
+            raise e
+
+    def _ensure_access(self, active_context: ActiveContext, progress: CommandDispatchProgress) -> None:
+        if active_context.type != "SYSTEM_ADMINISTRATOR" and progress.user_id != active_context.user.id:
+            raise ForbiddenError("You can only access command fan-outs you created.")
+
+command_fanout_policy = CommandFanoutPolicy()
@@ -2,6 +2,7 @@ import logging
 import re
 from typing import Dict, Any, Optional, Tuple
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 # Inter-domain Provider들을 통해 각 도메인의 기능을 통합합니다.
@@ -22,35 +23,39 @@ STATIC_ACL_RULES = {
 }
 
 class EmqxAuthPolicy:
-    """EMQX의 인증/인가 웹훅 요청에 대한 최종 결정을 내리는 Policy입니다."""
+    """
+    EMQX의 인증/인가 웹훅 요청에 대한 최종 결정을 내리는 Policy입니다.
+    모든 MQTT 연결/구독마다 호출되는 핫패스이므로 AsyncSession을 사용합니다.
+    장치 조회는 비동기 provider로, 그 외 동기 전용 provider(사용자 조회, 감사 로그)는 run_sync로 같은 트랜잭션에서 호출합니다.
+    """
 
-    async def handle_auth(self, db: Session, *, username: Optional[str] = None, password: Optional[str] = None, client_id: Optional[str] = None) -> bool:
+    async def handle_auth(self, db: AsyncSession, *, username: Optional[str] = None, password: Optional[str] = None, client_id: Optional[str] = None) -> bool:
         """사용자(ID/PW) 또는 기기(mTLS) 인증 시나리오를 지휘합니다."""
         
         # 1. 사용자 인증 루트 (아이디와 비밀번호가 모두 제공된 경우)
         if username and password:
             logger.info(f"[Policy] Path A: User Password Auth flow for '{username}'.")
-            user = user_identity_query_provider.get_user_by_username(db, username=username)
+            user = await db.run_sync(lambda sync_db: user_identity_query_provider.get_user_by_username(sync_db, username=username))
             if not user:
-                audit_command_provider.log(
-                    db=db,
+                await db.run_sync(lambda sync_db: audit_command_provider.log(
+                    db=sync_db,
                     event_type="MQTT_AUTH_FAILED",
                     description=f"MQTT Auth failed: User '{username}' not found.",
                     actor_user=None,
                     details={"username_attempted": username}
-                )
-                db.commit()
+                ))
+                await db.commit()
                 return False
             
             # (비밀번호 검증이 필요하다면 여기서 Validator를 추가로 지휘할 수 있습니다)
-            audit_command_provider.log(
-                db=db,
+            await db.run_sync(lambda sync_db: audit_command_provider.log(
+                db=sync_db,
                 event_type="MQTT_AUTH_SUCCESS",
                 description=f"MQTT Auth successful for user '{username}'.",
                 actor_user=user,
                 details={"username": username}
-            )
-            db.commit()
+            ))
+            await db.commit()
             return True
 
         # 2. 기기 인증 루트 (mTLS 하이패스 - 패스워드 없이 client_id만 온 경우)
@@ -58,7 +63,7 @@ class EmqxAuthPolicy:
             logger.info(f"[Policy] Path B: Orchestrating mTLS Auth for device: {client_id}")
             
             # [Step 1: Data Supply] 쿼리 전문가에게 데이터를 가져오라고 시킵니다.
-            device = device_management_query_provider.get_device_by_identifier(db, identifier=client_id)
+            device = await device_management_query_provider.get_device_by_identifier_async(db, identifier=client_id)
             
             # [Step 2: Validation] 판단 전문가(Validator Provider)에게 '이 기기가 통과될 만한지' 묻습니다.
             # (우리가 방금 수정한 '판단 전용' 메서드를 사용합니다)
@@ -66,14 +71,14 @@ class EmqxAuthPolicy:
             
             if is_valid:
                 # [Step 3: Action] 성공 시 감사 로그 기록을 지시하고 최종 승인합니다.
-                audit_command_provider.log(
-                    db=db,
+                await db.run_sync(lambda sync_db: audit_command_provider.log(
+                    db=sync_db,
                     event_type="MQTT_DEVICE_AUTH_SUCCESS",
                     description=f"MQTT Device Auth successful for ID '{client_id}'.",
                     actor_user=None,
                     details={"client_id": client_id}
-                )
-                db.commit()
+                ))
+                await db.commit()
                 return True
             
             logger.warning(f"[Policy] Device Auth Rejected: {error_msg}")
@@ -81,7 +86,7 @@ class EmqxAuthPolicy:
         # 3. 모든 인증 루트 실패
         return False
 
-    async def handle_acl(self, db: Session, *, username: str, client_id: str, topic: str, access: str) -> bool:
+    async def handle_acl(self, db: AsyncSession, *, username: str, client_id: str, topic: str, access: str) -> bool:
         """토픽 접근 권한(ACL)을 계층적으로 검증합니다."""
         logger.info(f"[Policy] Checking ACL: client_id='{client_id}', user='{username}', topic='{topic}'")
 
@@ -99,13 +104,13 @@ class EmqxAuthPolicy:
         # 3. [동적 권한 검증] 장치 식별자 추출
         identifier = self._extract_identifier(topic)
         if not identifier:
-            self._log_acl_denied(db, username, topic, access, "Malformed topic path: No device identifier")
+            await self._log_acl_denied(db, username, topic, access, "Malformed topic path: No device identifier")
             return False
 
         # 4. [Data Supply] 장치 정보 조회
-        device = device_management_query_provider.get_device_by_identifier(db, identifier=identifier)
+        device = await device_management_query_provider.get_device_by_identifier_async(db, identifier=identifier)
         if not device:
-            self._log_acl_denied(db, username, topic, access, "Device not registered")
+            await self._log_acl_denied(db, username, topic, access, "Device not registered")
             return False
 
         # 5. [Business Logic] 소유권 검증 위임
@@ -116,18 +121,22 @@ class EmqxAuthPolicy:
             is_allowed = (identifier == client_id) 
             msg = "mTLS device self-access" if is_allowed else "Device ID mismatch"
         else:
-            is_allowed, msg = device_ownership_validator_provider.validate_access(
-                db, user_email=username, device=device, access=access
-            )
+            is_allowed, msg = await db.run_sync(lambda sync_db: device_ownership_validator_provider.validate_access(
+                sync_db, user_email=username, device=device, access=access
+            ))
 
         if is_allowed:
             return True
         
-        self._log_acl_denied(db, username, topic, access, msg, device_id=device.id)
+        await self._log_acl_denied(db, username, topic, access, msg, device_id=device.id)
         return False
     
-    def _log_acl_denied(self, db: Session, username: str, topic: str, access: str, reason: str, device_id: Optional[int] = None):
+    async def _log_acl_denied(self, db: AsyncSession, username: str, topic: str, access: str, reason: str, device_id: Optional[int] = None):
         """ACL 거부 로그 통합 관리"""
+        await db.run_sync(lambda sync_db: self._write_acl_denied(sync_db, username, topic, access, reason, device_id))
+        await db.commit()
+
+    def _write_acl_denied(self, db: Session, username: str, topic: str, access: str, reason: str, device_id: Optional[int]):
         user = user_identity_query_provider.get_user_by_username(db, username=username)
         audit_command_provider.log(
             db=db,
@@ -136,7 +145,6 @@ class EmqxAuthPolicy:
             actor_user=user,
             details={"username": username, "topic": topic, "reason": reason, "device_id": device_id}
         )
-        db.commit()
     
     def _extract_identifier(self, topic: str) -> Optional[str]:
         """토픽 경로에서 장치 식별자 추출"""
@@ -1,8 +1,10 @@
 import logging
 from sqlalchemy.orm import Session
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
+from app.core.config import settings
 from app.core.exceptions import NotFoundError, PermissionDeniedError
+from app.models.objects.user import User
 
 # 도메인 서비스 및 검증기 프로바이더
 # 1. 검증기
@@ -70,6 +72,55 @@ class FactoryEnrollmentPolicy:
             self._audit_failure(db, cpu_serial, client_ip, e)
             raise e
     
+    async def execute_bulk_factory_enrollment(
+        self, db: Session, *, client_ip: str, cpu_serials: List[str], trusted_ips: list[str], actor_user: Optional[User] = None,
+        lot_id: Optional[str] = None, target_unit_name: Optional[str] = None, auto_activate: bool = False,
+        reported_ip: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """[Bulk] 생산 로트 단위 기기 일괄 등록. 기기별 성공/실패를 모아 한 번에 커밋합니다."""
+        try:
+            validator = factory_enrollment_validator_provider.get_validator()
+            validator.validate_network_trust_or_raise(client_ip, trusted_ips)
+            validator.validate_lot_size_or_raise(len(cpu_serials), settings.FACTORY_BULK_ENROLL_MAX_SERIALS)
+
+            cmd_svc = device_management_command_provider.get_service()
+            result = await cmd_svc.execute_bulk_factory_enrollment(
+                db=db, cpu_serials=cpu_serials, target_unit_name=target_unit_name, auto_activate=auto_activate
+            )
+
+            for package in result["enrolled"]:
+                audit_command_provider.log(
+                    db=db,
+                    actor_user=actor_user,
+                    event_type="FACTORY_ENROLLMENT_SUCCESS",
+                    description=f"Identity and mTLS Credentials granted (lot {lot_id})",
+                    details={"device_id": package["device_id"], "lot_id": lot_id, "certificate_issued": True}
+                )
+            audit_command_provider.log(
+                db=db,
+                actor_user=actor_user,
+                event_type="FACTORY_BULK_ENROLLMENT_COMPLETED",
+                description=f"Lot {lot_id}: {len(result['enrolled'])} enrolled, {len(result['failed'])} failed",
+                details={
+                    "lot_id": lot_id,
+                    "client_ip": client_ip,
+                    "reported_ip": reported_ip,
+                    "enrolled": len(result["enrolled"]),
+                    "already_enrolled": result["already_enrolled"],
+                    "failed": [f["cpu_serial"] for f in result["failed"]],
+                },
+                log_level="WARNING" if result["failed"] else "INFO"
+            )
+
+            db.commit()
+            logger.info(f"✅ [Policy] Bulk enrollment COMMIT for lot {lot_id}: {len(result['enrolled'])} devices")
+            return {"lot_id": lot_id, **result}
+
+        except Exception as e:
+            db.rollback()
+            self._audit_failure(db, f"lot:{lot_id}", client_ip, e)
+            raise e
+
     def claim_unit(self, db: Session, token_value: str, claimer_user_id: int) -> Dict[str, Any]:
         """
         [User Scenario] QR 토큰을 사용하여 시스템 유닛의 소유권을 사용자에게 할당합니다.
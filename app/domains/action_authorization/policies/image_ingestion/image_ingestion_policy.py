@@ -3,10 +3,12 @@ import base64
 import os
 import json
 import redis
-from typing import Tuple, Optional, Dict, Any
+from typing import Tuple, Optional, Dict, Any, List
 from sqlalchemy.orm import Session
 from datetime import datetime
 
+from app.core.registry import app_registry
+
 # --- Inter-Domain Providers (정보 징집 및 집행) ---
 from app.domains.inter_domain.device_management.device_query_provider import device_management_query_provider
 from app.domains.inter_domain.image_registry.image_command_provider import image_command_provider
@@ -14,6 +16,11 @@ from app.domains.inter_domain.storage.storage_service_provider import storage_pr
 from app.domains.inter_domain.audit.audit_command_provider import audit_command_provider
 from app.domains.inter_domain.observation.observation_snapshot_command_provider import observation_snapshot_command_provider
 from app.domains.inter_domain.batch_tracker.batch_status_command_provider import batch_status_command_provider
+from app.domains.inter_domain.vision_feature.vision_feature_command_provider import vision_feature_command_provider
+from app.domains.inter_domain.vision_feature.vision_feature_query_provider import vision_feature_query_provider
+from app.domains.services.vision_feature.schemas.vision_feature_command import VisionFeatureCreate
+from app.domains.services.observation.schemas.observation_snapshot_command import ObservationSnapshotCreate
+from app.domains.services.image_registry.schemas.image_registry_command import ImageRegistryCreate
 
 # --- Validator Provider (판단 요청 창구) ---
 from app.domains.inter_domain.validators.image_ingestion.image_ingestion_validator_provider import image_ingestion_validator_provider
@@ -24,7 +31,10 @@ logger = logging.getLogger(__name__)
 REDIS_URL = "redis://localhost:6379/0"
 IMAGE_QUEUE_NAME = "ares4_image_jobs"
 LANDING_ZONE_PATH = "/tmp/ares4_landing_zone"
-redis_client = redis.from_url(REDIS_URL)
+# 이미지 작업 큐 클라이언트 (첫 투척 시 생성)
+redis_client = app_registry.register(
+    "image_queue_redis", lambda: redis.from_url(REDIS_URL), close=lambda client: client.close()
+)
 
 class ImageIngestionPolicy:
     def ingest(self, db: Session, *, topic: str = None, payload: Dict, file_data: Optional[bytes] = None) -> Tuple[bool, Optional[str]]:
@@ -82,64 +92,142 @@ class ImageIngestionPolicy:
         """
         [Step 2: Process] 워커 전용 실행 로직
         - 워커 스크립트가 호출하며, 실제 물리/DB 저장 및 장부 업데이트를 완료합니다.
+        - 1건짜리 묶음으로 process_async_jobs와 같은 경로를 탑니다.
         """
-        try:
-            # 1. 실행 준비
-            device = device_management_query_provider.get_device_by_uuid(db, current_uuid=device_uuid)
-            if not device: return False, "Device not found during async processing."
+        job = {"device_uuid": device_uuid, "temp_file_path": temp_file_path, "payload": payload}
+        return self.process_async_jobs(db, jobs=[job])[0]
 
-            with open(temp_file_path, "rb") as f:
-                image_bytes = f.read()
+    def process_async_jobs(self, db: Session, *, jobs: List[Dict]) -> List[Tuple[bool, Optional[str]]]:
+        """
+        [Step 2: Process] 워커 전용 묶음 실행 로직
+        - 큐에서 함께 꺼낸 작업들을 각각 업로드한 뒤, 스냅샷/이미지/특징값/감사 로그를 한 트랜잭션으로 기록합니다.
+        - 묶음 기록이 실패하면 업로드를 다시 하지 않고 기록만 한 건씩 재시도해, 문제 있는 작업이 나머지를 막지 않게 합니다.
+        - 결과는 jobs와 같은 순서의 (성공 여부, 오류) 목록입니다.
+        """
+        results: List[Tuple[bool, Optional[str]]] = [(False, "Not processed.")] * len(jobs)
+        prepared: List[Tuple[int, Any, str, Dict]] = []  # (작업 순번, 기기, 업로드 경로, 페이로드)
+        devices: Dict[str, Any] = {}
+
+        for index, job in enumerate(jobs):
+            try:
+                # 1. 실행 준비 (같은 기기의 작업은 한 번만 조회)
+                device_uuid = job["device_uuid"]
+                if device_uuid not in devices:
+                    devices[device_uuid] = device_management_query_provider.get_device_by_uuid(db, current_uuid=device_uuid)
+                device = devices[device_uuid]
+                if not device:
+                    results[index] = (False, "Device not found during async processing.")
+                    continue
+
+                with open(job["temp_file_path"], "rb") as f:
+                    image_bytes = f.read()
+
+                # 2. 물리 저장 (S3 등)
+                uploaded_path = storage_provider.upload_image(image_bytes, device_uuid)
+                prepared.append((index, device, uploaded_path, job.get("payload") or {}))
+            except Exception as e:
+                logger.error(f"❌ [Async Process Error] {e}", exc_info=True)
+                results[index] = (False, str(e))
+
+        if not prepared:
+            return results
 
-            # 2. 물리 저장 (S3 등)
-            uploaded_path = storage_provider.upload_image(image_bytes, device_uuid)
-            
-            # 3. 스냅샷 확보
-            snapshot = observation_snapshot_command_provider.get_or_create_snapshot(
-                db=db,
+        try:
+            self._record_jobs(db, prepared, results)
+        except Exception as e:
+            db.rollback()
+            if len(prepared) == 1:
+                logger.error(f"❌ [Async Process Error] {e}", exc_info=True)
+                results[prepared[0][0]] = (False, str(e))
+                return results
+            logger.warning(f"⚠️ [Async Batch] Recording {len(prepared)} images failed, retrying one by one: {e}")
+            for item in prepared:
+                try:
+                    self._record_jobs(db, [item], results)
+                except Exception as item_error:
+                    logger.error(f"❌ [Async Process Error] {item_error}", exc_info=True)
+                    db.rollback()
+                    results[item[0]] = (False, str(item_error))
+
+        # 7. 성공 시에만 임시 파일 삭제
+        for index, job in enumerate(jobs):
+            if results[index][0] and os.path.exists(job["temp_file_path"]):
+                os.remove(job["temp_file_path"])
+        return results
+
+    def _record_jobs(self, db: Session, prepared: List[Tuple[int, Any, str, Dict]], results: List[Tuple[bool, Optional[str]]]) -> None:
+        """업로드를 마친 작업 묶음을 한 트랜잭션으로 기록하고 커밋합니다. 실패 시 예외를 그대로 올립니다. (롤백은 호출자)"""
+        # 3. 스냅샷 확보 (ON CONFLICT DO NOTHING, 여러 카메라가 같은 스냅샷을 보내도 충돌 없이 1행)
+        observation_snapshot_command_provider.ensure_snapshots(db, snapshots=[
+            ObservationSnapshotCreate(id=payload.get("snapshot_id"), system_unit_id=device.system_unit_id, observation_type="IMAGE")
+            for _, device, _, payload in prepared
+        ])
+
+        # 4. 이미지 레코드 생성 (다중 행 INSERT, 입력 순서대로 id)
+        image_ids = image_command_provider.create_image_records(db, records=[
+            ImageRegistryCreate(
                 snapshot_id=payload.get("snapshot_id"),
+                device_id=device.id,
                 system_unit_id=device.system_unit_id,
-                observation_type="IMAGE"
+                storage_path=uploaded_path,
+                image_metadata={k: v for k, v in payload.items() if k != "vision_features"}
             )
+            for _, device, uploaded_path, payload in prepared
+        ])
 
-            # 4. 이미지 레코드 생성
-            image_command_provider.create_image_record(
-                db=db,
-                snapshot_id=snapshot.id,
+        # 4-1. 엣지에서 추출해 함께 보낸 시각 특징값(임베딩 등) 저장
+        features = vision_feature_command_provider.create_features(db, obj_in_list=[
+            VisionFeatureCreate(
+                image_id=image_id,
+                snapshot_id=payload.get("snapshot_id"),
+                system_unit_id=device.system_unit_id,
                 device_id=device.id,
-                file_path=uploaded_path,
-                metadata=payload
+                vector_data=f.get("vector_data") or {k: v for k, v in f.items() if k != "model_version"},
+                model_version=f["model_version"],
             )
-
-            # 5. [추가] 배치 상태 장부 업데이트
-            # 워커가 일을 하나 끝냈으므로 장부에 기록하여 진행률을 올립니다.
-            batch_id = payload.get("batch_id")
-            if batch_id:
-                batch_status_command_provider.mark_item_processed(db, batch_id=batch_id)
-
-            # 6. 기기 상태 업데이트 및 감사 로그 기록
-            device.last_seen_at = datetime.now()
+            for (_, device, _, payload), image_id in zip(prepared, image_ids)
+            for f in payload.get("vision_features") or [] if f.get("model_version")
+        ])
+
+        # 5. 기기 상태 업데이트 및 감사 로그 기록
+        now = datetime.now()
+        for _, device, uploaded_path, payload in prepared:
+            device.last_seen_at = now
             audit_command_provider.log(
                 db=db,
                 event_type="IMAGE_INGESTED",
-                description=f"Async Ingested for Device: {device_uuid}",
+                description=f"Async Ingested for Device: {device.current_uuid}",
                 target_device=device,
                 details={"snapshot_id": payload.get("snapshot_id"), "file_path": uploaded_path}
             )
-            
-            # 7. 최종 트랜잭션 확정 (Snapshot + Image + BatchCount + Audit)
-            db.commit() 
 
-            # 8. 성공 시에만 임시 파일 삭제
-            if os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
+        # 커밋 시 ORM 객체가 만료되므로 색인에 넣을 값은 미리 떠 둡니다.
+        index_rows = [(f.id, f.system_unit_id, f.model_version, f.vector_data) for f in features]
 
-            return True, None
+        # 6. 최종 트랜잭션 확정 (Snapshot + Image + Features + Audit)
+        db.commit()
+        for index, _, _, _ in prepared:
+            results[index] = (True, None)
 
-        except Exception as e:
-            logger.error(f"❌ [Async Process Error] {e}", exc_info=True)
-            db.rollback()
-            return False, str(e)
+        # 6-1. [배치 장부] 워커가 일을 끝낸 만큼 진행률을 올립니다.
+        # 카운터는 트랜잭션 밖(Redis)에 있으므로 커밋된 뒤에만 셉니다. (롤백된 작업이 삭제 허가에 잡히지 않도록)
+        for _, _, _, payload in prepared:
+            batch_id = payload.get("batch_id")
+            if batch_id:
+                try:
+                    batch_status_command_provider.mark_item_processed(db, batch_id=batch_id)
+                    db.commit()  # 카운터가 없는 배치의 DB 경로 갱신분
+                except Exception as e:
+                    # 세지 못한 배치는 완료되지 않으므로 원본 삭제도 허가되지 않습니다. (안전한 쪽)
+                    logger.error(f"❌ [Batch Tracker] Failed to record progress for batch {batch_id}: {e}")
+                    db.rollback()
+
+        # 6-2. 커밋된 특징값만 벡터 색인에 증분 추가 (실패해도 다음 검색 시 DB에서 따라잡습니다)
+        if index_rows:
+            try:
+                vision_feature_query_provider.append_to_index(index_rows)
+            except Exception as e:
+                logger.warning(f"⚠️ [Vector Index] Append deferred to next sync: {e}")
 
     def _decode_image(self, raw_data: Any) -> Optional[bytes]:
         """Base64/바이너리 통합 디코딩 헬퍼"""
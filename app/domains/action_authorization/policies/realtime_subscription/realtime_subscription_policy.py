@@ -0,0 +1,76 @@
+import logging
+import uuid
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.models.objects.user import User
+
+# --- Inter-Domain Providers ---
+from app.domains.inter_domain.realtime.realtime_ticket_provider import realtime_ticket_provider
+from app.domains.inter_domain.user_identity.user_identity_query_provider import user_identity_query_provider
+from app.domains.inter_domain.device_management.device_query_provider import device_management_query_provider
+from app.domains.inter_domain.validators.device_ownership.provider import device_ownership_validator_provider
+
+logger = logging.getLogger(__name__)
+
+class RealtimeSubscriptionPolicy:
+    """
+    [Realtime Gateway] WebSocket 접속(티켓)과 기기 상태 구독에 대한 인가를 결정합니다.
+    구독 가능 여부는 MQTT ACL과 같은 소유권 판단(DeviceOwnershipValidator, 'subscribe' 접근)을 따릅니다.
+    """
+
+    def issue_ticket(self, *, actor_user: User) -> Dict[str, Any]:
+        ticket = realtime_ticket_provider.issue(user_id=actor_user.id, email=actor_user.email)
+        return {"ticket": ticket, "expires_in": settings.REALTIME_WS_TICKET_TTL_SECONDS}
+
+    def redeem_ticket(self, db: Session, *, ticket: str) -> Optional[User]:
+        """티켓을 소모하고 사용자를 반환합니다. 유효하지 않거나 비활성 사용자면 None."""
+        identity = realtime_ticket_provider.redeem(ticket)
+        if not identity:
+            return None
+        user = user_identity_query_provider.get_user_by_id(db, user_id=identity["user_id"])
+        if not user or not user.is_active:
+            return None
+        return user
+
+    def authorize_devices(self, db: Session, *, user_id: int, device_uuids: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        구독을 요청한(또는 이미 구독 중인) 기기 UUID를 (허용, 거부)로 나눕니다.
+        WebSocket은 오래 유지되므로 호출마다 사용자를 다시 읽어 그 사이 바뀐 역할/비활성화를 반영합니다.
+        (엔드포인트가 구독 시점과 REALTIME_REAUTHORIZE_INTERVAL_SECONDS마다 다시 호출해 회수된 기기를 뺍니다)
+        """
+        actor_user = user_identity_query_provider.get_user_by_id(db, user_id=user_id)
+        if not actor_user or not actor_user.is_active:
+            return [], [str(device_uuid) for device_uuid in device_uuids]
+
+        denied: List[str] = []
+        requested: Dict[str, uuid.UUID] = {}
+        for device_uuid in dict.fromkeys(device_uuids):
+            try:
+                parsed = uuid.UUID(str(device_uuid))
+            except ValueError:
+                denied.append(str(device_uuid))
+                continue
+            requested.setdefault(str(parsed), parsed)
+
+        # 기기 조회는 요청 수와 무관하게 IN 쿼리 1회
+        found = {
+            str(device.current_uuid): device
+            for device in device_management_query_provider.get_devices_by_uuids(db, current_uuids=list(requested.values()))
+        }
+        candidates = [device_uuid for device_uuid in requested if device_uuid in found]
+        denied.extend(device_uuid for device_uuid in requested if device_uuid not in found)
+
+        allowed = []
+        results = device_ownership_validator_provider.validate_access_many(
+            user=actor_user, devices=[found[device_uuid] for device_uuid in candidates], access="subscribe"
+        )
+        for device_uuid, (is_allowed, _) in zip(candidates, results):
+            (allowed if is_allowed else denied).append(device_uuid)
+
+        if denied:
+            logger.info(f"🔒 Realtime subscription denied for user {actor_user.id}: {len(denied)} devices")
+        return allowed, denied
+
+realtime_subscription_policy = RealtimeSubscriptionPolicy()
@@ -14,6 +14,7 @@ from app.domains.inter_domain.validators.cluster_authority.cluster_membership_va
 from app.domains.inter_domain.validators.hmac_integrity.provider import hmac_integrity_validator_provider
 from app.domains.inter_domain.telemetry.telemetry_command_provider import telemetry_command_provider
 from app.domains.inter_domain.device_management.device_command_provider import device_management_command_provider
+from app.domains.inter_domain.trigger_rule.trigger_engine_provider import trigger_engine_provider
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +23,10 @@ class TelemetryIngestionPolicy:
     [The Orchestrator] 텔레메트리 수신 정책:
     각 도메인 서비스와 검증기를 지휘하여 클러스터 데이터를 안전하게 수신합니다.
     """
-    def ingest(self, db: Session, *, device_uuid_str: str, topic: str, payload: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    def ingest(
+        self, db: Session, *, device_uuid_str: str, topic: str, payload: Dict[str, Any],
+        raw_payload: Optional[bytes] = None, signature: Optional[str] = None
+    ) -> Tuple[bool, Optional[str]]:
         try:
             # 1. [Query Service] 문맥 확보 (조회는 Query의 권한)
             master_device: Optional["Device"] = device_internal_query_provider.get_device_with_secret_by_uuid(db, UUID(device_uuid_str))
@@ -34,7 +38,9 @@ class TelemetryIngestionPolicy:
             if not is_valid: return False, err
 
             # 2-2. HMAC 무결성 검증
-            is_valid, err = hmac_integrity_validator_provider.validate(db=db, device=master_device, payload=payload)
+            is_valid, err = hmac_integrity_validator_provider.validate(
+                db=db, device=master_device, payload=payload, raw_payload=raw_payload, signature=signature
+            )
             if not is_valid: return False, err
 
             # 2-3. 클러스터 멤버십 검증
@@ -45,7 +51,7 @@ class TelemetryIngestionPolicy:
 
             # 3. [Command Service] 작업 하달 (수정/저장은 Command의 권한)
             # 데이터 파쇄(Shredding) 및 DB 저장은 Command Service 내부에서 수행됩니다.
-            telemetry_command_provider.process_cluster_batch_ingestion(
+            created_rows = telemetry_command_provider.process_cluster_batch_ingestion(
                 db=db,
                 system_unit=system_unit,
                 payload=payload
@@ -54,7 +60,13 @@ class TelemetryIngestionPolicy:
             # 4. [Command Service] 상태 업데이트
             device_management_command_provider.update_last_seen_at(db, master_device.id)
 
+            # 5. [Trigger Engine] 방금 저장된 메트릭의 평가 입력 (커밋하면 행이 만료되므로 먼저 만들어 둡니다)
+            trigger_input = trigger_engine_provider.build_telemetry_input(system_unit_id=system_unit.id, telemetry_rows=created_rows)
+
             db.commit()
+
+            # 6. 커밋된 데이터만 리더의 트리거 엔진으로 넘깁니다. (평가/발행은 엔진이 별도 트랜잭션으로 수행)
+            trigger_engine_provider.submit(trigger_input)
             return True, None
 
         except Exception as e:
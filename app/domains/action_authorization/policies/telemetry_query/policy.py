@@ -1,14 +1,19 @@
 import logging
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 
 from app.models.objects.user import User
-from app.core.exceptions import AccessDeniedError
+from app.core.exceptions import AccessDeniedError, ValidationError
+from app.database import ReplicaSessionLocal
 from app.domains.inter_domain.system_unit_assignment.system_unit_assignment_query_provider import system_unit_assignment_query_provider
 from app.domains.inter_domain.telemetry.telemetry_query_provider import telemetry_query_provider
 from app.domains.inter_domain.permissions.permission_query_provider import permission_query_provider
-from app.domains.services.telemetry.schemas.telemetry_query import TelemetryFilter
+from app.domains.services.telemetry.schemas.telemetry_query import (
+    TelemetryFilter, TelemetryExportFilter, TelemetryLatestFilter, TelemetrySeriesRead,
+)
+from app.models.events_logs.device_metric_latest import DeviceMetricLatest
 from app.models.events_logs.telemetry_data import TelemetryData
 
 logger = logging.getLogger(__name__)
@@ -33,42 +38,169 @@ class TelemetryQueryPolicy:
         """
         권한 및 역할 기반 텔레메트리 조회 오케스트레이션.
         """
-        # 1. [RBAC 체크] 현재 활성화된 Role이 'telemetry:read_all' 권한을 가졌는지 확인
-        # (시딩 스크립트 ESSENTIAL_PERMISSIONS에 정의된 키를 직접 사용)
-        is_privileged_role = permission_query_provider.check_role_has_permission(
-            db, role_id=active_role_id, permission_name="telemetry:read_all"
+        allowed, possession_start, possession_end = self._resolve_possession_window(
+            db, actor_user=actor_user, filters=filters, active_role_id=active_role_id
         )
+        if not allowed:
+            return []
 
-        possession_start = None
-        possession_end = None
+        # 3. Telemetry Provider 호출
+        # possession 정보가 있으면 필터링이 수행되고, None(관리자 권한)이면 전체 조회가 수행됩니다.
+        return telemetry_query_provider.get_telemetry_data(
+            db=db,
+            filters=filters,
+            possession_start=possession_start,
+            possession_end=possession_end
+        )
 
-        # 2. 전역 권한이 없는 일반 Role일 경우: 시나리오 A(기간 격리) 적용
-        if not is_privileged_role:
-            if not filters.system_unit_ids:
-                raise AccessDeniedError("일반 사용자는 조회할 시스템 유닛 ID를 명시해야 합니다.")
+    async def fetch_telemetry_data_async(
+        self,
+        db: AsyncSession,
+        *,
+        actor_user: User,
+        filters: TelemetryFilter,
+        active_role_id: int
+    ) -> List[TelemetryData]:
+        """[Async] fetch_telemetry_data의 AsyncSession 버전입니다."""
+        allowed, possession_start, possession_end = await self._resolve_possession_window_async(
+            db, actor_user=actor_user, filters=filters, active_role_id=active_role_id
+        )
+        if not allowed:
+            return []
 
-            unit_id = filters.system_unit_ids[0]
-            
-            # 해당 유저가 이 유닛을 소유했던 기록을 가져옴
-            assignment = system_unit_assignment_query_provider.get_assignment_period(
-                db, unit_id=unit_id, user_id=actor_user.id
-            )
+        return await telemetry_query_provider.get_telemetry_data_async(
+            db=db,
+            filters=filters,
+            possession_start=possession_start,
+            possession_end=possession_end
+        )
 
-            if not assignment:
-                logger.warning(f"Access Denied: User {actor_user.id} -> Unit {unit_id}")
-                return [] 
+    def fetch_telemetry_series(
+        self,
+        db: Session,
+        *,
+        actor_user: User,
+        filters: TelemetryFilter,
+        active_role_id: int
+    ) -> TelemetrySeriesRead:
+        """
+        차트용 시계열 조회. 원본 조회와 동일한 기간 격리를 적용한 뒤 해상도 플래너에 위임합니다.
+        """
+        allowed, possession_start, possession_end = self._resolve_possession_window(
+            db, actor_user=actor_user, filters=filters, active_role_id=active_role_id
+        )
+        if not allowed:
+            return TelemetrySeriesRead(resolution=filters.resolution or "auto", bucket_seconds=0)
+
+        return telemetry_query_provider.get_telemetry_series(
+            db=db,
+            filters=filters,
+            possession_start=possession_start,
+            possession_end=possession_end
+        )
 
-            # 소유 시작 시점과 종료 시점(unassigned_at)을 확보하여 필터로 사용
-            possession_start = assignment.created_at
-            possession_end = assignment.unassigned_at
+    def fetch_latest_values(
+        self,
+        db: Session,
+        *,
+        actor_user: User,
+        filters: TelemetryLatestFilter,
+        active_role_id: int
+    ) -> List[DeviceMetricLatest]:
+        """유닛 현재 상태(항목별 최신값) 조회. 원본 조회와 동일한 기간 격리를 적용합니다."""
+        allowed, possession_start, possession_end = self._resolve_possession_window(
+            db, actor_user=actor_user, filters=filters, active_role_id=active_role_id
+        )
+        if not allowed:
+            return []
 
-        # 3. Telemetry Provider 호출
-        # possession 정보가 있으면 필터링이 수행되고, None(관리자 권한)이면 전체 조회가 수행됩니다.
-        return telemetry_query_provider.get_telemetry_data(
+        return telemetry_query_provider.get_latest_values(
             db=db,
             filters=filters,
             possession_start=possession_start,
             possession_end=possession_end
         )
 
+    def export_telemetry(
+        self,
+        db: Session,
+        *,
+        actor_user: User,
+        filters: TelemetryExportFilter,
+        active_role_id: int
+    ) -> Iterator[bytes]:
+        """
+        스트리밍 내보내기. 권한/소유 기간 판단은 요청 세션(db)으로 즉시 수행하고,
+        실제 행 스트리밍은 응답 전송 동안 유지되는 전용 읽기 세션(복제본 우선)에서 수행합니다.
+        (요청 세션은 응답 본문이 전송되기 전에 닫힐 수 있기 때문입니다.)
+        """
+        if (filters.after_captured_at is None) != (filters.after_id is None):
+            raise ValidationError("after_captured_at과 after_id는 함께 지정해야 합니다.")
+
+        allowed, possession_start, possession_end = self._resolve_possession_window(
+            db, actor_user=actor_user, filters=filters, active_role_id=active_role_id
+        )
+        if not allowed:
+            # 빈 결과도 형식에 맞는 문서(CSV 헤더, 빈 Arrow 스트림)로 응답합니다.
+            filters = filters.model_copy(update={"max_rows": 0})
+
+        def stream() -> Iterator[bytes]:
+            export_db = ReplicaSessionLocal()
+            try:
+                yield from telemetry_query_provider.export_telemetry(
+                    db=export_db,
+                    filters=filters,
+                    possession_start=possession_start,
+                    possession_end=possession_end
+                )
+            finally:
+                export_db.close()
+
+        return stream()
+
+    def _resolve_possession_window(
+        self, db: Session, *, actor_user: User, filters: Union[TelemetryFilter, TelemetryExportFilter, TelemetryLatestFilter], active_role_id: int
+    ) -> Tuple[bool, Optional[datetime], Optional[datetime]]:
+        """(조회 허용 여부, 소유 시작, 소유 종료)를 반환합니다. 관리자 권한이면 기간 제한이 없습니다."""
+        # 1. [RBAC 체크] 현재 활성화된 Role이 'telemetry:read_all' 권한을 가졌는지 확인
+        # (시딩 스크립트 ESSENTIAL_PERMISSIONS에 정의된 키를 직접 사용)
+        is_privileged_role = permission_query_provider.check_role_has_permission(
+            db, role_id=active_role_id, permission_name="telemetry:read_all"
+        )
+        if is_privileged_role:
+            return True, None, None
+        return self._assignment_window(db, actor_user=actor_user, filters=filters)
+
+    def _assignment_window(
+        self, db: Session, *, actor_user: User, filters: Union[TelemetryFilter, TelemetryExportFilter, TelemetryLatestFilter]
+    ) -> Tuple[bool, Optional[datetime], Optional[datetime]]:
+        # 2. 전역 권한이 없는 일반 Role일 경우: 시나리오 A(기간 격리) 적용
+        if not filters.system_unit_ids:
+            raise AccessDeniedError("일반 사용자는 조회할 시스템 유닛 ID를 명시해야 합니다.")
+
+        unit_id = filters.system_unit_ids[0]
+
+        # 해당 유저가 이 유닛을 소유했던 기록을 가져옴
+        assignment = system_unit_assignment_query_provider.get_assignment_period(
+            db, unit_id=unit_id, user_id=actor_user.id
+        )
+
+        if not assignment:
+            logger.warning(f"Access Denied: User {actor_user.id} -> Unit {unit_id}")
+            return False, None, None
+
+        # 소유 시작 시점과 종료 시점(unassigned_at)을 확보하여 필터로 사용
+        return True, assignment.created_at, assignment.unassigned_at
+
+    async def _resolve_possession_window_async(
+        self, db: AsyncSession, *, actor_user: User, filters: TelemetryFilter, active_role_id: int
+    ) -> Tuple[bool, Optional[datetime], Optional[datetime]]:
+        """[Async] _resolve_possession_window와 같은 판단. 권한 확인은 비동기 조회로 바로 끝내고, 소유 기간은 동기 provider를 재사용합니다."""
+        is_privileged_role = await permission_query_provider.check_role_has_permission_async(
+            db, role_id=active_role_id, permission_name="telemetry:read_all"
+        )
+        if is_privileged_role:
+            return True, None, None
+        return await db.run_sync(lambda sync_db: self._assignment_window(sync_db, actor_user=actor_user, filters=filters))
+
 telemetry_query_policy = TelemetryQueryPolicy()
\ No newline at end of file
@@ -0,0 +1,48 @@
+import logging
+from datetime import datetime
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
+
+from app.core.exceptions import AccessDeniedError
+from app.dependencies import ActiveContext
+from app.domains.inter_domain.permissions.permission_query_provider import permission_query_provider
+from app.domains.inter_domain.system_unit_assignment.system_unit_assignment_query_provider import system_unit_assignment_query_provider
+from app.domains.inter_domain.vision_feature.vision_feature_query_provider import vision_feature_query_provider
+from app.domains.services.vision_feature.schemas.vision_feature_query import VisionSimilarityQuery, SimilarFeatureRead
+
+logger = logging.getLogger(__name__)
+
+class VisionQueryPolicy:
+    """
+    [Vision Similarity] 유사 특징 검색의 조회 범위를 결정합니다. 텔레메트리 조회와 같은 기준을 따릅니다.
+    1. 시스템 관리자 컨텍스트 또는 'telemetry:read_all' 권한 보유: 모든 유닛에서 검색
+    2. 일반 사용자: 현재 할당된 시스템 유닛만 검색 가능하며, 기준 특징(feature_id)도 그 유닛의 것이어야 합니다.
+       결과와 기준 특징은 유닛별 소유 기간(assigned_at ~ unassigned_at)에 생성된 것으로 한정됩니다.
+    """
+    def search_similar(self, db: Session, *, active_context: ActiveContext, query: VisionSimilarityQuery) -> List[SimilarFeatureRead]:
+        actor_user = active_context.user
+        is_privileged_role = active_context.type == "SYSTEM_ADMINISTRATOR" or "telemetry:read_all" in (
+            permission_query_provider.get_permissions_for_user_in_context(db, user_id=actor_user.id, organization_id=active_context.org_id)
+        )
+        possession_windows: Optional[Dict[int, Tuple[datetime, Optional[datetime]]]] = None
+        if not is_privileged_role:
+            if not query.system_unit_ids:
+                raise AccessDeniedError("일반 사용자는 검색할 시스템 유닛 ID를 명시해야 합니다.")
+            for unit_id in set(query.system_unit_ids):
+                if not system_unit_assignment_query_provider.is_user_assigned_to_unit(db, user_id=actor_user.id, unit_id=unit_id):
+                    logger.warning(f"Access Denied: User {actor_user.id} -> Unit {unit_id} (vision similarity)")
+                    raise AccessDeniedError()
+            if query.feature_id is not None:
+                unit_id = vision_feature_query_provider.get_feature_unit_id(db, feature_id=query.feature_id)
+                if unit_id not in query.system_unit_ids:
+                    raise AccessDeniedError("기준 특징값이 검색 대상 유닛에 속하지 않습니다.")
+            possession_windows = {}
+            for unit_id in set(query.system_unit_ids):
+                assignment = system_unit_assignment_query_provider.get_assignment_period(db, unit_id=unit_id, user_id=actor_user.id)
+                if not assignment:
+                    raise AccessDeniedError()
+                possession_windows[unit_id] = (assignment.created_at, assignment.unassigned_at)
+
+        return vision_feature_query_provider.search_similar(db, query=query, possession_windows=possession_windows)
+
+vision_query_policy = VisionQueryPolicy()
@@ -26,6 +26,13 @@ class FactoryEnrollmentValidator:
         if not self.validate_network_trust(client_ip, trusted_ips):
             raise AuthenticationError(f"Untrusted network access from {client_ip}")
 
+    def validate_lot_size_or_raise(self, serial_count: int, max_serials: int):
+        """일괄 등록 요청의 시리얼 수가 1 이상, 상한 이하인지 확인합니다."""
+        if serial_count < 1:
+            raise ValidationError("At least one cpu_serial is required.")
+        if serial_count > max_serials:
+            raise ValidationError(f"Too many serials in one lot: {serial_count} > {max_serials}")
+
     # --- 2. [Existing] 기기 및 패키지 검증 ---
 
     def validate_device_availability(self, device_exists: bool) -> bool:
@@ -2,26 +2,65 @@ import logging
 import json
 import hmac
 import hashlib
+import threading
+from collections import OrderedDict
 from sqlalchemy.orm import Session
 from typing import Tuple, Optional
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+class _PreparedKeyCache:
+    """
+    장치별로 키를 넣어 둔 hmac 객체 캐시 (LRU).
+    검증마다 시크릿을 인코딩하고 키 패딩을 다시 계산하는 대신 준비된 객체를 copy()해서 씁니다.
+    시크릿이 바뀌면(재발급/자동 등록) 캐시 항목을 새로 만듭니다.
+    """
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, Tuple[str, hmac.HMAC]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, device_id: int, secret: str) -> hmac.HMAC:
+        with self._lock:
+            entry = self._entries.get(device_id)
+            if entry and entry[0] == secret:
+                self._entries.move_to_end(device_id)
+                return entry[1]
+
+        prepared = hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+        with self._lock:
+            self._entries[device_id] = (secret, prepared)
+            self._entries.move_to_end(device_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return prepared
+
 class HmacIntegrityValidator:
     """
-    메시지의 무결성을 검증합니다. 
-    라즈베리파이 클라이언트의 json.dumps 규격과 완벽히 일치하도록 설정되었습니다.
+    메시지의 무결성을 검증합니다. 두 가지 모드를 지원합니다.
+    - Raw 모드: 장치가 보낸 바이트 그대로에 서명하고 서명은 MQTT5 User-Property(hmac)로 전달합니다.
+      서버는 수신한 원문 바이트를 그대로 HMAC하므로 파싱/재직렬화가 없습니다.
+    - Canonical-JSON 모드(구형 펌웨어): payload["hmac"]을 제외한 나머지를
+      라즈베리파이 클라이언트의 json.dumps 규격으로 재직렬화하여 검증합니다.
     """
+    def __init__(self):
+        self._keys = _PreparedKeyCache(settings.HMAC_KEY_CACHE_SIZE)
+
     def validate(
         self,
         db: Session,
         *,
         device: any, 
-        payload: dict
+        payload: dict,
+        raw_payload: Optional[bytes] = None,
+        signature: Optional[str] = None
     ) -> Tuple[bool, Optional[str]]:
         
-        # 1. 페이로드에서 클라이언트가 보낸 서명 추출
-        hmac_signature = payload.get("hmac")
+        # 1. 서명 추출 (원문 서명이 있으면 우선, 없으면 페이로드 내부 서명)
+        raw_mode = raw_payload is not None and bool(signature)
+        hmac_signature = signature if raw_mode else payload.get("hmac")
         if not hmac_signature:
             return False, "HMAC signature missing"
 
@@ -29,39 +68,37 @@ class HmacIntegrityValidator:
         if not device.hmac_secret_key:
             return False, "Device secret key missing in DB"
 
-        # 3. 검증용 데이터 준비 (서명 필드 제외)
-        payload_for_check = payload.copy()
-        payload_for_check.pop("hmac", None)
-
         try:
-            # 4. [핵심] 라즈베리파이 클라이언트와 직렬화 규격 통일
-            message_str = json.dumps(
-                payload_for_check, 
-                sort_keys=True, 
-                separators=(',', ':'),      # 공백 제거
-                ensure_ascii=False,         # 유니코드 유지
-                default=str                 # 날짜 객체 등 처리
-            )
-            
-            message = message_str.encode('utf-8')
-            secret = device.hmac_secret_key.encode('utf-8')
+            if raw_mode:
+                # 3-A. 수신 바이트 그대로 검증
+                message = raw_payload
+            else:
+                if not settings.HMAC_LEGACY_JSON_ENABLED:
+                    return False, "Canonical-JSON HMAC mode is disabled. Sign the raw payload bytes."
+
+                # 3-B. [구형 펌웨어] 라즈베리파이 클라이언트와 직렬화 규격 통일 (서명 필드 제외)
+                payload_for_check = {k: v for k, v in payload.items() if k != "hmac"}
+                message = json.dumps(
+                    payload_for_check, 
+                    sort_keys=True, 
+                    separators=(',', ':'),      # 공백 제거
+                    ensure_ascii=False,         # 유니코드 유지
+                    default=str                 # 날짜 객체 등 처리
+                ).encode('utf-8')
 
-            # 5. 서버 측 서명 생성 및 비교
-            expected_signature = hmac.new(
-                secret, 
-                message, 
-                hashlib.sha256
-            ).hexdigest()
+            # 4. 서버 측 서명 생성 및 비교 (장치별로 준비된 키 객체 재사용)
+            mac = self._keys.get(device.id, device.hmac_secret_key).copy()
+            mac.update(message)
 
-            if not hmac.compare_digest(expected_signature, hmac_signature):
+            if not hmac.compare_digest(mac.hexdigest(), hmac_signature):
                 logger.warning(f"❌ HMAC mismatch for device: {device.current_uuid}")
                 return False, "HMAC integrity check failed."
             
-            logger.info(f"✅ HMAC Verified: {device.current_uuid}")
+            logger.debug(f"✅ HMAC Verified ({'raw' if raw_mode else 'canonical-json'}): {device.current_uuid}")
             return True, None
 
         except Exception as e:
             logger.error(f"HMAC Error: {str(e)}")
             return False, f"HMAC error: {str(e)}"
 
-hmac_integrity_validator = HmacIntegrityValidator()
\ No newline at end of file
+hmac_integrity_validator = HmacIntegrityValidator()
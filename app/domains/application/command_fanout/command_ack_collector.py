@@ -0,0 +1,99 @@
+import logging
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy.orm import Session
+
+from app.models.events_logs.command_delivery import CommandDeliveryStatus
+from app.domains.services.command_fanout.schemas.command_fanout_command import CommandAck
+from app.domains.inter_domain.command_fanout.command_fanout_command_provider import command_fanout_command_provider
+
+logger = logging.getLogger(__name__)
+
+# 기기 응답 payload의 status 중 성공으로 보는 값 (그 외는 FAILED). 트리거 실행 응답에도 같은 기준을 씁니다.
+ACK_SUCCESS_STATUSES = {"ok", "success", "acked", "done"}
+
+class CommandAckCollector:
+    """
+    [Application Layer] 리스너가 commands/response/{uuid}에서 받은 팬아웃 응답을 모아 DB에 일괄 반영합니다.
+    - 메시지마다 트랜잭션을 열지 않고 flush_interval마다(또는 max_batch만큼 쌓이면) executemany UPDATE 1회로 반영합니다.
+    - correlation_id가 없는 응답(팬아웃이 아닌 명령의 응답)은 무시합니다.
+    - 반영에 실패한 묶음은 버리고 로그만 남깁니다. (해당 전달은 ack_timeout 후 TIMEOUT으로 집계)
+    """
+    def __init__(self, db_session_factory: Callable[..., Session], *, flush_interval: float, max_batch: int):
+        self.db_session_factory = db_session_factory
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._buffer: List[CommandAck] = []
+        self._full = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"received": 0, "flushed": 0, "dropped": 0}
+
+    def submit(self, device_uuid: str, payload: Dict[str, Any]) -> bool:
+        """응답 1건을 버퍼에 넣습니다. 팬아웃 응답이 아니면 False."""
+        correlation_id = payload.get("correlation_id")
+        if not isinstance(correlation_id, str) or not correlation_id:
+            return False
+        try:
+            uuid.UUID(device_uuid)
+        except ValueError:
+            return False
+
+        status = str(payload.get("status", "")).lower()
+        self._buffer.append(CommandAck(
+            correlation_id=correlation_id,
+            device_uuid=device_uuid,
+            status=CommandDeliveryStatus.ACKED if status in ACK_SUCCESS_STATUSES else CommandDeliveryStatus.FAILED,
+            acked_at=datetime.now(timezone.utc),
+            response=payload,
+        ))
+        self.stats["received"] += 1
+        if len(self._buffer) >= self.max_batch:
+            self._full.set()
+        return True
+
+    async def start(self):
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run_loop())
+
+    async def stop(self):
+        """루프를 멈추고 남은 응답을 마지막으로 반영합니다."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._full.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._buffer:
+            return
+        acks, self._buffer = self._buffer, []
+        try:
+            await asyncio.to_thread(self._apply, acks)
+            self.stats["flushed"] += len(acks)
+        except Exception as e:
+            self.stats["dropped"] += len(acks)
+            logger.error(f"❌ Failed to apply {len(acks)} command acks: {e}", exc_info=True)
+
+    def _apply(self, acks: List[CommandAck]) -> None:
+        with self.db_session_factory() as db:
+            try:
+                command_fanout_command_provider.apply_acks(db, acks=acks)
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
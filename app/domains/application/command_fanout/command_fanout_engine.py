@@ -0,0 +1,157 @@
+import logging
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings
+from app.models.events_logs.command_delivery import CommandDispatchStatus
+from app.domains.services.command_fanout.schemas.command_fanout_query import CommandDispatchRuntimeRead
+from app.domains.inter_domain.command_fanout.command_fanout_command_provider import command_fanout_command_provider
+from app.domains.inter_domain.command_fanout.command_fanout_query_provider import command_fanout_query_provider
+from app.domains.inter_domain.command_dispatch.command_dispatch_provider import publish_commands, DEVICE_COMMAND_TOPIC
+from app.domains.inter_domain.audit.audit_command_provider import audit_command_provider
+
+logger = logging.getLogger(__name__)
+
+class _TokenBucket:
+    """초당 rate개씩 채워지고 최대 1초치(최소 1개)까지 모이는 발행 토큰"""
+    def __init__(self, rate: float, now: float):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = 0.0
+        self.updated = now
+
+    def available(self, now: float) -> int:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        return int(self.tokens)
+
+    def consume(self, count: int) -> None:
+        self.tokens -= count
+
+class CommandFanoutEngine:
+    """
+    [Application Layer] 명령 팬아웃 엔진 (리더 워커 전용):
+    PENDING/RUNNING 작업의 QUEUED 전달을 틱마다 꺼내 `ares4/{uuid}/commands`로 발행합니다.
+
+    - 작업별 토큰 버킷(rate_per_second)과 전체 상한(COMMAND_FANOUT_GLOBAL_RATE_PER_SECOND)으로 브로커 부하를 제한합니다.
+    - 응답 대기(SENT) 수가 max_in_flight에 닿으면 응답/타임아웃으로 자리가 날 때까지 발행을 멈춥니다.
+    - 발행 전에 SENT로 커밋해, 응답이 먼저 도착해도 리스너가 매칭할 수 있게 합니다. 발행하지 못한 건은 QUEUED로 되돌립니다.
+    - 감사 로그는 건별이 아니라 작업 완료 시 1건만 남깁니다. (생성 시 1건은 Policy가 기록)
+    """
+    def __init__(self, settings: Settings, db_session_factory: Callable[..., Session]):
+        self.settings = settings
+        self.db_session_factory = db_session_factory
+        self._buckets: Dict[int, _TokenBucket] = {}
+        self._global_bucket = _TokenBucket(settings.COMMAND_FANOUT_GLOBAL_RATE_PER_SECOND, time.monotonic())
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run_loop())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("CommandFanoutEngine stopped.")
+
+    async def _run_loop(self):
+        logger.info("📣 CommandFanoutEngine loop started.")
+        tick = self.settings.COMMAND_FANOUT_TICK_SECONDS
+        while True:
+            try:
+                await asyncio.to_thread(self._tick)
+                await asyncio.sleep(tick)
+            except asyncio.CancelledError:
+                logger.info("CommandFanoutEngine loop is being cancelled...")
+                raise
+            except Exception as e:
+                logger.error(f"❌ Error in CommandFanoutEngine loop: {e}", exc_info=True)
+                await asyncio.sleep(tick)
+
+    def _tick(self) -> None:
+        with self.db_session_factory() as db:
+            dispatches = command_fanout_query_provider.get_runnable_dispatches(db)
+            runnable_ids = {d.id for d in dispatches}
+            for dispatch_id in list(self._buckets):
+                if dispatch_id not in runnable_ids:
+                    del self._buckets[dispatch_id]
+
+            for dispatch in dispatches:
+                try:
+                    self._advance(db, dispatch)
+                    db.commit()
+                except Exception as e:
+                    db.rollback()
+                    logger.error(f"❌ Command fan-out dispatch {dispatch.id} failed this tick: {e}", exc_info=True)
+
+    def _advance(self, db: Session, dispatch: CommandDispatchRuntimeRead) -> None:
+        now = datetime.now(timezone.utc)
+        if dispatch.status == CommandDispatchStatus.PENDING.value:
+            command_fanout_command_provider.mark_running(db, dispatch_id=dispatch.id, now=now)
+
+        command_fanout_command_provider.expire_timeouts(
+            db, dispatch_id=dispatch.id, ack_timeout_seconds=dispatch.ack_timeout_seconds, now=now
+        )
+        counts = command_fanout_query_provider.count_by_status(db, dispatch_id=dispatch.id)
+        queued, in_flight = counts.get("QUEUED", 0), counts.get("SENT", 0)
+        if not queued:
+            if not in_flight:
+                self._complete(db, dispatch, counts, now)
+            return
+
+        mono = time.monotonic()
+        bucket = self._buckets.get(dispatch.id)
+        if bucket is None:
+            bucket = self._buckets[dispatch.id] = _TokenBucket(dispatch.rate_per_second, mono)
+        budget = min(
+            queued,
+            dispatch.max_in_flight - in_flight,
+            bucket.available(mono),
+            self._global_bucket.available(mono),
+        )
+        if budget <= 0:
+            return
+
+        batch = command_fanout_query_provider.get_queued(db, dispatch_id=dispatch.id, limit=budget)
+        ids = [item.id for item in batch]
+        command_fanout_command_provider.mark_sent(db, delivery_ids=ids, sent_at=now)
+        db.commit()
+
+        published = publish_commands([
+            (
+                DEVICE_COMMAND_TOPIC.format(device_uuid=item.device_uuid),
+                {
+                    "action": dispatch.action,
+                    "parameters": dispatch.parameters or {},
+                    "correlation_id": item.correlation_id,
+                    "dispatch_id": dispatch.id,
+                },
+            )
+            for item in batch
+        ])
+        bucket.consume(published)
+        self._global_bucket.consume(published)
+        if published < len(ids):
+            command_fanout_command_provider.requeue(db, delivery_ids=ids[published:])
+            logger.warning(f"⚠️ Command fan-out {dispatch.id}: {len(ids) - published} deliveries requeued (publisher not ready)")
+
+    def _complete(self, db: Session, dispatch: CommandDispatchRuntimeRead, counts: Dict[str, int], now: datetime) -> None:
+        command_fanout_command_provider.mark_finished(
+            db, dispatch_id=dispatch.id, status=CommandDispatchStatus.COMPLETED, now=now
+        )
+        audit_command_provider.log(
+            db=db,
+            actor_user=None,
+            event_type="COMMAND_FANOUT_COMPLETED",
+            description=f"Command fan-out {dispatch.id} ({dispatch.action}) completed",
+            details={"dispatch_id": dispatch.id, "action": dispatch.action, "counts": counts}
+        )
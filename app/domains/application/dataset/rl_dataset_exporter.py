@@ -0,0 +1,264 @@
+import json
+import logging
+import os
+import shutil
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.domains.services.observation.schemas.observation_export_query import ObservationExportFilter
+from app.domains.inter_domain.observation.observation_export_query_provider import observation_export_query_provider
+from app.domains.inter_domain.telemetry.telemetry_query_provider import telemetry_query_provider
+
+logger = logging.getLogger(__name__)
+
+# 텔레메트리 스트림 행에서 각 통계값의 위치 (snapshot_id, component, metric, avg, min, max, std, slope)
+_STAT_POSITIONS = {"avg": 3, "min": 4, "max": 5, "std": 6, "slope": 7}
+
+_CHECKPOINT_FILE = "checkpoint.json"
+_MANIFEST_FILE = "manifest.json"
+
+@dataclass
+class RLExportSpec:
+    """
+    상태 벡터의 고정 레이아웃입니다. 재개(resume) 시에도 같은 레이아웃을 쓰도록 체크포인트에 저장됩니다.
+    state[:, i * len(stats) + j] = columns[i]의 stats[j] 값 (결측은 NaN)
+    """
+    columns: List[Tuple[str, str]]
+    stats: List[str] = field(default_factory=lambda: ["avg"])
+
+    @property
+    def width(self) -> int:
+        return len(self.columns) * len(self.stats)
+
+class _Peekable:
+    """snapshot_id로 정렬된 스트림을 병합 조인하기 위한 한 칸 미리보기 이터레이터입니다."""
+    def __init__(self, iterator: Iterator[Tuple[Any, ...]]):
+        self._it = iterator
+        self._head: Optional[Tuple[Any, ...]] = None
+        self._advance()
+
+    def _advance(self):
+        self._head = next(self._it, None)
+
+    def take(self, snapshot_id: str) -> List[Tuple[Any, ...]]:
+        """snapshot_id보다 앞선(고아) 행은 버리고, 같은 snapshot_id 행만 모아 반환합니다."""
+        while self._head is not None and self._head[0] < snapshot_id:
+            self._advance()
+        rows = []
+        while self._head is not None and self._head[0] == snapshot_id:
+            rows.append(self._head)
+            self._advance()
+        return rows
+
+class _ShardBuffer:
+    """샤드 1개 분량의 열(column) 버퍼. 상태 행렬은 미리 할당하여 재사용합니다."""
+    def __init__(self, capacity: int, width: int):
+        self.state = np.full((capacity, width), np.nan, dtype=np.float32)
+        self.reset()
+
+    def reset(self):
+        self.state.fill(np.nan)
+        self.size = 0
+        self.snapshot_ids: List[str] = []
+        self.system_unit_ids: List[int] = []
+        self.timestamps: List[int] = []
+        self.image_paths: List[str] = []
+        self.image_counts: List[int] = []
+        self.action_commands: List[str] = []
+        self.action_parameters: List[str] = []
+        self.action_actor_types: List[str] = []
+        self.action_statuses: List[str] = []
+        self.action_counts: List[int] = []
+
+class RLDatasetExporter:
+    """
+    [Application Layer] RL 데이터셋 추출기:
+    ObservationSnapshot을 동기화 키로 텔레메트리/이미지/액션을 병합 조인하여 `.npy` 샤드로 기록합니다.
+
+    - 4개의 서버 사이드 커서를 snapshot_id 순으로 동시에 읽으며 병합하므로 메모리는 샤드 1개 분량으로 일정합니다.
+    - 텔레메트리는 (component, metric) × stats 고정 폭 상태 벡터로 피벗됩니다.
+    - 이미지는 스냅샷의 첫 번째 경로, 액션은 스냅샷 시점의 첫 번째 명령을 라벨로 붙입니다. (개수는 별도 열로 기록)
+    - 샤드는 임시 디렉터리에 쓴 뒤 교체하고, 그 다음에 체크포인트를 갱신하므로 중단 후 재실행하면 이어서 추출합니다.
+    - 텔레메트리는 telemetry_data(DB)에서만 읽습니다. 콜드 스토리지로 옮겨진 구간(telemetry_archived_before 이전)의
+      스냅샷은 상태 벡터가 NaN으로 남으므로, 그 경계를 체크포인트/manifest에 기록하고 범위가 겹치면 경고합니다.
+    """
+    def __init__(self, output_dir: str, *, shard_rows: int = 50000, fetch_size: int = 10000):
+        self.output_dir = output_dir
+        self.shard_rows = shard_rows
+        self.fetch_size = fetch_size
+
+    # --- 체크포인트 ---
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.output_dir, name)
+
+    def _write_json(self, name: str, data: Dict[str, Any]):
+        tmp = self._path(f"{name}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._path(name))
+
+    def load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        path = self._path(_CHECKPOINT_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    # --- 추출 ---
+
+    def export(
+        self,
+        db: Session,
+        *,
+        filters: ObservationExportFilter,
+        stats: Sequence[str] = ("avg",),
+        columns: Optional[List[Tuple[str, str]]] = None,
+    ) -> Dict[str, Any]:
+        os.makedirs(self.output_dir, exist_ok=True)
+        for name in os.listdir(self.output_dir):
+            if name.endswith(".tmp"):
+                shutil.rmtree(self._path(name), ignore_errors=True)
+
+        filter_key = filters.model_dump(mode="json", exclude={"after_snapshot_id"})
+        checkpoint = self.load_checkpoint()
+        if checkpoint:
+            if checkpoint["filters"] != filter_key:
+                raise ValueError("Existing checkpoint was created with different filters. Use a new output directory.")
+            if checkpoint.get("completed"):
+                logger.info(f"📦 RL export already completed at {self.output_dir}.")
+                return checkpoint
+            spec = RLExportSpec(columns=[tuple(c) for c in checkpoint["spec"]["columns"]], stats=checkpoint["spec"]["stats"])
+            logger.info(f"⏯️ Resuming RL export after snapshot '{checkpoint['last_snapshot_id']}' (shard {checkpoint['next_shard']}).")
+        else:
+            unknown = [s for s in stats if s not in _STAT_POSITIONS]
+            if unknown:
+                raise ValueError(f"Unsupported stats: {unknown}")
+            spec = RLExportSpec(
+                columns=columns or observation_export_query_provider.get_metric_columns(db, filters=filters),
+                stats=list(stats),
+            )
+            archived_before = telemetry_query_provider.get_archived_before()
+            if archived_before is not None and (filters.start_time is None or filters.start_time < archived_before):
+                logger.warning(
+                    f"⚠️ Telemetry before {archived_before.isoformat()} is archived; "
+                    f"state vectors of earlier snapshots will be NaN. Narrow --start to exclude them."
+                )
+            checkpoint = {
+                "filters": filter_key,
+                "spec": asdict(spec),
+                "telemetry_archived_before": archived_before.isoformat() if archived_before else None,
+                "last_snapshot_id": None,
+                "next_shard": 0,
+                "rows_written": 0,
+                "shards": [],
+                "completed": False,
+            }
+            self._write_json(_CHECKPOINT_FILE, checkpoint)
+
+        stream_filters = filters.model_copy(update={"after_snapshot_id": checkpoint["last_snapshot_id"]})
+        column_index = {tuple(c): i for i, c in enumerate(spec.columns)}
+        stat_positions = [_STAT_POSITIONS[s] for s in spec.stats]
+        n_stats = len(stat_positions)
+
+        telemetry = _Peekable(observation_export_query_provider.stream_telemetry(db, filters=stream_filters, fetch_size=self.fetch_size))
+        images = _Peekable(observation_export_query_provider.stream_images(db, filters=stream_filters, fetch_size=self.fetch_size))
+        actions = _Peekable(observation_export_query_provider.stream_actions(db, filters=stream_filters, fetch_size=self.fetch_size))
+
+        buffer = _ShardBuffer(self.shard_rows, spec.width)
+        started = time.monotonic()
+        for snapshot_id, system_unit_id, created_at, _ in observation_export_query_provider.stream_snapshots(
+            db, filters=stream_filters, fetch_size=self.fetch_size
+        ):
+            row = buffer.size
+            state_row = buffer.state[row]
+            for t in telemetry.take(snapshot_id):
+                col = column_index.get((t[1], t[2]))
+                if col is None:
+                    continue
+                base = col * n_stats
+                for j, pos in enumerate(stat_positions):
+                    state_row[base + j] = t[pos]
+
+            image_rows = images.take(snapshot_id)
+            action_rows = actions.take(snapshot_id)
+            first_action = action_rows[0] if action_rows else None
+
+            buffer.snapshot_ids.append(snapshot_id)
+            buffer.system_unit_ids.append(system_unit_id)
+            buffer.timestamps.append(int(created_at.timestamp() * 1000))
+            buffer.image_paths.append(image_rows[0][1] if image_rows else "")
+            buffer.image_counts.append(len(image_rows))
+            buffer.action_commands.append(first_action[1] if first_action else "")
+            buffer.action_parameters.append(json.dumps(first_action[2], ensure_ascii=False) if first_action and first_action[2] is not None else "")
+            buffer.action_actor_types.append(self._enum_value(first_action[3]) if first_action else "")
+            buffer.action_statuses.append(self._enum_value(first_action[4]) if first_action else "")
+            buffer.action_counts.append(len(action_rows))
+            buffer.size += 1
+
+            if buffer.size >= self.shard_rows:
+                self._flush_shard(buffer, checkpoint)
+
+        if buffer.size:
+            self._flush_shard(buffer, checkpoint)
+
+        checkpoint["completed"] = True
+        self._write_json(_CHECKPOINT_FILE, checkpoint)
+        self._write_json(_MANIFEST_FILE, {
+            "spec": checkpoint["spec"],
+            "state_columns": [f"{c}.{m}.{s}" for c, m in spec.columns for s in spec.stats],
+            "filters": checkpoint["filters"],
+            "telemetry_archived_before": checkpoint.get("telemetry_archived_before"),
+            "rows": checkpoint["rows_written"],
+            "shards": checkpoint["shards"],
+        })
+        logger.info(
+            f"✅ RL export finished: {checkpoint['rows_written']} snapshot(s), {len(checkpoint['shards'])} shard(s) "
+            f"in {time.monotonic() - started:.1f}s → {self.output_dir}"
+        )
+        return checkpoint
+
+    @staticmethod
+    def _enum_value(value: Any) -> str:
+        return value.value if hasattr(value, "value") else str(value)
+
+    def _flush_shard(self, buffer: _ShardBuffer, checkpoint: Dict[str, Any]):
+        name = f"shard-{checkpoint['next_shard']:05d}"
+        tmp_dir = self._path(f"{name}.tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+        n = buffer.size
+
+        arrays = {
+            "state": buffer.state[:n],
+            "snapshot_ids": np.asarray(buffer.snapshot_ids, dtype=str),
+            "system_unit_ids": np.asarray(buffer.system_unit_ids, dtype=np.int64),
+            "timestamps_ms": np.asarray(buffer.timestamps, dtype=np.int64),
+            "image_paths": np.asarray(buffer.image_paths, dtype=str),
+            "image_counts": np.asarray(buffer.image_counts, dtype=np.int32),
+            "action_commands": np.asarray(buffer.action_commands, dtype=str),
+            "action_parameters": np.asarray(buffer.action_parameters, dtype=str),
+            "action_actor_types": np.asarray(buffer.action_actor_types, dtype=str),
+            "action_statuses": np.asarray(buffer.action_statuses, dtype=str),
+            "action_counts": np.asarray(buffer.action_counts, dtype=np.int32),
+        }
+        for key, array in arrays.items():
+            np.save(os.path.join(tmp_dir, f"{key}.npy"), array, allow_pickle=False)
+
+        final_dir = self._path(name)
+        # 체크포인트 갱신 전에 중단되었던 샤드가 남아 있다면 덮어씁니다.
+        shutil.rmtree(final_dir, ignore_errors=True)
+        os.replace(tmp_dir, final_dir)
+
+        checkpoint["last_snapshot_id"] = buffer.snapshot_ids[-1]
+        checkpoint["next_shard"] += 1
+        checkpoint["rows_written"] += n
+        checkpoint["shards"].append({"name": name, "rows": n, "last_snapshot_id": buffer.snapshot_ids[-1]})
+        self._write_json(_CHECKPOINT_FILE, checkpoint)
+        logger.info(f"💾 {name} written ({n} rows, total {checkpoint['rows_written']}).")
+        buffer.reset()
@@ -1,11 +1,12 @@
+import json
 import logging
 from typing import Dict, Any
 from fastapi import APIRouter, Request, Depends, HTTPException
 from fastapi.responses import JSONResponse, Response # <-- Response import는 필수입니다.
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.dependencies import get_db
+from app.dependencies import get_async_db
 from app.domains.inter_domain.policies.emqx_auth_policy.provider import emqx_auth_policy_provider
 from app.domains.application.ingestion.ingestion_policy import ingestion_policy
 
@@ -14,7 +15,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.post("/auth")
-async def mqtt_auth(request: Request, db: Session = Depends(get_db)):
+async def mqtt_auth(request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     EMQX HTTP 인증 웹훅 처리: 사용자(ID/PW) 또는 기기(mTLS) 인증 분기.
     """
@@ -48,7 +49,7 @@ async def mqtt_auth(request: Request, db: Session = Depends(get_db)):
         return JSONResponse(content={"result": "deny"}, status_code=500)
 
 @router.post("/acl")
-async def mqtt_acl(request: Request, db: Session = Depends(get_db)):
+async def mqtt_acl(request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     EMQX HTTP 권한 부여(ACL) 웹훅 처리.
     """
@@ -94,7 +95,7 @@ async def mqtt_superuser(request: Request):
     return JSONResponse(content={"result": "deny"})
 
 @router.post("/publish")
-async def mqtt_publish(request: Request, db: Session = Depends(get_db)):
+async def mqtt_publish(request: Request, db: AsyncSession = Depends(get_async_db)):
     try:
         # 1. 데이터 추출 (가장 먼저 수행)
         body: Dict[str, Any] = await request.json()
@@ -107,13 +108,27 @@ async def mqtt_publish(request: Request, db: Session = Depends(get_db)):
             # 보안 강화를 원하시면 아래 주석을 해제하여 엄격하게 차단하세요.
             # return JSONResponse(content={"result": "deny"}, status_code=403)
 
-        # 3. 통합 지휘관(Ingestion Policy) 호출
-        # body 자체가 아닌 body.get("payload")를 넘겨줌으로써 HMAC 대상 범위를 맞춥니다.
-        success, error_msg = ingestion_policy.handle_webhook_ingestion(
-            db, 
+        # 3. 페이로드/서명 준비
+        # - Raw 서명 모드: EMQX가 payload를 원문 문자열("${payload}")로, 장치의 MQTT5 User-Property(hmac)를
+        #   X-Ares-Hmac 헤더(또는 body.hmac)로 넘겨주면 수신 바이트 그대로 HMAC을 검증합니다. (재직렬화 없음)
+        # - 구형 펌웨어: payload가 JSON 객체로 들어오고 서명은 payload["hmac"]에 있습니다.
+        payload = body.get("payload")
+        raw_payload = None
+        if isinstance(payload, str):
+            raw_payload = payload.encode("utf-8")
+            payload = json.loads(raw_payload)
+        signature = request.headers.get("X-Ares-Hmac") or body.get("hmac")
+
+        # 4. 통합 지휘관(Ingestion Policy) 호출
+        # body 자체가 아닌 payload를 넘겨줌으로써 HMAC 대상 범위를 맞춥니다.
+        # 수신 정책은 동기 provider 체인이므로 run_sync로 실행합니다. (DB 대기는 asyncpg 위에서 루프를 양보)
+        success, error_msg = await db.run_sync(lambda sync_db: ingestion_policy.handle_webhook_ingestion(
+            sync_db, 
             topic=body.get("topic"), 
-            payload=body.get("payload")
-        )
+            payload=payload,
+            raw_payload=raw_payload,
+            signature=signature
+        ))
         
         if success:
             return JSONResponse(content={"result": "ok"})
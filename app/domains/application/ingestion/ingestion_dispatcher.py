@@ -8,17 +8,25 @@ from app.domains.inter_domain.policies.image_ingestion.image_ingestion_provider
 logger = logging.getLogger(__name__)
 
 class IngestionDispatcher:
-    def dispatch(self, db: Session, *, topic: str, payload: Dict) -> Tuple[bool, Optional[str]]:
+    def dispatch(
+        self, db: Session, *, topic: str, payload: Dict, raw_payload: Optional[bytes] = None, signature: Optional[str] = None
+    ) -> Tuple[bool, Optional[str]]:
         # 1. 데이터의 성격 파악 (어느 창구로 보낼지만 결정)
         data_type = self._identify_data_type(topic, payload)
         
         # 2. [Ares Aegis] 각 전문가에게 '원본 데이터셋'을 통째로 배달
         # 이제 배달부는 토픽을 쪼개거나 내용을 디코딩하지 않습니다.
         if data_type == "TELEMETRY":
+            topic_parts = topic.split("/")
+            if len(topic_parts) < 2:
+                return False, f"Invalid telemetry topic: {topic}"
             return telemetry_ingestion_policy_provider.ingest(
                 db=db, 
-                topic=topic,   # 토픽 파싱은 정책 내부에서 수행하도록 위임
-                payload=payload
+                device_uuid_str=topic_parts[1],  # telemetry/{uuid}/...
+                topic=topic,
+                payload=payload,
+                raw_payload=raw_payload,  # 원문 바이트 (Raw 서명 모드)
+                signature=signature
             )
             
         elif data_type == "IMAGE":
@@ -10,7 +10,9 @@ from app.domains.inter_domain.policies.image_ingestion.image_ingestion_provider
 logger = logging.getLogger(__name__)
 
 class IngestionPolicy:
-    def handle_webhook_ingestion(self, db: Session, *, topic: str, payload: Dict) -> Tuple[bool, Optional[str]]:
+    def handle_webhook_ingestion(
+        self, db: Session, *, topic: str, payload: Dict, raw_payload: Optional[bytes] = None, signature: Optional[str] = None
+    ) -> Tuple[bool, Optional[str]]:
         try:
             topic_parts = topic.split("/")
             device_uuid_str = topic_parts[1]
@@ -62,7 +64,8 @@ class IngestionPolicy:
             )
         elif data_type == "TELEMETRY":
             return telemetry_ingestion_policy_provider.ingest(
-                db=db, device_uuid_str=device_uuid_str, topic=topic, payload=payload
+                db=db, device_uuid_str=device_uuid_str, topic=topic, payload=payload,
+                raw_payload=raw_payload, signature=signature
             )
         
         return False, f"Unsupported type: {data_type}"
@@ -7,6 +7,7 @@ from app.core.config import Settings
 from app.core.registry import app_registry
 from app.domains.services.command_dispatch.managers.mqtt_connection_manager import MqttConnectionManager
 from app.domains.services.command_dispatch.repositories.command_dispatch_repository import CommandDispatchRepository
+from app.domains.services.command_dispatch.repositories.command_relay_repository import CommandRelayRepository
 from app.domains.inter_domain.policies.server_certificate_acquisition.server_certificate_acquisition_policy import server_certificate_acquisition_policy_provider
 
 logger = logging.getLogger(__name__)
@@ -14,11 +15,14 @@ logger = logging.getLogger(__name__)
 class MqttLifecycleOrchestrator:
     """
     애플리케이션의 MQTT 클라이언트들(Publisher, Listener)의 생명주기를 조율하는 컴포넌트입니다.
-    `main.py`의 `lifespan` 이벤트에 의해 호출됩니다.
+    `main.py`의 `lifespan` 이벤트에 의해 호출됩니다. (여러 워커 중 리더 워커에서만 기동)
+    command_relay가 주어지면 다른 워커들이 릴레이 큐에 넣은 명령도 이 연결로 발행합니다.
     """
-    def __init__(self, settings: Settings, db_session_factory: Callable[..., Session]):
+    def __init__(self, settings: Settings, db_session_factory: Callable[..., Session], command_relay: Optional[CommandRelayRepository] = None):
         self.settings = settings
         self.db_session_factory = db_session_factory
+        self.command_relay = command_relay
+        self._relay_task: Optional[asyncio.Task] = None
         self.publisher_connection_manager: Optional[MqttConnectionManager] = None
         # [수정] 태스크 변수명을 하나로 통일 (_rotation_monitor_task)
         self._rotation_monitor_task: Optional[asyncio.Task] = None
@@ -110,6 +114,10 @@ class MqttLifecycleOrchestrator:
                 
                 # 5. 자율 운영을 위한 로테이션 감시 루프 시작
                 self._rotation_monitor_task = asyncio.create_task(self._rotation_monitoring_loop())
+
+                # 6. 다른 워커의 발행 요청(릴레이 큐) 처리
+                if self.command_relay:
+                    self._relay_task = asyncio.create_task(self.command_relay.drain(self.publisher_connection_manager))
                 
                 db.commit()
             except Exception as e:
@@ -129,6 +137,9 @@ class MqttLifecycleOrchestrator:
         if self._connect_task:
             self._connect_task.cancel()
 
+        if self._relay_task:
+            self._relay_task.cancel()
+
         # 1. 감시 루프 태스크 취소
         if self._rotation_monitor_task:
             self._rotation_monitor_task.cancel()
@@ -1,11 +1,16 @@
 import logging
+import asyncio
 import json
-from typing import Dict
+from typing import Callable, Dict, Optional
 from gmqtt import Client as MQTTClient
+from sqlalchemy.orm import Session
 import redis
 
 # [중요] DB 저장 로직(Dispatcher) 대신, 실시간 서비스(RealtimeService)를 부릅니다.
 from app.domains.services.realtime.services.realtime_device_service import RealtimeDeviceService
+from app.domains.application.command_fanout.command_ack_collector import CommandAckCollector, ACK_SUCCESS_STATUSES
+from app.domains.inter_domain.schedule.schedule_run_provider import schedule_run_provider
+from app.domains.inter_domain.trigger_rule.trigger_engine_provider import trigger_engine_provider
 
 logger = logging.getLogger(__name__)
 
@@ -15,9 +20,16 @@ class MqttHandler:
     MQTT 메시지를 수신하여 Realtime 도메인 서비스로 연결(Wiring)합니다.
     DB 저장은 하지 않습니다. (그건 Webhook이 함)
     """
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        ack_collector: Optional[CommandAckCollector] = None,
+        db_session_factory: Optional[Callable[..., Session]] = None
+    ):
         # 도메인 서비스(실무자) 조립
         self.realtime_service = RealtimeDeviceService(redis_client)
+        self.ack_collector = ack_collector
+        self.db_session_factory = db_session_factory
 
     async def handle_message(self, client: MQTTClient, topic: str, payload: bytes, qos: int, properties: Dict):
         try:
@@ -43,5 +55,52 @@ class MqttHandler:
             elif topic_parts[0] == 'client' and topic_parts[1] == 'request_state':
                 await self.realtime_service.handle_state_request(client, topic_parts)
 
+            # Case C: 명령 응답
+            # - 스케줄 실행 결과(schedule_id + run_id) -> 스케줄 실행기 (진행 중 실행 종료, QUEUE 대기분 발행)
+            # - 트리거 실행 결과(execution_id) -> ActionLog 확정 후 리더의 트리거 엔진에 완료 표식 (슬롯 반환)
+            # - 그 외 -> 팬아웃 응답 수집기 (correlation_id 매칭, 일괄 DB 반영)
+            # 토픽 예: commands/response/{uuid}
+            elif len(topic_parts) == 3 and topic_parts[0] == 'commands' and topic_parts[1] == 'response':
+                if not isinstance(payload_dict, dict):
+                    return
+                if "schedule_id" in payload_dict and "run_id" in payload_dict:
+                    if self.db_session_factory:
+                        await asyncio.to_thread(self._report_schedule_completion, topic_parts[2], payload_dict)
+                elif "execution_id" in payload_dict:
+                    if self.db_session_factory:
+                        await asyncio.to_thread(self._complete_trigger_execution, topic_parts[2], payload_dict)
+                elif self.ack_collector:
+                    self.ack_collector.submit(topic_parts[2], payload_dict)
+
         except Exception as e:
-            logger.error(f"MQTT Handler Error: {e}")
\ No newline at end of file
+            logger.error(f"MQTT Handler Error: {e}")
+
+    def _report_schedule_completion(self, device_uuid: str, payload: Dict):
+        with self.db_session_factory() as db:
+            schedule_run_provider.report_completion(
+                db,
+                device_uuid=device_uuid,
+                schedule_id=int(payload["schedule_id"]),
+                run_id=str(payload["run_id"]),
+                status=str(payload.get("status", "")),
+            )
+
+    def _complete_trigger_execution(self, device_uuid: str, payload: Dict):
+        action_log_id = int(payload["execution_id"])
+        with self.db_session_factory() as db:
+            try:
+                completed = trigger_engine_provider.complete_execution(
+                    db,
+                    device_uuid=device_uuid,
+                    action_log_id=action_log_id,
+                    success=str(payload.get("status", "")).lower() in ACK_SUCCESS_STATUSES,
+                    result={"response": payload},
+                )
+                if not completed:
+                    return
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+        # 확정이 커밋된 뒤에만 리더의 엔진이 슬롯을 반환하도록 표식을 남깁니다.
+        trigger_engine_provider.release_execution(action_log_id)
@@ -0,0 +1,426 @@
+import logging
+import asyncio
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings
+from app.core.registry import app_registry
+from app.domains.services.schedule.managers.timer_wheel import HierarchicalTimerWheel
+from app.domains.services.schedule.managers.recurrence import next_fire_time, validate_pattern
+from app.domains.services.schedule.schemas.schedule_query import ScheduleRuntimeRead
+from app.domains.inter_domain.schedule.schedule_query_provider import schedule_query_provider
+from app.domains.inter_domain.schedule.schedule_run_provider import schedule_run_provider
+from app.domains.inter_domain.command_dispatch.command_dispatch_provider import publish_command, UNIT_COMMAND_TOPIC
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class ScheduleRun:
+    """실행기에서 추적하는 '진행 중인 1회 실행' 정보입니다."""
+    schedule_id: int
+    run_id: str
+    started_at: float
+    deadline: Optional[float] = None
+
+@dataclass
+class _PendingCommand:
+    topic: str
+    command: Dict
+    schedule_id: int
+    run: Optional[ScheduleRun] = None
+    queued_fire_at: Optional[float] = None  # QUEUE 대기열에서 꺼낸 발화면 원래 예정 시각 (발행 실패 시 되돌림)
+
+@dataclass
+class ExecutorStats:
+    loaded: int = 0
+    fired: int = 0
+    skipped: int = 0
+    queued: int = 0
+    queue_overflows: int = 0
+    replaced: int = 0
+    timed_out: int = 0
+    completed: int = 0
+    dispatch_failures: int = 0
+    reloads: int = 0
+    last_reload_changes: int = 0
+    invalid_schedules: Set[int] = field(default_factory=set)
+
+class ScheduleExecutor:
+    """
+    [Application Layer] 스케줄 실행기:
+    활성 스케줄을 계층형 타이머 휠에 적재하고, 만기된 스케줄의 `action_details`를
+    CommandDispatchRepository(publish_command)를 통해 유닛으로 발행합니다.
+
+    - 반복 규칙은 '다음 1회'만 계산하여 휠에 올리고, 발화 후 다음 차례를 다시 계산합니다. (Lazy Expansion)
+    - 틱마다 DB를 조회하지 않습니다. `updated_at` 기준 증분 리로드와 드문 ID 대사(reconcile)만 수행합니다.
+    - 동시성 정책(SKIP/QUEUE/REPLACE/FORCED)과 `timeout_seconds`는 실행기 메모리에서 집행합니다.
+      진행 중 실행은 기기의 완료 보고(리스너 -> schedule_run_provider) 또는 타임아웃으로 끝납니다.
+    - 다운타임 동안 놓친 반복 발화는 따라잡지 않습니다(skip). 1회성 작업만 `SCHEDULER_MISFIRE_GRACE_SECONDS` 내에서 보정합니다.
+    """
+    def __init__(self, settings: Settings, db_session_factory: Callable[..., Session]):
+        self.settings = settings
+        self.db_session_factory = db_session_factory
+        self.wheel = HierarchicalTimerWheel(start_time=time.time(), tick_seconds=settings.SCHEDULER_TICK_SECONDS)
+        self.stats = ExecutorStats()
+
+        self._schedules: Dict[int, ScheduleRuntimeRead] = {}
+        self._fired_cycles: Dict[int, int] = {}
+        self._active_runs: Dict[int, Dict[str, ScheduleRun]] = {}
+        self._queued_fires: Dict[int, Deque[float]] = {}
+
+        self._watermark: Optional[datetime] = None
+        self._last_reload = 0.0
+        self._last_reconcile = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    # --- 생명주기 ---
+
+    async def start(self):
+        """초기 적재 후 틱 루프를 백그라운드 태스크로 시작합니다. (Non-blocking)"""
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run_loop())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("ScheduleExecutor stopped.")
+
+    async def _run_loop(self):
+        try:
+            await self._initial_load()
+        except Exception as e:
+            logger.error(f"❌ ScheduleExecutor initial load failed: {e}", exc_info=True)
+
+        logger.info(f"⏰ ScheduleExecutor loop started with {len(self._schedules)} schedules.")
+        tick = self.settings.SCHEDULER_TICK_SECONDS
+        while True:
+            try:
+                now = time.time()
+                due = self.wheel.advance(now)
+                if due:
+                    await self._handle_due(due, now)
+                await self._drain_completions()
+
+                if now - self._last_reload >= self.settings.SCHEDULER_RELOAD_INTERVAL_SECONDS:
+                    await self._reload_changed()
+                if now - self._last_reconcile >= self.settings.SCHEDULER_RECONCILE_INTERVAL_SECONDS:
+                    await self._reconcile_deleted()
+
+                await asyncio.sleep(tick)
+            except asyncio.CancelledError:
+                logger.info("ScheduleExecutor loop is being cancelled...")
+                raise
+            except Exception as e:
+                logger.error(f"❌ Error in ScheduleExecutor loop: {e}", exc_info=True)
+                await asyncio.sleep(tick)
+
+    # --- 적재 / 증분 리로드 ---
+    # DB 조회만 스레드에서 수행하고, 휠/상태 갱신은 항상 이벤트 루프에서 수행합니다.
+
+    async def _query(self, fn, **kwargs):
+        def _run():
+            with self.db_session_factory() as db:
+                return fn(db, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(None, _run)
+
+    async def _initial_load(self):
+        schedules = await self._query(schedule_query_provider.get_active_schedules)
+        now = datetime.now(timezone.utc)
+        for schedule in schedules:
+            self._upsert(schedule, now)
+        self._watermark = max((s.updated_at for s in schedules), default=now)
+        self._last_reload = self._last_reconcile = time.time()
+        self.stats.loaded = len(self._schedules)
+
+    async def _reload_changed(self):
+        """`updated_at >= watermark - overlap` 인 행만 읽어 변경분을 반영합니다."""
+        self._last_reload = time.time()
+        since = (self._watermark or datetime.now(timezone.utc)) - timedelta(seconds=self.settings.SCHEDULER_RELOAD_OVERLAP_SECONDS)
+        changed = await self._query(schedule_query_provider.get_changed_schedules, since=since)
+
+        now = datetime.now(timezone.utc)
+        applied = 0
+        for schedule in changed:
+            known = self._schedules.get(schedule.id)
+            # overlap 구간 때문에 이미 반영한 버전이 다시 조회될 수 있으므로 건너뜁니다.
+            if known and known.updated_at == schedule.updated_at:
+                continue
+            if not known and not schedule.is_active:
+                continue
+            if schedule.is_active:
+                self._upsert(schedule, now)
+            else:
+                self._remove(schedule.id)
+            applied += 1
+            if self._watermark is None or schedule.updated_at > self._watermark:
+                self._watermark = schedule.updated_at
+
+        self.stats.reloads += 1
+        self.stats.last_reload_changes = applied
+        if applied:
+            logger.info(f"🔄 ScheduleExecutor applied {applied} schedule change(s).")
+
+    async def _reconcile_deleted(self):
+        """하드 삭제는 updated_at으로 감지할 수 없으므로, 드물게 ID 집합만 대사합니다."""
+        self._last_reconcile = time.time()
+        active_ids = await self._query(schedule_query_provider.get_active_schedule_ids)
+        for schedule_id in set(self._schedules) - active_ids:
+            self._remove(schedule_id)
+            logger.info(f"🗑️ Schedule {schedule_id} no longer exists. Removed from executor.")
+
+    def _upsert(self, schedule: ScheduleRuntimeRead, now: datetime):
+        errors = validate_pattern(schedule.execution_mode, schedule.recurrence_pattern)
+        if errors:
+            self.stats.invalid_schedules.add(schedule.id)
+            logger.warning(f"⚠️ Schedule {schedule.id} ignored: {errors}")
+            self._remove(schedule.id)
+            return
+        self.stats.invalid_schedules.discard(schedule.id)
+
+        previous = self._schedules.get(schedule.id)
+        if previous is None or previous.start_time != schedule.start_time or previous.recurrence_pattern != schedule.recurrence_pattern:
+            # 실행 규칙 자체가 바뀌면 반복 횟수(max_cycles) 계산을 새로 시작합니다.
+            self._fired_cycles[schedule.id] = 0
+        self._schedules[schedule.id] = schedule
+
+        after = now
+        if schedule.execution_mode in ("ONCE", "CONTINUOUS"):
+            after = now - timedelta(seconds=self.settings.SCHEDULER_MISFIRE_GRACE_SECONDS)
+        self._schedule_next(schedule, after)
+
+        if schedule.end_time is not None and schedule.execution_mode == "CONTINUOUS":
+            self.wheel.schedule(("end", schedule.id), schedule.end_time.timestamp())
+
+    def _remove(self, schedule_id: int):
+        self._schedules.pop(schedule_id, None)
+        self._fired_cycles.pop(schedule_id, None)
+        self._queued_fires.pop(schedule_id, None)
+        self.wheel.cancel(("fire", schedule_id))
+        self.wheel.cancel(("end", schedule_id))
+        self.wheel.cancel(("release", schedule_id))
+        # 진행 중인 실행은 타임아웃 타이머가 정리하도록 그대로 둡니다.
+
+    def _schedule_next(self, schedule: ScheduleRuntimeRead, after: datetime):
+        next_at = next_fire_time(
+            execution_mode=schedule.execution_mode,
+            start_time=schedule.start_time,
+            end_time=schedule.end_time,
+            recurrence_pattern=schedule.recurrence_pattern,
+            after=after,
+            fired_cycles=self._fired_cycles.get(schedule.id, 0),
+            default_timezone=self.settings.SCHEDULER_DEFAULT_TIMEZONE,
+        )
+        if next_at is None:
+            self.wheel.cancel(("fire", schedule.id))
+            return
+        self.wheel.schedule(("fire", schedule.id), next_at.timestamp())
+
+    # --- 발화 처리 ---
+
+    async def _handle_due(self, due: List[Tuple], now: float):
+        pending: List[_PendingCommand] = []
+        fires: List[Tuple[ScheduleRuntimeRead, float]] = []
+
+        for key, fire_at, _ in due:
+            kind = key[0]
+            if kind == "fire":
+                schedule = self._schedules.get(key[1])
+                if schedule:
+                    fires.append((schedule, fire_at))
+            elif kind == "timeout":
+                pending.extend(self._on_timeout(key[1], key[2]))
+            elif kind == "end":
+                pending.extend(self._cancel_active_runs(key[1], reason="END_TIME"))
+            elif kind == "release":
+                pending.extend(self._release_queued(key[1]))
+
+        # 같은 틱에 겹친 발화는 우선순위(0이 최상위) → 예정 시각 순으로 집행합니다.
+        fires.sort(key=lambda item: (item[0].priority, item[1]))
+        for schedule, fire_at in fires:
+            self._fired_cycles[schedule.id] = self._fired_cycles.get(schedule.id, 0) + 1
+            pending.extend(self._apply_concurrency(schedule, fire_at, now))
+            self._schedule_next(schedule, datetime.fromtimestamp(fire_at, timezone.utc))
+
+        if pending:
+            await self._dispatch(pending, now)
+
+    def _apply_concurrency(self, schedule: ScheduleRuntimeRead, fire_at: float, now: float) -> List[_PendingCommand]:
+        running = self._active_runs.get(schedule.id)
+        policy = schedule.concurrency_policy
+        if not running or policy == "FORCED":
+            return [self._build_run(schedule, now)]
+
+        if policy == "SKIP":
+            self.stats.skipped += 1
+            logger.info(f"⏭️ Schedule {schedule.id} skipped: previous run still active.")
+            return []
+        if policy == "QUEUE":
+            self.stats.queued += 1
+            queue = self._queued_fires.setdefault(schedule.id, deque())
+            if len(queue) >= self.settings.SCHEDULER_MAX_QUEUED_FIRES:
+                dropped = queue.popleft()
+                self.stats.queue_overflows += 1
+                logger.warning(
+                    f"⚠️ Schedule {schedule.id} queue is full ({len(queue) + 1}). "
+                    f"Dropped the oldest waiting fire scheduled at {datetime.fromtimestamp(dropped, timezone.utc).isoformat()}."
+                )
+            queue.append(fire_at)
+            return []
+        if policy == "REPLACE":
+            self.stats.replaced += 1
+            return self._cancel_active_runs(schedule.id, reason="REPLACED") + [self._build_run(schedule, now)]
+
+        logger.warning(f"Unknown concurrency policy '{policy}' for schedule {schedule.id}. Treating as SKIP.")
+        self.stats.skipped += 1
+        return []
+
+    def _build_run(self, schedule: ScheduleRuntimeRead, now: float) -> _PendingCommand:
+        run = ScheduleRun(
+            schedule_id=schedule.id,
+            run_id=uuid.uuid4().hex,
+            started_at=now,
+            deadline=now + schedule.timeout_seconds if schedule.timeout_seconds else None,
+        )
+        command = {
+            "type": "SCHEDULE_RUN",
+            "schedule_id": schedule.id,
+            "run_id": run.run_id,
+            "name": schedule.name,
+            "priority": schedule.priority,
+            "logic_version": schedule.logic_version,
+            "execution_mode": schedule.execution_mode,
+            "timeout_seconds": schedule.timeout_seconds,
+            "actions": schedule.action_details,
+            "issued_at": datetime.fromtimestamp(now, timezone.utc).isoformat(),
+        }
+        return _PendingCommand(UNIT_COMMAND_TOPIC.format(unit_id=schedule.system_unit_id), command, schedule.id, run)
+
+    def _cancel_active_runs(self, schedule_id: int, *, reason: str) -> List[_PendingCommand]:
+        runs = self._active_runs.pop(schedule_id, {})
+        schedule = self._schedules.get(schedule_id)
+        commands = []
+        for run in runs.values():
+            self.wheel.cancel(("timeout", schedule_id, run.run_id))
+            if schedule:
+                commands.append(self._build_cancel(schedule, run, reason))
+        return commands
+
+    def _build_cancel(self, schedule: ScheduleRuntimeRead, run: ScheduleRun, reason: str) -> _PendingCommand:
+        command = {
+            "type": "SCHEDULE_CANCEL",
+            "schedule_id": schedule.id,
+            "run_id": run.run_id,
+            "reason": reason,
+        }
+        return _PendingCommand(UNIT_COMMAND_TOPIC.format(unit_id=schedule.system_unit_id), command, schedule.id)
+
+    def _on_timeout(self, schedule_id: int, run_id: str) -> List[_PendingCommand]:
+        run = self._active_runs.get(schedule_id, {}).pop(run_id, None)
+        if not run:
+            return []
+        self.stats.timed_out += 1
+        logger.warning(f"⌛ Schedule {schedule_id} run {run_id} timed out.")
+        commands = []
+        schedule = self._schedules.get(schedule_id)
+        if schedule:
+            commands.append(self._build_cancel(schedule, run, reason="TIMEOUT"))
+        commands.extend(self._release_queued(schedule_id))
+        return commands
+
+    def _release_queued(self, schedule_id: int) -> List[_PendingCommand]:
+        """QUEUE 정책: 선행 실행이 끝나면 대기 중인 발화 1건을 시작합니다."""
+        queue = self._queued_fires.get(schedule_id)
+        schedule = self._schedules.get(schedule_id)
+        if not queue or not schedule or self._active_runs.get(schedule_id):
+            return []
+        command = self._build_run(schedule, time.time())
+        command.queued_fire_at = queue.popleft()
+        return [command]
+
+    def _requeue(self, item: _PendingCommand, now: float):
+        """대기열에서 꺼낸 발화의 발행이 실패하면 맨 앞에 되돌리고, 잠시 뒤 다시 꺼내도록 예약합니다."""
+        if item.schedule_id not in self._schedules:
+            return
+        self._queued_fires.setdefault(item.schedule_id, deque()).appendleft(item.queued_fire_at)
+        self.wheel.schedule(("release", item.schedule_id), now + self.settings.SCHEDULER_QUEUE_RETRY_SECONDS)
+        logger.warning(f"🔁 Schedule {item.schedule_id} queued fire returned to the queue after a dispatch failure.")
+
+    def complete_run(self, schedule_id: int, run_id: str) -> List[_PendingCommand]:
+        """
+        기기로부터 실행 완료 응답을 받았을 때 호출합니다.
+        진행 중 목록에서 제거하고, QUEUE 정책의 대기 발화가 있으면 이어서 발행할 명령을 돌려줍니다.
+        이미 타임아웃/교체로 정리된 실행의 늦은 응답은 무시합니다.
+        """
+        run = self._active_runs.get(schedule_id, {}).pop(run_id, None)
+        if not run:
+            return []
+        if not self._active_runs[schedule_id]:
+            del self._active_runs[schedule_id]
+        self.stats.completed += 1
+        self.wheel.cancel(("timeout", schedule_id, run_id))
+        return self._release_queued(schedule_id)
+
+    async def _drain_completions(self):
+        """리스너가 넘긴 실행 완료 보고를 반영합니다. 발행(_dispatch)과 같은 루프에서 순서대로 처리하므로 등록 전 완료는 없습니다."""
+        completions = await asyncio.to_thread(
+            schedule_run_provider.pop_completions, limit=self.settings.SCHEDULER_RUN_COMPLETION_BATCH
+        )
+        pending: List[_PendingCommand] = []
+        for completion in completions:
+            pending.extend(self.complete_run(completion.schedule_id, completion.run_id))
+        if pending:
+            await self._dispatch(pending, time.time())
+
+    # --- 발행 ---
+
+    async def _dispatch(self, pending: List[_PendingCommand], now: float):
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(None, self._publish_batch, pending)
+
+        for item, ok in zip(pending, results):
+            if not ok:
+                self.stats.dispatch_failures += 1
+                if item.queued_fire_at is not None:
+                    self._requeue(item, now)
+                continue
+            if item.run is None:
+                continue
+            self.stats.fired += 1
+            if item.run.deadline is None:
+                # 타임아웃이 없는 실행은 발행 즉시 완료된 것으로 간주합니다. (fire-and-forget)
+                continue
+            self._active_runs.setdefault(item.schedule_id, {})[item.run.run_id] = item.run
+            self.wheel.schedule(("timeout", item.schedule_id, item.run.run_id), item.run.deadline)
+
+    def _publish_batch(self, pending: List[_PendingCommand]) -> List[bool]:
+        """한 틱의 명령들을 하나의 세션/트랜잭션으로 발행하고 감사 로그를 확정합니다."""
+        if not app_registry.command_dispatch_repository:
+            logger.warning("CommandDispatchRepository is not ready yet. Scheduled commands were not dispatched.")
+            return [False] * len(pending)
+
+        results: List[bool] = []
+        with self.db_session_factory() as db:
+            for item in pending:
+                try:
+                    publish_command(db, topic=item.topic, command=item.command, actor_user=None)
+                    results.append(True)
+                except Exception as e:
+                    logger.error(f"❌ Failed to dispatch schedule {item.schedule_id}: {e}")
+                    results.append(False)
+            try:
+                db.commit()
+            except Exception as e:
+                logger.error(f"❌ Failed to commit schedule dispatch audit logs: {e}", exc_info=True)
+                db.rollback()
+        return results
@@ -0,0 +1,614 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings
+from app.models.objects.action_log import ActorType, ActionStatus
+from app.domains.services.trigger_rule.managers.trigger_index import (
+    CompiledCondition, EvaluationContext, IndexKey, MetricSample, TriggerIndex,
+)
+from app.domains.services.trigger_rule.schemas.trigger_rule_query import TriggerRuleRuntimeRead
+from app.domains.services.trigger_rule.schemas.trigger_input import TriggerInput
+from app.domains.services.action_log.schemas.action_log_command import ActionLogCreate
+from app.domains.services.trigger_rule.repositories.trigger_execution_repository import trigger_execution_repository
+from app.domains.services.trigger_rule.repositories.trigger_input_repository import trigger_input_repository
+from app.domains.inter_domain.trigger_rule.trigger_rule_query_provider import trigger_rule_query_provider
+from app.domains.inter_domain.action_log.action_log_command_provider import action_log_command_provider
+from app.domains.inter_domain.device_management.device_query_provider import device_management_query_provider
+from app.domains.inter_domain.command_dispatch.command_dispatch_provider import publish_command, UNIT_COMMAND_TOPIC
+
+logger = logging.getLogger(__name__)
+
+# (system_unit_id, action target) — 같은 대상을 제어하는 규칙들은 하나의 실행 슬롯을 공유합니다.
+SlotKey = Tuple[int, str]
+
+@dataclass
+class _CompiledRule:
+    rule: TriggerRuleRuntimeRead
+    condition: CompiledCondition
+    slot: SlotKey
+
+@dataclass
+class TriggerExecution:
+    """슬롯을 점유 중인 '진행 중인 1회 실행' 정보입니다. action_log_id가 곧 실행 ID입니다."""
+    rule_id: int
+    priority: int
+    slot: SlotKey
+    started_at: float
+    deadline: float
+    action_log_id: Optional[int] = None
+
+@dataclass
+class _Decision:
+    """잠금 구간에서 내린 판정. DB 기록과 발행은 잠금 밖에서 수행합니다."""
+    kind: str  # RUN / SKIP / CANCEL
+    rule: Optional[TriggerRuleRuntimeRead] = None
+    evidence: Optional[MetricSample] = None
+    execution: Optional[TriggerExecution] = None
+    outcome: Optional[str] = None
+    blocked_by: Optional[int] = None
+    action_log_id: Optional[int] = None
+
+@dataclass
+class TriggerEngineStats:
+    loaded: int = 0
+    evaluated: int = 0
+    fired: int = 0
+    skipped: int = 0
+    queued: int = 0
+    replaced: int = 0
+    timed_out: int = 0
+    completed: int = 0
+    dispatch_failures: int = 0
+    reloads: int = 0
+    invalid_rules: Set[int] = field(default_factory=set)
+
+class TriggerEngine:
+    """
+    [Application Layer] 이벤트 기반 트리거 엔진:
+    TriggerRule.condition이 참조하는 메트릭/이벤트로 역색인을 구성하고,
+    수신된 텔레메트리/이벤트가 건드린 규칙만 평가합니다. (전체 규칙 스캔 없음)
+
+    - 매칭된 규칙은 priority(숫자가 작을수록 우선) 순서로 처리합니다.
+    - 동시성 정책은 (유닛, action.target) 슬롯 단위로 집행합니다.
+      SKIP: 슬롯 점유 시 건너뜀 / QUEUE: 슬롯이 비면 우선순위 순으로 실행 / REPLACE: 기존 실행 취소 후 교체
+      (단, 더 높은 우선순위의 실행은 낮은 우선순위 규칙이 교체할 수 없습니다) / FORCED: 슬롯과 무관하게 실행
+    - 발화 방식: ONCE/CRON은 거짓→참 전이 시에만, CONTINUOUS/INTERVAL은 참인 동안 쿨다운 간격으로 재발화합니다.
+    - timeout_seconds가 없는 실행은 발행 즉시 슬롯을 반환합니다. (fire-and-forget)
+    - 모든 판정 결과는 ActionLog(actor_type=SYSTEM)에 기록되며, 그 ID가 실행 ID로 기기에 전달됩니다.
+      명령은 ActionLog가 커밋된 뒤에만 발행합니다. (기록이 되돌려졌는데 명령만 기기에 도달하는 일 방지)
+
+    슬롯/대기열/duration 추적/전이 상태가 프로세스마다 갈리지 않도록 엔진은 리더 워커 1곳에서만 돕니다.
+    수신 프로세스는 커밋을 마친 텔레메트리/이벤트를 평가 대기열(trigger_input_repository)에 넣고,
+    기기의 완료 응답은 리스너가 ActionLog를 확정한 뒤 완료 표식(trigger_execution_repository)으로 남깁니다.
+    엔진 루프는 대기열을 묶음으로 꺼내 평가하며, 같은 주기로 규칙 리로드/완료 회수/타임아웃 만료를 수행합니다.
+    리더가 바뀌면 새 리더는 빈 상태에서 시작합니다. (이전 리더의 진행 중 실행은 기기 응답으로만 확정됩니다)
+    DB/Redis 조회는 엔진 잠금 밖에서 수행하고, 잠금 구간에서는 메모리 상태만 바꿉니다.
+    """
+    def __init__(self, settings: Settings, db_session_factory: Callable[..., Session]):
+        self.settings = settings
+        self.db_session_factory = db_session_factory
+        self.stats = TriggerEngineStats()
+        self._lock = threading.RLock()
+        self._reload_lock = threading.Lock()
+
+        self._index = TriggerIndex()
+        self._rules: Dict[int, _CompiledRule] = {}
+        self._hold_state: Dict[int, Dict[int, float]] = {}
+        self._last_result: Dict[int, bool] = {}
+        self._last_fired: Dict[int, float] = {}
+
+        self._unit_metrics: Dict[int, Dict[Tuple[str, Optional[str]], MetricSample]] = {}
+        self._slots: Dict[SlotKey, TriggerExecution] = {}
+        self._executions: Dict[int, TriggerExecution] = {}
+        self._queues: Dict[SlotKey, List[Tuple[int, int, int, Optional[MetricSample]]]] = {}
+        self._queue_seq = itertools.count()
+
+        self._watermark: Optional[datetime] = None
+        self._last_reload = 0.0
+        self._last_reconcile = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    # --- 생명주기 ---
+
+    async def start(self):
+        """평가 대기열 소비 루프를 백그라운드 태스크로 시작합니다. (Non-blocking)"""
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run_loop())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("TriggerEngine stopped.")
+
+    async def _run_loop(self):
+        logger.info("⚡ TriggerEngine loop started.")
+        while True:
+            try:
+                inputs = await asyncio.to_thread(trigger_input_repository.pop_many, limit=self.settings.TRIGGER_INPUT_BATCH)
+                if inputs or self._has_pending_work():
+                    await asyncio.to_thread(self.process_inputs, inputs)
+                if len(inputs) < self.settings.TRIGGER_INPUT_BATCH:
+                    await asyncio.sleep(self.settings.TRIGGER_POLL_INTERVAL_SECONDS)
+            except asyncio.CancelledError:
+                logger.info("TriggerEngine loop is being cancelled...")
+                raise
+            except Exception as e:
+                logger.error(f"❌ Error in TriggerEngine loop: {e}", exc_info=True)
+                await asyncio.sleep(self.settings.TRIGGER_POLL_INTERVAL_SECONDS)
+
+    def _has_pending_work(self) -> bool:
+        """입력이 없어도 완료 회수/타임아웃 만료/리로드를 위해 한 번 돌아야 하는지 판단합니다."""
+        now = time.time()
+        return bool(self._executions or self._queues) or self._watermark is None or self._reload_due(now) or self._reconcile_due(now)
+
+    # --- 규칙 적재 ---
+
+    def _maybe_reload(self, db: Session, now: float):
+        """
+        규칙 리로드/대사가 필요하면 수행합니다. 조회는 잠금 밖에서 하므로 다른 스레드의 평가를 막지 않으며,
+        조회는 한 스레드만 수행하고 나머지는 기존 색인으로 평가를 이어갑니다. (최초 적재만 완료를 기다립니다)
+        """
+        initial = self._watermark is None
+        if not initial and not self._reload_due(now) and not self._reconcile_due(now):
+            return
+        if not self._reload_lock.acquire(blocking=initial):
+            return
+        try:
+            if self._watermark is None:
+                rules = trigger_rule_query_provider.get_active_rules(db)
+                with self._lock:
+                    for rule in rules:
+                        self._upsert(rule)
+                    self._watermark = max((r.updated_at for r in rules), default=datetime.now(timezone.utc))
+                    self._last_reload = self._last_reconcile = now
+                    self.stats.loaded = len(self._rules)
+                logger.info(f"⚡ TriggerEngine indexed {len(self._rules)} rule(s).")
+                return
+
+            if self._reload_due(now):
+                self._last_reload = now
+                since = self._watermark - timedelta(seconds=self.settings.TRIGGER_RELOAD_OVERLAP_SECONDS)
+                changed = trigger_rule_query_provider.get_changed_rules(db, since=since)
+                applied = 0
+                with self._lock:
+                    for rule in changed:
+                        known = self._rules.get(rule.id)
+                        # overlap 구간 때문에 이미 반영한 버전이 다시 조회될 수 있으므로 건너뜁니다.
+                        if known and known.rule.updated_at == rule.updated_at:
+                            continue
+                        if rule.is_active:
+                            self._upsert(rule)
+                        else:
+                            self._remove(rule.id)
+                        applied += 1
+                        if rule.updated_at > self._watermark:
+                            self._watermark = rule.updated_at
+                    self.stats.reloads += 1
+                if applied:
+                    logger.info(f"🔄 TriggerEngine applied {applied} rule change(s).")
+
+            if self._reconcile_due(now):
+                # 하드 삭제는 updated_at으로 감지할 수 없으므로, 드물게 ID 집합만 대사합니다.
+                self._last_reconcile = now
+                active_ids = trigger_rule_query_provider.get_active_rule_ids(db)
+                with self._lock:
+                    for rule_id in set(self._rules) - active_ids:
+                        self._remove(rule_id)
+        finally:
+            self._reload_lock.release()
+
+    def _reload_due(self, now: float) -> bool:
+        return now - self._last_reload >= self.settings.TRIGGER_RELOAD_INTERVAL_SECONDS
+
+    def _reconcile_due(self, now: float) -> bool:
+        return now - self._last_reconcile >= self.settings.TRIGGER_RECONCILE_INTERVAL_SECONDS
+
+    def _upsert(self, rule: TriggerRuleRuntimeRead):
+        try:
+            condition = CompiledCondition(rule.condition)
+        except Exception as e:
+            self.stats.invalid_rules.add(rule.id)
+            logger.warning(f"⚠️ TriggerRule {rule.id} ignored: {e}")
+            self._remove(rule.id)
+            return
+        self.stats.invalid_rules.discard(rule.id)
+
+        previous = self._rules.get(rule.id)
+        if previous is None or previous.rule.condition != rule.condition:
+            # 조건식이 바뀌면 duration 추적과 전이(edge) 상태를 새로 시작합니다.
+            self._hold_state[rule.id] = {}
+            self._last_result[rule.id] = False
+
+        target = str((rule.action or {}).get("target") or f"rule:{rule.id}")
+        self._rules[rule.id] = _CompiledRule(rule, condition, (rule.system_unit_id, target))
+        self._index.add(rule.id, rule.system_unit_id, condition.keys)
+
+    def _remove(self, rule_id: int):
+        self._rules.pop(rule_id, None)
+        self._index.remove(rule_id)
+        self._hold_state.pop(rule_id, None)
+        self._last_result.pop(rule_id, None)
+        self._last_fired.pop(rule_id, None)
+
+    # --- 평가 진입점 ---
+
+    def process_inputs(self, inputs: List[TriggerInput]) -> int:
+        """
+        평가 입력 묶음을 처리합니다. (엔진 루프 스레드)
+        1) 규칙 리로드, 다른 프로세스가 남긴 완료 표식 회수, 타임아웃 만료
+        2) 입력 순서대로 평가해 판정을 모으고, ActionLog를 기록해 커밋
+        3) 커밋이 끝난 뒤에만 명령을 발행하고, 발행 감사 로그/발행 실패 결과를 다시 커밋
+        발화(RUN)된 규칙 수를 반환합니다.
+        """
+        now = time.time()
+        with self.db_session_factory() as db:
+            self._maybe_reload(db, now)
+            finished = self._collect_finished()
+            with self._lock:
+                decisions = self._release_finished(finished, now)
+                decisions.extend(self._expire_slots(now))
+                for trigger_input in inputs:
+                    decisions.extend(self._evaluate_input(trigger_input, now))
+            if not decisions:
+                return 0
+
+            try:
+                self._record(db, decisions)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.error(f"❌ TriggerEngine failed to record decisions: {e}", exc_info=True)
+                self._abandon(decisions)
+                return 0
+
+            fired = self._dispatch(db, decisions, now)
+            try:
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.error(f"❌ TriggerEngine failed to commit dispatch results: {e}", exc_info=True)
+        self.stats.fired += fired
+        return fired
+
+    def _evaluate_input(self, trigger_input: TriggerInput, now: float) -> List[_Decision]:
+        """입력 1건으로 유닛의 최신값 캐시를 갱신하고, 건드린 메트릭/이벤트를 참조하는 규칙만 평가합니다. (잠금 구간)"""
+        system_unit_id = trigger_input.system_unit_id
+        metrics = self._unit_metrics.setdefault(system_unit_id, {})
+        if trigger_input.event_type:
+            event = {"type": trigger_input.event_type, "device_id": trigger_input.device_id, "details": trigger_input.details}
+            return self._evaluate(system_unit_id, {("event", trigger_input.event_type)}, metrics, event, now)
+
+        touched: Set[IndexKey] = set()
+        for row in trigger_input.metrics:
+            sample = MetricSample(
+                stats={"avg": row.avg, "min": row.min, "max": row.max, "std": row.std, "slope": row.slope},
+                captured_at=row.captured_at,
+                device_id=row.device_id,
+                snapshot_id=row.snapshot_id,
+            )
+            for key in ((row.metric_name, row.component_name), (row.metric_name, None)):
+                current = metrics.get(key)
+                # 배치 내 순서가 뒤섞여 도착해도 더 최신 샘플만 반영합니다.
+                if current is None or row.captured_at >= current.captured_at:
+                    metrics[key] = sample
+            touched.add(("metric", row.metric_name))
+        if not touched:
+            return []
+        return self._evaluate(system_unit_id, touched, metrics, None, now)
+
+    def _collect_finished(self) -> Set[int]:
+        """진행 중인 실행 중, 리스너가 완료 표식을 남긴 것을 회수합니다. (잠금 밖, Redis 1회)"""
+        with self._lock:
+            pending = list(self._executions)
+        if not pending:
+            return set()
+        try:
+            return trigger_execution_repository.pop_finished(pending)
+        except Exception as e:
+            # 회수하지 못한 실행은 타임아웃으로 정리되므로 평가는 계속합니다.
+            logger.warning(f"⚠️ TriggerEngine failed to collect finished executions: {e}")
+            return set()
+
+    def _release_finished(self, action_log_ids: Set[int], now: float) -> List[_Decision]:
+        decisions: List[_Decision] = []
+        for action_log_id in action_log_ids:
+            execution = self._executions.pop(action_log_id, None)
+            if execution is None:
+                continue
+            self.stats.completed += 1
+            if self._slots.get(execution.slot) is execution:
+                del self._slots[execution.slot]
+                decisions.extend(self._release_queue(execution.slot, now))
+        return decisions
+
+    # --- 판정 (잠금 구간) ---
+
+    def _evaluate(
+        self,
+        system_unit_id: int,
+        keys: Set[IndexKey],
+        metrics: Dict[Tuple[str, Optional[str]], MetricSample],
+        event: Optional[Dict[str, Any]],
+        now: float,
+    ) -> List[_Decision]:
+        decisions: List[_Decision] = []
+        candidates = [self._rules[rid] for rid in self._index.lookup(system_unit_id, keys) if rid in self._rules]
+        candidates.sort(key=lambda c: (c.rule.priority, c.rule.id))
+        self.stats.evaluated += len(candidates)
+
+        for compiled in candidates:
+            rule = compiled.rule
+            ctx = EvaluationContext(
+                metrics=metrics,
+                now=now,
+                stale_after=self.settings.TRIGGER_METRIC_STALE_SECONDS,
+                event=event,
+                hold_state=self._hold_state.setdefault(rule.id, {}),
+            )
+            matched = compiled.condition.evaluate(ctx)
+            if not self._should_fire(compiled, matched, event is not None, now):
+                continue
+            evidence = ctx.evidence[-1] if ctx.evidence else None
+            if evidence is None and event is not None:
+                evidence = MetricSample(stats={}, captured_at=now, device_id=event["device_id"])
+            if evidence is None:
+                continue
+            self._last_fired[rule.id] = now
+            decisions.extend(self._apply_concurrency(compiled, evidence, now))
+        return decisions
+
+    def _should_fire(self, compiled: _CompiledRule, matched: bool, by_event: bool, now: float) -> bool:
+        rule = compiled.rule
+        was_matched = self._last_result.get(rule.id, False)
+        # 이벤트는 순간 값이므로, 이벤트가 유발한 평가 결과는 다음 전이(edge) 판정에 남기지 않습니다.
+        if not by_event:
+            self._last_result[rule.id] = matched
+        if not matched:
+            return False
+        if not was_matched:
+            return True
+        if rule.execution_mode in ("CONTINUOUS", "INTERVAL"):
+            cooldown = rule.timeout_seconds or self.settings.TRIGGER_DEFAULT_COOLDOWN_SECONDS
+            return now - self._last_fired.get(rule.id, 0.0) >= cooldown
+        return False
+
+    def _apply_concurrency(self, compiled: _CompiledRule, evidence: MetricSample, now: float) -> List[_Decision]:
+        rule = compiled.rule
+        running = self._slots.get(compiled.slot)
+        policy = rule.concurrency_policy
+        if running is None or policy == "FORCED":
+            return [self._start(compiled, evidence, now)]
+
+        if policy == "REPLACE":
+            if rule.priority > running.priority:
+                self.stats.skipped += 1
+                return [_Decision("SKIP", rule=rule, evidence=evidence, outcome="PREEMPTION_DENIED", blocked_by=running.action_log_id)]
+            self.stats.replaced += 1
+            return [self._cancel(running, outcome="REPLACED"), self._start(compiled, evidence, now)]
+
+        if policy == "QUEUE":
+            queue = self._queues.setdefault(compiled.slot, [])
+            if len(queue) >= self.settings.TRIGGER_MAX_QUEUE_PER_SLOT:
+                self.stats.skipped += 1
+                return [_Decision("SKIP", rule=rule, evidence=evidence, outcome="QUEUE_FULL", blocked_by=running.action_log_id)]
+            self.stats.queued += 1
+            heapq.heappush(queue, (rule.priority, next(self._queue_seq), rule.id, evidence))
+            return []
+
+        self.stats.skipped += 1
+        return [_Decision("SKIP", rule=rule, evidence=evidence, outcome="SKIPPED", blocked_by=running.action_log_id)]
+
+    def _start(self, compiled: _CompiledRule, evidence: MetricSample, now: float) -> _Decision:
+        rule = compiled.rule
+        execution = None
+        if rule.timeout_seconds:
+            execution = TriggerExecution(
+                rule_id=rule.id,
+                priority=rule.priority,
+                slot=compiled.slot,
+                started_at=now,
+                deadline=now + rule.timeout_seconds,
+            )
+            if rule.concurrency_policy != "FORCED":
+                self._slots[compiled.slot] = execution
+        return _Decision("RUN", rule=rule, evidence=evidence, execution=execution)
+
+    def _cancel(self, execution: TriggerExecution, *, outcome: str) -> _Decision:
+        if self._slots.get(execution.slot) is execution:
+            del self._slots[execution.slot]
+        if execution.action_log_id is not None:
+            self._executions.pop(execution.action_log_id, None)
+        return _Decision("CANCEL", execution=execution, outcome=outcome)
+
+    def _expire_slots(self, now: float) -> List[_Decision]:
+        """타임아웃이 지난 실행을 만료시키고, 비게 된 슬롯의 QUEUE 대기 규칙을 꺼냅니다."""
+        decisions: List[_Decision] = []
+        expired = [e for e in self._executions.values() if e.deadline <= now]
+        for execution in expired:
+            self.stats.timed_out += 1
+            decisions.append(self._cancel(execution, outcome="TIMEOUT"))
+        for slot in {e.slot for e in expired} | set(self._queues):
+            if slot not in self._slots:
+                decisions.extend(self._release_queue(slot, now))
+        return decisions
+
+    def _release_queue(self, slot: SlotKey, now: float) -> List[_Decision]:
+        queue = self._queues.get(slot)
+        while queue:
+            _, _, rule_id, evidence = heapq.heappop(queue)
+            compiled = self._rules.get(rule_id)
+            if compiled is None or evidence is None:
+                continue
+            if not queue:
+                del self._queues[slot]
+            return [self._start(compiled, evidence, now)]
+        self._queues.pop(slot, None)
+        return []
+
+    # --- 기록 및 발행 (잠금 밖) ---
+
+    def _record(self, db: Session, decisions: List[_Decision]) -> None:
+        """판정을 ActionLog에 기록합니다. 실행 ID(action_log_id)는 여기서 정해지며, 발행은 커밋 후 _dispatch가 합니다."""
+        logged = [d for d in decisions if d.kind in ("RUN", "SKIP")]
+        logs = action_log_command_provider.create_logs(db, obj_in_list=[self._to_log(d) for d in logged])
+        for decision, log in zip(logged, logs):
+            decision.action_log_id = log.id
+        with self._lock:
+            for decision in logged:
+                if decision.execution is not None:
+                    decision.execution.action_log_id = decision.action_log_id
+                    self._executions[decision.action_log_id] = decision.execution
+
+        for decision in decisions:
+            execution = decision.execution
+            if decision.kind == "CANCEL" and execution.action_log_id is not None:
+                action_log_command_provider.update_status(
+                    db,
+                    action_log_id=execution.action_log_id,
+                    status=ActionStatus.TIMEOUT if decision.outcome == "TIMEOUT" else ActionStatus.FAILED,
+                    execution_result={"outcome": decision.outcome},
+                )
+
+    def _abandon(self, decisions: List[_Decision]) -> None:
+        """기록에 실패한 실행이 슬롯을 영구 점유하지 않도록 반환합니다. (발행 전이므로 기기에는 아무것도 가지 않았습니다)"""
+        with self._lock:
+            for decision in decisions:
+                execution = decision.execution
+                if decision.kind == "RUN" and execution is not None:
+                    if self._slots.get(execution.slot) is execution:
+                        del self._slots[execution.slot]
+                    if execution.action_log_id is not None:
+                        self._executions.pop(execution.action_log_id, None)
+
+    def _dispatch(self, db: Session, decisions: List[_Decision], now: float) -> int:
+        fired = 0
+        for decision in decisions:
+            if decision.kind == "CANCEL":
+                self._dispatch_cancel(db, decision)
+            elif decision.kind == "RUN" and self._dispatch_run(db, decision, now):
+                fired += 1
+        return fired
+
+    def _to_log(self, decision: _Decision) -> ActionLogCreate:
+        rule = decision.rule
+        action = rule.action or {}
+        result = None
+        status = ActionStatus.REQUESTED
+        if decision.kind == "SKIP":
+            status = ActionStatus.FAILED
+            result = {"outcome": decision.outcome, "blocked_by": decision.blocked_by}
+        return ActionLogCreate(
+            device_id=decision.evidence.device_id,
+            system_unit_id=rule.system_unit_id,
+            organization_id=rule.organization_id,
+            snapshot_id=decision.evidence.snapshot_id,
+            actor_type=ActorType.SYSTEM,
+            command=str(action.get("cmd") or "TRIGGER_RUN")[:100],
+            parameters={
+                "trigger_rule_id": rule.id,
+                "rule_name": rule.name,
+                "priority": rule.priority,
+                "logic_version": rule.logic_version,
+                "action": action,
+            },
+            status=status,
+            execution_result=result,
+        )
+
+    def _dispatch_run(self, db: Session, decision: _Decision, now: float) -> bool:
+        rule = decision.rule
+        action_log_id = decision.action_log_id
+        command = {
+            "type": "TRIGGER_RUN",
+            "rule_id": rule.id,
+            "execution_id": action_log_id,
+            "name": rule.name,
+            "priority": rule.priority,
+            "logic_version": rule.logic_version,
+            "timeout_seconds": rule.timeout_seconds,
+            "action": rule.action,
+            "snapshot_id": decision.evidence.snapshot_id,
+            "issued_at": datetime.fromtimestamp(now, timezone.utc).isoformat(),
+        }
+        try:
+            publish_command(db, topic=UNIT_COMMAND_TOPIC.format(unit_id=rule.system_unit_id), command=command, actor_user=None)
+            return True
+        except Exception as e:
+            self.stats.dispatch_failures += 1
+            logger.error(f"❌ Failed to dispatch trigger rule {rule.id}: {e}")
+            with self._lock:
+                execution = self._executions.pop(action_log_id, None)
+                if execution is not None and self._slots.get(execution.slot) is execution:
+                    del self._slots[execution.slot]
+            action_log_command_provider.update_status(
+                db, action_log_id=action_log_id, status=ActionStatus.FAILED,
+                execution_result={"outcome": "DISPATCH_FAILED", "error": str(e)},
+            )
+            return False
+
+    def _dispatch_cancel(self, db: Session, decision: _Decision):
+        execution = decision.execution
+        if execution.action_log_id is None:
+            return
+        compiled = self._rules.get(execution.rule_id)
+        if compiled is not None:
+            command = {
+                "type": "TRIGGER_CANCEL",
+                "rule_id": execution.rule_id,
+                "execution_id": execution.action_log_id,
+                "reason": decision.outcome,
+            }
+            try:
+                publish_command(db, topic=UNIT_COMMAND_TOPIC.format(unit_id=execution.slot[0]), command=command, actor_user=None)
+            except Exception as e:
+                logger.error(f"❌ Failed to dispatch trigger cancel for execution {execution.action_log_id}: {e}")
+
+    def active_executions(self, system_unit_id: Optional[int] = None) -> List[TriggerExecution]:
+        with self._lock:
+            return [e for e in self._slots.values() if system_unit_id is None or e.slot[0] == system_unit_id]
+
+def report_execution_result(db: Session, *, device_uuid: str, action_log_id: int, success: bool, result: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    기기의 실행 완료 응답을 ActionLog에 확정합니다. (리스너의 commands/response 경로, 커밋은 호출자가 수행)
+    - 응답 토픽의 기기가 ActionLog와 같은 유닛 소속일 때만 반영합니다. (다른 기기가 순차 execution_id로 남의 실행을 끝내는 것 방지)
+    - ActionLog가 아직 REQUESTED일 때만 SUCCESS/FAILED로 확정합니다. (타임아웃/교체된 실행의 늦은 응답은 무시)
+    커밋 후 release_execution으로 완료 표식을 남기면 리더의 엔진이 슬롯을 반환하고 QUEUE 대기 규칙을 이어서 발행합니다.
+    """
+    try:
+        parsed_uuid = UUID(device_uuid)
+    except ValueError:
+        return False
+    device = device_management_query_provider.get_device_by_uuid(db, current_uuid=parsed_uuid)
+    if device is None or device.system_unit_id is None:
+        return False
+    updated = action_log_command_provider.update_status(
+        db,
+        action_log_id=action_log_id,
+        status=ActionStatus.SUCCESS if success else ActionStatus.FAILED,
+        execution_result={"outcome": "COMPLETED" if success else "DEVICE_FAILED", **(result or {})},
+        expected_status=ActionStatus.REQUESTED,
+        expected_system_unit_id=device.system_unit_id,
+    )
+    if updated is None:
+        logger.warning(f"🚫 Ignored trigger execution {action_log_id} result from device {device_uuid}")
+        return False
+    return True
+
+def release_execution(action_log_id: int) -> None:
+    """확정이 커밋된 실행의 완료 표식을 남깁니다. 리더의 엔진이 다음 주기에 회수합니다."""
+    trigger_execution_repository.mark_finished(action_log_id)
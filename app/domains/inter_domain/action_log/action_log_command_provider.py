@@ -0,0 +1,32 @@
+from sqlalchemy.orm import Session
+from typing import List, Optional, Dict, Any
+
+from app.models.objects.action_log import ActionLog, ActionStatus
+from app.domains.services.action_log.services.action_log_command_service import action_log_command_service
+from app.domains.services.action_log.schemas.action_log_command import ActionLogCreate, ActionLogStatusUpdate
+
+class ActionLogCommandProvider:
+    """
+    [Inter-Domain Provider]
+    제어 명령의 요청/결과를 ActionLog에 기록하는 공식 통로
+    """
+    def create_logs(self, db: Session, *, obj_in_list: List[ActionLogCreate]) -> List[ActionLog]:
+        return action_log_command_service.create_logs(db, obj_in_list=obj_in_list)
+
+    def update_status(
+        self,
+        db: Session,
+        *,
+        action_log_id: int,
+        status: ActionStatus,
+        execution_result: Optional[Dict[str, Any]] = None,
+        expected_status: Optional[ActionStatus] = None,
+        expected_system_unit_id: Optional[int] = None
+    ) -> Optional[ActionLog]:
+        obj_in = ActionLogStatusUpdate(status=status, execution_result=execution_result)
+        return action_log_command_service.update_status(
+            db, action_log_id=action_log_id, obj_in=obj_in,
+            expected_status=expected_status, expected_system_unit_id=expected_system_unit_id
+        )
+
+action_log_command_provider = ActionLogCommandProvider()
@@ -1,4 +1,6 @@
 from sqlalchemy.orm import Session
+from typing import List
+from app.domains.services.batch_tracking.schemas.batch_tracking_command_schema import BatchProgressSnapshot
 from app.domains.services.batch_tracking.services.batch_command_service import batch_command_service
 
 class BatchStatusCommandProvider:
@@ -8,4 +10,13 @@ class BatchStatusCommandProvider:
     def mark_item_processed(self, db: Session, *, batch_id: str):
         return batch_command_service.increment_processed_count(db, batch_id=batch_id)
 
+    def collect_progress(self, *, limit: int) -> List[BatchProgressSnapshot]:
+        return batch_command_service.collect_progress(limit=limit)
+
+    def apply_progress(self, db: Session, *, snapshots: List[BatchProgressSnapshot]) -> None:
+        return batch_command_service.apply_progress(db, snapshots=snapshots)
+
+    def requeue_progress(self, batch_ids: List[str]) -> None:
+        return batch_command_service.requeue_progress(batch_ids)
+
 batch_status_command_provider = BatchStatusCommandProvider()
\ No newline at end of file
@@ -1,8 +1,19 @@
-from typing import Dict, Optional
+import uuid
+from typing import Any, Dict, Optional, Tuple
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models.objects.user import User
 from app.domains.services.certificate_management.repositories.vault_certificate_command_repository import vault_certificate_command_repository
+from app.domains.services.certificate_management.managers.device_certificate_pool import DeviceCertificatePool
+
+# 공장 등록용 선발급 인증서 풀 (DEVICE_CERT_POOL_SIZE > 0 일 때 lifespan에서 start)
+device_certificate_pool = DeviceCertificatePool(
+    lambda device_uuid: vault_certificate_command_repository.generate_device_certificate(common_name=device_uuid),
+    target_size=settings.DEVICE_CERT_POOL_SIZE,
+    max_age_seconds=settings.DEVICE_CERT_POOL_MAX_AGE_HOURS * 3600,
+    refill_concurrency=settings.DEVICE_CERT_POOL_REFILL_CONCURRENCY,
+)
 
 class CertificateCommandProvider:
     """
@@ -18,6 +29,21 @@ class CertificateCommandProvider:
         """
         return vault_certificate_command_repository.create_device_certificate(db, common_name=common_name, actor_user=actor_user)
 
+    def obtain_device_certificate(self) -> Tuple[str, Dict[str, Any]]:
+        """
+        (기기 UUID, 인증서)를 반환합니다. 선발급 풀에 있으면 꺼내 쓰고, 없으면 새 UUID로 즉시 발급합니다.
+        DB를 쓰지 않으므로 스레드에서 병렬로 호출할 수 있으며, 감사 로그는 record_device_certificate로 남깁니다.
+        """
+        pooled = device_certificate_pool.take()
+        if pooled:
+            return pooled.device_uuid, pooled.cert_data
+        device_uuid = str(uuid.uuid4())
+        return device_uuid, vault_certificate_command_repository.generate_device_certificate(common_name=device_uuid)
+
+    def record_device_certificate(self, db: Session, *, common_name: str, cert_data: Dict[str, Any], actor_user: Optional[User] = None) -> None:
+        """obtain_device_certificate로 받은 인증서의 발급 감사 로그를 기록합니다."""
+        vault_certificate_command_repository.record_device_certificate(db, common_name=common_name, cert_data=cert_data, actor_user=actor_user)
+
     def issue_server_mqtt_cert(self, db: Session, *, actor_user: Optional[User] = None) -> Dict:
         """
         서버 자신(MQTT 클라이언트)을 위한 새로운 인증서를 발급하고 감사 로그를 기록합니다。
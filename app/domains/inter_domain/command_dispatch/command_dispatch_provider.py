@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
 
 from app.models.objects.user import User
@@ -7,6 +7,11 @@ from app.core.registry import app_registry # Access the global registry
 
 logger = logging.getLogger(__name__)
 
+# 유닛 단위 자동화 명령(스케줄/트리거 실행)이 발행되는 토픽
+UNIT_COMMAND_TOPIC = "ares4/units/{unit_id}/commands"
+# 기기 단위 명령(팬아웃)이 발행되는 토픽. 기기는 commands/response/{uuid}로 응답합니다.
+DEVICE_COMMAND_TOPIC = "ares4/{device_uuid}/commands"
+
 def publish_command(db: Session, *, topic: str, command: Dict, actor_user: Optional[User]):
     """
     AppRegistry에 등록된 CommandDispatchRepository를 통해 명령 메시지를 발행합니다.
@@ -20,4 +25,13 @@ def publish_command(db: Session, *, topic: str, command: Dict, actor_user: Optio
         topic=topic,
         command=command,
         actor_user=actor_user
-    )
\ No newline at end of file
+    )
+
+def publish_commands(messages: List[Tuple[str, Dict]]) -> int:
+    """
+    (토픽, 명령) 묶음을 감사 로그 없이 연속 발행하고, 발행된 앞쪽 건수를 반환합니다.
+    저장소가 아직 준비되지 않았으면 0을 반환합니다. (호출자가 다음 주기에 재시도)
+    """
+    if not app_registry.command_dispatch_repository:
+        return 0
+    return app_registry.command_dispatch_repository.publish_many(messages)
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import List
+from sqlalchemy.orm import Session
+
+from app.models.events_logs.command_delivery import CommandDispatch, CommandDispatchStatus
+from app.domains.services.command_fanout.services.command_fanout_command_service import command_fanout_command_service
+from app.domains.services.command_fanout.schemas.command_fanout_command import CommandDispatchCreate, CommandAck
+
+class CommandFanoutCommandProvider:
+    """
+    [Inter-Domain Provider]
+    명령 팬아웃 작업의 생성(Policy), 발행/타임아웃 기록(엔진), 응답 일괄 반영(리스너)을 위한 공식 통로
+    """
+    def create_dispatch(self, db: Session, *, obj_in: CommandDispatchCreate, device_ids: List[int]) -> CommandDispatch:
+        return command_fanout_command_service.create_dispatch(db, obj_in=obj_in, device_ids=device_ids)
+
+    def mark_sent(self, db: Session, *, delivery_ids: List[int], sent_at: datetime) -> None:
+        command_fanout_command_service.mark_sent(db, delivery_ids=delivery_ids, sent_at=sent_at)
+
+    def requeue(self, db: Session, *, delivery_ids: List[int]) -> None:
+        command_fanout_command_service.requeue(db, delivery_ids=delivery_ids)
+
+    def apply_acks(self, db: Session, *, acks: List[CommandAck]) -> None:
+        command_fanout_command_service.apply_acks(db, acks=acks)
+
+    def expire_timeouts(self, db: Session, *, dispatch_id: int, ack_timeout_seconds: int, now: datetime) -> int:
+        return command_fanout_command_service.expire_timeouts(
+            db, dispatch_id=dispatch_id, ack_timeout_seconds=ack_timeout_seconds, now=now
+        )
+
+    def mark_running(self, db: Session, *, dispatch_id: int, now: datetime) -> None:
+        command_fanout_command_service.mark_running(db, dispatch_id=dispatch_id, now=now)
+
+    def mark_finished(self, db: Session, *, dispatch_id: int, status: CommandDispatchStatus, now: datetime) -> None:
+        command_fanout_command_service.mark_finished(db, dispatch_id=dispatch_id, status=status, now=now)
+
+command_fanout_command_provider = CommandFanoutCommandProvider()
@@ -0,0 +1,34 @@
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+
+from app.models.events_logs.command_delivery import CommandTargetType
+from app.domains.services.command_fanout.services.command_fanout_query_service import command_fanout_query_service
+from app.domains.services.command_fanout.schemas.command_fanout_query import (
+    CommandDispatchRuntimeRead, QueuedDelivery, CommandDispatchProgress
+)
+
+class CommandFanoutQueryProvider:
+    """
+    [Inter-Domain Provider]
+    팬아웃 엔진과 Policy가 대상 기기·전달 상태·진행 현황을 조회할 때 사용하는 공식 통로
+    """
+    def get_target_device_ids(
+        self, db: Session, *, target_type: CommandTargetType, target_id: int, owner_organization_id: Optional[int] = None
+    ) -> List[int]:
+        return command_fanout_query_service.get_target_device_ids(
+            db, target_type=target_type, target_id=target_id, owner_organization_id=owner_organization_id
+        )
+
+    def get_runnable_dispatches(self, db: Session) -> List[CommandDispatchRuntimeRead]:
+        return command_fanout_query_service.get_runnable_dispatches(db)
+
+    def count_by_status(self, db: Session, *, dispatch_id: int) -> Dict[str, int]:
+        return command_fanout_query_service.count_by_status(db, dispatch_id=dispatch_id)
+
+    def get_queued(self, db: Session, *, dispatch_id: int, limit: int) -> List[QueuedDelivery]:
+        return command_fanout_query_service.get_queued(db, dispatch_id=dispatch_id, limit=limit)
+
+    def get_progress(self, db: Session, *, dispatch_id: int) -> Optional[CommandDispatchProgress]:
+        return command_fanout_query_service.get_progress(db, dispatch_id=dispatch_id)
+
+command_fanout_query_provider = CommandFanoutQueryProvider()
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Any, Callable, Dict, List, Optional
 
 # --- [수정] DBDevice 임포트 위치 및 명칭 확정 ---
 from app.models.objects.device import Device as DBDevice 
@@ -35,6 +35,26 @@ class DeviceComponentCommandProvider:
             actor_user=actor_user
         )
 
+    def bulk_reinitialize_by_recipe(
+        self,
+        db: Session,
+        *,
+        device_ids: List[int],
+        recipe: List[BlueprintPinMappingRead],
+        pin_pool: List[int],
+        actor_user: User,
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """[Fleet Rollout] 하나의 레시피(고장 핀 우회 포함)를 여러 기기에 일괄 적용하는 통로"""
+        return device_component_instance_command_service.bulk_reinitialize_by_recipe(
+            db=db,
+            device_ids=device_ids,
+            recipe=recipe,
+            pin_pool=pin_pool,
+            actor_user=actor_user,
+            on_progress=on_progress
+        )
+
     def delete_instance(self, db: Session, *, db_obj: DeviceComponentInstance, actor_user: User) -> None:
         """단일 부품 인스턴스를 제거하는 순수 명령 통로입니다."""
         return device_component_instance_command_service.delete_instance(
@@ -1,4 +1,5 @@
 # inter_domain/device_management/device_query_provider.py
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID # UUID 타입 힌팅을 위해 추가
@@ -19,6 +20,10 @@ class DeviceManagementQueryProvider:
         """UUID로 단일 장치를 조회하는 안정적인 인터페이스를 제공합니다."""
         return device_management_query_service.get_device_by_uuid(db, current_uuid=current_uuid)
     
+    def get_devices_by_uuids(self, db: Session, *, current_uuids: List[UUID]) -> List[DeviceRead]:
+        """여러 UUID의 장치를 한 번의 쿼리로 조회하는 인터페이스를 제공합니다."""
+        return device_management_query_service.get_devices_by_uuids(db, current_uuids=current_uuids)
+
     def get_service(self):
         """
         Policy 계층에서 서비스를 가져올 때 사용합니다.
@@ -33,6 +38,14 @@ class DeviceManagementQueryProvider:
         """
         return device_management_query_service.get_device_by_identifier(db, identifier=identifier)
     
+    async def get_device_by_identifier_async(self, db: AsyncSession, *, identifier: str) -> Optional[DeviceRead]:
+        """[Async] get_device_by_identifier의 AsyncSession 버전입니다. (웹훅 인증/ACL, 배치 수신 핫패스용)"""
+        return await device_management_query_service.get_device_by_identifier_async(db, identifier=identifier)
+
+    def get_device_ids_by_blueprint(self, db: Session, *, blueprint_id: int, device_ids: Optional[List[int]] = None) -> List[int]:
+        """[Inter-Domain] 설계도별 활성 기기 ID 목록 조회 인터페이스"""
+        return device_management_query_service.get_device_ids_by_blueprint(db, blueprint_id=blueprint_id, device_ids=device_ids)
+
     def get_count_by_unit(self, db: Session, *, unit_id: int) -> int:
         """[Inter-Domain] 유닛별 기기 수량 조회 인터페이스"""
         return device_management_query_service.get_count_by_unit(db, unit_id=unit_id)
@@ -1,4 +1,7 @@
+from sqlalchemy.orm import Session
+from typing import List
 from app.domains.services.image_registry.services.image_service import image_service
+from app.domains.services.image_registry.schemas.image_registry_command import ImageRegistryCreate
 
 class ImageCommandProvider:
     """
@@ -26,4 +29,10 @@ class ImageCommandProvider:
             image_metadata=metadata # JSONB 컬럼에 담깁니다.
         )
 
+    def create_image_records(self, db: Session, *, records: List[ImageRegistryCreate]) -> List[int]:
+        """
+        여러 장의 장부를 한 번에 작성하고, 입력 순서대로 id를 돌려받습니다. (이미지 워커의 묶음 처리용)
+        """
+        return image_service.create_registry_records(db, records=records)
+
 image_command_provider = ImageCommandProvider()
\ No newline at end of file
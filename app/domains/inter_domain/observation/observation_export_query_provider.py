@@ -0,0 +1,27 @@
+from sqlalchemy.orm import Session
+from typing import Any, Iterator, List, Tuple
+
+from app.domains.services.observation.services.observation_export_query_service import observation_export_query_service
+from app.domains.services.observation.schemas.observation_export_query import ObservationExportFilter
+
+class ObservationExportQueryProvider:
+    """
+    [Inter-Domain Provider]
+    RL 데이터셋 추출기가 스냅샷 단위로 정렬된 관측 스트림을 받아가는 공식 통로
+    """
+    def get_metric_columns(self, db: Session, *, filters: ObservationExportFilter) -> List[Tuple[str, str]]:
+        return observation_export_query_service.get_metric_columns(db, filters=filters)
+
+    def stream_snapshots(self, db: Session, *, filters: ObservationExportFilter, fetch_size: int) -> Iterator[Tuple[Any, ...]]:
+        return observation_export_query_service.stream_snapshots(db, filters=filters, fetch_size=fetch_size)
+
+    def stream_telemetry(self, db: Session, *, filters: ObservationExportFilter, fetch_size: int) -> Iterator[Tuple[Any, ...]]:
+        return observation_export_query_service.stream_telemetry(db, filters=filters, fetch_size=fetch_size)
+
+    def stream_images(self, db: Session, *, filters: ObservationExportFilter, fetch_size: int) -> Iterator[Tuple[Any, ...]]:
+        return observation_export_query_service.stream_images(db, filters=filters, fetch_size=fetch_size)
+
+    def stream_actions(self, db: Session, *, filters: ObservationExportFilter, fetch_size: int) -> Iterator[Tuple[Any, ...]]:
+        return observation_export_query_service.stream_actions(db, filters=filters, fetch_size=fetch_size)
+
+observation_export_query_provider = ObservationExportQueryProvider()
@@ -1,6 +1,8 @@
 from sqlalchemy.orm import Session
+from typing import List
 from app.domains.services.observation.services.observation_snapshot_command_service import observation_snapshot_command_service
 from app.domains.services.observation.services.observation_snapshot_query_service import observation_snapshot_query_service
+from app.domains.services.observation.schemas.observation_snapshot_command import ObservationSnapshotCreate
 from .schemas.observation_snapshot_query import ObservationSnapshotRead
 
 class ObservationSnapshotCommandProvider:
@@ -16,18 +18,26 @@ class ObservationSnapshotCommandProvider:
         [핵심 로직] 스냅샷이 있으면 가져오고 없으면 생성하여 반환합니다.
         다양한 프로토콜(MQTT/HTTP)의 동기화 지점 역할을 수행합니다.
         """
-        # 1. 먼저 조회 (Query Service)
-        snapshot_model = observation_snapshot_query_service.get_snapshot(db, snapshot_id)
+        # 1. 먼저 생성 시도 (Command Service, ON CONFLICT DO NOTHING)
+        # 조회 후 생성하면 같은 스냅샷을 동시에 받은 워커끼리 PK 충돌이 나므로, 삽입을 먼저 하고 충돌 시에만 조회합니다.
+        snapshot_model = observation_snapshot_command_service.create_snapshot_if_absent(
+            db,
+            snapshot_id=snapshot_id,
+            system_unit_id=system_unit_id,
+            observation_type=observation_type
+        )
         
-        # 2. 없으면 생성 (Command Service)
+        # 2. 이미 있었으면 조회 (Query Service)
         if not snapshot_model:
-            snapshot_model = observation_snapshot_command_service.create_snapshot(
-                db,
-                snapshot_id=snapshot_id,
-                system_unit_id=system_unit_id,
-                observation_type=observation_type
-            )
+            snapshot_model = observation_snapshot_query_service.get_snapshot(db, snapshot_id)
             
         return ObservationSnapshotRead.model_validate(snapshot_model)
 
+    def ensure_snapshots(self, db: Session, *, snapshots: List[ObservationSnapshotCreate]) -> None:
+        """
+        여러 스냅샷을 한 번에 확보합니다. (이미지 워커의 묶음 처리용)
+        스냅샷 ID는 기기가 정하므로 생성 결과를 돌려받을 필요 없이 그 ID로 바로 연결하면 됩니다.
+        """
+        observation_snapshot_command_service.ensure_snapshots(db, obj_in_list=snapshots)
+
 observation_snapshot_command_provider = ObservationSnapshotCommandProvider()
\ No newline at end of file
@@ -1,4 +1,5 @@
 from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 # 서비스는 절대 경로로 import
@@ -19,4 +20,14 @@ class PermissionQueryProvider:
         )
         return [p.name for p in permissions]
 
+    def check_role_has_permission(self, db: Session, *, role_id: int, permission_name: str) -> bool:
+        """역할(Role)이 특정 권한을 가지고 있는지 여부를 반환합니다."""
+        return permission_query_service.check_role_has_permission(db, role_id=role_id, permission_name=permission_name)
+
+    async def check_role_has_permission_async(self, db: AsyncSession, *, role_id: int, permission_name: str) -> bool:
+        """[Async] check_role_has_permission의 AsyncSession 버전입니다."""
+        return await permission_query_service.check_role_has_permission_async(
+            db, role_id=role_id, permission_name=permission_name
+        )
+
 permission_query_provider = PermissionQueryProvider()
@@ -0,0 +1,21 @@
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional
+from app.models.objects.user import User
+
+from app.domains.action_authorization.policies.blueprint_rollout.blueprint_rollout_policy import blueprint_rollout_policy
+
+class BlueprintRolloutPolicyProvider:
+    """
+    [Inter-Domain Provider]
+    설계도 배선 일괄 배포 정책을 외부(API 등)에 제공하는 창구입니다.
+    """
+
+    def rollout(
+        self, db: Session, *, actor_user: User, blueprint_id: int, device_ids: Optional[List[int]] = None
+    ) -> Dict[str, Any]:
+        """설계도 레시피를 대상 기기 전체(또는 지정 기기)에 재배포"""
+        return blueprint_rollout_policy.rollout(
+            db=db, actor_user=actor_user, blueprint_id=blueprint_id, device_ids=device_ids
+        )
+
+blueprint_rollout_policy_provider = BlueprintRolloutPolicyProvider()
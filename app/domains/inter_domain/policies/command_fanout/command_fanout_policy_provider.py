@@ -0,0 +1,25 @@
+from sqlalchemy.orm import Session
+from typing import Any, Dict
+
+from app.dependencies import ActiveContext
+from app.domains.services.command_fanout.schemas.command_fanout_command import CommandFanoutRequest
+from app.domains.services.command_fanout.schemas.command_fanout_query import CommandDispatchProgress
+from app.domains.action_authorization.policies.command_fanout.command_fanout_policy import command_fanout_policy
+
+class CommandFanoutPolicyProvider:
+    """
+    [Inter-Domain Provider]
+    명령 팬아웃 정책을 외부(API 등)에 제공하는 창구입니다.
+    """
+
+    def create_dispatch(self, db: Session, *, active_context: ActiveContext, request: CommandFanoutRequest) -> Dict[str, Any]:
+        """대상 집합의 기기 전체에 대한 팬아웃 작업 생성"""
+        return command_fanout_policy.create_dispatch(db=db, active_context=active_context, request=request)
+
+    def get_progress(self, db: Session, *, active_context: ActiveContext, dispatch_id: int) -> CommandDispatchProgress:
+        return command_fanout_policy.get_progress(db=db, active_context=active_context, dispatch_id=dispatch_id)
+
+    def cancel_dispatch(self, db: Session, *, active_context: ActiveContext, dispatch_id: int) -> Dict[str, Any]:
+        return command_fanout_policy.cancel_dispatch(db=db, active_context=active_context, dispatch_id=dispatch_id)
+
+command_fanout_policy_provider = CommandFanoutPolicyProvider()
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional
 from app.domains.action_authorization.policies.image_ingestion.image_ingestion_policy import image_ingestion_policy
 
 class ImageIngestionPolicyProvider:
@@ -23,4 +23,24 @@ class ImageIngestionPolicyProvider:
             file_data=file_data
         )
 
+    def process_async_job(
+        self,
+        db: Session,
+        *,
+        device_uuid: str,
+        temp_file_path: str,
+        payload: Dict[str, Any]
+    ) -> Tuple[bool, Optional[str]]:
+        # 이미지 워커가 큐에서 꺼낸 작업 1건을 처리합니다.
+        return image_ingestion_policy.process_async_job(
+            db=db,
+            device_uuid=device_uuid,
+            temp_file_path=temp_file_path,
+            payload=payload
+        )
+
+    def process_async_jobs(self, db: Session, *, jobs: List[Dict[str, Any]]) -> List[Tuple[bool, Optional[str]]]:
+        # 큐에서 함께 꺼낸 작업 묶음을 한 트랜잭션으로 처리합니다. (결과는 jobs와 같은 순서)
+        return image_ingestion_policy.process_async_jobs(db, jobs=jobs)
+
 image_ingestion_policy_provider = ImageIngestionPolicyProvider()
\ No newline at end of file
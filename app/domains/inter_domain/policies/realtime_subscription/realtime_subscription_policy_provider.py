@@ -0,0 +1,24 @@
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Tuple
+from app.models.objects.user import User
+
+from app.domains.action_authorization.policies.realtime_subscription.realtime_subscription_policy import realtime_subscription_policy
+
+class RealtimeSubscriptionPolicyProvider:
+    """
+    [Inter-Domain Provider]
+    실시간 게이트웨이(WebSocket) 인가 정책을 외부(API 등)에 제공하는 창구입니다.
+    """
+
+    def issue_ticket(self, *, actor_user: User) -> Dict[str, Any]:
+        """WebSocket 접속용 1회성 티켓 발급"""
+        return realtime_subscription_policy.issue_ticket(actor_user=actor_user)
+
+    def redeem_ticket(self, db: Session, *, ticket: str) -> Optional[User]:
+        return realtime_subscription_policy.redeem_ticket(db, ticket=ticket)
+
+    def authorize_devices(self, db: Session, *, user_id: int, device_uuids: List[str]) -> Tuple[List[str], List[str]]:
+        """구독 요청 기기를 (허용, 거부)로 분류"""
+        return realtime_subscription_policy.authorize_devices(db, user_id=user_id, device_uuids=device_uuids)
+
+realtime_subscription_policy_provider = RealtimeSubscriptionPolicyProvider()
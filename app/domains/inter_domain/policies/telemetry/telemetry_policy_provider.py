@@ -1,8 +1,12 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Any
+from typing import Iterator, List, Any
+from app.database import replica_reads
 from app.models.objects.user import User
 from app.domains.action_authorization.policies.telemetry_query.policy import telemetry_query_policy
-from app.domains.services.telemetry.schemas.telemetry_query import TelemetryFilter
+from app.domains.services.telemetry.schemas.telemetry_query import (
+    TelemetryFilter, TelemetryExportFilter, TelemetryLatestFilter, TelemetrySeriesRead,
+)
 
 class TelemetryPolicyProvider:
     """
@@ -10,6 +14,7 @@ class TelemetryPolicyProvider:
     텔레메트리 조회 정책을 외부(API 등)에서 사용할 수 있도록 제공하는 통합 창구입니다.
     """
 
+    @replica_reads()
     def fetch_data(
         self, db: Session, *, actor_user: User, filters: TelemetryFilter, active_role_id: int
     ) -> List[Any]:
@@ -24,5 +29,64 @@ class TelemetryPolicyProvider:
             active_role_id=active_role_id
         )
 
+    async def fetch_data_async(
+        self, db: AsyncSession, *, actor_user: User, filters: TelemetryFilter, active_role_id: int
+    ) -> List[Any]:
+        """
+        [Async] fetch_data의 AsyncSession 버전입니다. DB 대기 동안 이벤트 루프를 양보합니다.
+        (데코레이터는 코루틴이 실행되기 전에 범위를 닫으므로 replica_reads를 본문에서 엽니다)
+        """
+        with replica_reads():
+            return await telemetry_query_policy.fetch_telemetry_data_async(
+                db=db,
+                actor_user=actor_user,
+                filters=filters,
+                active_role_id=active_role_id
+            )
+
+    @replica_reads()
+    def fetch_series(
+        self, db: Session, *, actor_user: User, filters: TelemetryFilter, active_role_id: int
+    ) -> TelemetrySeriesRead:
+        """
+        차트용 다운샘플 시계열 조회 정책을 실행합니다.
+        소유 기간 격리는 fetch_data와 동일하게 적용됩니다.
+        """
+        return telemetry_query_policy.fetch_telemetry_series(
+            db=db,
+            actor_user=actor_user,
+            filters=filters,
+            active_role_id=active_role_id
+        )
+
+    @replica_reads()
+    def fetch_latest(
+        self, db: Session, *, actor_user: User, filters: TelemetryLatestFilter, active_role_id: int
+    ) -> List[Any]:
+        """
+        기기/부품/항목별 최신값 조회 정책을 실행합니다.
+        플릿 개요 화면용으로, 유닛당 인덱스 조회 1회로 현재 상태를 반환합니다.
+        """
+        return telemetry_query_policy.fetch_latest_values(
+            db=db,
+            actor_user=actor_user,
+            filters=filters,
+            active_role_id=active_role_id
+        )
+
+    def export_data(
+        self, db: Session, *, actor_user: User, filters: TelemetryExportFilter, active_role_id: int
+    ) -> Iterator[bytes]:
+        """
+        스트리밍 내보내기 정책을 실행합니다.
+        소유 기간 격리를 적용한 뒤, 인코딩된 바이트 청크 이터레이터를 반환합니다.
+        """
+        return telemetry_query_policy.export_telemetry(
+            db=db,
+            actor_user=actor_user,
+            filters=filters,
+            active_role_id=active_role_id
+        )
+
 # 싱글톤 인스턴스
 telemetry_policy_provider = TelemetryPolicyProvider()
\ No newline at end of file
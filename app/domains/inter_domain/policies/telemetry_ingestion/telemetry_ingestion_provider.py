@@ -5,13 +5,15 @@ class TelemetryIngestionPolicyProvider:
     수치 데이터 처리 정책(Policy)을 도메인 외부에서 
     호출할 수 있게 해주는 inter_domain 제공자입니다.
     """
-    def ingest(self, db, *, device_uuid_str, topic, payload):
+    def ingest(self, db, *, device_uuid_str, topic, payload, raw_payload=None, signature=None):
         # 내부 도메인의 실제 '뇌(Policy)'에게 처리를 맡깁니다.
         return telemetry_ingestion_policy.ingest(
             db=db, 
             device_uuid_str=device_uuid_str, 
             topic=topic, 
-            payload=payload
+            payload=payload,
+            raw_payload=raw_payload,
+            signature=signature
         )
 
 # 다른 곳에서 바로 사용할 수 있도록 인스턴스화해서 내보냅니다.
@@ -0,0 +1,16 @@
+from sqlalchemy.orm import Session
+from typing import List
+
+from app.dependencies import ActiveContext
+from app.domains.action_authorization.policies.vision_query.policy import vision_query_policy
+from app.domains.services.vision_feature.schemas.vision_feature_query import VisionSimilarityQuery, SimilarFeatureRead
+
+class VisionPolicyProvider:
+    """
+    [Inter-Domain Provider]
+    시각 특징 유사도 검색 정책을 외부(API 등)에서 사용할 수 있도록 제공하는 통합 창구입니다.
+    """
+    def search_similar(self, db: Session, *, active_context: ActiveContext, query: VisionSimilarityQuery) -> List[SimilarFeatureRead]:
+        return vision_query_policy.search_similar(db, active_context=active_context, query=query)
+
+vision_policy_provider = VisionPolicyProvider()
@@ -0,0 +1,16 @@
+from typing import Any, Dict, List, Optional
+
+from app.domains.services.realtime.repositories.device_state_repository import device_state_repository
+
+class DeviceStateProvider:
+    """
+    [Inter-Domain Provider]
+    압축 포맷으로 저장된 기기 실시간 상태(device_state:{uuid})를 읽기 위한 공식 통로
+    """
+    def read(self, device_uuid: str) -> Optional[Dict[str, Any]]:
+        return device_state_repository.read(device_uuid)
+
+    def read_many(self, device_uuids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        return device_state_repository.read_many(device_uuids)
+
+device_state_provider = DeviceStateProvider()
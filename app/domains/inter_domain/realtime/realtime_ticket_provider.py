@@ -0,0 +1,16 @@
+from typing import Dict, Optional
+
+from app.domains.services.realtime.services.realtime_ticket_service import realtime_ticket_service
+
+class RealtimeTicketProvider:
+    """
+    [Inter-Domain Provider]
+    WebSocket 접속 티켓 발급/소모를 위한 공식 통로
+    """
+    def issue(self, *, user_id: int, email: str) -> str:
+        return realtime_ticket_service.issue(user_id=user_id, email=email)
+
+    def redeem(self, ticket: str) -> Optional[Dict]:
+        return realtime_ticket_service.redeem(ticket)
+
+realtime_ticket_provider = RealtimeTicketProvider()
@@ -0,0 +1,22 @@
+from sqlalchemy.orm import Session
+from typing import List, Set
+from datetime import datetime
+
+from app.domains.services.schedule.services.schedule_query_service import schedule_query_service
+from app.domains.services.schedule.schemas.schedule_query import ScheduleRuntimeRead
+
+class ScheduleQueryProvider:
+    """
+    [Inter-Domain Provider]
+    스케줄 실행기(Application 계층)가 스케줄 정보를 조회할 때 사용하는 공식 통로
+    """
+    def get_active_schedules(self, db: Session) -> List[ScheduleRuntimeRead]:
+        return schedule_query_service.get_active_schedules(db)
+
+    def get_changed_schedules(self, db: Session, *, since: datetime) -> List[ScheduleRuntimeRead]:
+        return schedule_query_service.get_changed_schedules(db, since=since)
+
+    def get_active_schedule_ids(self, db: Session) -> Set[int]:
+        return schedule_query_service.get_active_schedule_ids(db)
+
+schedule_query_provider = ScheduleQueryProvider()
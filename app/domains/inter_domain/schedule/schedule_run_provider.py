@@ -0,0 +1,37 @@
+import logging
+from typing import List
+from uuid import UUID
+from sqlalchemy.orm import Session
+
+from app.domains.services.schedule.schemas.schedule_run import ScheduleRunCompletion
+from app.domains.services.schedule.repositories.schedule_run_completion_repository import schedule_run_completion_repository
+from app.domains.services.schedule.services.schedule_query_service import schedule_query_service
+
+logger = logging.getLogger(__name__)
+
+class ScheduleRunProvider:
+    """
+    [Inter-Domain Provider]
+    리스너(명령 응답 수신)와 스케줄 실행기 사이에서 실행 완료 보고를 주고받는 공식 통로
+    """
+    def report_completion(self, db: Session, *, device_uuid: str, schedule_id: int, run_id: str, status: str) -> bool:
+        """
+        응답 토픽의 기기가 스케줄과 같은 유닛 소속일 때만 완료 보고를 실행기로 넘깁니다.
+        (다른 유닛의 기기가 run_id를 흉내 내 진행 중 실행을 끝내는 것 방지)
+        """
+        try:
+            parsed_uuid = UUID(device_uuid)
+        except ValueError:
+            return False
+        if not schedule_query_service.is_schedule_device(db, schedule_id=schedule_id, device_uuid=parsed_uuid):
+            logger.warning(f"🚫 Rejected schedule {schedule_id} completion from device {device_uuid}: not a member of the schedule's unit")
+            return False
+        schedule_run_completion_repository.push(
+            ScheduleRunCompletion(schedule_id=schedule_id, run_id=run_id, status=status)
+        )
+        return True
+
+    def pop_completions(self, *, limit: int) -> List[ScheduleRunCompletion]:
+        return schedule_run_completion_repository.pop_many(limit=limit)
+
+schedule_run_provider = ScheduleRunProvider()
@@ -1,10 +1,15 @@
 # --- Telemetry Command Provider ---
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from datetime import datetime
 
 from app.domains.services.telemetry.schemas.telemetry_command import TelemetryCommandDataCreate
 from app.domains.services.telemetry.services.telemetry_command_service import telemetry_command_service
+from app.domains.services.telemetry.services.telemetry_rollup_command_service import telemetry_rollup_command_service
+from app.domains.services.telemetry.services.telemetry_partition_service import telemetry_partition_service
+from app.domains.services.telemetry.services.telemetry_archive_service import telemetry_archive_service
 from app.models.events_logs.telemetry_data import TelemetryData
 
 class TelemetryCommandProvider:
@@ -23,6 +28,14 @@ class TelemetryCommandProvider:
             telemetry_list=telemetry_list
         )
     
+    async def bulk_upsert_telemetry_data_async(self, db: AsyncSession, *, device_id: int, telemetry_list: List[Dict]) -> int:
+        """[Async] bulk_upsert_telemetry_data의 AsyncSession 버전입니다. (배치 수신 엔드포인트용)"""
+        return await telemetry_command_service.bulk_upsert_telemetry_async(
+            db=db,
+            device_id=device_id,
+            telemetry_list=telemetry_list
+        )
+
     def process_cluster_batch_ingestion(self, db: Session, *, system_unit, payload: Dict[str, Any]):
         """클러스터 단위의 통합 데이터를 분해하여 저장하도록 서비스에 명령합니다."""
         return telemetry_command_service.process_cluster_batch_ingestion(
@@ -31,4 +44,20 @@ class TelemetryCommandProvider:
             payload=payload
         )
 
+    def rebuild_rollups(self, db: Session, *, start: datetime, end: datetime) -> Dict[str, int]:
+        """원본 텔레메트리로부터 1m/1h/1d 롤업을 재집계합니다. (백필/정합성 복구용, 커밋은 호출자 책임)"""
+        return telemetry_rollup_command_service.rebuild_range(db=db, start=start, end=end)
+
+    def maintain_partitions(self, db: Session) -> Dict[str, Any]:
+        """미래 파티션 생성 및 보존 기간 경과 파티션 정리를 수행합니다. (커밋은 호출자 책임)"""
+        return telemetry_partition_service.run_maintenance(db=db)
+
+    def archive_next_partition(self, db: Session) -> Optional[Dict[str, Any]]:
+        """오래된 파티션 1개를 콜드 스토리지 파일로 옮기고 DB에서 삭제합니다. 대상이 없으면 None. (커밋 후 publish_archived_partition 호출은 호출자 책임)"""
+        return telemetry_archive_service.archive_next(db=db)
+
+    def publish_archived_partition(self, partition: str) -> None:
+        """archive_next_partition의 결과를 커밋한 뒤 호출해 아카이브를 조회 경로에 노출합니다."""
+        telemetry_archive_service.publish(partition)
+
 telemetry_command_provider = TelemetryCommandProvider()
@@ -1,15 +1,21 @@
 # --- Telemetry Query Provider ---
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Iterator, List
 from datetime import datetime
 from typing import Optional
 
-from app.domains.services.telemetry.schemas.telemetry_query import TelemetryFilter
+from app.database import replica_reads
+from app.domains.services.telemetry.schemas.telemetry_query import (
+    TelemetryFilter, TelemetryExportFilter, TelemetryLatestFilter, TelemetrySeriesRead,
+)
+from app.models.events_logs.device_metric_latest import DeviceMetricLatest
 from app.domains.services.telemetry.services.telemetry_query_service import telemetry_query_service
 from app.models.events_logs.telemetry_data import TelemetryData as DBTelemetryData
 
 class TelemetryQueryProvider:
+    @replica_reads()
     def get_telemetry_data(
         self, db: Session, *, 
         filters: TelemetryFilter,
@@ -24,4 +30,66 @@ class TelemetryQueryProvider:
             possession_end=possession_end      # 전달
         )
 
+    async def get_telemetry_data_async(
+        self, db: AsyncSession, *,
+        filters: TelemetryFilter,
+        possession_start: Optional[datetime] = None,
+        possession_end: Optional[datetime] = None
+    ) -> List[DBTelemetryData]:
+        """[Async] get_telemetry_data의 AsyncSession 버전입니다."""
+        return await telemetry_query_service.get_telemetry_data_async(
+            db=db,
+            filters=filters,
+            possession_start=possession_start,
+            possession_end=possession_end
+        )
+
+    @replica_reads()
+    def get_telemetry_series(
+        self, db: Session, *,
+        filters: TelemetryFilter,
+        possession_start: Optional[datetime] = None,
+        possession_end: Optional[datetime] = None
+    ) -> TelemetrySeriesRead:
+        """Provides a stable interface to query downsampled telemetry series (raw/1m/1h/1d)."""
+        return telemetry_query_service.get_telemetry_series(
+            db=db,
+            filters=filters,
+            possession_start=possession_start,
+            possession_end=possession_end
+        )
+
+    def export_telemetry(
+        self, db: Session, *,
+        filters: TelemetryExportFilter,
+        possession_start: Optional[datetime] = None,
+        possession_end: Optional[datetime] = None
+    ) -> Iterator[bytes]:
+        """Provides a stable interface to stream raw telemetry as NDJSON/CSV/Arrow using keyset pagination."""
+        return telemetry_query_service.export_telemetry(
+            db=db,
+            filters=filters,
+            possession_start=possession_start,
+            possession_end=possession_end
+        )
+
+    @replica_reads()
+    def get_latest_values(
+        self, db: Session, *,
+        filters: TelemetryLatestFilter,
+        possession_start: Optional[datetime] = None,
+        possession_end: Optional[datetime] = None
+    ) -> List[DeviceMetricLatest]:
+        """Provides a stable interface to read the current value of each (device, component, metric)."""
+        return telemetry_query_service.get_latest_values(
+            db=db,
+            filters=filters,
+            possession_start=possession_start,
+            possession_end=possession_end
+        )
+
+    def get_archived_before(self) -> Optional[datetime]:
+        """Provides the upper bound of telemetry that now lives only in archive files."""
+        return telemetry_query_service.get_archived_before()
+
 telemetry_query_provider = TelemetryQueryProvider()
@@ -0,0 +1,66 @@
+import logging
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Optional, Sequence
+
+from app.core.config import settings
+from app.domains.application.trigger.trigger_engine import report_execution_result, release_execution
+from app.domains.services.trigger_rule.schemas.trigger_input import TriggerInput, TriggerMetricInput
+from app.domains.services.trigger_rule.repositories.trigger_input_repository import trigger_input_repository
+
+logger = logging.getLogger(__name__)
+
+class TriggerEngineProvider:
+    """
+    리더 워커의 트리거 엔진을 수신 정책(Policy)이나 게이트웨이에서 사용할 수 있도록 노출하는 inter_domain 제공자입니다.
+    평가 입력은 커밋이 끝난 뒤 submit으로 넘깁니다. (엔진은 대기열을 꺼내 별도 트랜잭션으로 평가/기록/발행)
+    """
+    def build_telemetry_input(self, *, system_unit_id: int, telemetry_rows: Sequence) -> Optional[TriggerInput]:
+        """
+        방금 저장한 텔레메트리 행에서 평가 입력을 만듭니다.
+        커밋하면 ORM 행이 만료되므로 커밋 전에 만들어 두고, 커밋 후 submit으로 넘깁니다.
+        """
+        if not settings.TRIGGER_ENGINE_ENABLED or not telemetry_rows:
+            return None
+        return TriggerInput(
+            system_unit_id=system_unit_id,
+            metrics=[
+                TriggerMetricInput(
+                    metric_name=row.metric_name,
+                    component_name=row.component_name,
+                    avg=row.avg_value,
+                    min=row.min_value,
+                    max=row.max_value,
+                    std=row.std_dev,
+                    slope=row.slope,
+                    captured_at=row.captured_at.timestamp(),
+                    device_id=row.device_id,
+                    snapshot_id=row.snapshot_id,
+                )
+                for row in telemetry_rows
+            ],
+        )
+
+    def build_event_input(self, *, system_unit_id: int, event_type: str, device_id: int, details: Optional[Dict[str, Any]] = None) -> Optional[TriggerInput]:
+        """기기 상태 변화 등 이산 이벤트(`{"event": ...}` 조건)의 평가 입력을 만듭니다."""
+        if not settings.TRIGGER_ENGINE_ENABLED:
+            return None
+        return TriggerInput(system_unit_id=system_unit_id, event_type=event_type, device_id=device_id, details=details or {})
+
+    def submit(self, trigger_input: Optional[TriggerInput]) -> None:
+        """커밋된 입력을 평가 대기열에 넣습니다. 실패해도 수신 처리는 이미 끝났으므로 기록만 남깁니다."""
+        if trigger_input is None:
+            return
+        try:
+            trigger_input_repository.push(trigger_input)
+        except Exception as e:
+            logger.error(f"❌ Failed to queue trigger input for unit {trigger_input.system_unit_id}: {e}")
+
+    def complete_execution(
+        self, db: Session, *, device_uuid: str, action_log_id: int, success: bool, result: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        return report_execution_result(db, device_uuid=device_uuid, action_log_id=action_log_id, success=success, result=result)
+
+    def release_execution(self, action_log_id: int) -> None:
+        release_execution(action_log_id)
+
+trigger_engine_provider = TriggerEngineProvider()
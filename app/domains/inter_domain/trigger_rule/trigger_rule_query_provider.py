@@ -0,0 +1,22 @@
+from sqlalchemy.orm import Session
+from typing import List, Set
+from datetime import datetime
+
+from app.domains.services.trigger_rule.services.trigger_rule_query_service import trigger_rule_query_service
+from app.domains.services.trigger_rule.schemas.trigger_rule_query import TriggerRuleRuntimeRead
+
+class TriggerRuleQueryProvider:
+    """
+    [Inter-Domain Provider]
+    트리거 엔진이 규칙 정보를 조회할 때 사용하는 공식 통로
+    """
+    def get_active_rules(self, db: Session) -> List[TriggerRuleRuntimeRead]:
+        return trigger_rule_query_service.get_active_rules(db)
+
+    def get_changed_rules(self, db: Session, *, since: datetime) -> List[TriggerRuleRuntimeRead]:
+        return trigger_rule_query_service.get_changed_rules(db, since=since)
+
+    def get_active_rule_ids(self, db: Session) -> Set[int]:
+        return trigger_rule_query_service.get_active_rule_ids(db)
+
+trigger_rule_query_provider = TriggerRuleQueryProvider()
@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 
+from app.models.objects.user import User
 from app.domains.inter_domain.device_management.schemas.device_query import DeviceRead
 from app.domains.action_authorization.validators.device_ownership.validator import device_ownership_validator
 from app.domains.inter_domain.user_identity.user_identity_query_provider import user_identity_query_provider
@@ -11,10 +12,8 @@ class DeviceOwnershipValidatorProvider:
         user = user_identity_query_provider.get_user_by_email(db, email=user_email)
         if not user: return False, "User not found"
 
-        # 2. 유저가 속한 모든 조직 ID 리스트 조회 (판단을 위한 재료 준비)
-        # 예시: user_identity_query_provider에 관련 메서드가 있다고 가정
-        user_orgs = user_identity_query_provider.get_user_organizations(db, user_id=user.id)
-        org_ids = [org.id for org in user_orgs]
+        # 2. 유저가 속한 모든 조직 ID 리스트 (판단을 위한 재료 준비)
+        org_ids = self._get_org_ids(user)
 
         # 3. 순수 발리데이터 호출 (판단만 부탁함)
         return device_ownership_validator.validate(
@@ -24,4 +23,17 @@ class DeviceOwnershipValidatorProvider:
             access=access
         )
 
-device_ownership_validator_provider = DeviceOwnershipValidatorProvider()
\ No newline at end of file
+    def validate_access_many(
+        self, *, user: User, devices: List[DeviceRead], access: str
+    ) -> List[Tuple[bool, Optional[str]]]:
+        """여러 기기를 한 사용자 기준으로 판단합니다. (사용자/조직 정보는 한 번만 준비)"""
+        org_ids = self._get_org_ids(user)
+        return [
+            device_ownership_validator.validate(user_id=user.id, user_org_ids=org_ids, device=device, access=access)
+            for device in devices
+        ]
+
+    def _get_org_ids(self, user: User) -> List[int]:
+        return [a.organization_id for a in user.user_role_assignments if a.organization_id is not None]
+
+device_ownership_validator_provider = DeviceOwnershipValidatorProvider()
@@ -17,15 +17,20 @@ class HmacIntegrityValidatorProvider:
         db: Session,
         *,
         device: DeviceWithSecret,
-        payload: Dict
+        payload: Dict,
+        raw_payload: Optional[bytes] = None,
+        signature: Optional[str] = None
     ) -> Tuple[bool, Optional[str]]:
         """
         페이로드의 무결성(HMAC)을 검증하는 '판단'을 위임합니다.
+        raw_payload와 signature가 함께 주어지면 수신 원문 바이트로 검증합니다.
         """
         return hmac_integrity_validator.validate(
             db=db,
             device=device,
-            payload=payload
+            payload=payload,
+            raw_payload=raw_payload,
+            signature=signature
         )
 
 hmac_integrity_validator_provider = HmacIntegrityValidatorProvider()
@@ -0,0 +1,15 @@
+from sqlalchemy.orm import Session
+from typing import List
+
+from app.models.objects.vision_feature import VisionFeature
+from app.domains.services.vision_feature.services.vision_feature_command_service import vision_feature_command_service
+from app.domains.services.vision_feature.schemas.vision_feature_command import VisionFeatureCreate
+
+class VisionFeatureCommandProvider:
+    """
+    다른 도메인(Policy 등)에서 시각 특징값 저장을 요청할 때 사용하는 전용 창구입니다.
+    """
+    def create_features(self, db: Session, *, obj_in_list: List[VisionFeatureCreate]) -> List[VisionFeature]:
+        return vision_feature_command_service.create_features(db, obj_in_list=obj_in_list)
+
+vision_feature_command_provider = VisionFeatureCommandProvider()
@@ -0,0 +1,39 @@
+from datetime import datetime
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.domains.services.vision_feature.services.vision_feature_query_service import vision_feature_query_service
+from app.domains.services.vision_feature.schemas.vision_feature_query import VisionSimilarityQuery, SimilarFeatureRead
+
+class VisionFeatureQueryProvider:
+    """
+    [Inter-Domain Provider]
+    시각 특징값 유사도 검색(top-k 코사인, 시스템 유닛 필터) 및 벡터 색인 유지 관리의 공식 통로
+    """
+    def search_similar(
+        self,
+        db: Session,
+        *,
+        query: VisionSimilarityQuery,
+        possession_windows: Optional[Dict[int, Tuple[datetime, Optional[datetime]]]] = None
+    ) -> List[SimilarFeatureRead]:
+        """possession_windows: {system_unit_id: (소유 시작, 소유 종료)} — None이면 기간 제한이 없습니다. (관리자)"""
+        return vision_feature_query_service.search_similar(db, query=query, possession_windows=possession_windows)
+
+    def get_feature_unit_id(self, db: Session, *, feature_id: int) -> Optional[int]:
+        return vision_feature_query_service.get_feature_unit_id(db, feature_id=feature_id)
+
+    def append_to_index(self, rows: Sequence[Tuple[int, int, str, Any]]) -> int:
+        """rows: 커밋된 (feature_id, system_unit_id, model_version, vector_data) 튜플"""
+        return vision_feature_query_service.append_features(rows)
+
+    def sync_index(self, db: Session, *, model_version: str) -> int:
+        return vision_feature_query_service.sync_index(db, model_version=model_version)
+
+    def rebuild_index(self, db: Session, *, model_version: str) -> Dict[str, Any]:
+        return vision_feature_query_service.rebuild_index(db, model_version=model_version)
+
+    def get_model_versions(self, db: Session) -> List[str]:
+        return vision_feature_query_service.get_model_versions(db)
+
+vision_feature_query_provider = VisionFeatureQueryProvider()
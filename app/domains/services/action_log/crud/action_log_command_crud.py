@@ -0,0 +1,40 @@
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from app.models.objects.action_log import ActionLog, ActionStatus
+from ..schemas.action_log_command import ActionLogCreate, ActionLogStatusUpdate
+
+class CRUDActionLogCommand:
+    def create_multiple(self, db: Session, *, obj_in_list: List[ActionLogCreate]) -> List[ActionLog]:
+        db_objs = [ActionLog(**obj_in.model_dump()) for obj_in in obj_in_list]
+        db.add_all(db_objs)
+        # 발행 페이로드에 실행 ID(action_log.id)를 실어야 하므로 flush로 PK만 확보합니다.
+        # 커밋은 서비스/애플리케이션 계층에서 처리
+        db.flush()
+        return db_objs
+
+    def update_status(
+        self,
+        db: Session,
+        *,
+        action_log_id: int,
+        obj_in: ActionLogStatusUpdate,
+        expected_status: Optional[ActionStatus] = None,
+        expected_system_unit_id: Optional[int] = None
+    ) -> Optional[ActionLog]:
+        db_obj = db.get(ActionLog, action_log_id)
+        if db_obj is None:
+            return None
+        # 기기 응답으로 확정할 때는 응답한 기기의 유닛과 기록의 유닛이 같아야 합니다.
+        if expected_system_unit_id is not None and db_obj.system_unit_id != expected_system_unit_id:
+            return None
+        # 이미 다른 결과(타임아웃/취소)로 확정된 기록은 늦게 도착한 응답으로 덮어쓰지 않습니다.
+        if expected_status is not None and db_obj.status != expected_status:
+            return None
+        db_obj.status = obj_in.status
+        if obj_in.execution_result is not None:
+            db_obj.execution_result = {**(db_obj.execution_result or {}), **obj_in.execution_result}
+        db.add(db_obj)
+        return db_obj
+
+action_log_command_crud = CRUDActionLogCommand()
@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from typing import Optional, Dict, Any
+
+from app.models.objects.action_log import ActorType, ActionStatus
+
+class ActionLogCreate(BaseModel):
+    device_id: int
+    system_unit_id: int
+    user_id: Optional[int] = None
+    organization_id: Optional[int] = None
+    snapshot_id: Optional[str] = None
+    actor_type: ActorType = ActorType.SYSTEM
+    model_id: Optional[int] = None
+    command: str
+    parameters: Optional[Dict[str, Any]] = None
+    status: ActionStatus = ActionStatus.REQUESTED
+    execution_result: Optional[Dict[str, Any]] = None
+
+class ActionLogStatusUpdate(BaseModel):
+    status: ActionStatus
+    execution_result: Optional[Dict[str, Any]] = None
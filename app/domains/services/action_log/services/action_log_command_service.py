@@ -0,0 +1,28 @@
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from app.models.objects.action_log import ActionLog, ActionStatus
+from ..crud.action_log_command_crud import action_log_command_crud
+from ..schemas.action_log_command import ActionLogCreate, ActionLogStatusUpdate
+
+class ActionLogCommandService:
+    def create_logs(self, db: Session, *, obj_in_list: List[ActionLogCreate]) -> List[ActionLog]:
+        if not obj_in_list:
+            return []
+        return action_log_command_crud.create_multiple(db, obj_in_list=obj_in_list)
+
+    def update_status(
+        self,
+        db: Session,
+        *,
+        action_log_id: int,
+        obj_in: ActionLogStatusUpdate,
+        expected_status: Optional[ActionStatus] = None,
+        expected_system_unit_id: Optional[int] = None
+    ) -> Optional[ActionLog]:
+        return action_log_command_crud.update_status(
+            db, action_log_id=action_log_id, obj_in=obj_in,
+            expected_status=expected_status, expected_system_unit_id=expected_system_unit_id
+        )
+
+action_log_command_service = ActionLogCommandService()
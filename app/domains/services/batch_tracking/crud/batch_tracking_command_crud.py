@@ -1,7 +1,11 @@
+from datetime import datetime, timezone
+from typing import List
 from sqlalchemy.orm import Session
-from sqlalchemy import update
-from app.models.events_logs.batch_tracking import BatchTracking
-from ..schemas.batch_tracking_command_schema import BatchTrackingCreate
+from sqlalchemy import DateTime, bindparam, case, func, literal, update
+from app.models.events_logs.batch_tracking import BatchTracking, BatchStatus
+from ..schemas.batch_tracking_command_schema import BatchTrackingCreate, BatchProgressSnapshot
+
+_batches = BatchTracking.__table__
 
 class BatchTrackingCommandCRUD:
     def create(self, db: Session, *, obj_in: BatchTrackingCreate) -> BatchTracking:
@@ -23,4 +27,36 @@ class BatchTrackingCommandCRUD:
             .values(processed_count=BatchTracking.processed_count + 1)
         )
 
-batch_tracking_command_crud = BatchTrackingCommandCRUD()
\ No newline at end of file
+    def mark_complete(self, db: Session, batch_id: str):
+        db.execute(
+            update(BatchTracking)
+            .where(BatchTracking.batch_id == batch_id, BatchTracking.status != BatchStatus.COMPLETED)
+            .values(status=BatchStatus.COMPLETED, completed_at=datetime.now(timezone.utc))
+        )
+
+    def bulk_apply_progress(self, db: Session, *, snapshots: List[BatchProgressSnapshot]) -> None:
+        """
+        Redis 카운터 묶음을 한 번의 executemany UPDATE로 반영합니다.
+        - processed_count는 GREATEST로 올리기만 하므로, 같은 값을 다시 반영하거나 순서가 바뀌어도 안전합니다.
+        - 완료 시각이 있는 배치만 COMPLETED로 전환합니다. (이미 완료된 행의 completed_at은 유지)
+        """
+        if not snapshots:
+            return
+        completed_at = bindparam("b_completed_at", type_=DateTime(timezone=True))
+        finishing = completed_at.is_not(None) & (_batches.c.status != BatchStatus.COMPLETED)
+        completed = literal(BatchStatus.COMPLETED, type_=_batches.c.status.type)
+        db.execute(
+            update(_batches)
+            .where(_batches.c.batch_id == bindparam("b_batch_id"))
+            .values(
+                processed_count=func.greatest(_batches.c.processed_count, bindparam("b_processed")),
+                status=case((finishing, completed), else_=_batches.c.status),
+                completed_at=case((finishing, completed_at), else_=_batches.c.completed_at),
+            ),
+            [
+                {"b_batch_id": s.batch_id, "b_processed": s.processed_count, "b_completed_at": s.completed_at}
+                for s in snapshots
+            ]
+        )
+
+batch_tracking_command_crud = BatchTrackingCommandCRUD()
@@ -0,0 +1,97 @@
+import logging
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from app.core.config import get_settings
+from app.core.redis_client import redis_client
+from ..schemas.batch_tracking_command_schema import BatchProgressSnapshot
+
+logger = logging.getLogger(__name__)
+
+BATCH_PROGRESS_KEY_PREFIX = "batch_progress:"
+# DB에 아직 반영되지 않은 카운터의 batch_id 집합
+BATCH_PROGRESS_DIRTY_KEY = "batch_progress_dirty"
+
+# 처리 1건 기록. 카운터가 total에 닿는 순간을 HSETNX로 한 번만 잡아 완료 시각을 남깁니다.
+# 카운터가 없으면(만료/Redis 초기화/이전 배포에서 만든 배치) nil을 돌려 호출자가 DB 경로로 처리하게 합니다.
+_INCREMENT_SCRIPT = """
+local total = redis.call('HGET', KEYS[1], 'total')
+if not total then return nil end
+local processed = redis.call('HINCRBY', KEYS[1], 'processed', 1)
+redis.call('SADD', KEYS[2], ARGV[1])
+local completed = 0
+if processed >= tonumber(total) and redis.call('HSETNX', KEYS[1], 'completed_at', ARGV[2]) == 1 then
+    completed = 1
+end
+return {processed, tonumber(total), completed}
+"""
+
+class BatchProgressRepository:
+    """
+    [Batch Progress Counter] 배치 진행률의 빠른 경로.
+    워커마다 batch_trackings의 같은 행을 UPDATE하면 행 잠금에서 줄을 서므로, 처리 건수는 Redis 해시
+    (batch_progress:{batch_id} = total/processed/completed_at)에서 HINCRBY로 세고,
+    리더 워커가 BATCH_PROGRESS_FLUSH_INTERVAL_SECONDS마다 바뀐 배치만 모아 DB에 일괄 반영합니다.
+    """
+    def __init__(self, redis_client):
+        self.redis = redis_client
+        self._increment = None  # 첫 사용 시 등록 (import 시점에 클라이언트를 만들지 않도록)
+
+    def _key(self, batch_id: str) -> str:
+        return f"{BATCH_PROGRESS_KEY_PREFIX}{batch_id}"
+
+    def seed(self, batch_id: str, *, total_count: int) -> None:
+        key = self._key(batch_id)
+        pipe = self.redis.pipeline()
+        pipe.hset(key, mapping={"total": total_count, "processed": 0})
+        pipe.expire(key, get_settings().BATCH_PROGRESS_COUNTER_TTL_SECONDS)
+        pipe.execute()
+
+    def increment(self, batch_id: str) -> Optional[Tuple[int, int, bool]]:
+        """(processed, total, 이번 호출로 완료되었는지). 카운터가 없으면 None."""
+        if self._increment is None:
+            self._increment = self.redis.register_script(_INCREMENT_SCRIPT)
+        result = self._increment(
+            keys=[self._key(batch_id), BATCH_PROGRESS_DIRTY_KEY],
+            args=[batch_id, datetime.now(timezone.utc).isoformat()]
+        )
+        if result is None:
+            return None
+        processed, total, completed = result
+        return int(processed), int(total), bool(completed)
+
+    def read(self, batch_id: str) -> Optional[BatchProgressSnapshot]:
+        return self.read_many([batch_id])[0]
+
+    def read_many(self, batch_ids: List[str]) -> List[Optional[BatchProgressSnapshot]]:
+        pipe = self.redis.pipeline(transaction=False)
+        for batch_id in batch_ids:
+            pipe.hgetall(self._key(batch_id))
+        return [self._to_snapshot(batch_id, raw) for batch_id, raw in zip(batch_ids, pipe.execute())]
+
+    def pop_dirty(self, limit: int) -> List[str]:
+        """반영할 batch_id를 꺼냅니다. 꺼낸 뒤 들어온 처리 건은 다시 집합에 들어가므로 누락되지 않습니다."""
+        batch_ids = self.redis.spop(BATCH_PROGRESS_DIRTY_KEY, limit) or []
+        return [b.decode() if isinstance(b, bytes) else b for b in batch_ids]
+
+    def requeue(self, batch_ids: List[str]) -> None:
+        """DB 반영에 실패한 batch_id를 다음 주기로 되돌립니다."""
+        if batch_ids:
+            self.redis.sadd(BATCH_PROGRESS_DIRTY_KEY, *batch_ids)
+
+    def _to_snapshot(self, batch_id: str, raw) -> Optional[BatchProgressSnapshot]:
+        fields = {
+            (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+            for k, v in (raw or {}).items()
+        }
+        if "total" not in fields:
+            return None
+        completed_at = fields.get("completed_at")
+        return BatchProgressSnapshot(
+            batch_id=batch_id,
+            total_count=int(fields["total"]),
+            processed_count=int(fields.get("processed", 0)),
+            completed_at=datetime.fromisoformat(completed_at) if completed_at else None,
+        )
+
+batch_progress_repository = BatchProgressRepository(redis_client)
@@ -12,4 +12,12 @@ class BatchTrackingUpdate(BaseModel):
     """상태 및 카운트 업데이트 규격"""
     processed_count: Optional[int] = None
     status: Optional[str] = None
-    completed_at: Optional[datetime] = None
\ No newline at end of file
+    completed_at: Optional[datetime] = None
+
+
+class BatchProgressSnapshot(BaseModel):
+    """Redis 진행 카운터 1건 (조회 및 DB 일괄 반영 단위)"""
+    batch_id: str
+    total_count: int
+    processed_count: int
+    completed_at: Optional[datetime] = None
@@ -2,10 +2,12 @@ import logging
 import uuid
 from sqlalchemy.orm import Session
 from datetime import datetime
+from typing import List
 
 from ..crud.batch_tracking_command_crud import batch_tracking_command_crud
 from ..crud.batch_tracking_query_crud import batch_tracking_query_crud
-from ..schemas.batch_tracking_command_schema import BatchTrackingCreate
+from ..repositories.batch_progress_repository import batch_progress_repository
+from ..schemas.batch_tracking_command_schema import BatchTrackingCreate, BatchProgressSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -22,19 +24,50 @@ class BatchCommandService:
                 total_count=total_count
             )
         )
+
+        # 진행 카운터 개설. 실패해도 배치는 DB 경로(행 UPDATE)로 계속 집계됩니다.
+        try:
+            batch_progress_repository.seed(batch_uuid, total_count=total_count)
+        except Exception as e:
+            logger.warning(f"⚠️ [Batch Tracker] Progress counter unavailable for {batch_uuid}, using DB path: {e}")
         
         logger.info(f"📝 [Batch Tracker] Initialized: {batch_uuid} for Device {device_id} (Total: {total_count})")
         return batch_uuid
         
     def increment_processed_count(self, db: Session, *, batch_id: str):
         """항목 처리 완료를 기록하고, 필요 시 전체 완료 상태로 전환합니다."""
-        # 1. 원자적 카운트 증가
+        # 1. 빠른 경로: Redis 카운터 (완료 판정도 카운터에서 원자적으로, DB 반영은 주기적 일괄 flush)
+        try:
+            result = batch_progress_repository.increment(batch_id)
+        except Exception as e:
+            logger.warning(f"⚠️ [Batch Tracker] Progress counter unavailable for {batch_id}, using DB path: {e}")
+            result = None
+        if result is not None:
+            processed, total, just_completed = result
+            if just_completed:
+                logger.info(f"🚩 [Batch Tracker] Batch {batch_id} fully COMPLETED ({processed}/{total}).")
+            return
+
+        # 2. 카운터가 없는 배치: 원자적 카운트 증가
         batch_tracking_command_crud.atomic_increment(db, batch_id=batch_id)
         
-        # 2. 완료 여부 확인 및 상태 갱신 (지휘관 로직)
+        # 3. 완료 여부 확인 및 상태 갱신 (지휘관 로직)
         batch = batch_tracking_query_crud.get_by_batch_id(db, batch_id=batch_id)
         if batch and batch.processed_count >= batch.total_count:
             batch_tracking_command_crud.mark_complete(db, batch_id=batch_id)
             logger.info(f"🚩 [Batch Tracker] Batch {batch_id} fully COMPLETED.")
 
-batch_command_service = BatchCommandService()
\ No newline at end of file
+    def collect_progress(self, *, limit: int) -> List[BatchProgressSnapshot]:
+        """DB에 반영할 카운터를 꺼냅니다. 반영에 실패하면 requeue_progress로 되돌려야 합니다."""
+        batch_ids = batch_progress_repository.pop_dirty(limit)
+        if not batch_ids:
+            return []
+        return [s for s in batch_progress_repository.read_many(batch_ids) if s is not None]
+
+    def apply_progress(self, db: Session, *, snapshots: List[BatchProgressSnapshot]) -> None:
+        batch_tracking_command_crud.bulk_apply_progress(db, snapshots=snapshots)
+
+    def requeue_progress(self, batch_ids: List[str]) -> None:
+        batch_progress_repository.requeue(batch_ids)
+
+batch_command_service = BatchCommandService()
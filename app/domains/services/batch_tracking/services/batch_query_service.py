@@ -1,33 +1,54 @@
 import logging
 from sqlalchemy.orm import Session
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from app.models.events_logs.batch_tracking import BatchStatus
 from ..crud.batch_tracking_query_crud import batch_tracking_query_crud
+from ..repositories.batch_progress_repository import batch_progress_repository
+from ..schemas.batch_tracking_command_schema import BatchProgressSnapshot
 
 logger = logging.getLogger(__name__)
 
 class BatchQueryService:
     def get_progress(self, db: Session, *, batch_id: str) -> Dict[str, Any]:
-        """배치의 현재 진행 상황을 백분율로 산출합니다."""
-        batch = batch_tracking_query_crud.get_by_batch_id(db, batch_id=batch_id)
-        if not batch:
-            return {"error": "Batch not found"}
+        """배치의 현재 진행 상황을 백분율로 산출합니다. (DB보다 앞서 있는 Redis 카운터를 먼저 봅니다)"""
+        counter = self._read_counter(batch_id)
+        if counter:
+            total, processed = counter.total_count, counter.processed_count
+            status = BatchStatus.COMPLETED if counter.completed_at else BatchStatus.PROCESSING
+        else:
+            batch = batch_tracking_query_crud.get_by_batch_id(db, batch_id=batch_id)
+            if not batch:
+                return {"error": "Batch not found"}
+            total, processed, status = batch.total_count, batch.processed_count, batch.status
         
-        progress_pct = (batch.processed_count / batch.total_count) * 100 if batch.total_count > 0 else 0
+        progress_pct = (processed / total) * 100 if total > 0 else 0
         
         return{
             "batch_id": batch_id,
-            "total": batch.total_count,
-            "processed": batch.processed_count,
+            "total": total,
+            "processed": processed,
             "progress_percentage": round(progress_pct, 2),
-            "status": batch.status
+            "status": status
         }
     
     def is_purge_allowed(self, db: Session, *, batch_id: str) -> bool:
         """Ares Aegis 무결성 원칙: 100.0% 완료 및 COMPLETED 상태일 때만 삭제 허용"""
+        counter = self._read_counter(batch_id)
+        if counter:
+            return counter.completed_at is not None and counter.processed_count >= counter.total_count
+
         batch = batch_tracking_query_crud.get_by_batch_id(db, batch_id=batch_id)
         if not batch:
             return False
             
         return batch.status == "COMPLETED" and batch.processed_count >= batch.total_count
 
-batch_query_service = BatchQueryService()
\ No newline at end of file
+    def _read_counter(self, batch_id: str) -> Optional[BatchProgressSnapshot]:
+        # 카운터는 커밋된 처리 건만 세므로 DB 행과 같거나 앞서 있습니다. 없거나 Redis 장애면 DB를 읽습니다.
+        try:
+            return batch_progress_repository.read(batch_id)
+        except Exception as e:
+            logger.warning(f"⚠️ [Batch Tracker] Progress counter read failed for {batch_id}, using DB: {e}")
+            return None
+
+batch_query_service = BatchQueryService()
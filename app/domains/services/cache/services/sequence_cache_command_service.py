@@ -1,8 +1,6 @@
 import logging
 from typing import Optional
-from app.core.redis_client import get_redis_client
-
-redis_client = get_redis_client()
+from app.core.redis_client import redis_client
 
 logger = logging.getLogger(__name__)
 
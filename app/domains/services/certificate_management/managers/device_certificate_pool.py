@@ -0,0 +1,103 @@
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+class PooledCertificate(NamedTuple):
+    device_uuid: str           # 인증서 CN에 들어간 UUID. 인증서를 배정받은 기기는 이 UUID를 사용해야 합니다.
+    cert_data: Dict[str, Any]  # Vault PKI 응답 (certificate, private_key, issuing_ca, serial_number)
+    issued_at: float           # time.monotonic() 기준 발급 시각
+
+class DeviceCertificatePool:
+    """
+    [Pre-issued Pool] 공장 등록용 장치 인증서(키쌍 포함)를 미리 발급해 두는 프로세스 내 풀입니다.
+    - 인증서 CN에 기기 UUID가 들어가므로 UUID도 함께 미리 정하고, 등록 시 (UUID, 인증서)를 한 쌍으로 꺼냅니다.
+    - 백그라운드 스레드가 target_size까지 채우며, max_age_seconds가 지난 항목은 버립니다. (유효기간이 덜 남은 인증서 배정 방지)
+    - 개인키는 메모리에만 보관하고 디스크/Redis에 쓰지 않습니다. 프로세스가 종료되면 남은 인증서는 쓰이지 않고 만료됩니다.
+    issue는 UUID를 받아 인증서를 발급하는 함수입니다. (Vault 호출, 스레드에서 실행)
+    """
+    def __init__(self, issue: Callable[[str], Dict[str, Any]], *, target_size: int, max_age_seconds: float, refill_concurrency: int = 2):
+        self.issue = issue
+        self.target_size = target_size
+        self.max_age_seconds = max_age_seconds
+        self.refill_concurrency = max(1, refill_concurrency)
+        self._items: Deque[PooledCertificate] = deque()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"issued": 0, "taken": 0, "misses": 0, "expired": 0, "issue_failures": 0}
+
+    def take(self) -> Optional[PooledCertificate]:
+        """가장 오래된 유효 항목을 꺼냅니다. 비어 있으면 None (호출자가 직접 발급)."""
+        with self._lock:
+            self._discard_expired()
+            item = self._items.popleft() if self._items else None
+            self._stats["taken" if item else "misses"] += 1
+        self._wakeup.set()
+        return item
+
+    def _discard_expired(self) -> None:
+        deadline = time.monotonic() - self.max_age_seconds
+        while self._items and self._items[0].issued_at < deadline:
+            self._items.popleft()
+            self._stats["expired"] += 1
+
+    def start(self) -> None:
+        if self.target_size <= 0 or (self._thread and self._thread.is_alive()):
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._refill_loop, name="device-cert-pool", daemon=True)
+        self._thread.start()
+        logger.info(f"🎫 Device certificate pool started (target={self.target_size}, concurrency={self.refill_concurrency})")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _refill_loop(self) -> None:
+        with ThreadPoolExecutor(max_workers=self.refill_concurrency, thread_name_prefix="device-cert-issue") as executor:
+            while not self._stopping.is_set():
+                with self._lock:
+                    self._discard_expired()
+                    deficit = self.target_size - len(self._items)
+                if deficit > 0:
+                    # 한 번에 refill_concurrency건씩 채워 등록 요청의 Vault 호출과 경쟁을 줄입니다.
+                    batch = min(deficit, self.refill_concurrency)
+                    failed = sum(not ok for ok in executor.map(lambda _: self._issue_one(), range(batch)))
+                    if failed < batch:
+                        continue
+                    # 전부 실패(Vault 장애 등)하면 잠시 쉬었다가 다시 시도합니다.
+                self._wakeup.wait(timeout=60)
+                self._wakeup.clear()
+
+    def _issue_one(self) -> bool:
+        device_uuid = str(uuid.uuid4())
+        try:
+            cert_data = self.issue(device_uuid)
+        except Exception as e:
+            logger.warning(f"⚠️ Device certificate pre-issue failed: {e}")
+            with self._lock:
+                self._stats["issue_failures"] += 1
+            return False
+        with self._lock:
+            self._items.append(PooledCertificate(device_uuid, cert_data, time.monotonic()))
+            self._stats["issued"] += 1
+        return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "running": bool(self._thread and self._thread.is_alive()),
+                "available": len(self._items),
+                "target_size": self.target_size,
+                **self._stats,
+            }
@@ -5,7 +5,8 @@ import os
 from typing import Optional, Dict, Any, TypedDict
 from sqlalchemy.orm import Session
 
-from app.core.config import Settings
+from app.core.config import Settings, get_settings
+from app.core.registry import app_registry
 from app.models.objects.user import User
 from app.domains.inter_domain.audit.audit_command_provider import audit_command_provider
 
@@ -55,44 +56,52 @@ class VaultCertificateCommandRepository:
             logger.error(f"Vault authentication critical failure: {e}")
             raise ConnectionError(f"Vault Auth Error: {e}")
 
-    def create_device_certificate(self, db: Session, *, common_name: str, actor_user: Optional[User] = None) -> VaultCertData:
+    def generate_device_certificate(self, *, common_name: str) -> VaultCertData:
         """
-        인자로 받은 common_name(Device UUID)을 사용하여 보안 규격에 맞는 인증서를 발급합니다.
-        상위 계층에서 'common_name'이라는 키워드로 인자를 넘겨주므로 이름을 통일합니다.
+        Vault PKI로 장치 인증서와 개인키를 발급만 합니다. (DB/감사 로그 없음)
+        인증서 풀의 선발급과 일괄 등록의 병렬 발급에서 사용하며, 감사 기록은 기기에 배정할 때 record_device_certificate로 남깁니다.
         """
         # ✅ 전달받은 UUID(common_name) 뒤에 보안 도메인을 붙여 최종 CN 구성
         full_common_name = f"{common_name}.device.ares4.internal"
         logger.info(f"🚀 Issuing device cert for CN: {full_common_name}")
-        
+
         try:
             cert_response = self.client.secrets.pki.generate_certificate(
                 # ✅ 1. mount_point를 반드시 명시 (pki_int)
-                mount_point=self.settings.VAULT_PKI_MOUNT_POINT, 
+                mount_point=self.settings.VAULT_PKI_MOUNT_POINT,
                 # ✅ 2. env에서 가져온 정확한 Role 이름 사용
                 name=self.settings.VAULT_PKI_LISTENER_ROLE,
                 common_name=full_common_name,
                 extra_params={"ttl": "8760h"}
             )
-            
-            cert_data: VaultCertData = cert_response['data']
-            
-            # 감사 로그 기록
-            audit_command_provider.log(
-                db=db, 
-                actor_user=actor_user,
-                event_type="DEVICE_CERTIFICATE_CREATED",
-                description=f"Issued device certificate for CN='{full_common_name}'.",
-                details={
-                    "common_name": full_common_name,
-                    "serial_number": cert_data.get("serial_number"),
-                }
-            )
-            return cert_data
-            
+            return cert_response['data']
         except Exception as e:
             logger.error(f"💥 Failed to issue cert for {full_common_name}: {e}")
             raise
 
+    def record_device_certificate(self, db: Session, *, common_name: str, cert_data: VaultCertData, actor_user: Optional[User] = None) -> None:
+        """발급된 장치 인증서의 감사 로그를 기록합니다."""
+        full_common_name = f"{common_name}.device.ares4.internal"
+        audit_command_provider.log(
+            db=db,
+            actor_user=actor_user,
+            event_type="DEVICE_CERTIFICATE_CREATED",
+            description=f"Issued device certificate for CN='{full_common_name}'.",
+            details={
+                "common_name": full_common_name,
+                "serial_number": cert_data.get("serial_number"),
+            }
+        )
+
+    def create_device_certificate(self, db: Session, *, common_name: str, actor_user: Optional[User] = None) -> VaultCertData:
+        """
+        인자로 받은 common_name(Device UUID)을 사용하여 보안 규격에 맞는 인증서를 발급합니다.
+        상위 계층에서 'common_name'이라는 키워드로 인자를 넘겨주므로 이름을 통일합니다.
+        """
+        cert_data = self.generate_device_certificate(common_name=common_name)
+        self.record_device_certificate(db, common_name=common_name, cert_data=cert_data, actor_user=actor_user)
+        return cert_data
+
     def issue_server_mqtt_cert(self, db: Session, *, actor_user: Optional[User] = None) -> Dict[str, Any]:
         """서버용 MQTT 클라이언트 인증서를 발급합니다."""
         common_name = self.settings.MQTT_CLIENT_ID 
@@ -137,6 +146,7 @@ class VaultCertificateCommandRepository:
             logger.error(f"Failed to revoke cert {serial_number}: {e}")
             raise
 
-# 싱글톤 인스턴스
-from app.core.config import settings as app_settings
-vault_certificate_command_repository = VaultCertificateCommandRepository(settings=app_settings)
\ No newline at end of file
+# 싱글톤 인스턴스 (Vault 인증은 첫 사용 시 수행)
+vault_certificate_command_repository = app_registry.register(
+    "vault_certificate_command", lambda: VaultCertificateCommandRepository(settings=get_settings())
+)
@@ -4,7 +4,8 @@ import os # [추가] 파일 존재 여부 확인용
 from typing import Optional, List, Dict
 from datetime import datetime
 
-from app.core.config import Settings
+from app.core.config import Settings, get_settings
+from app.core.registry import app_registry
 
 logger = logging.getLogger(__name__)
 
@@ -122,5 +123,6 @@ class VaultCertificateQueryRepository:
         return None
 
 # --- Singleton Instance ---
-app_settings = Settings()
-vault_certificate_query_repository = VaultCertificateQueryRepository(settings=app_settings)
\ No newline at end of file
+vault_certificate_query_repository = app_registry.register(
+    "vault_certificate_query", lambda: VaultCertificateQueryRepository(settings=get_settings())
+)
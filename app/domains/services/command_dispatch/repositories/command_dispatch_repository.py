@@ -1,6 +1,6 @@
 import logging
 import json
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
 
 from app.core.config import Settings
@@ -61,6 +61,24 @@ class CommandDispatchRepository:
             logger.error(f"Failed to publish command to topic '{topic}': {e}", exc_info=True)
             raise
 
+    def publish_many(self, messages: List[Tuple[str, Dict]]) -> int:
+        """
+        (토픽, 명령) 묶음을 연속 발행합니다. 건별 감사 로그는 남기지 않습니다. (팬아웃 작업 단위로 기록)
+        발행한 앞쪽 건수를 반환하며, 연결이 없으면 0입니다.
+        """
+        client = self.connection_manager.client
+        if not self.connection_manager.is_connected or not client:
+            return 0
+        published = 0
+        for topic, command in messages:
+            try:
+                client.publish(topic, json.dumps(command), qos=1)
+            except Exception as e:
+                logger.error(f"Failed to publish command to topic '{topic}': {e}")
+                break
+            published += 1
+        return published
+
 # 이 리포지토리는 Policy 또는 애플리케이션 시작 시 인스턴스화되며,
 # MqttConnectionManager 인스턴스를 주입받아 사용합니다.
 # 자체적으로 싱글턴이 아니며, 관리되는 MqttConnectionManager에 의존합니다.
\ No newline at end of file
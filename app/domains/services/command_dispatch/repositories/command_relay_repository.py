@@ -0,0 +1,100 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings
+from app.models.objects.user import User
+from app.domains.services.command_dispatch.managers.mqtt_connection_manager import MqttConnectionManager
+from app.domains.inter_domain.audit.audit_command_provider import audit_command_provider
+
+logger = logging.getLogger(__name__)
+
+# 큐에 남은 자리만큼만 앞에서부터 넣고 넣은 건수를 반환합니다. (기존 대기 명령을 밀어내지 않음)
+_ENQUEUE_WITHIN_LIMIT_SCRIPT = """
+local room = tonumber(ARGV[1]) - redis.call('llen', KEYS[1])
+local count = math.min(math.max(room, 0), #ARGV - 1)
+for i = 2, count + 1 do
+    redis.call('lpush', KEYS[1], ARGV[i])
+end
+return count
+"""
+
+class CommandRelayRepository:
+    """
+    [Cross-Worker Publish] 리더가 아닌 워커가 발행할 MQTT 명령을 Redis 리스트에 넣고,
+    리더 워커의 MQTT 연결이 꺼내서 발행합니다. (워커 수만큼 브로커 연결이 늘어나지 않도록)
+    - 순서: LPUSH로 넣고 BRPOP으로 꺼내므로 FIFO입니다.
+    - MQTT_PUBLISH_RELAY_MAX_AGE_SECONDS보다 오래 대기한 명령은 발행하지 않고 버립니다. (지연된 제어 명령 방지)
+    - 리스트는 MQTT_PUBLISH_RELAY_MAX_LENGTH로 상한을 두며, 넘치면 가장 오래된 명령부터 버려집니다.
+    """
+    def __init__(self, settings: Settings, redis_client):
+        self.settings = settings
+        self.redis = redis_client
+        self.key = settings.MQTT_PUBLISH_RELAY_KEY
+
+    def publish_command(self, db: Session, *, topic: str, command: Dict, actor_user: Optional[User]):
+        """CommandDispatchRepository와 같은 인터페이스. 명령을 릴레이 큐에 넣고 감사 로그를 기록합니다."""
+        message = json.dumps({"topic": topic, "payload": json.dumps(command), "enqueued_at": time.time()})
+        pipe = self.redis.pipeline()
+        pipe.lpush(self.key, message)
+        pipe.ltrim(self.key, 0, self.settings.MQTT_PUBLISH_RELAY_MAX_LENGTH - 1)
+        pipe.execute()
+
+        audit_command_provider.log(
+            db=db,
+            actor_user=actor_user,
+            event_type="DEVICE_COMMAND_DISPATCHED",
+            description=f"Dispatched command to topic: {topic} (relayed)",
+            details={"topic": topic, "command": command, "relayed": True}
+        )
+        logger.info(f"Queued command for topic '{topic}' on the leader publish relay.")
+
+    def publish_many(self, messages: List[Tuple[str, Dict]]) -> int:
+        """
+        CommandDispatchRepository.publish_many와 같은 인터페이스. 큐 상한 안에서 앞쪽부터 원자적으로 넣고
+        실제로 넣은 건수를 반환합니다. (큐가 가득 차면 0 — 나머지는 호출자가 다음 회차에 다시 보냄)
+        """
+        if not messages:
+            return 0
+        now = time.time()
+        enqueued = self.redis.eval(
+            _ENQUEUE_WITHIN_LIMIT_SCRIPT, 1, self.key, self.settings.MQTT_PUBLISH_RELAY_MAX_LENGTH,
+            *[json.dumps({"topic": topic, "payload": json.dumps(command), "enqueued_at": now}) for topic, command in messages],
+        )
+        if enqueued < len(messages):
+            logger.warning(f"📮 Publish relay is full: queued {enqueued} of {len(messages)} commands.")
+        return int(enqueued)
+
+    async def drain(self, connection_manager: MqttConnectionManager) -> None:
+        """[Leader] 릴레이 큐를 비우며 리더의 MQTT 연결로 발행합니다. 태스크 취소로 종료합니다."""
+        logger.info(f"📮 MQTT publish relay drain started ({self.key}).")
+        max_age = self.settings.MQTT_PUBLISH_RELAY_MAX_AGE_SECONDS
+        while True:
+            try:
+                if not connection_manager.is_connected or not connection_manager.client:
+                    await asyncio.sleep(1)
+                    continue
+
+                popped = await asyncio.to_thread(self.redis.brpop, self.key, 1)
+                if not popped:
+                    continue
+                item = json.loads(popped[1])
+
+                age = time.time() - item["enqueued_at"]
+                if age > max_age:
+                    logger.warning(f"⏱️ Dropped relayed command for '{item['topic']}' (waited {age:.0f}s > {max_age:.0f}s)")
+                    continue
+                if not connection_manager.is_connected:
+                    # 꺼낸 사이 연결이 끊겼다면 꺼낸 쪽 끝으로 되돌려 순서를 유지합니다.
+                    await asyncio.to_thread(self.redis.rpush, self.key, popped[1])
+                    continue
+                connection_manager.client.publish(item["topic"], item["payload"], qos=1)
+            except asyncio.CancelledError:
+                logger.info("MQTT publish relay drain is being cancelled...")
+                break
+            except Exception as e:
+                logger.error(f"❌ Error in MQTT publish relay drain: {e}", exc_info=True)
+                await asyncio.sleep(1)
@@ -0,0 +1,114 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import List, Optional
+from sqlalchemy import DateTime, bindparam, extract, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models.objects.device import Device
+from app.models.events_logs.command_delivery import (
+    CommandDispatch, CommandDelivery, CommandDispatchStatus, CommandDeliveryStatus
+)
+from ..schemas.command_fanout_command import CommandDispatchCreate, CommandAck
+
+_deliveries = CommandDelivery.__table__
+
+class CommandFanoutCommandCRUD:
+    def create_dispatch(self, db: Session, *, obj_in: CommandDispatchCreate) -> CommandDispatch:
+        db_obj = CommandDispatch(**obj_in.model_dump(), status=CommandDispatchStatus.PENDING)
+        db.add(db_obj)
+        db.flush()
+        return db_obj
+
+    def bulk_create_deliveries(self, db: Session, *, dispatch_id: int, device_ids: List[int]) -> None:
+        """기기별 전달 행을 correlation_id와 함께 한 번의 executemany로 적재합니다."""
+        if not device_ids:
+            return
+        db.execute(insert(_deliveries), [
+            {
+                "dispatch_id": dispatch_id,
+                "device_id": device_id,
+                "correlation_id": uuid.uuid4().hex,
+                "status": CommandDeliveryStatus.QUEUED,
+            }
+            for device_id in device_ids
+        ])
+
+    def mark_sent(self, db: Session, *, delivery_ids: List[int], sent_at: datetime) -> None:
+        if not delivery_ids:
+            return
+        db.execute(
+            update(_deliveries)
+            .where(_deliveries.c.id.in_(delivery_ids), _deliveries.c.status == CommandDeliveryStatus.QUEUED)
+            .values(status=CommandDeliveryStatus.SENT, sent_at=sent_at)
+        )
+
+    def requeue(self, db: Session, *, delivery_ids: List[int]) -> None:
+        """발행하지 못한 전달을 QUEUED로 되돌립니다."""
+        if not delivery_ids:
+            return
+        db.execute(
+            update(_deliveries)
+            .where(_deliveries.c.id.in_(delivery_ids), _deliveries.c.status == CommandDeliveryStatus.SENT)
+            .values(status=CommandDeliveryStatus.QUEUED, sent_at=None)
+        )
+
+    def apply_acks(self, db: Session, *, acks: List[CommandAck]) -> None:
+        """
+        응답 묶음을 한 번의 executemany UPDATE로 반영합니다. 지연(ms)은 DB에서 sent_at 기준으로 계산합니다.
+        - correlation_id와 응답 토픽의 기기 UUID가 모두 맞아야 반영합니다. (다른 기기의 명령을 대신 응답하는 것 방지)
+        - TIMEOUT 처리 후 늦게 도착한 응답도 반영해 실제 지연을 남깁니다.
+        """
+        if not acks:
+            return
+        acked_at = bindparam("b_acked_at", type_=DateTime(timezone=True))
+        device_id = select(Device.id).where(Device.current_uuid == bindparam("b_device_uuid")).scalar_subquery()
+        db.execute(
+            update(_deliveries)
+            .where(
+                _deliveries.c.correlation_id == bindparam("b_correlation_id"),
+                _deliveries.c.device_id == device_id,
+                # executemany에는 확장(IN) 파라미터를 쓸 수 없으므로 OR로 풉니다.
+                or_(_deliveries.c.status == CommandDeliveryStatus.SENT, _deliveries.c.status == CommandDeliveryStatus.TIMEOUT),
+            )
+            .values(
+                status=bindparam("b_status"),
+                acked_at=acked_at,
+                latency_ms=extract("epoch", acked_at - _deliveries.c.sent_at) * 1000,
+                response=bindparam("b_response"),
+            ),
+            [
+                {
+                    "b_correlation_id": ack.correlation_id,
+                    "b_device_uuid": uuid.UUID(ack.device_uuid),
+                    "b_status": ack.status,
+                    "b_acked_at": ack.acked_at,
+                    "b_response": ack.response,
+                }
+                for ack in acks
+            ]
+        )
+
+    def expire_timeouts(self, db: Session, *, dispatch_id: int, ack_timeout_seconds: int, now: datetime) -> int:
+        result = db.execute(
+            update(_deliveries)
+            .where(
+                _deliveries.c.dispatch_id == dispatch_id,
+                _deliveries.c.status == CommandDeliveryStatus.SENT,
+                _deliveries.c.sent_at < now - timedelta(seconds=ack_timeout_seconds),
+            )
+            .values(status=CommandDeliveryStatus.TIMEOUT)
+        )
+        return result.rowcount
+
+    def update_dispatch_status(
+        self, db: Session, *, dispatch_id: int, status: CommandDispatchStatus,
+        started_at: Optional[datetime] = None, completed_at: Optional[datetime] = None
+    ) -> None:
+        values = {"status": status}
+        if started_at:
+            values["started_at"] = started_at
+        if completed_at:
+            values["completed_at"] = completed_at
+        db.execute(update(CommandDispatch).where(CommandDispatch.id == dispatch_id).values(**values))
+
+command_fanout_command_crud = CommandFanoutCommandCRUD()
@@ -0,0 +1,68 @@
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.objects.device import Device
+from app.models.objects.system_unit import SystemUnit
+from app.models.events_logs.command_delivery import (
+    CommandDispatch, CommandDelivery, CommandTargetType, CommandDispatchStatus, CommandDeliveryStatus
+)
+
+class CommandFanoutQueryCRUD:
+    def get_target_device_ids(
+        self, db: Session, *, target_type: CommandTargetType, target_id: int, owner_organization_id: Optional[int] = None
+    ) -> List[int]:
+        """대상 집합에 속한 활성 기기 ID. owner_organization_id를 주면 해당 조직 소유 기기로 한정합니다."""
+        stmt = select(Device.id).where(Device.is_active.is_(True))
+        if target_type == CommandTargetType.SYSTEM_UNIT:
+            stmt = stmt.where(Device.system_unit_id == target_id)
+        elif target_type == CommandTargetType.PRODUCT_LINE:
+            stmt = stmt.join(SystemUnit, SystemUnit.id == Device.system_unit_id).where(SystemUnit.product_line_id == target_id)
+        else:
+            stmt = stmt.where(Device.owner_organization_id == target_id)
+        if owner_organization_id is not None:
+            stmt = stmt.where(Device.owner_organization_id == owner_organization_id)
+        return list(db.scalars(stmt.order_by(Device.id)))
+
+    def get_dispatch(self, db: Session, *, dispatch_id: int) -> Optional[CommandDispatch]:
+        return db.get(CommandDispatch, dispatch_id)
+
+    def get_runnable_dispatches(self, db: Session) -> List[CommandDispatch]:
+        return list(db.scalars(
+            select(CommandDispatch)
+            .where(CommandDispatch.status.in_([CommandDispatchStatus.PENDING, CommandDispatchStatus.RUNNING]))
+            .order_by(CommandDispatch.id)
+        ))
+
+    def count_by_status(self, db: Session, *, dispatch_id: int) -> Dict[str, int]:
+        rows = db.execute(
+            select(CommandDelivery.status, func.count())
+            .where(CommandDelivery.dispatch_id == dispatch_id)
+            .group_by(CommandDelivery.status)
+        )
+        return {status.value: count for status, count in rows}
+
+    def get_queued(self, db: Session, *, dispatch_id: int, limit: int) -> List[Tuple[int, str, str]]:
+        """발행할 QUEUED 전달을 (id, correlation_id, 기기 UUID)로 꺼냅니다."""
+        rows = db.execute(
+            select(CommandDelivery.id, CommandDelivery.correlation_id, Device.current_uuid)
+            .join(Device, Device.id == CommandDelivery.device_id)
+            .where(CommandDelivery.dispatch_id == dispatch_id, CommandDelivery.status == CommandDeliveryStatus.QUEUED)
+            .order_by(CommandDelivery.id)
+            .limit(limit)
+        )
+        return [(row.id, row.correlation_id, str(row.current_uuid)) for row in rows]
+
+    def get_latency_stats(self, db: Session, *, dispatch_id: int) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """응답이 도착한 전달의 지연 (p50, p95, max) ms"""
+        row = db.execute(
+            select(
+                func.percentile_cont(0.5).within_group(CommandDelivery.latency_ms),
+                func.percentile_cont(0.95).within_group(CommandDelivery.latency_ms),
+                func.max(CommandDelivery.latency_ms),
+            )
+            .where(CommandDelivery.dispatch_id == dispatch_id, CommandDelivery.latency_ms.is_not(None))
+        ).one()
+        return row[0], row[1], row[2]
+
+command_fanout_query_crud = CommandFanoutQueryCRUD()
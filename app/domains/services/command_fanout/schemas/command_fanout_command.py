@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field
+
+from app.models.events_logs.command_delivery import CommandTargetType, CommandDeliveryStatus
+
+class CommandFanoutRequest(BaseModel):
+    """
+    [Request Schema] 대상 집합(유닛/제품군/조직)의 기기 전체에 명령을 발행할 때 쓰는 바디 데이터
+    """
+    target_type: CommandTargetType = Field(..., description="SYSTEM_UNIT / PRODUCT_LINE / ORGANIZATION")
+    target_id: int = Field(..., description="대상 유닛/제품군/조직 ID")
+    action: str = Field(..., min_length=1, max_length=100, description="명령 종류 (예: FIRMWARE_UPDATE)")
+    parameters: Optional[Dict[str, Any]] = Field(None, description="명령 파라미터")
+    rate_per_second: Optional[float] = Field(None, gt=0, description="초당 최대 발행 수 (비우면 서버 기본값)")
+    max_in_flight: Optional[int] = Field(None, gt=0, description="응답 대기 중인 최대 명령 수 (비우면 서버 기본값)")
+    ack_timeout_seconds: Optional[int] = Field(None, gt=0, description="응답 대기 시간 (비우면 서버 기본값)")
+
+class CommandDispatchCreate(BaseModel):
+    target_type: CommandTargetType
+    target_id: int
+    action: str
+    parameters: Optional[Dict[str, Any]] = None
+    rate_per_second: float
+    max_in_flight: int
+    ack_timeout_seconds: int
+    total_count: int
+    user_id: Optional[int] = None
+
+class CommandAck(BaseModel):
+    """리스너가 commands/response/{uuid}에서 받은 응답 1건 (일괄 반영 단위)"""
+    correlation_id: str
+    device_uuid: str
+    status: CommandDeliveryStatus  # ACKED / FAILED
+    acked_at: datetime
+    response: Optional[Dict[str, Any]] = None
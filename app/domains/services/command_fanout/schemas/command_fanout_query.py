@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, ConfigDict
+
+class CommandDispatchRuntimeRead(BaseModel):
+    """
+    팬아웃 엔진(Executor)이 틱마다 다루는 실행 전용 스냅샷입니다.
+    ORM 객체를 세션 밖으로 들고 다니지 않도록 발행 판단에 필요한 필드만 복사합니다.
+    """
+    id: int
+    action: str
+    parameters: Optional[Dict[str, Any]] = None
+    status: str
+    rate_per_second: float
+    max_in_flight: int
+    ack_timeout_seconds: int
+
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+
+class QueuedDelivery(BaseModel):
+    """발행 대상으로 꺼낸 전달 1건"""
+    id: int
+    correlation_id: str
+    device_uuid: str
+
+class CommandDispatchProgress(BaseModel):
+    """[Response Schema] 팬아웃 작업 진행 현황: 상태별 건수와 응답 지연 분포"""
+    dispatch_id: int
+    action: str
+    status: str
+    total_count: int
+    user_id: Optional[int] = None
+    counts: Dict[str, int]
+    latency_p50_ms: Optional[float] = None
+    latency_p95_ms: Optional[float] = None
+    latency_max_ms: Optional[float] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
@@ -0,0 +1,43 @@
+import logging
+from datetime import datetime
+from typing import List
+from sqlalchemy.orm import Session
+
+from app.models.events_logs.command_delivery import CommandDispatch, CommandDispatchStatus
+from ..crud.command_fanout_command_crud import command_fanout_command_crud
+from ..schemas.command_fanout_command import CommandDispatchCreate, CommandAck
+
+logger = logging.getLogger(__name__)
+
+class CommandFanoutCommandService:
+    def create_dispatch(self, db: Session, *, obj_in: CommandDispatchCreate, device_ids: List[int]) -> CommandDispatch:
+        """팬아웃 작업과 기기별 전달(QUEUED)을 생성합니다. 커밋은 호출자(Policy)가 합니다."""
+        dispatch = command_fanout_command_crud.create_dispatch(db, obj_in=obj_in)
+        command_fanout_command_crud.bulk_create_deliveries(db, dispatch_id=dispatch.id, device_ids=device_ids)
+        logger.info(f"📝 [Command Fan-out] Dispatch {dispatch.id} created: {obj_in.action} -> {len(device_ids)} devices")
+        return dispatch
+
+    def mark_sent(self, db: Session, *, delivery_ids: List[int], sent_at: datetime) -> None:
+        command_fanout_command_crud.mark_sent(db, delivery_ids=delivery_ids, sent_at=sent_at)
+
+    def requeue(self, db: Session, *, delivery_ids: List[int]) -> None:
+        command_fanout_command_crud.requeue(db, delivery_ids=delivery_ids)
+
+    def apply_acks(self, db: Session, *, acks: List[CommandAck]) -> None:
+        command_fanout_command_crud.apply_acks(db, acks=acks)
+
+    def expire_timeouts(self, db: Session, *, dispatch_id: int, ack_timeout_seconds: int, now: datetime) -> int:
+        return command_fanout_command_crud.expire_timeouts(
+            db, dispatch_id=dispatch_id, ack_timeout_seconds=ack_timeout_seconds, now=now
+        )
+
+    def mark_running(self, db: Session, *, dispatch_id: int, now: datetime) -> None:
+        command_fanout_command_crud.update_dispatch_status(
+            db, dispatch_id=dispatch_id, status=CommandDispatchStatus.RUNNING, started_at=now
+        )
+
+    def mark_finished(self, db: Session, *, dispatch_id: int, status: CommandDispatchStatus, now: datetime) -> None:
+        command_fanout_command_crud.update_dispatch_status(db, dispatch_id=dispatch_id, status=status, completed_at=now)
+        logger.info(f"🚩 [Command Fan-out] Dispatch {dispatch_id} {status.value}.")
+
+command_fanout_command_service = CommandFanoutCommandService()
@@ -0,0 +1,45 @@
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+
+from app.models.events_logs.command_delivery import CommandTargetType
+from ..crud.command_fanout_query_crud import command_fanout_query_crud
+from ..schemas.command_fanout_query import CommandDispatchRuntimeRead, QueuedDelivery, CommandDispatchProgress
+
+class CommandFanoutQueryService:
+    def get_target_device_ids(
+        self, db: Session, *, target_type: CommandTargetType, target_id: int, owner_organization_id: Optional[int] = None
+    ) -> List[int]:
+        return command_fanout_query_crud.get_target_device_ids(
+            db, target_type=target_type, target_id=target_id, owner_organization_id=owner_organization_id
+        )
+
+    def get_runnable_dispatches(self, db: Session) -> List[CommandDispatchRuntimeRead]:
+        return [CommandDispatchRuntimeRead.model_validate(d) for d in command_fanout_query_crud.get_runnable_dispatches(db)]
+
+    def count_by_status(self, db: Session, *, dispatch_id: int) -> Dict[str, int]:
+        return command_fanout_query_crud.count_by_status(db, dispatch_id=dispatch_id)
+
+    def get_queued(self, db: Session, *, dispatch_id: int, limit: int) -> List[QueuedDelivery]:
+        rows = command_fanout_query_crud.get_queued(db, dispatch_id=dispatch_id, limit=limit)
+        return [QueuedDelivery(id=id_, correlation_id=correlation_id, device_uuid=device_uuid) for id_, correlation_id, device_uuid in rows]
+
+    def get_progress(self, db: Session, *, dispatch_id: int) -> Optional[CommandDispatchProgress]:
+        dispatch = command_fanout_query_crud.get_dispatch(db, dispatch_id=dispatch_id)
+        if not dispatch:
+            return None
+        p50, p95, max_ms = command_fanout_query_crud.get_latency_stats(db, dispatch_id=dispatch_id)
+        return CommandDispatchProgress(
+            dispatch_id=dispatch.id,
+            action=dispatch.action,
+            status=dispatch.status.value,
+            total_count=dispatch.total_count,
+            user_id=dispatch.user_id,
+            counts=command_fanout_query_crud.count_by_status(db, dispatch_id=dispatch_id),
+            latency_p50_ms=p50,
+            latency_p95_ms=p95,
+            latency_max_ms=max_ms,
+            started_at=dispatch.started_at,
+            completed_at=dispatch.completed_at,
+        )
+
+command_fanout_query_service = CommandFanoutQueryService()
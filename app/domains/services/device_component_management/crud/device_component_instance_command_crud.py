@@ -1,5 +1,10 @@
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List
+
 from app.core.crud_base import CRUDBase
 from app.models.relationships.device_component_instance import DeviceComponentInstance
+from app.models.relationships.device_component_pin_mapping import DeviceComponentPinMapping, PinStatusEnum
 from ..schemas.device_component_instance_command import DeviceComponentInstanceCreate
 from pydantic import BaseModel # Placeholder for Update schema
 
@@ -9,6 +14,22 @@ class DeviceComponentInstanceUpdate(BaseModel):
 
 class CRUDDeviceComponentInstanceCommand(CRUDBase[DeviceComponentInstance, DeviceComponentInstanceCreate, DeviceComponentInstanceUpdate]):
     """장치-부품 연결 인스턴스의 생성, 수정, 삭제를 담당합니다."""
-    pass
+
+    def delete_wiring_for_devices(self, db: Session, *, device_ids: List[int]) -> None:
+        """여러 기기의 배선을 한 번에 정리합니다. 고장(FAULTY) 핀 기록은 남기고, 부품 인스턴스는 모두 제거합니다."""
+        db.execute(delete(DeviceComponentPinMapping).where(
+            DeviceComponentPinMapping.device_id.in_(device_ids),
+            DeviceComponentPinMapping.status != PinStatusEnum.FAULTY,
+        ))
+        db.execute(delete(DeviceComponentInstance).where(DeviceComponentInstance.device_id.in_(device_ids)))
+
+    def bulk_create_instances(self, db: Session, *, rows: List[Dict[str, Any]]) -> List[int]:
+        """다중 행 INSERT ... RETURNING으로 인스턴스를 만들고, 입력 순서대로 id를 반환합니다."""
+        stmt = insert(DeviceComponentInstance).returning(DeviceComponentInstance.id, sort_by_parameter_order=True)
+        return list(db.scalars(stmt, rows))
+
+    def bulk_create_pin_mappings(self, db: Session, *, rows: List[Dict[str, Any]]) -> None:
+        """핀 매핑을 다중 행 INSERT로 한 번에 기록합니다."""
+        db.execute(insert(DeviceComponentPinMapping), rows)
 
 device_component_instance_command_crud = CRUDDeviceComponentInstanceCommand(DeviceComponentInstance)
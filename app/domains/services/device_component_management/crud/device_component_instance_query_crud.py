@@ -1,10 +1,9 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
-from typing import Optional, List
-
-from sqlalchemy.orm import Session, joinedload
-from typing import Optional, List
+from typing import Dict, Optional, List, Set
 
 from app.models.relationships.device_component_instance import DeviceComponentInstance
+from app.models.relationships.device_component_pin_mapping import DeviceComponentPinMapping, PinStatusEnum
 
 class CRUDDeviceComponentInstanceQuery:
     # 헬퍼 메서드 추가 (내부적으로만 사용)
@@ -43,4 +42,17 @@ class CRUDDeviceComponentInstanceQuery:
             .all()
         )
 
+    def get_faulty_pin_numbers(self, db: Session, *, device_ids: List[int]) -> Dict[int, Set[int]]:
+        """여러 기기의 고장(FAULTY) 핀 번호를 한 번의 쿼리로 조회합니다. {device_id: {pin_number, ...}}"""
+        rows = db.execute(
+            select(DeviceComponentPinMapping.device_id, DeviceComponentPinMapping.pin_number).where(
+                DeviceComponentPinMapping.device_id.in_(device_ids),
+                DeviceComponentPinMapping.status == PinStatusEnum.FAULTY,
+            )
+        )
+        faulty: Dict[int, Set[int]] = {}
+        for device_id, pin_number in rows:
+            faulty.setdefault(device_id, set()).add(pin_number)
+        return faulty
+
 device_component_instance_query_crud = CRUDDeviceComponentInstanceQuery()
\ No newline at end of file
@@ -1,6 +1,6 @@
 import logging
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Any, Callable, Dict, List, Optional, Set
 
 # --- Model Imports ---
 from app.models.relationships.device_component_instance import DeviceComponentInstance
@@ -11,12 +11,17 @@ from app.models.objects.device import Device as DBDevice # 타입 힌팅용
 # --- Schema Imports (Policy로부터 전달받을 데이터 타입) ---
 from app.domains.services.hardware_blueprint.schemas.hardware_blueprint_query import BlueprintPinMappingRead
 from ..schemas.device_component_instance_command import DeviceComponentInstanceCreate
+from ..crud.device_component_instance_command_crud import device_component_instance_command_crud
+from ..crud.device_component_instance_query_crud import device_component_instance_query_crud
 
 # --- Provider Imports ---
 from app.domains.inter_domain.audit.audit_command_provider import audit_command_provider
 
 logger = logging.getLogger(__name__)
 
+# 일괄 배포 시 한 번에 처리하는 기기 수 (청크마다 진행 상황을 보고)
+ROLLOUT_CHUNK_SIZE = 500
+
 class DeviceComponentInstanceCommandService:
     """
     [Pure Command Service]
@@ -28,42 +33,11 @@ class DeviceComponentInstanceCommandService:
         self, db: Session, *, device_id: int, recipe: List[BlueprintPinMappingRead], actor_user: User
     ) -> None:
         """[The Realizer] 기존 설정을 밀고(고장 제외) 새 배선을 실행합니다."""
-        
-        # 1. 기존 데이터 정리 (고장난 핀(FAULTY) 기록은 절대 지우지 않음)
-        db.query(DeviceComponentPinMapping).filter(
-            DeviceComponentPinMapping.device_id == device_id,
-            DeviceComponentPinMapping.status != PinStatusEnum.FAULTY # [중요] FAULTY 제외
-        ).delete()
-        
-        # 인스턴스는 배선이 새로 깔리므로 일단 모두 제거
-        db.query(DeviceComponentInstance).filter(DeviceComponentInstance.device_id == device_id).delete()
-        db.flush()
-
-        # 2. 레시피(BlueprintPinMappingRead)를 바탕으로 실체화
-        for item in recipe:
-            # 부품 인스턴스 생성
-            new_instance = DeviceComponentInstance(
-                device_id=device_id,
-                supported_component_id=item.supported_component_id,
-                instance_name=item.pin_name,
-                configuration={}
-            )
-            db.add(new_instance)
-            db.flush()
-
-            # B. 핀 매핑 생성 (실제 배선)
-            new_mapping = DeviceComponentPinMapping(
-                device_id=device_id,
-                device_component_instance_id=new_instance.id,
-                pin_name=item.pin_name,
-                pin_number=item.pin_number,
-                pin_mode=item.pin_mode,
-                status=PinStatusEnum.ACTIVE
-            )
-            db.add(new_mapping)
+        # 1~2. 기존 배선 정리(FAULTY 제외) 후 레시피 실체화
+        self._realize_recipes(db, {device_id: recipe})
 
         # 3. 감사 로그 기록
-        audit_command_provider.log_event(
+        audit_command_provider.log(
             db=db,
             actor_user=actor_user,
             event_type="DEVICE_COMPONENTS_REINITIALIZED",
@@ -72,6 +46,87 @@ class DeviceComponentInstanceCommandService:
         )
         db.flush()
 
+    def bulk_reinitialize_by_recipe(
+        self, db: Session, *, device_ids: List[int], recipe: List[BlueprintPinMappingRead], pin_pool: List[int],
+        actor_user: User, on_progress: Optional[Callable[[int, int], None]] = None, chunk_size: int = ROLLOUT_CHUNK_SIZE
+    ) -> Dict[str, Any]:
+        """
+        [Fleet Rollout] 하나의 레시피를 여러 기기에 한 트랜잭션으로 적용합니다. (고장 핀 우회 포함)
+        chunk_size 기기씩 묶어 고장 핀 조회 1회 + 삭제 2회 + 다중 행 INSERT 2종으로 처리하며,
+        청크마다 on_progress(처리한 기기 수, 전체 기기 수)를 호출합니다. 커밋은 Policy가 수행합니다.
+        고장 핀을 모두 우회할 가용 핀이 없는 기기는 기존 배선을 그대로 두고 failed_device_ids로 돌려줍니다.
+        """
+        total = len(device_ids)
+        mapping_count = 0
+        rerouted_count = 0
+        failed_device_ids: List[int] = []
+
+        for offset in range(0, total, chunk_size):
+            chunk = device_ids[offset:offset + chunk_size]
+            faulty_by_device = device_component_instance_query_crud.get_faulty_pin_numbers(db, device_ids=chunk)
+
+            recipes = {}
+            for device_id in chunk:
+                faulty_pin_nos = faulty_by_device.get(device_id, set())
+                final_recipe = self._reroute_recipe(device_id, recipe, pin_pool, faulty_pin_nos)
+                if any(item.pin_number in faulty_pin_nos for item in final_recipe):
+                    failed_device_ids.append(device_id)
+                    continue
+                rerouted_count += sum(1 for raw, final in zip(recipe, final_recipe) if raw.pin_number != final.pin_number)
+                recipes[device_id] = final_recipe
+
+            if recipes:
+                mapping_count += self._realize_recipes(db, recipes)
+            if on_progress:
+                on_progress(offset + len(chunk), total)
+
+        audit_command_provider.log(
+            db=db,
+            actor_user=actor_user,
+            event_type="DEVICE_COMPONENTS_BULK_REINITIALIZED",
+            description=f"{total - len(failed_device_ids)}/{total} devices reinitialized based on blueprint recipe.",
+            details={
+                "device_ids": device_ids, "failed_device_ids": failed_device_ids,
+                "recipe_count": len(recipe), "rerouted_pins": rerouted_count
+            }
+        )
+        db.flush()
+        return {
+            "device_count": total,
+            "rewired_device_count": total - len(failed_device_ids),
+            "failed_device_ids": failed_device_ids,
+            "pin_mapping_count": mapping_count,
+            "rerouted_pin_count": rerouted_count,
+        }
+
+    def _realize_recipes(self, db: Session, recipes: Dict[int, List[BlueprintPinMappingRead]]) -> int:
+        """
+        {device_id: 최종 레시피}를 배선으로 실체화합니다. 기기 수와 무관하게 집합 단위 삭제 2회 + 다중 행 INSERT 2종입니다.
+        (인스턴스 id는 INSERT ... RETURNING으로 받아 핀 매핑에 연결하므로 행마다 flush하지 않습니다.)
+        """
+        device_component_instance_command_crud.delete_wiring_for_devices(db, device_ids=list(recipes))
+
+        items = [(device_id, item) for device_id, recipe in recipes.items() for item in recipe]
+        if not items:
+            return 0
+
+        instance_ids = device_component_instance_command_crud.bulk_create_instances(db, rows=[
+            {"device_id": device_id, "supported_component_id": item.supported_component_id, "instance_name": item.pin_name}
+            for device_id, item in items
+        ])
+        device_component_instance_command_crud.bulk_create_pin_mappings(db, rows=[
+            {
+                "device_id": device_id,
+                "device_component_instance_id": instance_id,
+                "pin_name": item.pin_name,
+                "pin_number": item.pin_number,
+                "pin_mode": item.pin_mode,
+                "status": PinStatusEnum.ACTIVE,
+            }
+            for instance_id, (device_id, item) in zip(instance_ids, items)
+        ])
+        return len(items)
+
     def create_instance(self, db: Session, *, obj_in: DeviceComponentInstanceCreate, actor_user: User) -> DeviceComponentInstance:
         """단일 부품 인스턴스 생성 (Pure Write)"""
         db_obj = DeviceComponentInstance(**obj_in.model_dump())
@@ -106,6 +161,12 @@ class DeviceComponentInstanceCommandService:
         """
         # 1. 현재 기기에서 고장으로 판명된 핀 번호 추출
         faulty_pin_nos = {m.pin_number for m in device.pin_mappings if m.status == PinStatusEnum.FAULTY}
+        return self._reroute_recipe(device.id, recipe, pin_pool, faulty_pin_nos)
+
+    def _reroute_recipe(
+        self, device_id: int, recipe: List[BlueprintPinMappingRead], pin_pool: List[int], faulty_pin_nos: Set[int]
+    ) -> List[BlueprintPinMappingRead]:
+        """고장 핀을 가용 핀으로 바꾼 레시피 사본을 반환합니다. (여러 기기가 같은 레시피를 공유하므로 원본은 바꾸지 않음)"""
         if not faulty_pin_nos:
             return recipe
 
@@ -114,14 +175,16 @@ class DeviceComponentInstanceCommandService:
         available_pins = [p for p in pin_pool if p not in faulty_pin_nos and p not in used_in_recipe]
 
         # 3. 고장 핀을 발견하면 가용 풀에서 하나씩 꺼내 교체 (우회 실행)
+        rerouted = []
         for item in recipe:
             if item.pin_number in faulty_pin_nos:
                 if not available_pins:
-                    logger.error(f"❌ 기기 {device.id}: 우회할 가용 핀이 부족합니다.")
-                    continue
-                item.pin_number = available_pins.pop(0)
+                    logger.error(f"❌ 기기 {device_id}: 우회할 가용 핀이 부족합니다.")
+                else:
+                    item = item.model_copy(update={"pin_number": available_pins.pop(0)})
+            rerouted.append(item)
         
-        return recipe
+        return rerouted
 
     def reinitialize_with_smart_rerouting(
         self, db: Session, *, device_obj: DBDevice, raw_recipe: List[BlueprintPinMappingRead], 
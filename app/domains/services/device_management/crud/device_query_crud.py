@@ -1,5 +1,6 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_
+from sqlalchemy import or_, select
 from typing import Optional, List
 from uuid import UUID
 import uuid  # [추가] UUID 형식 검증을 위해 반드시 필요합니다.
@@ -28,6 +29,12 @@ class CRUDDeviceQuery:
         except (ValueError, AttributeError):
             return None
 
+    def get_multi_by_uuids(self, db: Session, *, current_uuids: List[UUID]) -> List[Device]:
+        """여러 UUID의 활성 장치를 한 번의 IN 쿼리로 조회합니다. (소유권 관계 포함)"""
+        if not current_uuids:
+            return []
+        return self._get_base_query(db).filter(Device.current_uuid.in_(current_uuids)).all()
+
     def get_by_serial(self, db: Session, *, serial: str) -> Optional[Device]:
         """CPU 시리얼로 장치를 조회합니다."""
         return self._get_base_query(db).filter(Device.cpu_serial == serial).first()
@@ -56,6 +63,20 @@ class CRUDDeviceQuery:
             # UUID 형식이 아닌 경우: cpu_serial 컬럼만 검색 (에러 원천 차단)
             return query.filter(Device.cpu_serial == identifier).first()
 
+    async def get_by_identifier_async(self, db: AsyncSession, *, identifier: str) -> Optional[Device]:
+        """
+        [Async] get_by_identifier의 AsyncSession 버전.
+        async 세션에서는 lazy load를 할 수 없으므로, DeviceRead 변환에 필요한 컬럼만 가진 Device를 반환합니다.
+        """
+        try:
+            uuid.UUID(str(identifier))
+            condition = (Device.current_uuid == identifier) | (Device.cpu_serial == identifier)
+        except (ValueError, AttributeError):
+            condition = Device.cpu_serial == identifier
+
+        stmt = select(Device).where(Device.is_active == True, condition).limit(1)
+        return (await db.execute(stmt)).scalars().first()
+
     def get_multi(self, db: Session, *, query_params: DeviceQuery) -> List[Device]:
         """
         DeviceQuery 스키마 기반 동적 조회 시에도 관계 데이터를 포함합니다.
@@ -85,4 +106,11 @@ class CRUDDeviceQuery:
 
         return query.offset(query_params.skip).limit(query_params.limit).all()
 
+    def get_ids_by_blueprint(self, db: Session, *, blueprint_id: int, device_ids: Optional[List[int]] = None) -> List[int]:
+        """특정 설계도로 제작된 활성 기기 ID 목록 (device_ids가 주어지면 그 중에서만). 관계 로드 없이 id만 읽습니다."""
+        stmt = select(Device.id).where(Device.hardware_blueprint_id == blueprint_id, Device.is_active == True)
+        if device_ids is not None:
+            stmt = stmt.where(Device.id.in_(device_ids))
+        return list(db.scalars(stmt.order_by(Device.id)))
+
 device_query_crud = CRUDDeviceQuery()
\ No newline at end of file
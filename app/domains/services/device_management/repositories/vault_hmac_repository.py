@@ -2,7 +2,8 @@ import logging
 import hvac
 import os
 
-from app.core.config import Settings
+from app.core.config import Settings, get_settings
+from app.core.registry import app_registry
 
 logger = logging.getLogger(__name__)
 
@@ -99,6 +100,5 @@ class VaultHmacRepository:
             return False # 검증 실패 시 False 반환
 
 # --- Singleton Instance ---
-# 애플리케이션 설정(settings)을 로드하여 리포지토리의 싱글턴 인스턴스를 생성합니다.
-app_settings = Settings()
-vault_hmac_repository = VaultHmacRepository(settings=app_settings)
+# Vault 인증은 네트워크 호출이므로 import 시점이 아니라 첫 사용(또는 lifespan warm-up) 때 수행합니다.
+vault_hmac_repository = app_registry.register("vault_hmac", lambda: VaultHmacRepository(settings=get_settings()))
@@ -1,5 +1,5 @@
 # schemas/device_command.py
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from pydantic import BaseModel, Field
 
@@ -22,3 +22,11 @@ class DeviceUpdate(BaseModel):
     hardware_blueprint_id: Optional[int] = Field(None, description="장치의 하드웨어 블루프린트 ID")
     system_unit_id: Optional[int] = Field(None, description="시스템 유닛 ID")
     visibility_status: Optional[str] = Field(None, description="장치의 공개 범위 상태")
+
+class FactoryBulkEnrollRequest(BaseModel):
+    """생산 로트 단위 공장 일괄 등록 요청."""
+    reported_ip: Optional[str] = Field(None, description="게이트웨이가 스스로 보고한 IP (감사 기록용, 신뢰 판단에는 쓰지 않음)")
+    cpu_serials: List[str] = Field(..., min_length=1, description="등록할 보드의 CPU 시리얼 목록")
+    lot_id: Optional[str] = Field(None, description="생산 로트 식별자 (감사 로그용)")
+    target_unit_name: Optional[str] = Field(None, description="등록과 함께 배정할 시스템 유닛 이름")
+    auto_activate: bool = Field(False, description="유닛이 배정된 경우 ONLINE 상태로 등록")
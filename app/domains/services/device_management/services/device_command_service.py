@@ -1,8 +1,9 @@
+import asyncio
 import logging
-import uuid
 import secrets
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import Optional, Tuple, List
+from typing import Optional, Set, Tuple, List
 from datetime import datetime, timezone
 
 # --- Model Imports ---
@@ -11,6 +12,8 @@ from app.models.objects.user import User
 from app.models.objects.hardware_blueprint import HardwareBlueprint
 from app.models.objects.system_unit import SystemUnit
 
+from app.core.config import settings
+
 # --- ID Generator and Exceptions ---
 from app.core.id_generator import generate_device_id
 from app.core.exceptions import NotFoundError, DuplicateEntryError
@@ -98,66 +101,132 @@ class DeviceManagementCommandService:
         )
         return new_device
     
-    async def execute_factory_enrollment_transaction(
-        self, db: Session, cpu_serial: str, client_ip: str,
-        target_unit_name: str = None, components: List[str] = None, auto_activate: bool = False
-    ) -> dict:
+    def prepare_factory_identity(self, *, cpu_serial: str) -> dict:
         """
-        [핵심] 공장 등록 통합 트랜잭션. 
-        청사진과 유닛이 없어도 기기를 등록할 수 있도록 유연하게 처리합니다.
+        [Vault 단계] 공장 등록 기기의 정체성(UUID, HMAC 키, mTLS 인증서)을 준비합니다.
+        DB를 사용하지 않으므로 일괄 등록에서 스레드로 병렬 실행됩니다. 인증서는 선발급 풀이 있으면 풀에서 꺼냅니다.
         """
-        # A. 정체성 데이터 생성
-        new_uuid = str(uuid.uuid4())
         new_hmac_key = secrets.token_hex(32)
         vault_path = f"ares4/hmac/{cpu_serial}"
 
-        # B. HMAC 저장
         hmac_svc = hmac_command_provider.get_service()
         hmac_svc.store_device_hmac(path=vault_path, key=new_hmac_key)
 
-        bp_id = self._get_default_blueprint_id(db)
-        unit_id = self._get_target_unit_id(db, target_unit_name)
+        # 인증서 CN에 UUID가 들어가므로 UUID는 인증서와 한 쌍으로 정해집니다.
+        new_uuid, certs = certificate_command_provider.obtain_device_certificate()
+        return {"cpu_serial": cpu_serial, "uuid": new_uuid, "hmac_key": new_hmac_key, "vault_path": vault_path, "certs": certs}
 
+    def register_factory_identity(
+        self, db: Session, *, identity: dict, bp_id: Optional[int], unit_id: Optional[int], auto_activate: bool = False
+    ) -> dict:
+        """[DB 단계] 준비된 정체성으로 기기를 생성하고 인증서 발급 감사 로그를 남깁니다. (커밋은 호출자)"""
         # 상태 결정 (자동 활성화 요청이 있고 + 유닛도 배정되었을 때만 ONLINE)
         if auto_activate and unit_id:
             initial_status = "ONLINE"
         else:
             initial_status = "PENDING"
 
-        # C. DB 등록
         obj_in = DeviceCreate(
-            cpu_serial=cpu_serial,
-            uuid=new_uuid,
+            cpu_serial=identity["cpu_serial"],
+            uuid=identity["uuid"],
             status=initial_status,
-            hmac_key_name=vault_path,
+            hmac_key_name=identity["vault_path"],
             hardware_blueprint_id=bp_id, # None이어도 OK
             system_unit_id=unit_id       # None이어도 OK
         )
-        
+
         # 시스템 유저(actor=None) 권한으로 생성
         new_device = self.create_device(db, obj_in=obj_in, actor_user=None)
-        
-        new_device.hmac_secret_key = new_hmac_key
-        db.add(new_device)
-        db.flush()
-        db.refresh(new_device)
 
-        # D. mTLS 인증서 발급
-        cert_svc = certificate_command_provider.get_service()
-        certs = cert_svc.create_device_certificate(db=db, common_name=new_uuid)
-        
+        new_device.hmac_secret_key = identity["hmac_key"]
+        db.add(new_device)
+        certificate_command_provider.record_device_certificate(db, common_name=identity["uuid"], cert_data=identity["certs"])
         db.flush()
-        logger.info(f"⚙️ [Service] Device {new_uuid} prepared for commitment.")
 
         return {
-            "device_id": new_uuid,
-            "hmac_key": new_hmac_key,
-            **certs,
+            "device_id": identity["uuid"],
+            "hmac_key": identity["hmac_key"],
+            **identity["certs"],
             "status": initial_status,
             "unit_id": unit_id,
             "blueprint_id": bp_id
         }
-    
+
+    async def execute_factory_enrollment_transaction(
+        self, db: Session, cpu_serial: str, client_ip: str,
+        target_unit_name: str = None, components: List[str] = None, auto_activate: bool = False
+    ) -> dict:
+        """
+        [핵심] 공장 등록 통합 트랜잭션. 
+        청사진과 유닛이 없어도 기기를 등록할 수 있도록 유연하게 처리합니다.
+        """
+        # A. 정체성 데이터 생성 + HMAC 저장 + mTLS 인증서 (Vault 왕복은 이벤트 루프 밖에서)
+        identity = await asyncio.to_thread(self.prepare_factory_identity, cpu_serial=cpu_serial)
+
+        bp_id = self._get_default_blueprint_id(db)
+        unit_id = self._get_target_unit_id(db, target_unit_name)
+
+        # B. DB 등록
+        package = self.register_factory_identity(db, identity=identity, bp_id=bp_id, unit_id=unit_id, auto_activate=auto_activate)
+        logger.info(f"⚙️ [Service] Device {identity['uuid']} prepared for commitment.")
+        return package
+
+    async def execute_bulk_factory_enrollment(
+        self, db: Session, *, cpu_serials: List[str], target_unit_name: str = None, auto_activate: bool = False
+    ) -> dict:
+        """
+        [일괄 등록] 생산 로트의 CPU 시리얼들을 한 번에 등록합니다.
+        1. 이미 등록된 시리얼을 한 번의 조회로 걸러내고
+        2. 기기별 Vault 작업(HMAC 저장, 인증서)을 FACTORY_ENROLL_VAULT_CONCURRENCY 만큼 병렬로 수행한 뒤
+        3. 같은 세션에서 기기별 SAVEPOINT로 DB 등록을 진행합니다. (한 기기의 실패가 로트 전체를 되돌리지 않음)
+        커밋은 호출자(Policy)가 수행합니다.
+        """
+        serials = list(dict.fromkeys(s.strip() for s in cpu_serials if s and s.strip()))
+        enrolled_serials = self._get_enrolled_serials(db, serials)
+        candidates = [s for s in serials if s not in enrolled_serials]
+
+        semaphore = asyncio.Semaphore(max(1, settings.FACTORY_ENROLL_VAULT_CONCURRENCY))
+
+        async def prepare(serial: str) -> dict:
+            async with semaphore:
+                return await asyncio.to_thread(self.prepare_factory_identity, cpu_serial=serial)
+
+        prepared = await asyncio.gather(*(prepare(s) for s in candidates), return_exceptions=True)
+
+        bp_id = self._get_default_blueprint_id(db)
+        unit_id = self._get_target_unit_id(db, target_unit_name)
+
+        enrolled, failed = [], []
+        for serial, identity in zip(candidates, prepared):
+            if isinstance(identity, BaseException):
+                logger.error(f"❌ [Bulk Enroll] Vault preparation failed for {serial}: {identity}")
+                failed.append({"cpu_serial": serial, "error": str(identity)})
+                continue
+            try:
+                with db.begin_nested():
+                    enrolled.append(self.register_factory_identity(
+                        db, identity=identity, bp_id=bp_id, unit_id=unit_id, auto_activate=auto_activate
+                    ))
+            except Exception as e:
+                logger.error(f"❌ [Bulk Enroll] Registration failed for {serial}: {e}")
+                failed.append({"cpu_serial": serial, "error": str(e)})
+
+        logger.info(
+            f"⚙️ [Service] Bulk enrollment prepared: {len(enrolled)} enrolled, {len(failed)} failed, "
+            f"{len(enrolled_serials)} already enrolled."
+        )
+        return {
+            "enrolled": enrolled,
+            "failed": failed,
+            "already_enrolled": [s for s in serials if s in enrolled_serials],
+        }
+
+    def _get_enrolled_serials(self, db: Session, serials: List[str]) -> Set[str]:
+        """이미 등록된(비활성 포함) CPU 시리얼 집합."""
+        if not serials:
+            return set()
+        return set(db.scalars(select(DBDevice.cpu_serial).where(DBDevice.cpu_serial.in_(serials))))
+
     def update_device(self, db: Session, *, device_id: int, obj_in: DeviceUpdate, actor_user: Optional[User] = None) -> DBDevice:
         """기존 장치 정보를 업데이트합니다."""
         db_obj = device_command_crud.get(db, id=device_id)
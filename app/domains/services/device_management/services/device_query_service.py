@@ -1,3 +1,4 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, undefer
 from typing import List, Optional
 from uuid import UUID
@@ -31,6 +32,10 @@ class DeviceManagementQueryService:
         db_device = self.get_device_model_by_uuid(db, current_uuid=current_uuid)
         return DeviceRead.model_validate(db_device) if db_device else None
     
+    def get_devices_by_uuids(self, db: Session, *, current_uuids: List[UUID]) -> List[DeviceRead]:
+        """여러 UUID의 장치를 한 번에 조회합니다. 없는 UUID는 결과에서 빠집니다."""
+        return [DeviceRead.model_validate(device) for device in device_query_crud.get_multi_by_uuids(db, current_uuids=current_uuids)]
+
     def get_device_model_by_uuid(self, db: Session, *, current_uuid: UUID) -> Optional[DBDevice]:
         """
         [내부용] Pydantic 변환 없이 SQLAlchemy 모델 원본을 반환합니다.
@@ -72,6 +77,11 @@ class DeviceManagementQueryService:
             
         return DeviceRead.model_validate(db_device)
     
+    async def get_device_by_identifier_async(self, db: AsyncSession, *, identifier: str) -> Optional[DeviceRead]:
+        """[Async] UUID 또는 CPU Serial로 장치를 조회합니다. (단일 쿼리)"""
+        db_device = await device_query_crud.get_by_identifier_async(db, identifier=identifier)
+        return DeviceRead.model_validate(db_device) if db_device else None
+
     def get_by_serial(self, db: Session, *, serial: str) -> Optional[DeviceRead]:
         """시리얼 번호로 장치를 조회합니다."""
         return self.get_device_by_identifier(db, identifier=serial)
@@ -82,6 +92,10 @@ class DeviceManagementQueryService:
         if existing_device:
             raise AppLogicError(f"Device with serial {serial} is already enrolled.")
         
+    def get_device_ids_by_blueprint(self, db: Session, *, blueprint_id: int, device_ids: Optional[List[int]] = None) -> List[int]:
+        """설계도별 활성 기기 ID 목록을 조회합니다. (일괄 배선 배포 대상 선정)"""
+        return device_query_crud.get_ids_by_blueprint(db, blueprint_id=blueprint_id, device_ids=device_ids)
+
     def get_count_by_unit(self, db: Session, *, unit_id: int) -> int:
         """해당 유닛에 현재 연결된 기기 숫자를 카운트합니다."""
         return db.query(DBDevice).filter(DBDevice.system_unit_id == unit_id).count()
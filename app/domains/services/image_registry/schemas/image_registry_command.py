@@ -0,0 +1,9 @@
+from pydantic import BaseModel, Field
+from typing import Optional, Dict
+
+class ImageRegistryCreate(BaseModel):
+    snapshot_id: str = Field(..., description="연결할 관측 스냅샷 ID")
+    device_id: int = Field(..., description="이미지를 보낸 기기 ID")
+    system_unit_id: int = Field(..., description="소속 시스템 유닛 ID")
+    storage_path: str = Field(..., description="S3/MinIO 저장 경로")
+    image_metadata: Optional[Dict] = Field(None, description="카메라 설정 등 가변 메타데이터 (JSONB)")
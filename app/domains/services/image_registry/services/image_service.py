@@ -1,5 +1,8 @@
+from typing import List
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.models.objects.image_registry import ImageRegistry
+from ..schemas.image_registry_command import ImageRegistryCreate
 
 class ImageService:
     """
@@ -32,4 +35,14 @@ class ImageService:
         
         return new_record
 
+    def create_registry_records(self, db: Session, *, records: List[ImageRegistryCreate]) -> List[int]:
+        """
+        여러 이미지를 다중 행 INSERT ... RETURNING 한 번으로 등록하고, 입력 순서대로 id를 반환합니다.
+        (건별 add + flush의 왕복을 묶음 1회로 줄입니다)
+        """
+        if not records:
+            return []
+        stmt = insert(ImageRegistry).returning(ImageRegistry.id, sort_by_parameter_order=True)
+        return list(db.scalars(stmt, [record.model_dump() for record in records]))
+
 image_service = ImageService()
\ No newline at end of file
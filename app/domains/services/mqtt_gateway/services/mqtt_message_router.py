@@ -1,15 +1,28 @@
 import logging
 import json
-from typing import Callable, Dict
+from typing import Callable, Dict, Optional
 from sqlalchemy.orm import Session
 import redis
 from gmqtt import Client as MQTTClient
 
+from app.core.query_stats import track_queries
+
 # [수정] 전문가를 직접 부르지 않고, 중앙 디스패처 제공자를 통합니다.
 from app.domains.inter_domain.policies.ingestion.ingestion_dispatcher_provider import ingestion_dispatcher_provider
+from app.domains.inter_domain.realtime.device_state_provider import device_state_provider
 
 logger = logging.getLogger(__name__)
 
+# 장치가 원문 바이트에 대한 서명을 실어 보내는 MQTT5 User-Property 이름
+HMAC_USER_PROPERTY = "hmac"
+
+def extract_signature(properties: Optional[Dict]) -> Optional[str]:
+    """gmqtt properties의 user_property([(키, 값), ...])에서 HMAC 서명을 꺼냅니다."""
+    for key, value in (properties or {}).get('user_property') or []:
+        if key == HMAC_USER_PROPERTY:
+            return value
+    return None
+
 class MqttMessageRouter:
     """
     MQTT 메시지를 분석하여 중앙 디스패처로 전달하거나,
@@ -21,7 +34,7 @@ class MqttMessageRouter:
 
     async def handle_message(self, client: MQTTClient, topic: str, payload: bytes, qos: int, properties: Dict):
         """gmqtt 클라이언트의 on_message 콜백"""
-        with self.db_session_factory() as db:
+        with track_queries(f"mqtt {topic.split('/', 1)[0]}"), self.db_session_factory() as db:
             try:
                 # 1. 페이로드 디코딩
                 try:
@@ -38,10 +51,13 @@ class MqttMessageRouter:
                     logger.info(f"ROUTER: Inbound telemetry dispatching for {topic}")
                     
                     # [핵심] 중앙 디스패처에게 모든 처리를 위임합니다.
+                    # 서명(User-Property)이 있으면 수신 바이트 그대로 HMAC 검증하도록 원문도 함께 넘깁니다.
                     is_valid, error_msg = ingestion_dispatcher_provider.dispatch(
                         db=db,
                         topic=topic,
-                        payload=payload_dict
+                        payload=payload_dict,
+                        raw_payload=payload,
+                        signature=extract_signature(properties)
                     )
                     
                     if is_valid:
@@ -67,10 +83,9 @@ class MqttMessageRouter:
             return
             
         user_email, device_uuid = topic_parts[2], topic_parts[3]
-        state_key = f"device_state:{device_uuid}"
         
         try:
-            cached_state = self.redis_client.hgetall(state_key)
+            cached_state = device_state_provider.read(device_uuid)
             response_payload = json.dumps(cached_state) if cached_state else "{}"
             response_topic = f"client/state/{user_email}/{device_uuid}"
             
@@ -0,0 +1,93 @@
+# --- Query-related CRUD ---
+# 이 파일은 RL 데이터셋 추출을 위해 스냅샷 기준으로 정렬된 행 스트림을 제공하는 'Query' CRUD 클래스를 정의합니다.
+
+from sqlalchemy import select, Select
+from sqlalchemy.orm import Session
+from typing import Any, Iterator, List, Tuple
+
+from app.models.events_logs.observation_snapshot import ObservationSnapshot
+from app.models.events_logs.telemetry_data import TelemetryData
+from app.models.objects.image_registry import ImageRegistry
+from app.models.objects.action_log import ActionLog
+from ..schemas.observation_export_query import ObservationExportFilter
+
+# 파이썬 측 병합 조인(merge join)은 문자열을 코드포인트 순으로 비교하므로,
+# DB 정렬도 로캘 규칙이 아닌 바이트 순서("C")로 맞춥니다.
+_BYTE_ORDER = "C"
+
+class CRUDObservationExportQuery:
+    def _apply_snapshot_filter(self, stmt: Select, filters: ObservationExportFilter) -> Select:
+        if filters.system_unit_ids:
+            stmt = stmt.where(ObservationSnapshot.system_unit_id.in_(filters.system_unit_ids))
+        if filters.start_time:
+            stmt = stmt.where(ObservationSnapshot.created_at >= filters.start_time)
+        if filters.end_time:
+            stmt = stmt.where(ObservationSnapshot.created_at < filters.end_time)
+        if filters.observation_types:
+            stmt = stmt.where(ObservationSnapshot.observation_type.in_(filters.observation_types))
+        if filters.after_snapshot_id:
+            stmt = stmt.where(ObservationSnapshot.id.collate(_BYTE_ORDER) > filters.after_snapshot_id)
+        return stmt
+
+    def _stream(self, db: Session, stmt: Select, fetch_size: int) -> Iterator[Tuple[Any, ...]]:
+        """서버 사이드 커서로 fetch_size씩 가져오며, ORM 객체 없이 튜플만 흘려보냅니다."""
+        result = db.execute(stmt, execution_options={"stream_results": True, "yield_per": fetch_size})
+        for row in result:
+            yield tuple(row)
+
+    def get_metric_columns(self, db: Session, *, filters: ObservationExportFilter) -> List[Tuple[str, str]]:
+        stmt = (
+            select(TelemetryData.component_name, TelemetryData.metric_name)
+            .join(ObservationSnapshot, TelemetryData.snapshot_id == ObservationSnapshot.id)
+            .distinct()
+        )
+        stmt = self._apply_snapshot_filter(stmt, filters)
+        return sorted((row[0], row[1]) for row in db.execute(stmt))
+
+    def stream_snapshots(self, db: Session, *, filters: ObservationExportFilter, fetch_size: int) -> Iterator[Tuple[Any, ...]]:
+        """(snapshot_id, system_unit_id, created_at, observation_type)"""
+        stmt = select(
+            ObservationSnapshot.id, ObservationSnapshot.system_unit_id,
+            ObservationSnapshot.created_at, ObservationSnapshot.observation_type,
+        )
+        stmt = self._apply_snapshot_filter(stmt, filters).order_by(ObservationSnapshot.id.collate(_BYTE_ORDER))
+        return self._stream(db, stmt, fetch_size)
+
+    def stream_telemetry(self, db: Session, *, filters: ObservationExportFilter, fetch_size: int) -> Iterator[Tuple[Any, ...]]:
+        """(snapshot_id, component_name, metric_name, avg, min, max, std, slope)"""
+        stmt = (
+            select(
+                TelemetryData.snapshot_id, TelemetryData.component_name, TelemetryData.metric_name,
+                TelemetryData.avg_value, TelemetryData.min_value, TelemetryData.max_value,
+                TelemetryData.std_dev, TelemetryData.slope,
+            )
+            .join(ObservationSnapshot, TelemetryData.snapshot_id == ObservationSnapshot.id)
+        )
+        stmt = self._apply_snapshot_filter(stmt, filters).order_by(
+            TelemetryData.snapshot_id.collate(_BYTE_ORDER), TelemetryData.captured_at
+        )
+        return self._stream(db, stmt, fetch_size)
+
+    def stream_images(self, db: Session, *, filters: ObservationExportFilter, fetch_size: int) -> Iterator[Tuple[Any, ...]]:
+        """(snapshot_id, storage_path)"""
+        stmt = (
+            select(ImageRegistry.snapshot_id, ImageRegistry.storage_path)
+            .join(ObservationSnapshot, ImageRegistry.snapshot_id == ObservationSnapshot.id)
+        )
+        stmt = self._apply_snapshot_filter(stmt, filters).order_by(
+            ImageRegistry.snapshot_id.collate(_BYTE_ORDER), ImageRegistry.id
+        )
+        return self._stream(db, stmt, fetch_size)
+
+    def stream_actions(self, db: Session, *, filters: ObservationExportFilter, fetch_size: int) -> Iterator[Tuple[Any, ...]]:
+        """(snapshot_id, command, parameters, actor_type, status)"""
+        stmt = (
+            select(ActionLog.snapshot_id, ActionLog.command, ActionLog.parameters, ActionLog.actor_type, ActionLog.status)
+            .join(ObservationSnapshot, ActionLog.snapshot_id == ObservationSnapshot.id)
+        )
+        stmt = self._apply_snapshot_filter(stmt, filters).order_by(
+            ActionLog.snapshot_id.collate(_BYTE_ORDER), ActionLog.created_at, ActionLog.id
+        )
+        return self._stream(db, stmt, fetch_size)
+
+observation_export_crud_query = CRUDObservationExportQuery()
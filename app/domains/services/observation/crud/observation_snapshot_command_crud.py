@@ -1,4 +1,6 @@
+from typing import List, Optional
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.models.events_logs.observation_snapshot import ObservationSnapshot
 from ..schemas.observation_snapshot_command import ObservationSnapshotCreate
 
@@ -13,4 +15,25 @@ class CRUDObservationSnapshotCommand:
         db.flush() # ID 확정 및 세션 등록 (Commit은 Policy에서)
         return db_obj
 
-observation_snapshot_crud_command = CRUDObservationSnapshotCommand()
\ No newline at end of file
+    def insert_if_absent(self, db: Session, *, obj_in: ObservationSnapshotCreate) -> Optional[ObservationSnapshot]:
+        """
+        INSERT ... ON CONFLICT DO NOTHING RETURNING. 새로 만든 경우에만 행을 돌려주고, 이미 있으면 None.
+        여러 카메라의 이미지가 같은 스냅샷으로 동시에 들어와도 PK 충돌 없이 한 행만 남습니다.
+        """
+        stmt = (
+            pg_insert(ObservationSnapshot)
+            .values(obj_in.model_dump())
+            .on_conflict_do_nothing(index_elements=["id"])
+            .returning(ObservationSnapshot)
+        )
+        return db.scalars(stmt).first()
+
+    def ensure_many(self, db: Session, *, obj_in_list: List[ObservationSnapshotCreate]) -> None:
+        """여러 스냅샷을 한 번의 다중 행 INSERT로 확보합니다. 이미 있는 ID는 건드리지 않습니다."""
+        if not obj_in_list:
+            return
+        # 같은 문장 안에서 같은 ID가 두 번 나오면 ON CONFLICT도 막지 못하므로 먼저 합칩니다.
+        rows = list({obj_in.id: obj_in.model_dump() for obj_in in obj_in_list}.values())
+        db.execute(pg_insert(ObservationSnapshot).values(rows).on_conflict_do_nothing(index_elements=["id"]))
+
+observation_snapshot_crud_command = CRUDObservationSnapshotCommand()
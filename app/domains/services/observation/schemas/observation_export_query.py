@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List, Optional
+
+class ObservationExportFilter(BaseModel):
+    """
+    RL 데이터셋 추출 범위. 모든 스트림(스냅샷/텔레메트리/이미지/액션)에 동일하게 적용됩니다.
+    after_snapshot_id는 재개(resume) 시 마지막으로 기록된 스냅샷 이후부터 읽기 위한 키셋 커서입니다.
+    """
+    system_unit_ids: Optional[List[int]] = None
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    observation_types: Optional[List[str]] = None
+    after_snapshot_id: Optional[str] = None
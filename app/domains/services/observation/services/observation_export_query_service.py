@@ -0,0 +1,27 @@
+from sqlalchemy.orm import Session
+from typing import Any, Iterator, List, Tuple
+
+from ..crud.observation_export_query_crud import observation_export_crud_query
+from ..schemas.observation_export_query import ObservationExportFilter
+
+class ObservationExportQueryService:
+    """
+    스냅샷(ObservationSnapshot)을 동기화 키로 하는 관측 데이터 스트림을 제공합니다.
+    모든 스트림은 snapshot_id 바이트 순으로 정렬되어 호출자가 병합 조인할 수 있습니다.
+    """
+    def get_metric_columns(self, db: Session, *, filters: ObservationExportFilter) -> List[Tuple[str, str]]:
+        return observation_export_crud_query.get_metric_columns(db, filters=filters)
+
+    def stream_snapshots(self, db: Session, *, filters: ObservationExportFilter, fetch_size: int) -> Iterator[Tuple[Any, ...]]:
+        return observation_export_crud_query.stream_snapshots(db, filters=filters, fetch_size=fetch_size)
+
+    def stream_telemetry(self, db: Session, *, filters: ObservationExportFilter, fetch_size: int) -> Iterator[Tuple[Any, ...]]:
+        return observation_export_crud_query.stream_telemetry(db, filters=filters, fetch_size=fetch_size)
+
+    def stream_images(self, db: Session, *, filters: ObservationExportFilter, fetch_size: int) -> Iterator[Tuple[Any, ...]]:
+        return observation_export_crud_query.stream_images(db, filters=filters, fetch_size=fetch_size)
+
+    def stream_actions(self, db: Session, *, filters: ObservationExportFilter, fetch_size: int) -> Iterator[Tuple[Any, ...]]:
+        return observation_export_crud_query.stream_actions(db, filters=filters, fetch_size=fetch_size)
+
+observation_export_query_service = ObservationExportQueryService()
@@ -1,3 +1,4 @@
+from typing import List, Optional
 from sqlalchemy.orm import Session
 from ..crud.observation_snapshot_command_crud import observation_snapshot_crud_command
 from ..schemas.observation_snapshot_command import ObservationSnapshotCreate
@@ -8,4 +9,11 @@ class ObservationSnapshotCommandService:
         obj_in = ObservationSnapshotCreate(id=snapshot_id, system_unit_id=system_unit_id, observation_type=observation_type)
         return observation_snapshot_crud_command.create(db, obj_in=obj_in)
 
-observation_snapshot_command_service = ObservationSnapshotCommandService()
\ No newline at end of file
+    def create_snapshot_if_absent(self, db: Session, *, snapshot_id: str, system_unit_id: int, observation_type: str) -> Optional[ObservationSnapshot]:
+        obj_in = ObservationSnapshotCreate(id=snapshot_id, system_unit_id=system_unit_id, observation_type=observation_type)
+        return observation_snapshot_crud_command.insert_if_absent(db, obj_in=obj_in)
+
+    def ensure_snapshots(self, db: Session, *, obj_in_list: List[ObservationSnapshotCreate]) -> None:
+        observation_snapshot_crud_command.ensure_many(db, obj_in_list=obj_in_list)
+
+observation_snapshot_command_service = ObservationSnapshotCommandService()
@@ -1,3 +1,5 @@
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -25,4 +27,20 @@ class CRUDPermissionQuery(CRUDBase[Permission, None, None]):
         # 3. 찾은 모든 역할들에 연결된 권한 리스트 추출
         role_ids = [a.role_id for a in assignments]
         return db.query(Permission).join(RolePermission).filter(RolePermission.role_id.in_(role_ids)).distinct().all()
+
+    def _role_has_permission_stmt(self, *, role_id: int, permission_name: str):
+        return select(exists().where(
+            RolePermission.role_id == role_id,
+            RolePermission.permission_id == Permission.id,
+            Permission.name == permission_name,
+        ))
+
+    def role_has_permission(self, db: Session, *, role_id: int, permission_name: str) -> bool:
+        """역할에 해당 이름의 권한이 연결되어 있는지 EXISTS 1회로 확인합니다."""
+        return bool(db.execute(self._role_has_permission_stmt(role_id=role_id, permission_name=permission_name)).scalar())
+
+    async def role_has_permission_async(self, db: AsyncSession, *, role_id: int, permission_name: str) -> bool:
+        result = await db.execute(self._role_has_permission_stmt(role_id=role_id, permission_name=permission_name))
+        return bool(result.scalar())
+
 permission_query_crud = CRUDPermissionQuery(Permission)
@@ -1,4 +1,5 @@
 from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.objects.permission import Permission
@@ -15,4 +16,11 @@ class PermissionQueryService:
             db=db, user_id=user_id, organization_id=organization_id
         )
 
+    def check_role_has_permission(self, db: Session, *, role_id: int, permission_name: str) -> bool:
+        """특정 역할이 주어진 권한을 가지고 있는지 확인합니다."""
+        return permission_query_crud.role_has_permission(db, role_id=role_id, permission_name=permission_name)
+
+    async def check_role_has_permission_async(self, db: AsyncSession, *, role_id: int, permission_name: str) -> bool:
+        return await permission_query_crud.role_has_permission_async(db, role_id=role_id, permission_name=permission_name)
+
 permission_query_service = PermissionQueryService()
@@ -0,0 +1,144 @@
+import json
+import struct
+from typing import Any, Dict, List, Tuple, Union
+
+# [Device State Format v1]
+# device_state:{uuid} 해시의 필드는 두 종류입니다.
+# - 헤더 필드: 최상위의 문자열 값(device_status, last_seen_at, user_email 등). 이름/값을 그대로 저장하며,
+#   헬스체커처럼 필드 이름으로 직접 읽고 쓰는 쪽과의 호환을 위해 인코딩하지 않습니다.
+# - 메트릭 필드: 그 밖의 모든 값(중첩된 nodes[].metrics[] 포함). 경로를 전역 사전의 정수 ID로 바꿔 "#<hex id>"를
+#   필드 이름으로 쓰고, 값은 1바이트 타입 태그 + struct로 패킹합니다.
+STATE_FORMAT_VERSION = 1
+VERSION_FIELD = "_v"
+METRIC_FIELD_PREFIX = "#"
+
+# 경로 구성요소: dict 키(str), 리스트 인덱스(int), 리스트 길이 표식(None).
+# JSON 객체의 키는 항상 문자열이므로 셋은 서로 겹치지 않습니다.
+PathPart = Union[str, int, None]
+
+_INT32 = struct.Struct("<i")
+_INT64 = struct.Struct("<q")
+_FLOAT32 = struct.Struct("<f")
+_FLOAT64 = struct.Struct("<d")
+
+def _round_float32(body: bytes) -> float:
+    # float32 왕복 오차(23.456 -> 23.4559993...)를 유효숫자 7자리로 되돌립니다.
+    return float(f"{_FLOAT32.unpack(body)[0]:.7g}")
+
+def encode_value(value: Any) -> bytes:
+    """
+    리프 값을 태그 + 바이너리로 패킹합니다.
+    실수는 float32(5바이트)로 되돌렸을 때 원래 값과 같을 때만 float32로 저장하고,
+    그렇지 않은 값(epoch 타임스탬프, 유효숫자 8자리 이상, float32 범위 밖)은 float64(9바이트)로 저장합니다.
+    """
+    if value is None:
+        return b"n"
+    if value is True:
+        return b"t"
+    if value is False:
+        return b"f"
+    if isinstance(value, int):
+        if -2**31 <= value < 2**31:
+            return b"i" + _INT32.pack(value)
+        if -2**63 <= value < 2**63:
+            return b"q" + _INT64.pack(value)
+        return b"j" + json.dumps(value).encode()
+    if isinstance(value, float):
+        try:
+            body = _FLOAT32.pack(value)
+            if _round_float32(body) == value:
+                return b"r" + body
+        except OverflowError:
+            pass
+        return b"d" + _FLOAT64.pack(value)
+    if isinstance(value, str):
+        return b"s" + value.encode()
+    return b"j" + json.dumps(value, default=str).encode()
+
+def decode_value(raw: bytes) -> Any:
+    tag, body = raw[:1], raw[1:]
+    if tag == b"r":
+        return _round_float32(body)
+    if tag == b"d":
+        return _FLOAT64.unpack(body)[0]
+    if tag == b"i":
+        return _INT32.unpack(body)[0]
+    if tag == b"s":
+        return body.decode()
+    if tag == b"q":
+        return _INT64.unpack(body)[0]
+    if tag == b"n":
+        return None
+    if tag == b"t":
+        return True
+    if tag == b"f":
+        return False
+    if tag == b"j":
+        return json.loads(body)
+    raise ValueError(f"Unknown device state value tag: {tag!r}")
+
+def encode_path(path: Tuple[PathPart, ...]) -> str:
+    return json.dumps(path, separators=(",", ":"))
+
+def decode_path(encoded: str) -> Tuple[PathPart, ...]:
+    return tuple(json.loads(encoded))
+
+def metric_field(metric_id: int) -> str:
+    return f"{METRIC_FIELD_PREFIX}{metric_id:x}"
+
+def metric_id_of(field: str) -> int:
+    return int(field[len(METRIC_FIELD_PREFIX):], 16)
+
+def split_payload(payload: Dict[str, Any]) -> Tuple[Dict[str, str], Dict[Tuple[PathPart, ...], Any]]:
+    """텔레메트리 페이로드를 (헤더 필드, 경로별 리프 값)으로 나눕니다."""
+    headers: Dict[str, str] = {}
+    leaves: Dict[Tuple[PathPart, ...], Any] = {}
+    for key, value in payload.items():
+        key = str(key)
+        if isinstance(value, str) and not key.startswith(METRIC_FIELD_PREFIX) and key != VERSION_FIELD:
+            headers[key] = value
+        else:
+            _flatten(value, (key,), leaves)
+    return headers, leaves
+
+def _flatten(value: Any, path: Tuple[PathPart, ...], leaves: Dict[Tuple[PathPart, ...], Any]) -> None:
+    if isinstance(value, dict):
+        for key, child in value.items():
+            _flatten(child, path + (str(key),), leaves)
+    elif isinstance(value, (list, tuple)):
+        # 길이도 함께 저장해, 목록이 줄어들면 이전의 긴 목록 꼬리가 디코딩 결과에 남지 않게 합니다.
+        leaves[path + (None,)] = len(value)
+        for index, child in enumerate(value):
+            _flatten(child, path + (index,), leaves)
+    else:
+        leaves[path] = value
+
+def build_state(headers: Dict[str, str], leaves: Dict[Tuple[PathPart, ...], Any]) -> Dict[str, Any]:
+    """split_payload의 역변환. 헤더와 경로별 리프 값으로 원래의 중첩 구조를 복원합니다."""
+    tree: Dict[PathPart, Any] = {}
+    for path, value in leaves.items():
+        node = tree
+        for part in path[:-1]:
+            child = node.get(part)
+            if not isinstance(child, dict):
+                child = node[part] = {}
+            node = child
+        if not isinstance(node.get(path[-1]), dict):
+            node[path[-1]] = value
+    state = _materialize(tree)
+    state.update(headers)
+    return state
+
+def _materialize(node: Dict[PathPart, Any]) -> Any:
+    length = node.get(None)
+    if length is not None:
+        items: List[Any] = [None] * length
+        for part, child in node.items():
+            if isinstance(part, int) and 0 <= part < length:
+                items[part] = _materialize(child) if isinstance(child, dict) else child
+        return items
+    return {
+        part: _materialize(child) if isinstance(child, dict) else child
+        for part, child in node.items()
+        if isinstance(part, str)
+    }
@@ -0,0 +1,223 @@
+import logging
+import asyncio
+import json
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set
+
+import redis.asyncio as aioredis
+from fastapi import WebSocket
+
+from app.core.config import Settings, get_settings
+from app.domains.services.realtime.services.realtime_device_service import DEVICE_STATE_CHANNEL_PREFIX
+from app.domains.services.realtime.repositories.device_state_repository import device_state_repository
+
+logger = logging.getLogger(__name__)
+
+class RealtimeConnection:
+    """
+    브라우저 WebSocket 연결 1개의 전송 상태.
+    같은 기기의 갱신은 전송 주기 사이에 최신값 1건으로 덮어쓰므로, 대기 메모리는 구독 기기 수를 넘지 않습니다.
+    """
+    def __init__(self, websocket: WebSocket, *, user_id: int):
+        self.websocket = websocket
+        self.user_id = user_id
+        self.devices: Set[str] = set()
+        self.closed = False
+        self.sent = 0
+        self.coalesced = 0
+        self._pending: Dict[str, str] = {}   # 기기 UUID -> 최신 상태(JSON 문자열)
+        self._control: Deque[str] = deque()   # 구독 응답 등 제어 메시지 (상태보다 먼저 전송)
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def offer(self, device_uuid: str, data: str) -> None:
+        if device_uuid in self._pending:
+            self.coalesced += 1
+        self._pending[device_uuid] = data
+        self._wakeup.set()
+
+    def send_control(self, message: Dict[str, Any]) -> None:
+        self._control.append(json.dumps(message))
+        self._wakeup.set()
+
+    def _take_frames(self) -> List[str]:
+        frames = list(self._control)
+        self._control.clear()
+        if self._pending:
+            updates, self._pending = self._pending, {}
+            # 상태는 이미 JSON 문자열이므로 다시 파싱/직렬화하지 않고 이어 붙입니다.
+            body = ",".join(f'"{device_uuid}":{data}' for device_uuid, data in updates.items())
+            frames.append(f'{{"type":"state","updates":{{{body}}}}}')
+        return frames
+
+class RealtimeHub:
+    """
+    [Realtime Gateway] 리스너가 Redis pub/sub으로 전파한 기기 상태를 이 워커의 WebSocket 구독자들에게 나눠 보냅니다.
+    - 이 워커에 구독자가 1명 이상인 기기 채널만 구독합니다. (워커마다 전체 기기 스트림을 받지 않도록)
+    - 연결마다 REALTIME_COALESCE_INTERVAL_SECONDS 주기로 모아서 1프레임으로 보냅니다.
+    - 전송이 REALTIME_SEND_TIMEOUT_SECONDS를 넘는 느린 연결은 끊어 다른 연결과 메모리를 보호합니다.
+    API 워커 프로세스마다 1개씩 동작하며, 리더 선출과 무관합니다.
+    """
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self._redis: Optional[aioredis.Redis] = None
+        self._pubsub = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._connections: Set[RealtimeConnection] = set()
+        self._subscribers: Dict[str, Set[RealtimeConnection]] = {}
+        self._channel_lock = asyncio.Lock()
+        self.stats = {"received": 0, "evicted": 0}
+
+    @property
+    def is_running(self) -> bool:
+        return self._reader_task is not None and not self._reader_task.done()
+
+    # --- 생명주기 ---
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+        self._redis = aioredis.Redis(
+            host=self.settings.REDIS_HOST, port=self.settings.REDIS_PORT, db=self.settings.REDIS_DB, decode_responses=True
+        )
+        self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        self._reader_task = asyncio.create_task(self._read_loop())
+        logger.info("📡 Realtime hub started.")
+
+    async def stop(self) -> None:
+        if self._reader_task:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        for connection in list(self._connections):
+            await self._close(connection, code=1001)
+        if self._pubsub:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._redis:
+            await self._redis.aclose()
+            self._redis = None
+        logger.info("Realtime hub stopped.")
+
+    # --- 연결/구독 관리 ---
+
+    def connect(self, websocket: WebSocket, *, user_id: int) -> Optional[RealtimeConnection]:
+        """연결을 등록하고 전송 루프를 시작합니다. 워커당 연결 상한을 넘으면 None."""
+        if len(self._connections) >= self.settings.REALTIME_MAX_CONNECTIONS:
+            return None
+        connection = RealtimeConnection(websocket, user_id=user_id)
+        connection._task = asyncio.create_task(self._send_loop(connection))
+        self._connections.add(connection)
+        return connection
+
+    async def disconnect(self, connection: RealtimeConnection) -> None:
+        connection.closed = True
+        self._connections.discard(connection)
+        if connection._task and connection._task is not asyncio.current_task():
+            connection._task.cancel()
+        await self.unsubscribe(connection, list(connection.devices))
+
+    async def subscribe(self, connection: RealtimeConnection, device_uuids: Iterable[str]) -> List[str]:
+        """구독을 추가하고 현재 캐시된 상태를 바로 한 번 보냅니다. 연결당 상한을 넘는 기기는 제외합니다."""
+        room = self.settings.REALTIME_MAX_DEVICES_PER_CONNECTION - len(connection.devices)
+        added = [device_uuid for device_uuid in dict.fromkeys(device_uuids) if device_uuid not in connection.devices][:max(room, 0)]
+        if not added:
+            return []
+
+        new_channels = []
+        for device_uuid in added:
+            connection.devices.add(device_uuid)
+            subscribers = self._subscribers.setdefault(device_uuid, set())
+            if not subscribers:
+                new_channels.append(f"{DEVICE_STATE_CHANNEL_PREFIX}{device_uuid}")
+            subscribers.add(connection)
+        if new_channels:
+            async with self._channel_lock:
+                await self._pubsub.subscribe(*new_channels)
+
+        # 초기 상태: request_state 응답과 같은 디코더로 device_state 해시들을 한 번의 파이프라인으로 읽습니다.
+        states = await asyncio.to_thread(device_state_repository.read_many, added)
+        for device_uuid, state in zip(added, states):
+            if state:
+                connection.offer(device_uuid, json.dumps(state))
+        return added
+
+    async def unsubscribe(self, connection: RealtimeConnection, device_uuids: Iterable[str]) -> None:
+        stale_channels = []
+        for device_uuid in device_uuids:
+            connection.devices.discard(device_uuid)
+            subscribers = self._subscribers.get(device_uuid)
+            if subscribers is None:
+                continue
+            subscribers.discard(connection)
+            if not subscribers:
+                del self._subscribers[device_uuid]
+                stale_channels.append(f"{DEVICE_STATE_CHANNEL_PREFIX}{device_uuid}")
+        if stale_channels and self._pubsub:
+            async with self._channel_lock:
+                await self._pubsub.unsubscribe(*stale_channels)
+
+    # --- 수신/전송 루프 ---
+
+    async def _read_loop(self) -> None:
+        prefix_length = len(DEVICE_STATE_CHANNEL_PREFIX)
+        while True:
+            try:
+                if not self._pubsub.subscribed:
+                    await asyncio.sleep(0.5)
+                    continue
+                message = await self._pubsub.get_message(timeout=1.0)
+                if not message or message["type"] != "message":
+                    continue
+                self.stats["received"] += 1
+                device_uuid = message["channel"][prefix_length:]
+                for connection in self._subscribers.get(device_uuid, ()):
+                    connection.offer(device_uuid, message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 연결이 끊기면 redis-py가 재접속 시 구독 채널을 복구합니다.
+                logger.error(f"❌ Realtime hub read error: {e}")
+                await asyncio.sleep(1)
+
+    async def _send_loop(self, connection: RealtimeConnection) -> None:
+        interval = self.settings.REALTIME_COALESCE_INTERVAL_SECONDS
+        timeout = self.settings.REALTIME_SEND_TIMEOUT_SECONDS
+        try:
+            while not connection.closed:
+                await connection._wakeup.wait()
+                await asyncio.sleep(interval)
+                connection._wakeup.clear()
+                for frame in connection._take_frames():
+                    await asyncio.wait_for(connection.websocket.send_text(frame), timeout=timeout)
+                    connection.sent += 1
+        except asyncio.CancelledError:
+            pass
+        except asyncio.TimeoutError:
+            self.stats["evicted"] += 1
+            logger.warning(f"🐢 Evicted slow realtime consumer (user {connection.user_id}, {len(connection.devices)} devices)")
+            await self._close(connection, code=1013)
+        except Exception:
+            # 이미 끊긴 연결. 정리는 엔드포인트의 disconnect가 합니다.
+            connection.closed = True
+
+    async def _close(self, connection: RealtimeConnection, *, code: int) -> None:
+        await self.disconnect(connection)
+        try:
+            await asyncio.wait_for(connection.websocket.close(code=code), timeout=1.0)
+        except Exception:
+            pass
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "running": self.is_running,
+            "connections": len(self._connections),
+            "devices": len(self._subscribers),
+            **self.stats,
+        }
+
+# API 워커 프로세스 공용 허브. Redis 연결은 lifespan의 start()에서 맺습니다.
+realtime_hub = RealtimeHub(get_settings())
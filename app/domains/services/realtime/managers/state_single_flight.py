@@ -0,0 +1,73 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Tuple
+
+class StateSingleFlight:
+    """
+    [Single-flight] 같은 키에 대한 동시 조회를 1회의 로드로 합칩니다.
+    - 로드 중인 키에 들어온 요청은 그 결과를 함께 기다립니다. (collapsed)
+    - 로드가 끝난 값은 window_seconds 동안 재사용합니다. (window_hits)
+    - invalidate(key)는 재사용 중인 값과 진행 중인 로드를 끊어, 이후 요청이 새 값을 읽게 합니다.
+    값은 직렬화된 문자열 그대로 보관하므로 응답자마다 다시 직렬화하지 않습니다.
+    """
+    _PRUNE_THRESHOLD = 10000
+
+    def __init__(self, load: Callable[[str], Awaitable[str]], *, window_seconds: float):
+        self._load = load
+        self.window_seconds = window_seconds
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._recent: Dict[str, Tuple[float, str]] = {}
+        self.stats = {"requests": 0, "loads": 0, "collapsed": 0, "window_hits": 0, "load_failures": 0}
+
+    async def get(self, key: str) -> str:
+        self.stats["requests"] += 1
+        recent = self._recent.get(key)
+        if recent and recent[0] > time.monotonic():
+            self.stats["window_hits"] += 1
+            return recent[1]
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats["collapsed"] += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._load(key)
+        except asyncio.CancelledError:
+            self._release(key, future)
+            future.cancel()
+            raise
+        except Exception as e:
+            self._release(key, future)
+            self.stats["load_failures"] += 1
+            future.set_exception(e)
+            future.exception()  # 기다리는 요청이 없어도 'never retrieved' 경고가 나지 않도록
+            raise
+
+        # 로드 도중 invalidate되지 않은 값만 재사용 창에 올립니다.
+        if self._release(key, future):
+            self._remember(key, value)
+        self.stats["loads"] += 1
+        future.set_result(value)
+        return value
+
+    def _release(self, key: str, future: asyncio.Future) -> bool:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+            return True
+        return False
+
+    def invalidate(self, key: str) -> None:
+        self._recent.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def _remember(self, key: str, value: str) -> None:
+        now = time.monotonic()
+        if len(self._recent) >= self._PRUNE_THRESHOLD:
+            self._recent = {k: v for k, v in self._recent.items() if v[0] > now}
+        self._recent[key] = (now + self.window_seconds, value)
+
+    def snapshot(self) -> Dict[str, int]:
+        return {**self.stats, "inflight": len(self._inflight), "cached": len(self._recent)}
@@ -0,0 +1,180 @@
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.redis_client import redis_client
+from app.domains.services.realtime.managers.device_state_codec import (
+    STATE_FORMAT_VERSION, VERSION_FIELD, METRIC_FIELD_PREFIX, PathPart,
+    encode_value, decode_value, encode_path, decode_path, metric_field, metric_id_of, split_payload, build_state,
+)
+
+logger = logging.getLogger(__name__)
+
+DEVICE_STATE_KEY_PREFIX = "device_state:"
+# 메트릭 경로 사전. device_state:* 스캔(헬스체커)에 걸리지 않도록 접두어를 분리합니다.
+METRIC_PATHS_KEY = "device_state_dict:paths"   # 경로(JSON) -> ID
+METRIC_IDS_KEY = "device_state_dict:ids"       # ID -> 경로(JSON)
+METRIC_SEQ_KEY = "device_state_dict:seq"
+
+# 여러 경로를 한 번에 등록합니다. 이미 있는 경로는 기존 ID를 돌려주므로 동시에 등록해도 ID가 갈리지 않습니다.
+_INTERN_SCRIPT = """
+local ids = {}
+for i, path in ipairs(ARGV) do
+    local id = redis.call('HGET', KEYS[1], path)
+    if not id then
+        id = redis.call('INCR', KEYS[3])
+        redis.call('HSET', KEYS[1], path, id)
+        redis.call('HSET', KEYS[2], id, path)
+    end
+    ids[i] = tonumber(id)
+end
+return ids
+"""
+
+class DeviceStateRepository:
+    """
+    [Device State Store] device_state:{uuid} 해시를 v1 압축 포맷(device_state_codec)으로 읽고 씁니다.
+    - 쓰기: 이 프로세스가 마지막으로 쓴 메트릭 값과 비교해 바뀐 필드만 HSET합니다. 헤더 필드는 헬스체커가
+      직접 고치므로(device_status=TIMEOUT) 비교 없이 매번 쓰고, 버전 필드(_v)도 매번 함께 씁니다.
+      해시가 밖에서 지워졌다면(Redis 재시작 등) HSET이 새로 만든 필드 수로 알아채고 다음 쓰기를 전체 쓰기로 되돌립니다.
+    - 읽기: 메트릭 ID를 경로로 되돌려 원래의 중첩 구조(dict)로 복원합니다.
+    메트릭 사전(경로 <-> ID)은 한 번 정해지면 바뀌지 않으므로 프로세스 로컬에 계속 캐시합니다.
+    redis_client는 바이트 응답(decode_responses=False) 클라이언트여야 합니다.
+    """
+    def __init__(self, redis_client, *, delta_cache_size: int = 0):
+        self.redis = redis_client
+        self._intern = None  # 첫 등록 시 생성 (모듈 싱글턴이 import 시점에 클라이언트를 만들지 않도록)
+        self._path_ids: Dict[Tuple[PathPart, ...], int] = {}
+        self._id_paths: Dict[int, Tuple[PathPart, ...]] = {}
+        # 기기 UUID -> {필드: 마지막으로 쓴 인코딩 값}. 상한을 넘으면 오래된 기기부터 버리고 다음에 전체를 다시 씁니다.
+        self._written: "OrderedDict[str, Dict[str, bytes]]" = OrderedDict()
+        # 기기 UUID -> 직전 stage_write의 HSET이 새로 만들어야 정상인 필드 수 (confirm_write에서 대조)
+        self._expected_new: Dict[str, int] = {}
+        self.delta_cache_size = delta_cache_size
+        self.stats = {"writes": 0, "fields_written": 0, "fields_skipped": 0, "resets": 0}
+
+    # --- 쓰기 ---
+
+    def stage_write(self, pipe, device_uuid: str, payload: Dict[str, Any]) -> int:
+        """
+        텔레메트리 1건의 변경분을 HSET 1개로 파이프라인에 싣습니다. (실행은 호출자가 다른 명령과 함께)
+        실행 후에는 그 HSET의 결과(새로 만든 필드 수)를 confirm_write에 넘겨야 합니다.
+        반환값은 이번에 쓰는 메트릭 필드 수입니다.
+        """
+        headers, leaves = split_payload(payload)
+        ids = self._ensure_ids(leaves.keys())
+        previous = self._written.get(device_uuid) if self.delta_cache_size > 0 else None
+
+        changed: Dict[str, bytes] = {}
+        for path, value in leaves.items():
+            field = metric_field(ids[path])
+            encoded = encode_value(value)
+            if previous is not None and previous.get(field) == encoded:
+                continue
+            changed[field] = encoded
+
+        # 버전 필드는 델타 쓰기에도 항상 포함합니다. (해시가 새로 만들어져도 포맷을 알 수 있도록)
+        mapping: Dict[str, Any] = {**headers, **changed, VERSION_FIELD: STATE_FORMAT_VERSION}
+        pipe.hset(f"{DEVICE_STATE_KEY_PREFIX}{device_uuid}", mapping=mapping)
+
+        if self.delta_cache_size > 0:
+            if previous is None:
+                previous = self._written[device_uuid] = {}
+                if len(self._written) > self.delta_cache_size:
+                    self._written.popitem(last=False)
+            else:
+                self._written.move_to_end(device_uuid)
+            self._expected_new[device_uuid] = sum(1 for field in mapping if field not in previous)
+            previous.update(changed)
+            # 헤더/버전 필드는 비교하지 않지만, 이미 쓴 필드인지는 알아야 하므로 이름만 기억합니다.
+            previous.update((field, b"") for field in headers if field not in previous)
+            previous.setdefault(VERSION_FIELD, b"")
+
+        self.stats["writes"] += 1
+        self.stats["fields_written"] += len(changed)
+        self.stats["fields_skipped"] += len(leaves) - len(changed)
+        return len(changed)
+
+    def confirm_write(self, device_uuid: str, created_fields: int) -> None:
+        """
+        stage_write가 실은 HSET의 결과(새로 만든 필드 수)를 받아, 예상보다 많으면 해시가 밖에서 지워졌다가
+        이번 델타 쓰기로 일부만 다시 만들어진 것이므로 다음 쓰기를 전체 쓰기로 되돌립니다.
+        """
+        expected = self._expected_new.pop(device_uuid, None)
+        if expected is not None and created_fields > expected:
+            logger.warning(f"⚠️ Device state hash for {device_uuid} was recreated; next write will be a full write")
+            self.stats["resets"] += 1
+            self.forget(device_uuid)
+
+    def forget(self, device_uuid: str) -> None:
+        """다음 쓰기를 전체 쓰기로 되돌립니다. (해시가 밖에서 지워졌을 때 등)"""
+        self._written.pop(device_uuid, None)
+
+    def _ensure_ids(self, paths: Iterable[Tuple[PathPart, ...]]) -> Dict[Tuple[PathPart, ...], int]:
+        missing = [path for path in paths if path not in self._path_ids]
+        if missing:
+            if self._intern is None:
+                self._intern = self.redis.register_script(_INTERN_SCRIPT)
+            ids = self._intern(
+                keys=[METRIC_PATHS_KEY, METRIC_IDS_KEY, METRIC_SEQ_KEY],
+                args=[encode_path(path) for path in missing]
+            )
+            for path, metric_id in zip(missing, ids):
+                self._remember(path, int(metric_id))
+            logger.info(f"📖 Registered {len(missing)} device state metric paths")
+        return self._path_ids
+
+    def _remember(self, path: Tuple[PathPart, ...], metric_id: int) -> None:
+        self._path_ids[path] = metric_id
+        self._id_paths[metric_id] = path
+
+    # --- 읽기 ---
+
+    def read(self, device_uuid: str) -> Optional[Dict[str, Any]]:
+        """저장된 상태를 복원합니다. 해시가 없으면 None."""
+        return self.decode(self.redis.hgetall(f"{DEVICE_STATE_KEY_PREFIX}{device_uuid}"))
+
+    def read_many(self, device_uuids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        pipe = self.redis.pipeline(transaction=False)
+        for device_uuid in device_uuids:
+            pipe.hgetall(f"{DEVICE_STATE_KEY_PREFIX}{device_uuid}")
+        return [self.decode(raw) for raw in pipe.execute()]
+
+    def decode(self, raw: Dict[bytes, bytes]) -> Optional[Dict[str, Any]]:
+        """HGETALL 결과(바이트)를 상태 dict로 복원합니다. 포맷 이전의 평문 해시는 헤더 필드로만 읽힙니다."""
+        if not raw:
+            return None
+        headers: Dict[str, str] = {}
+        packed: Dict[int, bytes] = {}
+        version = None
+        for key, value in raw.items():
+            field = key.decode() if isinstance(key, bytes) else key
+            if field == VERSION_FIELD:
+                version = int(value)
+            elif field.startswith(METRIC_FIELD_PREFIX):
+                packed[metric_id_of(field)] = value
+            else:
+                headers[field] = value.decode() if isinstance(value, bytes) else value
+
+        if packed and version != STATE_FORMAT_VERSION:
+            logger.warning(f"⚠️ Unsupported device state format version {version}; reading header fields only")
+            packed = {}
+        if any(metric_id not in self._id_paths for metric_id in packed):
+            self._load_dictionary()
+
+        leaves = {}
+        for metric_id, value in packed.items():
+            path = self._id_paths.get(metric_id)
+            if path is not None:
+                leaves[path] = decode_value(value)
+        return build_state(headers, leaves)
+
+    def _load_dictionary(self) -> None:
+        for metric_id, encoded in self.redis.hgetall(METRIC_IDS_KEY).items():
+            self._remember(decode_path(encoded.decode() if isinstance(encoded, bytes) else encoded), int(metric_id))
+
+    def snapshot(self) -> Dict[str, int]:
+        return {**self.stats, "cached_devices": len(self._written), "metric_paths": len(self._path_ids)}
+
+# 읽기 공용 인스턴스 (헬스체커, API 워커의 허브 등). 리스너는 쓰기용 델타 캐시를 가진 자체 인스턴스를 씁니다.
+device_state_repository = DeviceStateRepository(redis_client)
@@ -1,46 +1,62 @@
 import logging
+import asyncio
 import json
 import redis
 from gmqtt import Client as MQTTClient
 
+from app.core.config import get_settings
+from app.domains.services.realtime.managers.state_single_flight import StateSingleFlight
+from app.domains.services.realtime.repositories.device_state_repository import DeviceStateRepository
+
 logger = logging.getLogger(__name__)
 
+# 기기 상태 갱신이 전파되는 Redis pub/sub 채널. API 워커의 RealtimeHub가 구독자가 있는 기기만 구독합니다.
+DEVICE_STATE_CHANNEL_PREFIX = "realtime:device_state:"
+
 class RealtimeDeviceService:
     """
     [Domain Layer]
     실시간 데이터 처리 비즈니스 로직 (Redis 저장, 전파 등)
     """
     def __init__(self, redis_client: redis.Redis):
+        # 기기 상태를 바이너리 포맷으로 저장하므로 바이트 응답(decode_responses=False) 클라이언트를 받습니다.
         self.redis_client = redis_client
+        self.device_states = DeviceStateRepository(
+            redis_client, delta_cache_size=get_settings().REALTIME_STATE_DELTA_CACHE_DEVICES
+        )
+        # 같은 기기에 대한 동시 상태 요청(예: 교대 시간 대시보드 일제 접속)을 Redis 조회 1회로 합칩니다.
+        self.state_reads = StateSingleFlight(
+            self._load_state, window_seconds=get_settings().REALTIME_STATE_REQUEST_WINDOW_SECONDS
+        )
+
+    async def _load_state(self, device_uuid: str) -> str:
+        # 압축 포맷을 원래의 중첩 구조로 복원해 JSON으로 응답합니다. 데이터가 없으면 빈 dict.
+        state = await asyncio.to_thread(self.device_states.read, device_uuid)
+        return json.dumps(state or {})
 
     async def process_telemetry(self, device_uuid: str, payload: dict):
-        # 1. Redis 캐싱 (Hot Path)
-        redis_key = f"device_state:{device_uuid}"
-        
-        # decode_responses=True 덕분에 그냥 넣으면 됩니다.
-        self.redis_client.hset(redis_key, mapping=payload)
+        # 1. Redis 캐싱 (Hot Path): 직전 값과 달라진 메트릭 필드만 씁니다.
+        # 2. WebSocket 게이트웨이로 전파 (캐싱과 한 번의 왕복으로 처리)
+        pipe = self.redis_client.pipeline(transaction=False)
+        self.device_states.stage_write(pipe, device_uuid, payload)
+        pipe.publish(f"{DEVICE_STATE_CHANNEL_PREFIX}{device_uuid}", json.dumps(payload))
+        created_fields, _ = pipe.execute()
+        self.device_states.confirm_write(device_uuid, created_fields)
+        # 재사용 중인 상태 스냅샷은 버려 다음 요청이 새 값을 읽게 합니다.
+        self.state_reads.invalidate(device_uuid)
         logger.info(f"🔥 Cached telemetry for {device_uuid}")
-        
-        # 2. (추후 추가) WebSocket으로 프론트엔드에 전송
-        # await websocket_manager.broadcast(...)
 
     async def handle_state_request(self, client: MQTTClient, topic_parts: list):
-        # Redis 조회 및 응답 로직
+        # Redis 조회(single-flight) 및 응답 로직
         user_email, device_uuid = topic_parts[2], topic_parts[3]
-        redis_key = f"device_state:{device_uuid}"
-        
+
         try:
-            # [수정] decode_responses=True이므로, 리턴값은 이미 dict[str, str]입니다.
-            # 복잡한 decode() 로직 삭제!
-            data = self.redis_client.hgetall(redis_key)
-            
-            # 데이터가 없을 경우 빈 dict 처리
-            if not data:
-                data = {}
+            # 직렬화된 JSON을 모든 요청자가 그대로 재사용합니다.
+            data = await self.state_reads.get(device_uuid)
 
             resp_topic = f"client/state/{user_email}/{device_uuid}"
-            client.publish(resp_topic, json.dumps(data))
-            logger.info(f"📤 Sent state snapshot to {resp_topic}")
-            
+            client.publish(resp_topic, data)
+            logger.debug(f"📤 Sent state snapshot to {resp_topic}")
+
         except Exception as e:
-            logger.error(f"Failed to handle state request: {e}")
\ No newline at end of file
+            logger.error(f"Failed to handle state request: {e}")
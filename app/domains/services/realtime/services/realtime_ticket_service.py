@@ -0,0 +1,36 @@
+import json
+import logging
+import secrets
+from typing import Dict, Optional
+
+from app.core.config import get_settings
+from app.core.redis_client import redis_text_client
+
+logger = logging.getLogger(__name__)
+
+TICKET_KEY_PREFIX = "realtime:ws_ticket:"
+
+class RealtimeTicketService:
+    """
+    [Domain Layer] WebSocket 접속용 1회성 티켓.
+    브라우저 WebSocket은 DPoP 헤더를 붙일 수 없으므로, DPoP로 인증된 HTTP 요청에서 짧게 유효한 티켓을 발급하고
+    WebSocket 핸드셰이크에서 한 번만 사용(조회와 동시에 삭제)합니다.
+    """
+    def issue(self, *, user_id: int, email: str) -> str:
+        ticket = secrets.token_urlsafe(32)
+        redis_text_client.set(
+            f"{TICKET_KEY_PREFIX}{ticket}",
+            json.dumps({"user_id": user_id, "email": email}),
+            ex=get_settings().REALTIME_WS_TICKET_TTL_SECONDS
+        )
+        return ticket
+
+    def redeem(self, ticket: str) -> Optional[Dict]:
+        """티켓을 소모하고 발급 대상 사용자 정보를 반환합니다. 없거나 만료/재사용이면 None."""
+        pipe = redis_text_client.pipeline()
+        pipe.get(f"{TICKET_KEY_PREFIX}{ticket}")
+        pipe.delete(f"{TICKET_KEY_PREFIX}{ticket}")
+        raw, _ = pipe.execute()
+        return json.loads(raw) if raw else None
+
+realtime_ticket_service = RealtimeTicketService()
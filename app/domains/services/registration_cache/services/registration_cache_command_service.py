@@ -1,7 +1,6 @@
-import redis
 import json
 
-from app.core.config import settings
+from app.core.redis_client import redis_client
 from ..schemas.registration_cache_command import CacheRegistrationData
 
 class RegistrationCacheCommandService:
@@ -9,9 +8,8 @@ class RegistrationCacheCommandService:
     가입 정보 임시 저장(Redis)에 대한 Command 작업을 담당합니다.
     """
     def __init__(self):
-        self.redis_client = redis.Redis(
-            host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=settings.REDIS_DB
-        )
+        # 공용 클라이언트의 지연 프록시입니다. (import 시점에는 연결하지 않음)
+        self.redis_client = redis_client
 
     def cache_registration_data(self, *, data: CacheRegistrationData, code: str, ttl_seconds: int):
         """
@@ -1,8 +1,7 @@
-import redis
 import json
 from typing import Optional
 
-from app.core.config import settings
+from app.core.redis_client import redis_text_client
 from ..schemas.registration_cache_query import RegistrationDataResponse
 
 class RegistrationCacheQueryService:
@@ -10,9 +9,7 @@ class RegistrationCacheQueryService:
     가입 정보 임시 저장(Redis)에 대한 Query 작업을 담당합니다.
     """
     def __init__(self):
-        self.redis_client = redis.Redis(
-            host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=settings.REDIS_DB, decode_responses=True
-        )
+        self.redis_client = redis_text_client
 
     def get_registration_data(self, *, code: str) -> Optional[RegistrationDataResponse]:
         """
@@ -0,0 +1,43 @@
+# --- Query-related CRUD ---
+# 이 파일은 데이터의 상태를 변경하지 않고 DB에서 스케줄을 조회하는 'Query' CRUD 클래스를 정의합니다.
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select
+from typing import List
+from datetime import datetime
+from uuid import UUID
+
+from app.models.relationships.schedule import Schedule
+from app.models.objects.device import Device
+
+class CRUDScheduleQuery:
+    def get_active(self, db: Session) -> List[Schedule]:
+        """실행기 기동 시 1회: 활성화된 모든 스케줄을 적재합니다."""
+        return db.query(Schedule).filter(Schedule.is_active.is_(True)).all()
+
+    def get_changed_since(self, db: Session, *, since: datetime) -> List[Schedule]:
+        """
+        증분 리로드: `updated_at`이 기준 시각 이후인 행만 조회합니다.
+        비활성화된 스케줄도 포함해야 실행기에서 제거할 수 있으므로 is_active 필터를 걸지 않습니다.
+        """
+        return (
+            db.query(Schedule)
+            .filter(Schedule.updated_at >= since)
+            .order_by(Schedule.updated_at.asc())
+            .all()
+        )
+
+    def get_active_ids(self, db: Session) -> List[int]:
+        """하드 삭제된 스케줄을 걸러내기 위한 ID 전용 경량 조회입니다."""
+        return [row[0] for row in db.query(Schedule.id).filter(Schedule.is_active.is_(True)).all()]
+
+    def is_unit_device(self, db: Session, *, schedule_id: int, device_uuid: UUID) -> bool:
+        """기기가 스케줄과 같은 시스템 유닛에 속해 있는지 한 번의 조회로 확인합니다."""
+        stmt = (
+            select(Schedule.id)
+            .join(Device, Device.system_unit_id == Schedule.system_unit_id)
+            .where(Schedule.id == schedule_id, Device.current_uuid == device_uuid)
+        )
+        return db.execute(stmt).first() is not None
+
+schedule_crud_query = CRUDScheduleQuery()
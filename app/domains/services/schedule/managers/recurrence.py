@@ -0,0 +1,170 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Set
+from zoneinfo import ZoneInfo
+
+# recurrence_pattern {"type": ..., "value": N} 의 단위 → 초
+_INTERVAL_UNITS = {
+    "seconds": 1,
+    "minutes": 60,
+    "hours": 3600,
+    "days": 86400,
+}
+
+class CronExpression:
+    """
+    표준 5필드 cron 표현식(분 시 일 월 요일)의 경량 파서입니다.
+    `*`, `*/n`, `a-b`, `a-b/n`, `a,b,c` 문법을 지원하며, 요일은 0(또는 7)=일요일입니다.
+    일/요일이 모두 제한된 경우 cron 관례대로 둘 중 하나만 만족해도 발화합니다.
+    """
+    _FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: '{expression}'")
+        self.expression = expression
+        parsed = [self._parse_field(f, lo, hi) for f, (lo, hi) in zip(fields, self._FIELD_RANGES)]
+        self.minutes, self.hours, self.days, self.months, dows = parsed
+        self.dows = {0 if d == 7 else d for d in dows}
+        self._dom_restricted = fields[2] != "*"
+        self._dow_restricted = fields[4] != "*"
+
+    @staticmethod
+    def _parse_field(field: str, lo: int, hi: int) -> Set[int]:
+        values: Set[int] = set()
+        for part in field.split(","):
+            step = 1
+            if "/" in part:
+                part, step_str = part.split("/", 1)
+                step = int(step_str)
+                if step <= 0:
+                    raise ValueError(f"Invalid cron step: '{field}'")
+            if part == "*":
+                start, end = lo, hi
+            elif "-" in part:
+                start_str, end_str = part.split("-", 1)
+                start, end = int(start_str), int(end_str)
+            else:
+                start = int(part)
+                end = hi if step > 1 else start
+            if start < lo or end > hi or start > end:
+                raise ValueError(f"Cron field out of range: '{field}'")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, dt: datetime) -> bool:
+        dom_ok = dt.day in self.days
+        # Python weekday(): 월=0 ... 일=6 → cron 요일: 일=0 ... 토=6
+        dow_ok = ((dt.weekday() + 1) % 7) in self.dows
+        if self._dom_restricted and self._dow_restricted:
+            return dom_ok or dow_ok
+        return dom_ok and dow_ok
+
+    def next_after(self, after: datetime) -> Optional[datetime]:
+        """`after` 이후(초과) 첫 발화 시각을 `after`와 같은 타임존으로 반환합니다."""
+        dt = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # 최대 5년 탐색: 2/30 같은 불가능한 조합에서 무한 루프를 방지합니다.
+        limit = dt + timedelta(days=366 * 5)
+        while dt <= limit:
+            if dt.month not in self.months:
+                year, month = (dt.year + 1, 1) if dt.month == 12 else (dt.year, dt.month + 1)
+                dt = dt.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(dt):
+                dt = (dt + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if dt.hour not in self.hours:
+                dt = (dt + timedelta(hours=1)).replace(minute=0)
+                continue
+            if dt.minute not in self.minutes:
+                dt += timedelta(minutes=1)
+                continue
+            return dt
+        return None
+
+def interval_seconds(pattern: Optional[dict]) -> Optional[float]:
+    """INTERVAL 패턴({"type": "seconds", "value": 300})을 초 단위로 변환합니다."""
+    if not pattern or "value" not in pattern:
+        return None
+    unit = _INTERVAL_UNITS.get(str(pattern.get("type", "seconds")).lower())
+    if unit is None:
+        raise ValueError(f"Unsupported interval type: {pattern.get('type')}")
+    seconds = float(pattern["value"]) * unit
+    if seconds <= 0:
+        raise ValueError("Interval must be positive.")
+    return seconds
+
+def next_fire_time(
+    *,
+    execution_mode: str,
+    start_time: datetime,
+    end_time: Optional[datetime],
+    recurrence_pattern: Optional[dict],
+    after: datetime,
+    fired_cycles: int = 0,
+    default_timezone: str = "UTC",
+) -> Optional[datetime]:
+    """
+    [Lazy Expansion] 반복 규칙을 펼치지 않고 `after` 이후의 '다음 한 번'만 계산합니다.
+    더 이상 발화할 차례가 없으면 None을 반환합니다.
+
+    - ONCE / CONTINUOUS: start_time 1회 (아직 지나지 않았을 때만)
+    - INTERVAL: start_time + k * interval 중 `after` 이후 첫 시각 (산술 계산, 루프 없음)
+    - CRON: start_time 이후의 cron 발화 시각 (pattern["timezone"] 기준, 없으면 default_timezone)
+    - pattern["max_cycles"]: 발화 횟수 상한
+    """
+    mode = str(execution_mode).upper()
+    pattern = recurrence_pattern or {}
+    max_cycles = pattern.get("max_cycles")
+    if max_cycles is not None and fired_cycles >= int(max_cycles):
+        return None
+
+    candidate: Optional[datetime]
+    if mode in ("ONCE", "CONTINUOUS"):
+        candidate = start_time if fired_cycles == 0 and start_time > after else None
+
+    elif mode == "INTERVAL":
+        step = interval_seconds(pattern)
+        if step is None:
+            return None
+        if after < start_time:
+            candidate = start_time
+        else:
+            elapsed_cycles = int((after - start_time).total_seconds() // step) + 1
+            if max_cycles is not None and elapsed_cycles >= int(max_cycles):
+                return None
+            candidate = start_time + timedelta(seconds=elapsed_cycles * step)
+
+    elif mode == "CRON":
+        expression = pattern.get("expression")
+        if not expression:
+            return None
+        tz = ZoneInfo(pattern.get("timezone") or default_timezone)
+        base = max(after, start_time - timedelta(microseconds=1)).astimezone(tz)
+        local_next = CronExpression(expression).next_after(base)
+        candidate = local_next.astimezone(timezone.utc) if local_next else None
+
+    else:
+        raise ValueError(f"Unsupported execution mode: {execution_mode}")
+
+    if candidate is None or (end_time is not None and candidate > end_time):
+        return None
+    return candidate
+
+def validate_pattern(execution_mode: str, recurrence_pattern: Optional[dict]) -> List[str]:
+    """실행기 적재 전 반복 패턴의 형식 오류를 수집합니다. (빈 리스트면 정상)"""
+    errors: List[str] = []
+    mode = str(execution_mode).upper()
+    try:
+        if mode == "INTERVAL" and interval_seconds(recurrence_pattern) is None:
+            errors.append("INTERVAL schedule requires {'type', 'value'} pattern.")
+        if mode == "CRON":
+            expression = (recurrence_pattern or {}).get("expression")
+            if not expression:
+                errors.append("CRON schedule requires {'expression'} pattern.")
+            else:
+                CronExpression(expression)
+                ZoneInfo((recurrence_pattern or {}).get("timezone") or "UTC")
+    except Exception as e:
+        errors.append(str(e))
+    return errors
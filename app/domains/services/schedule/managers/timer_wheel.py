@@ -0,0 +1,134 @@
+import heapq
+import math
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+class _TimerEntry:
+    __slots__ = ("key", "expiry_tick", "fire_at", "payload", "cancelled")
+
+    def __init__(self, key: Hashable, expiry_tick: int, fire_at: float, payload: Any):
+        self.key = key
+        self.expiry_tick = expiry_tick
+        self.fire_at = fire_at
+        self.payload = payload
+        self.cancelled = False
+
+    def __lt__(self, other: "_TimerEntry") -> bool:
+        return self.expiry_tick < other.expiry_tick
+
+class HierarchicalTimerWheel:
+    """
+    계층형 타이머 휠(Hierarchical Timing Wheel):
+    수천 개의 타이머를 O(1)로 등록/취소하고, 틱마다 해당 슬롯만 확인하여 만기 항목을 꺼냅니다.
+
+    - level 0: 1틱 단위 슬롯 `slots_per_level`개
+    - level n: `slots_per_level ** n` 틱 단위 슬롯. 상위 레벨 슬롯은 하위 레벨로 내려오며(cascade) 정밀도를 회복합니다.
+    - 휠 범위를 넘는 먼 미래의 항목은 overflow 힙에 두었다가 범위 안으로 들어올 때 재삽입합니다.
+
+    키(key)당 타이머는 하나만 유지되며, 같은 키로 다시 등록하면 이전 항목은 지연 취소(lazy cancel)됩니다.
+    스레드 안전하지 않으므로 하나의 이벤트 루프에서만 조작해야 합니다.
+    """
+    def __init__(self, *, start_time: float, tick_seconds: float = 1.0, slots_per_level: int = 64, levels: int = 4):
+        if tick_seconds <= 0:
+            raise ValueError("tick_seconds must be positive.")
+        self.tick_seconds = tick_seconds
+        self.slots_per_level = slots_per_level
+        self.levels = levels
+        self._origin = start_time
+        self._current_tick = 0
+        self._span = slots_per_level ** levels
+        self._wheels: List[List[List[_TimerEntry]]] = [
+            [[] for _ in range(slots_per_level)] for _ in range(levels)
+        ]
+        self._overflow: List[_TimerEntry] = []
+        self._entries: Dict[Hashable, _TimerEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def _to_tick(self, ts: float) -> int:
+        # 만기 시각을 넘긴 뒤에 발화하도록 올림 처리합니다.
+        return max(0, math.ceil((ts - self._origin) / self.tick_seconds))
+
+    def schedule(self, key: Hashable, fire_at: float, payload: Any = None) -> None:
+        """`fire_at`(epoch seconds)에 만기되는 타이머를 등록합니다. 기존 키는 교체됩니다."""
+        self.cancel(key)
+        entry = _TimerEntry(key, self._to_tick(fire_at), fire_at, payload)
+        self._entries[key] = entry
+        self._place(entry)
+
+    def cancel(self, key: Hashable) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        entry.cancelled = True
+        return True
+
+    def get_fire_at(self, key: Hashable) -> Optional[float]:
+        entry = self._entries.get(key)
+        return entry.fire_at if entry else None
+
+    def _place(self, entry: _TimerEntry) -> None:
+        delta = entry.expiry_tick - self._current_tick
+        if delta <= 0:
+            # 이미 지난 타이머는 다음 advance에서 즉시 꺼내지도록 현재 level 0 슬롯에 둡니다.
+            self._wheels[0][self._current_tick % self.slots_per_level].append(entry)
+            return
+        if delta >= self._span:
+            heapq.heappush(self._overflow, entry)
+            return
+        for level in range(self.levels):
+            if delta < self.slots_per_level ** (level + 1):
+                unit = self.slots_per_level ** level
+                slot = (entry.expiry_tick // unit) % self.slots_per_level
+                self._wheels[level][slot].append(entry)
+                return
+
+    def _cascade(self) -> None:
+        """상위 레벨의 현재 슬롯을 비우고 항목들을 다시 배치해 하위 레벨로 내립니다."""
+        for level in range(1, self.levels):
+            unit = self.slots_per_level ** level
+            if self._current_tick % unit != 0:
+                break
+            slot = (self._current_tick // unit) % self.slots_per_level
+            bucket, self._wheels[level][slot] = self._wheels[level][slot], []
+            for entry in bucket:
+                if not entry.cancelled:
+                    self._place(entry)
+
+        while self._overflow and self._overflow[0].expiry_tick - self._current_tick < self._span:
+            entry = heapq.heappop(self._overflow)
+            if not entry.cancelled:
+                self._place(entry)
+
+    def advance(self, now: float) -> List[Tuple[Hashable, float, Any]]:
+        """
+        현재 시각까지 휠을 돌리고 만기된 `(key, fire_at, payload)` 목록을 만기 순으로 반환합니다.
+        루프가 지연되어 여러 틱을 건너뛴 경우에도 건너뛴 틱의 항목을 모두 꺼냅니다.
+        """
+        target_tick = int((now - self._origin) // self.tick_seconds)
+        expired: List[_TimerEntry] = []
+
+        while True:
+            slot = self._current_tick % self.slots_per_level
+            bucket, self._wheels[0][slot] = self._wheels[0][slot], []
+            for entry in bucket:
+                if entry.cancelled:
+                    continue
+                if entry.expiry_tick <= self._current_tick:
+                    expired.append(entry)
+                else:
+                    self._place(entry)
+
+            if self._current_tick >= target_tick:
+                break
+            self._current_tick += 1
+            self._cascade()
+
+        for entry in expired:
+            if self._entries.get(entry.key) is entry:
+                del self._entries[entry.key]
+        expired.sort(key=lambda e: e.fire_at)
+        return [(e.key, e.fire_at, e.payload) for e in expired]
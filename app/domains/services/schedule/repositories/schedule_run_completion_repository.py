@@ -0,0 +1,38 @@
+import json
+import logging
+from typing import List
+
+from app.core.redis_client import redis_client
+from ..schemas.schedule_run import ScheduleRunCompletion
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_RUN_COMPLETION_KEY = "schedule_run_completions"
+# 실행기가 멈춰 있는 동안 무한히 쌓이지 않도록 두는 상한 (넘치면 오래된 보고부터 버려지고, 해당 실행은 타임아웃으로 정리)
+SCHEDULE_RUN_COMPLETION_MAX_LENGTH = 10000
+
+class ScheduleRunCompletionRepository:
+    """
+    [Cross-Process Relay] 기기의 실행 완료 보고는 리스너 프로세스가 받고, 진행 중 실행은 리더 워커의
+    스케줄 실행기가 들고 있으므로 Redis 리스트로 넘깁니다. (LPUSH로 넣고 RPOP으로 꺼내는 FIFO)
+    """
+    def __init__(self, redis_client):
+        self.redis = redis_client
+
+    def push(self, completion: ScheduleRunCompletion) -> None:
+        pipe = self.redis.pipeline()
+        pipe.lpush(SCHEDULE_RUN_COMPLETION_KEY, completion.model_dump_json())
+        pipe.ltrim(SCHEDULE_RUN_COMPLETION_KEY, 0, SCHEDULE_RUN_COMPLETION_MAX_LENGTH - 1)
+        pipe.execute()
+
+    def pop_many(self, *, limit: int) -> List[ScheduleRunCompletion]:
+        raw = self.redis.rpop(SCHEDULE_RUN_COMPLETION_KEY, limit) or []
+        completions = []
+        for item in raw:
+            try:
+                completions.append(ScheduleRunCompletion(**json.loads(item)))
+            except (ValueError, TypeError) as e:
+                logger.warning(f"⚠️ Dropped malformed schedule run completion: {e}")
+        return completions
+
+schedule_run_completion_repository = ScheduleRunCompletionRepository(redis_client)
@@ -0,0 +1,32 @@
+import enum
+from typing import Optional, Any
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+class ScheduleRuntimeRead(BaseModel):
+    """
+    스케줄 실행기(Executor)가 메모리에 적재하는 실행 전용 스냅샷입니다.
+    ORM 객체를 세션 밖으로 들고 다니지 않도록, 실행 판단에 필요한 필드만 복사합니다.
+    """
+    id: int
+    system_unit_id: int
+    name: str
+    priority: int = Field(10, description="0: 최상위/긴급, 99: 최하위")
+    execution_mode: str
+    concurrency_policy: str
+    timeout_seconds: Optional[int] = None
+    start_time: datetime
+    end_time: Optional[datetime] = None
+    recurrence_pattern: Optional[dict] = None
+    action_details: Any
+    logic_version: str = "1.0.0"
+    is_active: bool = True
+    updated_at: datetime
+
+    @field_validator("execution_mode", "concurrency_policy", mode="before")
+    @classmethod
+    def _enum_to_value(cls, v):
+        # Schedule 모델과 base_model의 Enum 값(대/소문자)이 달라 대문자 문자열로 통일합니다.
+        return (v.value if isinstance(v, enum.Enum) else str(v)).upper()
+
+    model_config = ConfigDict(from_attributes=True)
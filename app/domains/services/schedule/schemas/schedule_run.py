@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+class ScheduleRunCompletion(BaseModel):
+    """기기가 SCHEDULE_RUN 명령의 실행 결과를 보고한 1건 (리스너 -> 스케줄 실행기)"""
+    schedule_id: int
+    run_id: str
+    status: str
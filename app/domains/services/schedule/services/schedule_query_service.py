@@ -0,0 +1,28 @@
+# --- Query-related Service ---
+# 이 파일은 데이터의 상태를 변경하지 않는 'Query' 성격의 스케줄 조회 로직을 담당합니다.
+
+from sqlalchemy.orm import Session
+from typing import List, Set
+from datetime import datetime
+from uuid import UUID
+
+from ..crud.schedule_query_crud import schedule_crud_query
+from ..schemas.schedule_query import ScheduleRuntimeRead
+
+class ScheduleQueryService:
+    def get_active_schedules(self, db: Session) -> List[ScheduleRuntimeRead]:
+        """활성 스케줄 전체를 실행 전용 스냅샷으로 변환해 반환합니다."""
+        return [ScheduleRuntimeRead.model_validate(s) for s in schedule_crud_query.get_active(db)]
+
+    def get_changed_schedules(self, db: Session, *, since: datetime) -> List[ScheduleRuntimeRead]:
+        """기준 시각 이후 변경된 스케줄(비활성화 포함)을 반환합니다."""
+        return [ScheduleRuntimeRead.model_validate(s) for s in schedule_crud_query.get_changed_since(db, since=since)]
+
+    def get_active_schedule_ids(self, db: Session) -> Set[int]:
+        return set(schedule_crud_query.get_active_ids(db))
+
+    def is_schedule_device(self, db: Session, *, schedule_id: int, device_uuid: UUID) -> bool:
+        """완료를 보고한 기기가 그 스케줄의 유닛 소속인지 확인합니다."""
+        return schedule_crud_query.is_unit_device(db, schedule_id=schedule_id, device_uuid=device_uuid)
+
+schedule_query_service = ScheduleQueryService()
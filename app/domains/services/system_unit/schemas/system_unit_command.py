@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from app.models.objects.system_unit import UnitStatus
 
 class SystemUnitUpdate(BaseModel):
@@ -20,4 +20,11 @@ class DeviceBindingRequest(BaseModel):
     """
     unit_id: int = Field(..., description="결합할 대상 시스템 유닛 ID")
     device_id: int = Field(..., description="결합할 대상 기기 ID")
-    role: str = Field(..., description="기기의 역할 (예: LEADER, FOLLOWER)")
\ No newline at end of file
+    role: str = Field(..., description="기기의 역할 (예: LEADER, FOLLOWER)")
+
+class BlueprintRolloutRequest(BaseModel):
+    """
+    [Request Schema] 설계도 배선 레시피를 여러 기기에 일괄 재배포할 때 쓰는 바디 데이터
+    """
+    blueprint_id: int = Field(..., description="배포할 하드웨어 설계도 ID")
+    device_ids: Optional[List[int]] = Field(None, description="대상 기기 ID 목록 (비우면 해당 설계도의 모든 활성 기기)")
@@ -0,0 +1,74 @@
+# --- Archive CRUD ---
+# 이 파일은 콜드 스토리지 아카이브 대상 파티션(테이블)의 조회와 행 스트리밍을 담당합니다.
+# 테이블 이름은 파티션 카탈로그에서 읽은 값만 사용하며, 사용자 입력이 SQL에 들어가지 않습니다.
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from typing import Any, Iterator, List, Optional, Tuple
+from datetime import datetime
+
+from ..managers.partition_calendar import PARENT_TABLE
+
+# 아카이브 파일의 열 순서 (EXPORT_COLUMNS / METADATA_COLUMNS와 일치)
+_DATA_COLUMNS = (
+    "id, captured_at, device_id, system_unit_id, snapshot_id, component_name, metric_name, "
+    "unit, avg_value, min_value, max_value, std_dev, slope, sample_count, extra_stats"
+)
+_METADATA_COLUMNS = "m.telemetry_data_id, m.meta_key, m.meta_value, m.meta_value_type::text, m.description, m.created_at"
+
+class CRUDTelemetryArchive:
+    def list_detached_partitions(self, db: Session) -> List[Tuple[str, Optional[datetime], Optional[datetime]]]:
+        """
+        보존 정책(detach 모드)으로 부모에서 분리된 파티션 테이블과 실제 데이터 구간.
+        분리된 테이블은 범위 경계를 잃으므로 min/max(captured_at)로 구간을 대신합니다. (빈 테이블은 None)
+        """
+        names = db.execute(text(f"""
+            SELECT c.relname FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = current_schema()
+              AND c.relkind = 'r' AND NOT c.relispartition
+              AND c.relname LIKE '{PARENT_TABLE}\\_p%'
+            ORDER BY c.relname
+        """)).scalars().all()
+        result = []
+        for name in names:
+            start, end = db.execute(text(f'SELECT min(captured_at), max(captured_at) FROM "{name}"')).one()
+            result.append((name, start, end))
+        return result
+
+    def lock_table(self, db: Session, *, table_name: str) -> None:
+        """
+        아카이브가 끝날(트랜잭션 커밋) 때까지 이 테이블로의 쓰기를 막습니다. (읽기는 허용)
+        다른 파티션으로 가는 수신 INSERT는 영향받지 않으며, 대기 상한은 try_lock의 lock_timeout을 따릅니다.
+        """
+        db.execute(text(f'LOCK TABLE "{table_name}" IN SHARE MODE'))
+
+    def table_exists(self, db: Session, *, table_name: str) -> bool:
+        return db.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": f'"{table_name}"'}).scalar()
+
+    def count_rows(self, db: Session, *, table_name: str) -> int:
+        return db.execute(text(f'SELECT count(*) FROM "{table_name}"')).scalar()
+
+    def stream_rows(self, db: Session, *, table_name: str, fetch_size: int) -> Iterator[Tuple[Any, ...]]:
+        """파티션(테이블) 전체를 (captured_at, id) 순으로 서버 사이드 커서를 통해 흘려보냅니다."""
+        result = db.execute(
+            text(f'SELECT {_DATA_COLUMNS} FROM "{table_name}" ORDER BY captured_at, id'),
+            execution_options={"stream_results": True, "yield_per": fetch_size},
+        )
+        for row in result:
+            yield tuple(row)
+
+    def stream_metadata_rows(self, db: Session, *, table_name: str, fetch_size: int) -> Iterator[Tuple[Any, ...]]:
+        """파티션 행에 딸린 telemetry_metadata를 telemetry_data_id 순으로 흘려보냅니다."""
+        result = db.execute(
+            text(f"""
+                SELECT {_METADATA_COLUMNS} FROM telemetry_metadata m
+                JOIN "{table_name}" t ON t.id = m.telemetry_data_id
+                ORDER BY m.telemetry_data_id, m.meta_key
+            """),
+            execution_options={"stream_results": True, "yield_per": fetch_size},
+        )
+        for row in result:
+            yield tuple(row)
+
+telemetry_archive_crud = CRUDTelemetryArchive()
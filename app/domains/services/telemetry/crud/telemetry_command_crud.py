@@ -1,6 +1,7 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert as pg_insert
-from typing import List, Dict
+from typing import Any, List, Dict
 from app.models.events_logs.telemetry_data import TelemetryData
 from app.models.events_logs.telemetry_metadata import TelemetryMetadata
 from ..schemas.telemetry_command import TelemetryCommandDataCreate
@@ -33,11 +34,22 @@ class CRUDTelemetryCommand:
 
         return db_telemetry_list
     
-    def bulk_upsert(self, db: Session, *, obj_in_list: List[Dict]) -> int:
-        """[Ares Aegis] DB 레벨 고속 벌크 업서트"""
+    def bulk_upsert(self, db: Session, *, obj_in_list: List[Dict]) -> List[Any]:
+        """
+        [Ares Aegis] DB 레벨 고속 벌크 업서트
+        실제로 삽입된 행만 RETURNING으로 돌려받아, 중복으로 무시된 행이 롤업/최신값에 다시 반영되지 않게 합니다.
+        """
         if not obj_in_list:
-            return 0
+            return []
+        return db.execute(self._bulk_upsert_stmt(obj_in_list)).all()
 
+    async def bulk_upsert_async(self, db: AsyncSession, *, obj_in_list: List[Dict]) -> List[Any]:
+        """[Async] bulk_upsert의 AsyncSession 버전입니다."""
+        if not obj_in_list:
+            return []
+        return (await db.execute(self._bulk_upsert_stmt(obj_in_list))).all()
+
+    def _bulk_upsert_stmt(self, obj_in_list: List[Dict]):
         stmt = pg_insert(TelemetryData).values(obj_in_list)
 
         # [핵심 수정] 어떤 부품(component_name)에서 온 데이터인지도 중복 체크 기준에 포함해야 합니다.
@@ -45,7 +57,11 @@ class CRUDTelemetryCommand:
             index_elements=['device_id', 'component_name', 'metric_name', 'captured_at']
         )
 
-        result = db.execute(stmt)
-        return result.rowcount
+        return stmt.returning(
+            TelemetryData.device_id, TelemetryData.system_unit_id, TelemetryData.component_name,
+            TelemetryData.metric_name, TelemetryData.captured_at, TelemetryData.snapshot_id, TelemetryData.unit,
+            TelemetryData.avg_value, TelemetryData.min_value, TelemetryData.max_value, TelemetryData.std_dev,
+            TelemetryData.slope, TelemetryData.sample_count,
+        )
 
 telemetry_crud_command = CRUDTelemetryCommand()
\ No newline at end of file
@@ -0,0 +1,42 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import Any, Dict, List, Sequence, Tuple
+
+from app.models.events_logs.device_metric_latest import DeviceMetricLatest
+
+_KEY = ["device_id", "component_name", "metric_name"]
+_VALUE_COLUMNS = [
+    "system_unit_id", "unit", "avg_value", "min_value", "max_value", "std_dev", "slope",
+    "sample_count", "captured_at", "snapshot_id",
+]
+
+class CRUDTelemetryLatestCommand:
+    def upsert_latest(self, db: Session, *, rows: Sequence[Any]) -> int:
+        """
+        원본 텔레메트리 행들로 최신값 테이블을 한 번의 INSERT ... ON CONFLICT로 갱신합니다.
+        - 한 문장 안에서 같은 키를 두 번 갱신할 수 없으므로, 배치 내에서 키별 최신 1행으로 먼저 줄입니다.
+        - WHERE excluded.captured_at > 현재값 조건으로, 늦게 도착한(재전송/배치) 과거 데이터는 최신값을 덮지 않습니다.
+        """
+        latest: Dict[Tuple, Any] = {}
+        for row in rows:
+            key = (row.device_id, row.component_name, row.metric_name)
+            current = latest.get(key)
+            if current is None or row.captured_at > current.captured_at:
+                latest[key] = row
+        if not latest:
+            return 0
+
+        values: List[Dict[str, Any]] = [
+            {c: getattr(latest[key], c) for c in _KEY + _VALUE_COLUMNS} for key in sorted(latest)
+        ]
+        stmt = pg_insert(DeviceMetricLatest).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=_KEY,
+            set_={c: getattr(stmt.excluded, c) for c in _VALUE_COLUMNS} | {"updated_at": func.now()},
+            where=stmt.excluded.captured_at > DeviceMetricLatest.captured_at,
+        )
+        db.execute(stmt)
+        return len(values)
+
+telemetry_latest_crud_command = CRUDTelemetryLatestCommand()
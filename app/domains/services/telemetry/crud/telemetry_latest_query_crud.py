@@ -0,0 +1,38 @@
+# --- Query-related CRUD ---
+# 이 파일은 기기별 측정 항목 최신값(device_metric_latest)을 조회하는 'Query' CRUD 클래스를 정의합니다.
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import datetime
+
+from app.models.events_logs.device_metric_latest import DeviceMetricLatest
+
+class CRUDTelemetryLatestQuery:
+    def get_latest(
+        self,
+        db: Session,
+        *,
+        system_unit_ids: Optional[List[int]] = None,
+        device_ids: Optional[List[int]] = None,
+        metric_names: Optional[List[str]] = None,
+        captured_from: Optional[datetime] = None,
+        captured_to: Optional[datetime] = None,
+    ) -> List[DeviceMetricLatest]:
+        stmt = select(DeviceMetricLatest)
+
+        if system_unit_ids:
+            stmt = stmt.where(DeviceMetricLatest.system_unit_id.in_(system_unit_ids))
+        if device_ids:
+            stmt = stmt.where(DeviceMetricLatest.device_id.in_(device_ids))
+        if metric_names:
+            stmt = stmt.where(DeviceMetricLatest.metric_name.in_(metric_names))
+        if captured_from:
+            stmt = stmt.where(DeviceMetricLatest.captured_at >= captured_from)
+        if captured_to:
+            stmt = stmt.where(DeviceMetricLatest.captured_at <= captured_to)
+
+        stmt = stmt.order_by(DeviceMetricLatest.device_id, DeviceMetricLatest.component_name, DeviceMetricLatest.metric_name)
+        return list(db.scalars(stmt).all())
+
+telemetry_latest_crud_query = CRUDTelemetryLatestQuery()
@@ -0,0 +1,95 @@
+# --- Partition Maintenance CRUD ---
+# 이 파일은 telemetry_data 파티션의 조회/생성/분리/삭제 DDL을 담당합니다.
+# 파티션 이름과 경계는 서비스가 계산한 값만 사용하며, 사용자 입력이 DDL에 들어가지 않습니다.
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from typing import List
+from datetime import datetime
+
+from ..managers.partition_calendar import PARENT_TABLE, DEFAULT_PARTITION, ExistingPartition, PartitionRange
+
+# 여러 워커가 동시에 유지보수를 수행하지 않도록 하는 advisory lock 키
+_MAINTENANCE_LOCK_KEY = 0x7E1E_0001
+
+class CRUDTelemetryPartition:
+    def try_lock(self, db: Session, *, lock_timeout_ms: int) -> bool:
+        """트랜잭션 범위 advisory lock. 다른 워커가 수행 중이면 False를 반환합니다."""
+        db.execute(text(f"SET LOCAL lock_timeout = {int(lock_timeout_ms)}"))
+        return bool(db.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _MAINTENANCE_LOCK_KEY}).scalar())
+
+    def list_partitions(self, db: Session) -> List[ExistingPartition]:
+        """부모에 붙어 있는 파티션과 실제 범위 경계 (경계 문자열을 같은 세션에서 timestamptz로 되돌려 해석)."""
+        rows = db.execute(text(f"""
+            SELECT c.relname,
+                   (regexp_match(pg_get_expr(c.relpartbound, c.oid), 'FROM \\(''([^'']+)''\\)'))[1]::timestamptz,
+                   (regexp_match(pg_get_expr(c.relpartbound, c.oid), 'TO \\(''([^'']+)''\\)'))[1]::timestamptz
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = '{PARENT_TABLE}'::regclass
+            ORDER BY 2 NULLS FIRST
+        """)).all()
+        return [ExistingPartition(name, start, end) for name, start, end in rows]
+
+    def default_has_rows(self, db: Session, *, start: datetime, end: datetime) -> bool:
+        return db.execute(
+            text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE captured_at >= :start AND captured_at < :end)"),
+            {"start": start, "end": end},
+        ).scalar()
+
+    def create_partition(self, db: Session, *, target: PartitionRange) -> None:
+        bounds = f"FOR VALUES FROM ('{target.start.isoformat()}') TO ('{target.end.isoformat()}')"
+        if not self.default_has_rows(db, start=target.start, end=target.end):
+            db.execute(text(f'CREATE TABLE "{target.name}" PARTITION OF {PARENT_TABLE} {bounds}'))
+            return
+        # DEFAULT 파티션에 이미 해당 구간 행(시계가 앞선 기기 등)이 있으면 PARTITION OF가 실패하므로,
+        # 독립 테이블로 만든 뒤 행을 옮기고 ATTACH 합니다. (인덱스는 ATTACH 시 부모 기준으로 생성됨)
+        db.execute(text(f'CREATE TABLE "{target.name}" (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'))
+        db.execute(
+            text(f"""
+                WITH moved AS (
+                    DELETE FROM {DEFAULT_PARTITION} WHERE captured_at >= :start AND captured_at < :end RETURNING *
+                )
+                INSERT INTO "{target.name}" SELECT * FROM moved
+            """),
+            {"start": target.start, "end": target.end},
+        )
+        db.execute(text(f'ALTER TABLE {PARENT_TABLE} ATTACH PARTITION "{target.name}" {bounds}'))
+
+    def delete_metadata_for(self, db: Session, *, partition_name: str) -> int:
+        """파티션 행에 딸린 telemetry_metadata를 삭제합니다. (DB 외래 키가 없으므로 직접 정리)"""
+        return db.execute(text(f"""
+            DELETE FROM telemetry_metadata m USING "{partition_name}" t WHERE m.telemetry_data_id = t.id
+        """)).rowcount
+
+    def detach_partition(self, db: Session, *, partition_name: str) -> None:
+        db.execute(text(f'ALTER TABLE {PARENT_TABLE} DETACH PARTITION "{partition_name}"'))
+
+    def drop_table(self, db: Session, *, table_name: str) -> None:
+        db.execute(text(f'DROP TABLE IF EXISTS "{table_name}"'))
+
+    def detach_default_before(self, db: Session, *, cutoff: datetime, table_name: str) -> int:
+        """
+        DEFAULT 파티션의 보존 기간 경과 행을 독립 테이블(table_name)로 옮깁니다. (detach 모드)
+        분리된 파티션과 같은 이름 규칙을 따르므로 아카이브 작업이 다른 분리 테이블처럼 파일로 옮긴 뒤 삭제합니다.
+        telemetry_metadata는 telemetry_data_id로만 연결되어 있으므로 그대로 두면 아카이브가 함께 가져갑니다.
+        """
+        params = {"cutoff": cutoff}
+        if not db.execute(text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE captured_at < :cutoff)"), params).scalar():
+            return 0
+        db.execute(text(f'CREATE TABLE IF NOT EXISTS "{table_name}" (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'))
+        return db.execute(text(f"""
+            WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE captured_at < :cutoff RETURNING *)
+            INSERT INTO "{table_name}" SELECT * FROM moved
+        """), params).rowcount
+
+    def delete_default_before(self, db: Session, *, cutoff: datetime) -> int:
+        """DEFAULT 파티션에 떨어진 보존 기간 경과 행(시계 오류로 과거 시각이 찍힌 행 등)을 행 단위로 삭제합니다."""
+        params = {"cutoff": cutoff}
+        db.execute(text(f"""
+            DELETE FROM telemetry_metadata m USING {DEFAULT_PARTITION} t
+            WHERE m.telemetry_data_id = t.id AND t.captured_at < :cutoff
+        """), params)
+        return db.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE captured_at < :cutoff"), params).rowcount
+
+telemetry_partition_crud = CRUDTelemetryPartition()
@@ -1,11 +1,33 @@
 # --- Query-related CRUD ---
 # 이 파일은 데이터의 상태를 변경하지 않고 DB에서 데이터를 조회하는 'Query' CRUD 클래스를 정의합니다.
 
-from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional
+from sqlalchemy import func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
+from typing import Any, Iterator, List, Optional, Tuple
 from datetime import datetime
 
 from app.models.events_logs.telemetry_data import TelemetryData as DBTelemetryData
+from ..schemas.telemetry_query import TelemetryExportFilter
+
+# 스트리밍 내보내기 열 순서 (인코더의 EXPORT_COLUMNS와 일치)
+_EXPORT_COLUMNS = (
+    DBTelemetryData.id,
+    DBTelemetryData.captured_at,
+    DBTelemetryData.device_id,
+    DBTelemetryData.system_unit_id,
+    DBTelemetryData.snapshot_id,
+    DBTelemetryData.component_name,
+    DBTelemetryData.metric_name,
+    DBTelemetryData.unit,
+    DBTelemetryData.avg_value,
+    DBTelemetryData.min_value,
+    DBTelemetryData.max_value,
+    DBTelemetryData.std_dev,
+    DBTelemetryData.slope,
+    DBTelemetryData.sample_count,
+    DBTelemetryData.extra_stats,
+)
 
 class CRUDTelemetryQuery:
     def get_multiple_telemetry_data(
@@ -21,8 +43,63 @@ class CRUDTelemetryQuery:
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> List[DBTelemetryData]:
-        query = db.query(DBTelemetryData).options(joinedload(DBTelemetryData.device))
+        query = self._filtered_query(
+            db.query(DBTelemetryData).options(joinedload(DBTelemetryData.device)),
+            device_ids=device_ids,
+            system_unit_ids=system_unit_ids,
+            snapshot_id=snapshot_id,
+            metric_names=metric_names,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        return query.order_by(DBTelemetryData.captured_at.desc()).offset(skip).limit(limit).all()
+
+    def count_telemetry_data(
+        self,
+        db: Session,
+        *,
+        device_ids: Optional[List[int]] = None,
+        system_unit_ids: Optional[List[int]] = None,
+        snapshot_id: Optional[str] = None,
+        metric_names: Optional[List[str]] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> int:
+        """get_multiple_telemetry_data와 같은 조건의 전체 행 수. (DB 페이지 이후 아카이브 구간의 offset 계산용)"""
+        query = self._filtered_query(
+            db.query(func.count(DBTelemetryData.id)),
+            device_ids=device_ids,
+            system_unit_ids=system_unit_ids,
+            snapshot_id=snapshot_id,
+            metric_names=metric_names,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        return query.scalar()
 
+    async def get_multiple_telemetry_data_async(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        **filters
+    ) -> List[DBTelemetryData]:
+        """[Async] get_multiple_telemetry_data의 AsyncSession 버전. (filters는 동일한 키워드)"""
+        # 응답 직렬화가 metadata_items를 읽으므로 미리 로드합니다. (AsyncSession에서는 lazy load가 불가)
+        stmt = self._filtered_query(
+            select(DBTelemetryData).options(joinedload(DBTelemetryData.device), selectinload(DBTelemetryData.metadata_items)),
+            **filters,
+        )
+        stmt = stmt.order_by(DBTelemetryData.captured_at.desc()).offset(skip).limit(limit)
+        return list((await db.execute(stmt)).scalars().all())
+
+    async def count_telemetry_data_async(self, db: AsyncSession, **filters) -> int:
+        stmt = self._filtered_query(select(func.count(DBTelemetryData.id)), **filters)
+        return (await db.execute(stmt)).scalar()
+
+    def _filtered_query(self, query, *, device_ids, system_unit_ids, snapshot_id, metric_names, start_time, end_time):
+        """Query와 Select 모두 .filter()를 지원하므로 동기/비동기 조회가 같은 조건 구성을 공유합니다."""
         if device_ids:
             query = query.filter(DBTelemetryData.device_id.in_(device_ids))
         if system_unit_ids: # [추가]
@@ -37,7 +114,121 @@ class CRUDTelemetryQuery:
             query = query.filter(DBTelemetryData.captured_at >= start_time)
         if end_time:
             query = query.filter(DBTelemetryData.captured_at <= end_time)
-        
-        return query.order_by(DBTelemetryData.captured_at.desc()).offset(skip).limit(limit).all()
+        return query
+
+    def get_raw_series(
+        self,
+        db: Session,
+        *,
+        start_time: datetime,
+        end_time: datetime,
+        device_ids: Optional[List[int]] = None,
+        system_unit_ids: Optional[List[int]] = None,
+        metric_names: Optional[List[str]] = None,
+        limit: int,
+    ) -> List[Any]:
+        """차트용 원본 시계열: 롤업과 같은 열 구성으로, ORM 객체/관계 로딩 없이 필요한 컬럼만 읽습니다."""
+        stmt = select(
+            DBTelemetryData.device_id,
+            DBTelemetryData.component_name,
+            DBTelemetryData.metric_name,
+            DBTelemetryData.captured_at.label("bucket_start"),
+            DBTelemetryData.sample_count,
+            DBTelemetryData.min_value,
+            DBTelemetryData.max_value,
+            DBTelemetryData.avg_value,
+            DBTelemetryData.std_dev,
+        ).where(DBTelemetryData.captured_at >= start_time, DBTelemetryData.captured_at < end_time)
+
+        if device_ids:
+            stmt = stmt.where(DBTelemetryData.device_id.in_(device_ids))
+        if system_unit_ids:
+            stmt = stmt.where(DBTelemetryData.system_unit_id.in_(system_unit_ids))
+        if metric_names:
+            stmt = stmt.where(DBTelemetryData.metric_name.in_(metric_names))
+
+        stmt = stmt.order_by(
+            DBTelemetryData.device_id, DBTelemetryData.component_name, DBTelemetryData.metric_name, DBTelemetryData.captured_at
+        ).limit(limit)
+        return db.execute(stmt).all()
+
+    def get_raw_bucket(
+        self,
+        db: Session,
+        *,
+        start_time: datetime,
+        end_time: datetime,
+        device_ids: Optional[List[int]] = None,
+        system_unit_ids: Optional[List[int]] = None,
+        metric_names: Optional[List[str]] = None,
+    ) -> List[Any]:
+        """
+        [start_time, end_time) 원본 행을 시리즈별 1개 점(bucket_start=start_time)으로 집계합니다.
+        롤업 버킷의 일부만 조회 구간에 걸칠 때, 그 부분 버킷을 구간 안의 행만으로 다시 계산하는 데 씁니다.
+        열 구성은 get_raw_series/롤업 조회와 같으며, avg/std는 표본 수 가중 합계·제곱합으로 병합합니다.
+        """
+        n = DBTelemetryData.sample_count
+        total = func.sum(n)
+        avg = func.sum(n * DBTelemetryData.avg_value) / total
+        sum_sq = func.sum(n * (DBTelemetryData.std_dev * DBTelemetryData.std_dev + DBTelemetryData.avg_value * DBTelemetryData.avg_value))
+        stmt = select(
+            DBTelemetryData.device_id,
+            DBTelemetryData.component_name,
+            DBTelemetryData.metric_name,
+            literal(start_time, DBTelemetryData.captured_at.type).label("bucket_start"),
+            total.label("sample_count"),
+            func.min(DBTelemetryData.min_value).label("min_value"),
+            func.max(DBTelemetryData.max_value).label("max_value"),
+            avg.label("avg_value"),
+            func.sqrt(func.greatest(sum_sq / total - avg * avg, 0.0)).label("std_dev"),
+        ).where(DBTelemetryData.captured_at >= start_time, DBTelemetryData.captured_at < end_time)
+
+        if device_ids:
+            stmt = stmt.where(DBTelemetryData.device_id.in_(device_ids))
+        if system_unit_ids:
+            stmt = stmt.where(DBTelemetryData.system_unit_id.in_(system_unit_ids))
+        if metric_names:
+            stmt = stmt.where(DBTelemetryData.metric_name.in_(metric_names))
+
+        stmt = stmt.group_by(
+            DBTelemetryData.device_id, DBTelemetryData.component_name, DBTelemetryData.metric_name
+        ).order_by(DBTelemetryData.device_id, DBTelemetryData.component_name, DBTelemetryData.metric_name)
+        return db.execute(stmt).all()
+
+    def stream_export_page(
+        self,
+        db: Session,
+        *,
+        filters: TelemetryExportFilter,
+        after: Optional[Tuple[datetime, int]],
+        limit: int,
+        fetch_size: int,
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        [Keyset] (captured_at, id) > after 인 행을 순서대로 최대 limit개 흘려보냅니다.
+        offset을 쓰지 않으므로 페이지 깊이와 무관하게 인덱스 탐색 1회로 시작 위치를 찾고,
+        서버 사이드 커서로 fetch_size씩 읽어 ORM 객체를 만들지 않습니다.
+        """
+        stmt = select(*_EXPORT_COLUMNS)
+
+        if filters.device_ids:
+            stmt = stmt.where(DBTelemetryData.device_id.in_(filters.device_ids))
+        if filters.system_unit_ids:
+            stmt = stmt.where(DBTelemetryData.system_unit_id.in_(filters.system_unit_ids))
+        if filters.snapshot_id:
+            stmt = stmt.where(DBTelemetryData.snapshot_id == filters.snapshot_id)
+        if filters.metric_names:
+            stmt = stmt.where(DBTelemetryData.metric_name.in_(filters.metric_names))
+        if filters.start_time:
+            stmt = stmt.where(DBTelemetryData.captured_at >= filters.start_time)
+        if filters.end_time:
+            stmt = stmt.where(DBTelemetryData.captured_at <= filters.end_time)
+        if after is not None:
+            stmt = stmt.where(tuple_(DBTelemetryData.captured_at, DBTelemetryData.id) > tuple_(*after))
+
+        stmt = stmt.order_by(DBTelemetryData.captured_at, DBTelemetryData.id).limit(limit)
+        result = db.execute(stmt, execution_options={"stream_results": True, "yield_per": fetch_size})
+        for row in result:
+            yield tuple(row)
 
 telemetry_crud_query = CRUDTelemetryQuery()
@@ -0,0 +1,74 @@
+from sqlalchemy import func, select, literal
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import Any, Dict, List
+from datetime import datetime
+
+from app.models.events_logs.telemetry_data import TelemetryData
+from ..managers.rollup_levels import RollupLevel
+
+_PK = ["device_id", "metric_name", "component_name", "bucket_start"]
+
+class CRUDTelemetryRollupCommand:
+    def upsert_deltas(self, db: Session, *, level: RollupLevel, buckets: List[Dict[str, Any]]) -> int:
+        """
+        버킷 델타를 한 번의 INSERT ... ON CONFLICT DO UPDATE로 누적 병합합니다.
+        (count/sum/sum_sq는 더하고, min/max는 LEAST/GREATEST로 갱신)
+        """
+        if not buckets:
+            return 0
+        model = level.model
+        stmt = pg_insert(model).values(buckets)
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=_PK,
+            set_={
+                "row_count": model.row_count + excluded.row_count,
+                "sample_count": model.sample_count + excluded.sample_count,
+                "min_value": func.least(model.min_value, excluded.min_value),
+                "max_value": func.greatest(model.max_value, excluded.max_value),
+                "sum_value": model.sum_value + excluded.sum_value,
+                "sum_sq_value": model.sum_sq_value + excluded.sum_sq_value,
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(stmt)
+        return len(buckets)
+
+    def rebuild_range(self, db: Session, *, level: RollupLevel, start: datetime, end: datetime) -> int:
+        """
+        [Backfill] 원본 telemetry_data에서 [start, end) 구간을 다시 집계하여 롤업을 덮어씁니다.
+        구간은 해당 레벨의 버킷 경계에 맞춰 호출해야 합니다.
+        """
+        model = level.model
+        n = func.greatest(TelemetryData.sample_count, 1)
+        bucket = func.date_trunc(level.trunc_unit, TelemetryData.captured_at, literal("UTC"))
+        source = (
+            select(
+                TelemetryData.device_id,
+                TelemetryData.metric_name,
+                TelemetryData.component_name,
+                bucket.label("bucket_start"),
+                func.min(TelemetryData.system_unit_id).label("system_unit_id"),
+                func.count().label("row_count"),
+                func.sum(n).label("sample_count"),
+                func.min(TelemetryData.min_value).label("min_value"),
+                func.max(TelemetryData.max_value).label("max_value"),
+                func.sum(n * TelemetryData.avg_value).label("sum_value"),
+                func.sum(n * (TelemetryData.std_dev * TelemetryData.std_dev + TelemetryData.avg_value * TelemetryData.avg_value)).label("sum_sq_value"),
+            )
+            .where(TelemetryData.captured_at >= start, TelemetryData.captured_at < end)
+            .group_by(TelemetryData.device_id, TelemetryData.metric_name, TelemetryData.component_name, bucket)
+        )
+        columns = [
+            "device_id", "metric_name", "component_name", "bucket_start", "system_unit_id", "row_count",
+            "sample_count", "min_value", "max_value", "sum_value", "sum_sq_value",
+        ]
+        stmt = pg_insert(model).from_select(columns, source)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=_PK,
+            set_={c: getattr(stmt.excluded, c) for c in columns if c not in _PK} | {"updated_at": func.now()},
+        )
+        return db.execute(stmt).rowcount
+
+telemetry_rollup_crud_command = CRUDTelemetryRollupCommand()
@@ -0,0 +1,53 @@
+# --- Query-related CRUD ---
+# 이 파일은 텔레메트리 롤업(1m/1h/1d) 테이블에서 차트용 시계열을 조회하는 'Query' CRUD 클래스를 정의합니다.
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from typing import Any, List, Optional
+from datetime import datetime
+
+from ..managers.rollup_levels import RollupLevel
+
+class CRUDTelemetryRollupQuery:
+    def get_series(
+        self,
+        db: Session,
+        *,
+        level: RollupLevel,
+        start_time: datetime,
+        end_time: datetime,
+        device_ids: Optional[List[int]] = None,
+        system_unit_ids: Optional[List[int]] = None,
+        metric_names: Optional[List[str]] = None,
+        limit: int,
+    ) -> List[Any]:
+        """
+        [start_time, end_time) 안에 시작하는 버킷을 읽습니다. 호출자는 구간을 버킷 경계에 맞춰 넘겨야 하며,
+        경계에 걸친 버킷은 구간 밖 행을 포함하므로 여기서 읽지 않습니다. (부분 버킷은 원본에서 따로 집계)
+        avg/std는 저장된 합계·제곱합으로부터 DB에서 계산하여, 버킷당 1행만 전송합니다.
+        """
+        model = level.model
+        avg = model.sum_value / model.sample_count
+        stmt = select(
+            model.device_id,
+            model.component_name,
+            model.metric_name,
+            model.bucket_start,
+            model.sample_count,
+            model.min_value,
+            model.max_value,
+            avg.label("avg_value"),
+            func.sqrt(func.greatest(model.sum_sq_value / model.sample_count - avg * avg, 0.0)).label("std_dev"),
+        ).where(model.bucket_start >= start_time, model.bucket_start < end_time)
+
+        if device_ids:
+            stmt = stmt.where(model.device_id.in_(device_ids))
+        if system_unit_ids:
+            stmt = stmt.where(model.system_unit_id.in_(system_unit_ids))
+        if metric_names:
+            stmt = stmt.where(model.metric_name.in_(metric_names))
+
+        stmt = stmt.order_by(model.device_id, model.component_name, model.metric_name, model.bucket_start).limit(limit)
+        return db.execute(stmt).all()
+
+telemetry_rollup_crud_query = CRUDTelemetryRollupQuery()
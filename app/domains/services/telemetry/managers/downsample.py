@@ -0,0 +1,74 @@
+from itertools import groupby
+from typing import Any, Callable, Dict, List, Sequence
+
+import numpy as np
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: 시각적 형태(피크/골)를 가장 잘 보존하는 threshold개의 점을 고릅니다.
+    첫 점과 마지막 점은 항상 포함되며, 반환값은 오름차순 인덱스입니다.
+    """
+    n = x.shape[0]
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    prev = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # 다음 버킷의 평균점을 세 번째 꼭짓점으로 사용합니다. (마지막 버킷은 마지막 점)
+        next_start, next_end = end, edges[i + 2] if i + 2 < len(edges) else n
+        if next_end <= next_start:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        bx, by = x[start:end], y[start:end]
+        areas = np.abs((x[prev] - avg_x) * (by - y[prev]) - (x[prev] - bx) * (avg_y - y[prev]))
+        prev = start + int(np.argmax(areas))
+        selected[i + 1] = prev
+    return selected
+
+def minmax_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Min/Max 버킷: threshold/2개의 구간마다 최소/최대 점을 남겨, 스파이크가 평균에 묻히지 않게 합니다.
+    반환값은 오름차순 인덱스입니다.
+    """
+    n = y.shape[0]
+    if threshold >= n or threshold < 2:
+        return np.arange(n)
+
+    edges = np.linspace(0, n, threshold // 2 + 1).astype(np.int64)
+    picked: List[int] = []
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end <= start:
+            continue
+        chunk = y[start:end]
+        picked.append(start + int(np.argmin(chunk)))
+        picked.append(start + int(np.argmax(chunk)))
+    return np.unique(np.asarray(picked, dtype=np.int64))
+
+DOWNSAMPLERS: Dict[str, Callable[[np.ndarray, np.ndarray, int], np.ndarray]] = {
+    "lttb": lttb_indices,
+    "minmax": minmax_indices,
+}
+
+def downsample_series(rows: Sequence[Any], *, method: str, points: int) -> List[Any]:
+    """
+    (device_id, component_name, metric_name) 순으로 정렬된 시계열 행을 시리즈별로 points개 이하로 줄입니다.
+    행 속성: device_id, component_name, metric_name, bucket_start, avg_value.
+    점을 새로 만들지 않고 원래 행을 선택하므로, 남은 점의 min/max/std 등은 그대로 유지됩니다.
+    """
+    select = DOWNSAMPLERS[method]
+    result: List[Any] = []
+    for _, group in groupby(rows, key=lambda r: (r.device_id, r.component_name, r.metric_name)):
+        series = list(group)
+        if len(series) <= points:
+            result.extend(series)
+            continue
+        x = np.fromiter((r.bucket_start.timestamp() for r in series), dtype=np.float64, count=len(series))
+        y = np.fromiter((r.avg_value for r in series), dtype=np.float64, count=len(series))
+        result.extend(series[i] for i in select(x, y, points))
+    return result
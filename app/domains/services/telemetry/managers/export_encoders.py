@@ -0,0 +1,103 @@
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+# CRUD의 내보내기 SELECT 열 순서와 일치해야 합니다.
+EXPORT_COLUMNS: Tuple[str, ...] = (
+    "id", "captured_at", "device_id", "system_unit_id", "snapshot_id", "component_name", "metric_name",
+    "unit", "avg_value", "min_value", "max_value", "std_dev", "slope", "sample_count", "extra_stats",
+)
+_CAPTURED_AT = EXPORT_COLUMNS.index("captured_at")
+_EXTRA_STATS = EXPORT_COLUMNS.index("extra_stats")
+
+MEDIA_TYPES: Dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+FILE_EXTENSIONS: Dict[str, str] = {"ndjson": "ndjson", "csv": "csv", "arrow": "arrows"}
+
+def _chunked(rows: Iterable[Tuple[Any, ...]], size: int) -> Iterator[List[Tuple[Any, ...]]]:
+    chunk: List[Tuple[Any, ...]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def encode_ndjson(rows: Iterable[Tuple[Any, ...]], *, batch_rows: int) -> Iterator[bytes]:
+    """행당 JSON 객체 1줄. batch_rows 단위로 묶어 쓰기 호출 수를 줄입니다."""
+    for chunk in _chunked(rows, batch_rows):
+        lines = []
+        for row in chunk:
+            record = dict(zip(EXPORT_COLUMNS, row))
+            record["captured_at"] = row[_CAPTURED_AT].isoformat()
+            lines.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+def encode_csv(rows: Iterable[Tuple[Any, ...]], *, batch_rows: int) -> Iterator[bytes]:
+    """헤더 1줄 + 행. extra_stats(JSONB)는 JSON 문자열로 한 칸에 씁니다."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for chunk in _chunked(rows, batch_rows):
+        for row in chunk:
+            values = list(row)
+            values[_CAPTURED_AT] = row[_CAPTURED_AT].isoformat()
+            if values[_EXTRA_STATS] is not None:
+                values[_EXTRA_STATS] = json.dumps(values[_EXTRA_STATS], ensure_ascii=False)
+            writer.writerow(values)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+def arrow_schema():
+    """EXPORT_COLUMNS의 Arrow 스키마. (extra_stats는 JSON 문자열)"""
+    import pyarrow as pa
+
+    return pa.schema([
+        ("id", pa.int64()),
+        ("captured_at", pa.timestamp("us", tz="UTC")),
+        ("device_id", pa.int64()),
+        ("system_unit_id", pa.int64()),
+        ("snapshot_id", pa.string()),
+        ("component_name", pa.string()),
+        ("metric_name", pa.string()),
+        ("unit", pa.string()),
+        ("avg_value", pa.float64()),
+        ("min_value", pa.float64()),
+        ("max_value", pa.float64()),
+        ("std_dev", pa.float64()),
+        ("slope", pa.float64()),
+        ("sample_count", pa.int32()),
+        ("extra_stats", pa.string()),
+    ])
+
+def encode_arrow(rows: Iterable[Tuple[Any, ...]], *, batch_rows: int) -> Iterator[bytes]:
+    """
+    Arrow IPC 스트림. batch_rows 단위 RecordBatch를 만들 때마다 바로 흘려보내므로,
+    클라이언트(pyarrow.ipc.open_stream, pandas, polars 등)는 전체를 받기 전에 읽기 시작할 수 있습니다.
+    """
+    import pyarrow as pa  # 내보내기에서만 필요하므로 지연 임포트
+
+    schema = arrow_schema()
+    buffer = io.BytesIO()
+    writer = pa.ipc.new_stream(buffer, schema)
+    for chunk in _chunked(rows, batch_rows):
+        columns = [list(col) for col in zip(*chunk)]
+        columns[_EXTRA_STATS] = [json.dumps(v, ensure_ascii=False) if v is not None else None for v in columns[_EXTRA_STATS]]
+        writer.write_batch(pa.RecordBatch.from_arrays(
+            [pa.array(col, type=f.type) for col, f in zip(columns, schema)], schema=schema
+        ))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    writer.close()
+    yield buffer.getvalue()
+
+ENCODERS = {"ndjson": encode_ndjson, "csv": encode_csv, "arrow": encode_arrow}
@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, NamedTuple, Optional, Sequence
+
+PARENT_TABLE = "telemetry_data"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+PARTITION_INTERVALS = ("day", "week")
+
+class PartitionRange(NamedTuple):
+    name: str
+    start: datetime
+    end: datetime
+
+class ExistingPartition(NamedTuple):
+    name: str
+    start: Optional[datetime]  # DEFAULT 파티션은 None
+    end: Optional[datetime]
+
+def period_start(ts: datetime, interval: str) -> datetime:
+    """UTC 기준 파티션 시작 시각. 주 단위는 ISO 주(월요일 시작)를 따릅니다."""
+    day = ts.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    if interval == "week":
+        return day - timedelta(days=day.weekday())
+    if interval == "day":
+        return day
+    raise ValueError(f"Unsupported partition interval: {interval}")
+
+def period_range(start: datetime, interval: str) -> PartitionRange:
+    end = start + timedelta(days=7 if interval == "week" else 1)
+    return PartitionRange(f"{PARENT_TABLE}_p{start:%Y%m%d}", start, end)
+
+def expired_default_table(now: datetime) -> str:
+    """
+    detach 모드에서 DEFAULT 파티션의 경과 행을 옮겨 둘 독립 테이블 이름.
+    분리된 파티션과 같은 접두사(_p)를 써서 아카이브 대상 목록에 함께 잡히게 합니다.
+    """
+    return f"{PARENT_TABLE}_p{now.astimezone(timezone.utc):%Y%m%d%H%M%S}_default"
+
+def planned_ranges(now: datetime, interval: str, premake: int) -> List[PartitionRange]:
+    """현재 구간부터 premake개의 미래 구간까지, 존재해야 하는 파티션 목록입니다."""
+    ranges = []
+    start = period_start(now, interval)
+    for _ in range(premake + 1):
+        ranges.append(period_range(start, interval))
+        start = ranges[-1].end
+    return ranges
+
+def overlapping(target: PartitionRange, existing: Sequence[ExistingPartition]) -> List[ExistingPartition]:
+    """
+    target 구간과 겹치는 기존 범위 파티션. 주기 설정이 바뀌어(day ↔ week) 경계가 어긋난 경우에도
+    겹치는 파티션을 새로 만들지 않도록 이름이 아니라 실제 경계로 비교합니다.
+    """
+    return [p for p in existing if p.start is not None and p.start < target.end and target.start < p.end]
+
+def expired(existing: Sequence[ExistingPartition], cutoff: datetime) -> List[ExistingPartition]:
+    """상한이 cutoff 이하인, 즉 모든 행이 보존 기간을 지난 파티션 (오래된 순)."""
+    return sorted((p for p in existing if p.end is not None and p.end <= cutoff), key=lambda p: p.start)
@@ -0,0 +1,84 @@
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from app.models.events_logs.telemetry_rollup import (
+    TelemetryRollupMixin, TelemetryRollupMinute, TelemetryRollupHour, TelemetryRollupDay,
+)
+
+@dataclass(frozen=True)
+class RollupLevel:
+    name: str
+    seconds: int
+    model: Type[TelemetryRollupMixin]
+    trunc_unit: str  # PostgreSQL date_trunc 단위
+
+ROLLUP_LEVELS: Tuple[RollupLevel, ...] = (
+    RollupLevel("1m", 60, TelemetryRollupMinute, "minute"),
+    RollupLevel("1h", 3600, TelemetryRollupHour, "hour"),
+    RollupLevel("1d", 86400, TelemetryRollupDay, "day"),
+)
+ROLLUP_LEVELS_BY_NAME: Dict[str, RollupLevel] = {level.name: level for level in ROLLUP_LEVELS}
+
+RAW_RESOLUTION = "raw"
+RESOLUTION_CHOICES = ("auto", RAW_RESOLUTION) + tuple(ROLLUP_LEVELS_BY_NAME)
+
+def bucket_start(ts: datetime, seconds: int) -> datetime:
+    """UTC epoch 기준으로 버킷 시작 시각을 절삭합니다. (DB의 date_trunc(..., 'UTC')와 동일한 경계)"""
+    epoch = ts.astimezone(timezone.utc).timestamp()
+    return datetime.fromtimestamp(math.floor(epoch / seconds) * seconds, timezone.utc)
+
+def aggregate_rows(rows: Iterable[Any], level: RollupLevel) -> List[Dict[str, Any]]:
+    """
+    원본 텔레메트리 행(속성: device_id, system_unit_id, component_name, metric_name, captured_at,
+    avg_value, min_value, max_value, std_dev, sample_count)을 한 레벨의 버킷 델타로 병합합니다.
+    교착 상태를 피하기 위해 결과는 기본 키 순으로 정렬됩니다.
+    """
+    buckets: Dict[Tuple, Dict[str, Any]] = {}
+    for row in rows:
+        key = (row.device_id, row.metric_name, row.component_name, bucket_start(row.captured_at, level.seconds))
+        n = max(int(row.sample_count or 1), 1)
+        avg, std = float(row.avg_value), float(row.std_dev or 0.0)
+        bucket = buckets.get(key)
+        if bucket is None:
+            buckets[key] = {
+                "device_id": key[0], "metric_name": key[1], "component_name": key[2], "bucket_start": key[3],
+                "system_unit_id": row.system_unit_id,
+                "row_count": 1, "sample_count": n,
+                "min_value": float(row.min_value), "max_value": float(row.max_value),
+                "sum_value": n * avg, "sum_sq_value": n * (std * std + avg * avg),
+            }
+            continue
+        bucket["row_count"] += 1
+        bucket["sample_count"] += n
+        bucket["min_value"] = min(bucket["min_value"], float(row.min_value))
+        bucket["max_value"] = max(bucket["max_value"], float(row.max_value))
+        bucket["sum_value"] += n * avg
+        bucket["sum_sq_value"] += n * (std * std + avg * avg)
+    return [buckets[k] for k in sorted(buckets)]
+
+def plan_resolution(
+    *, start: datetime, end: datetime, points: int, requested: Optional[str], raw_interval_seconds: int
+) -> str:
+    """
+    [Query Planner] 요청 구간을 points 예산 안에 담을 수 있는 해상도 중 가장 촘촘한 것을 고릅니다.
+    (예: 1주일 / 500포인트 → 1h, 1시간 / 500포인트 → raw) 어느 것도 예산을 만족하지 못하면 1d를 씁니다.
+    """
+    if requested and requested != "auto":
+        return requested
+    span = max((end - start).total_seconds(), 0.0)
+    candidates = [(RAW_RESOLUTION, raw_interval_seconds)] + [(l.name, l.seconds) for l in ROLLUP_LEVELS]
+    for name, seconds in candidates:
+        if span / seconds <= points:
+            return name
+    return ROLLUP_LEVELS[-1].name
+
+def align_range_to_days(start: datetime, end: datetime) -> Tuple[datetime, datetime]:
+    """재집계 구간을 가장 큰 버킷(1일) 경계로 넓혀, 부분 버킷이 덮어써지지 않도록 합니다."""
+    day = ROLLUP_LEVELS[-1].seconds
+    aligned_start = bucket_start(start, day)
+    aligned_end = bucket_start(end, day)
+    if aligned_end < end:
+        aligned_end += timedelta(seconds=day)
+    return aligned_start, aligned_end
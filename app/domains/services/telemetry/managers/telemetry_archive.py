@@ -0,0 +1,339 @@
+import fcntl
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from functools import reduce
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .export_encoders import EXPORT_COLUMNS, _chunked, arrow_schema
+
+_MANIFEST_FILE = "manifest.json"
+_LOCK_FILE = ".manifest.lock"
+_PENDING_SUFFIX = ".pending.json"
+_CAPTURED_AT = EXPORT_COLUMNS.index("captured_at")
+_ID = EXPORT_COLUMNS.index("id")
+_EXTRA_STATS = EXPORT_COLUMNS.index("extra_stats")
+
+def _metadata_schema():
+    import pyarrow as pa
+    return pa.schema([
+        ("telemetry_data_id", pa.int64()),
+        ("meta_key", pa.string()),
+        ("meta_value", pa.string()),
+        ("meta_value_type", pa.string()),
+        ("description", pa.string()),
+        ("created_at", pa.timestamp("us", tz="UTC")),
+    ])
+
+METADATA_COLUMNS = ("telemetry_data_id", "meta_key", "meta_value", "meta_value_type", "description", "created_at")
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _write_json(path: str, payload: Dict[str, Any]) -> None:
+    """임시 파일에 쓰고 fsync 후 교체합니다. (읽는 쪽은 이전 내용 또는 새 내용만 봄)"""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def _utc(ts: datetime) -> datetime:
+    """naive 시각은 UTC로 간주합니다. (DB의 timestamptz 비교와 같은 기준)"""
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts
+
+def _epoch_us(ts: datetime) -> int:
+    return int(ts.timestamp() * 1_000_000)
+
+class TelemetryArchiveStore:
+    """
+    콜드 스토리지: 파티션 1개 = Arrow IPC 파일 1개 (+ 메타데이터 파일 1개).
+
+    디스크 구성 (`{base_dir}/`):
+    - {partition}.arrow: captured_at, id 오름차순으로 정렬된 텔레메트리 행 (컬럼 단위 zstd 압축)
+    - {partition}.metadata.arrow: 해당 행들의 telemetry_metadata
+    - manifest.json: 파티션별 구간, 행 수, sha256, 배치별 captured_at 범위, 포함된 system_unit_id 목록
+
+    - {partition}.pending.json: 파일은 썼지만 DB 삭제가 아직 커밋되지 않은 항목 (publish 전까지 조회에 보이지 않음)
+
+    읽기는 pa.memory_map으로 파일을 매핑하고, manifest의 배치 범위로 필요 없는 배치는 열지 않습니다.
+    쓰기는 임시 파일에 쓴 뒤 교체하고 pending 항목만 남깁니다. DB 트랜잭션이 커밋된 뒤 publish로 manifest에
+    옮기므로, 롤백된 아카이브가 DB 행과 함께 이중으로 조회되는 일이 없습니다.
+    flock으로 manifest 갱신을 직렬화하므로 base_dir은 모든 API/워커 호스트가 마운트한 같은 공유 볼륨이어야 합니다.
+    """
+    def __init__(self, base_dir: str):
+        self.base_dir = base_dir
+        self._thread_lock = threading.Lock()
+        self._cached_mtime: Optional[int] = None
+        self._cached_manifest: Dict[str, Any] = {"partitions": {}}
+
+    # --- manifest ---
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        os.makedirs(self.base_dir, exist_ok=True)
+        with self._thread_lock, open(os.path.join(self.base_dir, _LOCK_FILE), "a+") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def manifest(self) -> Dict[str, Any]:
+        """manifest.json이 바뀌었을 때만 다시 읽습니다."""
+        path = os.path.join(self.base_dir, _MANIFEST_FILE)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return {"partitions": {}}
+        if mtime != self._cached_mtime:
+            with open(path, "r", encoding="utf-8") as f:
+                self._cached_manifest = json.load(f)
+            self._cached_mtime = mtime
+        return self._cached_manifest
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        _write_json(os.path.join(self.base_dir, _MANIFEST_FILE), manifest)
+
+    def archived_before(self) -> Optional[datetime]:
+        """아카이브된 구간의 상한 중 가장 늦은 시각. (이보다 이른 조회만 파일을 열어 봅니다)"""
+        ends = [e["end"] for e in self.manifest()["partitions"].values()]
+        return datetime.fromisoformat(max(ends)) if ends else None
+
+    # --- 쓰기 ---
+
+    def _write_file(self, path: str, schema, rows: Iterable[Tuple[Any, ...]], *, batch_rows: int, compression: str,
+                    json_columns: Sequence[int] = (), track_time: bool = False) -> Tuple[int, List[List[int]], List[int]]:
+        """행을 배치 단위로 Arrow 파일에 씁니다. (행 수, 배치별 [min_us, max_us, rows], system_unit_id 목록)"""
+        import pyarrow as pa
+
+        total = 0
+        batches: List[List[int]] = []
+        units: set = set()
+        options = pa.ipc.IpcWriteOptions(compression=compression or None)
+        with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, schema, options=options) as writer:
+            for chunk in _chunked(rows, batch_rows):
+                columns = [list(col) for col in zip(*chunk)]
+                for index in json_columns:
+                    columns[index] = [json.dumps(v, ensure_ascii=False) if v is not None else None for v in columns[index]]
+                writer.write_batch(pa.RecordBatch.from_arrays(
+                    [pa.array(col, type=f.type) for col, f in zip(columns, schema)], schema=schema
+                ))
+                total += len(chunk)
+                if track_time:
+                    batches.append([_epoch_us(chunk[0][_CAPTURED_AT]), _epoch_us(chunk[-1][_CAPTURED_AT]), len(chunk)])
+                    units.update(columns[EXPORT_COLUMNS.index("system_unit_id")])
+        return total, batches, sorted(units)
+
+    def write_partition(
+        self,
+        name: str,
+        *,
+        start: datetime,
+        end: datetime,
+        rows: Iterable[Tuple[Any, ...]],
+        metadata_rows: Iterable[Tuple[Any, ...]],
+        batch_rows: int,
+        compression: str,
+    ) -> Dict[str, Any]:
+        """
+        파티션 1개를 파일로 기록하고 pending 항목을 남깁니다. (manifest 등록은 publish) rows는 EXPORT_COLUMNS 순서,
+        (captured_at, id) 오름차순이어야 합니다. 같은 이름으로 다시 호출하면 덮어씁니다. (재실행 안전)
+        """
+        os.makedirs(self.base_dir, exist_ok=True)
+        data_path = os.path.join(self.base_dir, f"{name}.arrow")
+        meta_path = os.path.join(self.base_dir, f"{name}.metadata.arrow")
+
+        count, batches, units = self._write_file(
+            f"{data_path}.tmp", arrow_schema(), rows, batch_rows=batch_rows, compression=compression,
+            json_columns=(_EXTRA_STATS,), track_time=True,
+        )
+        metadata_count, _, _ = self._write_file(
+            f"{meta_path}.tmp", _metadata_schema(), metadata_rows, batch_rows=batch_rows, compression=compression,
+        )
+        for path in (data_path, meta_path):
+            with open(f"{path}.tmp", "rb") as f:
+                os.fsync(f.fileno())
+            os.replace(f"{path}.tmp", path)
+
+        entry = {
+            "file": os.path.basename(data_path),
+            "metadata_file": os.path.basename(meta_path),
+            "start": start.astimezone(timezone.utc).isoformat(),
+            "end": end.astimezone(timezone.utc).isoformat(),
+            "rows": count,
+            "metadata_rows": metadata_count,
+            "sha256": _sha256(data_path),
+            "metadata_sha256": _sha256(meta_path),
+            "compression": compression,
+            "batches": batches,
+            "system_unit_ids": units,
+            "archived_at": datetime.now(timezone.utc).isoformat(),
+        }
+        _write_json(self._pending_path(name), entry)
+        return entry
+
+    def _pending_path(self, name: str) -> str:
+        return os.path.join(self.base_dir, f"{name}{_PENDING_SUFFIX}")
+
+    def _read_pending(self, name: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._pending_path(name), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def pending(self) -> List[str]:
+        """파일은 기록됐지만 아직 manifest에 등록되지 않은 파티션 이름 목록."""
+        if not os.path.isdir(self.base_dir):
+            return []
+        return sorted(f[:-len(_PENDING_SUFFIX)] for f in os.listdir(self.base_dir) if f.endswith(_PENDING_SUFFIX))
+
+    def publish(self, name: str) -> Optional[Dict[str, Any]]:
+        """pending 항목을 manifest에 등록합니다. (DB 삭제가 커밋된 뒤 호출, 이미 등록됐으면 None)"""
+        with self._write_lock():
+            entry = self._read_pending(name)
+            if entry is None:
+                return None
+            manifest = self.manifest()
+            manifest = {**manifest, "partitions": {**manifest["partitions"], name: entry}}
+            self._write_manifest(manifest)
+            os.remove(self._pending_path(name))
+        return entry
+
+    def discard(self, name: str) -> None:
+        """DB 삭제가 롤백된 pending 항목과 그 파일을 지웁니다. (원본은 DB에 그대로 남아 있음)"""
+        with self._write_lock():
+            if self._read_pending(name) is None:
+                return
+            if name not in self.manifest()["partitions"]:
+                for suffix in (".arrow", ".metadata.arrow"):
+                    path = os.path.join(self.base_dir, f"{name}{suffix}")
+                    if os.path.exists(path):
+                        os.remove(path)
+            os.remove(self._pending_path(name))
+
+    def verify(self, name: str) -> bool:
+        """파일 체크섬이 pending(없으면 manifest) 항목과 일치하는지 확인합니다."""
+        entry = self._read_pending(name) or self.manifest()["partitions"].get(name)
+        if entry is None:
+            return False
+        return (
+            _sha256(os.path.join(self.base_dir, entry["file"])) == entry["sha256"]
+            and _sha256(os.path.join(self.base_dir, entry["metadata_file"])) == entry["metadata_sha256"]
+        )
+
+    # --- 읽기 ---
+
+    def scan(
+        self,
+        *,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        device_ids: Optional[Sequence[int]] = None,
+        system_unit_ids: Optional[Sequence[int]] = None,
+        snapshot_id: Optional[str] = None,
+        metric_names: Optional[Sequence[str]] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        descending: bool = False,
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        조건에 맞는 아카이브 행을 EXPORT_COLUMNS 순서의 튜플로 (captured_at, id) 순서대로 흘려보냅니다.
+        (start_time 이상, end_time 이하 — DB 조회와 같은 경계)
+        """
+        start_time = _utc(start_time) if start_time else None
+        end_time = _utc(end_time) if end_time else None
+        after = (_utc(after[0]), after[1]) if after else None
+        entries = sorted(self.manifest()["partitions"].values(), key=lambda e: e["start"], reverse=descending)
+        start_us = _epoch_us(start_time) if start_time else None
+        end_us = _epoch_us(end_time) if end_time else None
+        unit_filter = set(system_unit_ids or ())
+
+        for entry in entries:
+            if start_time and datetime.fromisoformat(entry["end"]) <= start_time:
+                continue
+            if end_time and datetime.fromisoformat(entry["start"]) > end_time:
+                continue
+            if after and datetime.fromisoformat(entry["end"]) <= after[0]:
+                continue
+            if unit_filter and not unit_filter.intersection(entry["system_unit_ids"]):
+                continue
+            yield from self._scan_file(
+                entry, start_us=start_us, end_us=end_us, device_ids=device_ids, system_unit_ids=system_unit_ids,
+                snapshot_id=snapshot_id, metric_names=metric_names, after=after, descending=descending,
+            )
+
+    def _scan_file(self, entry: Dict[str, Any], *, start_us, end_us, device_ids, system_unit_ids, snapshot_id,
+                   metric_names, after, descending) -> Iterator[Tuple[Any, ...]]:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        after_us = _epoch_us(after[0]) if after else None
+        with pa.memory_map(os.path.join(self.base_dir, entry["file"]), "r") as source:
+            reader = pa.ipc.open_file(source)
+            order = range(reader.num_record_batches)
+            for i in (reversed(order) if descending else order):
+                batch_min, batch_max, _ = entry["batches"][i]
+                if (start_us is not None and batch_max < start_us) or (end_us is not None and batch_min > end_us):
+                    continue
+                if after_us is not None and batch_max < after_us:
+                    continue
+
+                batch = reader.get_batch(i)
+                ts_type = pa.timestamp("us", tz="UTC")
+                conditions = []
+                if start_us is not None:
+                    conditions.append(pc.greater_equal(batch.column("captured_at"), pa.scalar(start_us, type=ts_type)))
+                if end_us is not None:
+                    conditions.append(pc.less_equal(batch.column("captured_at"), pa.scalar(end_us, type=ts_type)))
+                if device_ids:
+                    conditions.append(pc.is_in(batch.column("device_id"), value_set=pa.array(list(device_ids), type=pa.int64())))
+                if system_unit_ids:
+                    conditions.append(pc.is_in(batch.column("system_unit_id"), value_set=pa.array(list(system_unit_ids), type=pa.int64())))
+                if snapshot_id:
+                    conditions.append(pc.equal(batch.column("snapshot_id"), snapshot_id))
+                if metric_names:
+                    conditions.append(pc.is_in(batch.column("metric_name"), value_set=pa.array(list(metric_names), type=pa.string())))
+                if conditions:
+                    batch = batch.filter(reduce(pc.and_, conditions))
+                if batch.num_rows == 0:
+                    continue
+
+                rows = list(zip(*(batch.column(c).to_pylist() for c in EXPORT_COLUMNS)))
+                if after is not None:
+                    rows = [r for r in rows if (r[_CAPTURED_AT], r[_ID]) > after]
+                rows = [r[:_EXTRA_STATS] + (json.loads(r[_EXTRA_STATS]) if r[_EXTRA_STATS] is not None else None,) + r[_EXTRA_STATS + 1:] for r in rows]
+                yield from (reversed(rows) if descending else rows)
+
+    def scan_metadata(self, telemetry_data_ids: Sequence[int], *, start_time: datetime, end_time: datetime) -> Dict[int, List[Tuple[Any, ...]]]:
+        """
+        아카이브된 행의 telemetry_metadata를 telemetry_data_id별 METADATA_COLUMNS 튜플 목록으로 읽습니다.
+        start_time~end_time(해당 행들의 captured_at 범위)과 겹치는 파티션의 메타데이터 파일만 엽니다.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        result: Dict[int, List[Tuple[Any, ...]]] = {}
+        if not telemetry_data_ids:
+            return result
+        start_time, end_time = _utc(start_time), _utc(end_time)
+        id_set = pa.array(sorted(set(telemetry_data_ids)), type=pa.int64())
+        for entry in self.manifest()["partitions"].values():
+            if not entry.get("metadata_rows"):
+                continue
+            if datetime.fromisoformat(entry["end"]) <= start_time or datetime.fromisoformat(entry["start"]) > end_time:
+                continue
+            with pa.memory_map(os.path.join(self.base_dir, entry["metadata_file"]), "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+                table = table.filter(pc.is_in(table.column("telemetry_data_id"), value_set=id_set))
+                for row in zip(*(table.column(c).to_pylist() for c in METADATA_COLUMNS)):
+                    result.setdefault(row[0], []).append(row)
+        return result
@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict
+from typing import List, Literal, Optional, Dict
 from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict, field_serializer
 
@@ -78,4 +78,96 @@ class TelemetryFilter(BaseModel):
     
     # 페이지네이션
     skip: int = Field(0, ge=0, description="건너뛸 레코드 수")
-    limit: int = Field(100, ge=1, le=1000, description="반환할 최대 레코드 수 (최대 1000)")
\ No newline at end of file
+    limit: int = Field(100, ge=1, le=1000, description="반환할 최대 레코드 수 (최대 1000)")
+
+    # 시계열(차트) 조회 전용
+    resolution: Optional[Literal["auto", "raw", "1m", "1h", "1d"]] = Field(
+        None, description="시계열 해상도 (auto면 구간과 points로부터 플래너가 선택)"
+    )
+    points: Optional[int] = Field(None, ge=2, le=10000, description="시리즈당 포인트 예산")
+    downsample: Optional[Literal["lttb", "minmax"]] = Field(
+        None, description="예산을 넘는 시리즈를 서버에서 줄이는 방식 (lttb: 형태 보존, minmax: 스파이크 보존)"
+    )
+
+
+class TelemetrySeriesPointRead(BaseModel):
+    """
+    시계열 한 점(버킷) 조회 스키마.
+    raw 해상도에서는 원본 10초 통계 1건, 롤업 해상도에서는 버킷 내 통계를 병합한 값입니다.
+    """
+    device_id: int = Field(..., description="관련 기기의 ID")
+    component_name: str = Field(..., description="부품 인스턴스 명칭")
+    metric_name: str = Field(..., description="측정 항목명")
+    bucket_start: datetime = Field(..., description="버킷 시작 시각 (raw는 captured_at)")
+    sample_count: int = Field(..., description="버킷에 포함된 실제 샘플 수")
+    min_value: float = Field(..., description="버킷 최소값")
+    max_value: float = Field(..., description="버킷 최대값")
+    avg_value: float = Field(..., description="샘플 수 가중 평균값")
+    std_dev: float = Field(..., description="병합된 표준편차")
+
+    @field_serializer('bucket_start')
+    def serialize_dt(self, dt: datetime, _info):
+        return dt.isoformat(timespec='milliseconds')
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TelemetrySeriesRead(BaseModel):
+    """차트용 시계열 응답. 플래너가 선택한 해상도와 실제 조회 구간을 함께 반환합니다."""
+    resolution: str = Field(..., description="실제 사용된 해상도 (raw, 1m, 1h, 1d)")
+    bucket_seconds: int = Field(..., description="버킷 폭(초). raw는 명목 수집 간격")
+    start_time: Optional[datetime] = Field(None, description="조회 시작 시간 (소유 기간 보정 후)")
+    end_time: Optional[datetime] = Field(None, description="조회 종료 시간 (소유 기간 보정 후)")
+    downsample: Optional[str] = Field(None, description="적용된 다운샘플링 방식 (없으면 None)")
+    truncated: bool = Field(False, description="최대 행 수 제한으로 잘렸는지 여부")
+    points: List[TelemetrySeriesPointRead] = Field(default_factory=list, description="기기/부품/항목/시각 순으로 정렬된 점 목록")
+
+
+class TelemetryExportFilter(BaseModel):
+    """
+    스트리밍 내보내기 필터 스키마.
+    offset 대신 (captured_at, id) 키셋 커서를 사용합니다. 응답이 끊기면 마지막으로 받은 행의
+    captured_at/id를 after_captured_at/after_id로 넘겨 그 다음 행부터 이어받습니다.
+    """
+    device_ids: Optional[List[int]] = Field(None, description="필터링할 기기 ID 리스트")
+    system_unit_ids: Optional[List[int]] = Field(None, description="필터링할 시스템 유닛 ID 리스트")
+    snapshot_id: Optional[str] = Field(None, description="특정 스냅샷 ID(온톨로지 키) 필터")
+    metric_names: Optional[List[str]] = Field(None, description="필터링할 측정 항목 이름 리스트")
+    start_time: Optional[datetime] = Field(None, description="조회 시작 시간 (captured_at 기준)")
+    end_time: Optional[datetime] = Field(None, description="조회 종료 시간 (captured_at 기준)")
+
+    format: Literal["ndjson", "csv", "arrow"] = Field("ndjson", description="출력 형식 (arrow는 Arrow IPC 스트림)")
+    after_captured_at: Optional[datetime] = Field(None, description="키셋 커서: 이 시각 이후부터")
+    after_id: Optional[int] = Field(None, description="키셋 커서: 같은 시각이면 이 ID 이후부터")
+    max_rows: Optional[int] = Field(None, ge=1, description="이번 응답에서 내보낼 최대 행 수 (생략 시 전체)")
+
+
+class TelemetryLatestFilter(BaseModel):
+    """최신값 조회 필터 스키마. 일반 사용자는 system_unit_ids를 반드시 지정해야 합니다."""
+    system_unit_ids: Optional[List[int]] = Field(None, description="필터링할 시스템 유닛 ID 리스트")
+    device_ids: Optional[List[int]] = Field(None, description="필터링할 기기 ID 리스트")
+    metric_names: Optional[List[str]] = Field(None, description="필터링할 측정 항목 이름 리스트")
+
+
+class DeviceMetricLatestRead(BaseModel):
+    """기기별 측정 항목 최신값 조회 스키마."""
+    device_id: int = Field(..., description="관련 기기의 ID")
+    system_unit_id: int = Field(..., description="관련 시스템 유닛 ID")
+    component_name: str = Field(..., description="부품 인스턴스 명칭")
+    metric_name: str = Field(..., description="측정 항목명")
+    unit: Optional[str] = Field(None, description="측정 단위")
+    avg_value: float = Field(..., description="최신 10초 평균값")
+    min_value: float = Field(..., description="최신 10초 최소값")
+    max_value: float = Field(..., description="최신 10초 최대값")
+    std_dev: float = Field(..., description="최신 10초 표준편차")
+    slope: float = Field(..., description="최신 10초 기울기")
+    sample_count: int = Field(..., description="통계 계산에 사용된 샘플 수")
+    captured_at: datetime = Field(..., description="최신값의 측정 시각")
+    snapshot_id: str = Field(..., description="최신값이 속한 스냅샷 ID")
+
+    @field_serializer('captured_at')
+    def serialize_dt(self, dt: datetime, _info):
+        return dt.isoformat(timespec='milliseconds')
+
+    model_config = ConfigDict(from_attributes=True)
+
@@ -0,0 +1,124 @@
+import logging
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+
+from app.core.config import settings
+from ..crud.telemetry_archive_crud import telemetry_archive_crud
+from ..crud.telemetry_partition_crud import telemetry_partition_crud
+from ..managers.partition_calendar import expired
+from ..managers.telemetry_archive import TelemetryArchiveStore
+
+logger = logging.getLogger(__name__)
+
+class TelemetryArchiveService:
+    """
+    [Cold Storage] 오래된 telemetry_data 파티션을 압축 컬럼 파일(Arrow IPC + zstd)로 옮기고 DB에서 제거합니다.
+    - 대상: 상한이 ARCHIVE_AFTER_DAYS를 지난 파티션 + 보존 정책(detach)으로 분리된 파티션 테이블
+    - 순서: 테이블 쓰기 잠금 → 파일 기록(pending) → 행 수/체크섬 검증 → 메타데이터 삭제/분리/DROP
+      → (호출자) 커밋 → publish로 manifest 등록
+      잠금 덕분에 파일에 담긴 행이 곧 DROP되는 행이며, manifest는 DB 삭제가 커밋된 뒤에만 바뀌므로
+      분리/커밋이 실패해도 DB 행과 아카이브 행이 함께 조회되는 일이 없습니다.
+      커밋 후 publish 전에 프로세스가 죽으면 다음 archive_next가 남은 pending 항목을 정리합니다.
+    한 번 호출에 파티션 1개를 처리하며, 트랜잭션 커밋과 publish는 호출자(아카이브 작업)가 수행합니다.
+    TELEMETRY_ARCHIVE_DIR은 모든 API/워커 호스트가 공유하는 볼륨이어야 합니다. (로컬 디스크면 아카이브한 호스트만 읽음)
+    """
+    def __init__(self, store: TelemetryArchiveStore):
+        self.store = store
+
+    def archive_next(self, db: Session, *, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """아카이브할 파티션 1개를 처리하고 결과를 반환합니다. 대상이 없거나 다른 워커가 수행 중이면 None."""
+        if settings.TELEMETRY_ARCHIVE_AFTER_DAYS <= 0:
+            return None
+        if not telemetry_partition_crud.try_lock(db, lock_timeout_ms=settings.TELEMETRY_PARTITION_LOCK_TIMEOUT_MS):
+            return None
+
+        self._recover_pending(db)
+
+        now = now or datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=settings.TELEMETRY_ARCHIVE_AFTER_DAYS)
+
+        detached = telemetry_archive_crud.list_detached_partitions(db)
+        if detached:
+            name, start, end = detached[0]
+            if start is None:
+                # 빈 분리 테이블은 옮길 것이 없으므로 바로 정리합니다.
+                telemetry_partition_crud.drop_table(db, table_name=name)
+                return {"partition": name, "rows": 0, "metadata_rows": 0, "detached": True}
+            return self._archive_table(db, name=name, start=start, end=end + timedelta(microseconds=1), attached=False)
+
+        candidates = expired(telemetry_partition_crud.list_partitions(db), cutoff)
+        if not candidates:
+            return None
+        oldest = candidates[0]
+        return self._archive_table(db, name=oldest.name, start=oldest.start, end=oldest.end, attached=True)
+
+    def _archive_table(self, db: Session, *, name: str, start: datetime, end: datetime, attached: bool) -> Dict[str, Any]:
+        batch_rows = settings.TELEMETRY_ARCHIVE_BATCH_ROWS
+        telemetry_archive_crud.lock_table(db, table_name=name)
+        expected = telemetry_archive_crud.count_rows(db, table_name=name)
+        entry = self.store.write_partition(
+            name,
+            start=start,
+            end=end,
+            rows=telemetry_archive_crud.stream_rows(db, table_name=name, fetch_size=batch_rows),
+            metadata_rows=telemetry_archive_crud.stream_metadata_rows(db, table_name=name, fetch_size=batch_rows),
+            batch_rows=batch_rows,
+            compression=settings.TELEMETRY_ARCHIVE_COMPRESSION,
+        )
+        if entry["rows"] != expected or not self.store.verify(name):
+            self.store.discard(name)
+            raise RuntimeError(f"Archive verification failed for {name}: wrote {entry['rows']} of {expected} rows.")
+
+        telemetry_partition_crud.delete_metadata_for(db, partition_name=name)
+        if attached:
+            telemetry_partition_crud.detach_partition(db, partition_name=name)
+        telemetry_partition_crud.drop_table(db, table_name=name)
+
+        logger.info(
+            f"🧊 Telemetry partition archived (pending commit): {name} rows={entry['rows']} "
+            f"metadata_rows={entry['metadata_rows']} sha256={entry['sha256'][:12]}"
+        )
+        return {"partition": name, "rows": entry["rows"], "metadata_rows": entry["metadata_rows"], "detached": not attached}
+
+    def publish(self, name: str) -> None:
+        """커밋된 아카이브를 manifest에 등록해 조회 경로에 보이게 합니다. (archive_next 결과를 커밋한 뒤 호출)"""
+        if self.store.publish(name) is not None:
+            logger.info(f"📇 Telemetry archive published: {name}")
+
+    def _recover_pending(self, db: Session) -> None:
+        """
+        이전 실행이 남긴 pending 항목 정리. (유지보수 락을 쥔 상태에서 호출되므로 진행 중인 아카이브는 없음)
+        원본 테이블이 사라졌으면 커밋된 것이므로 등록하고, 남아 있으면 롤백된 것이므로 버립니다.
+        """
+        for name in self.store.pending():
+            if telemetry_archive_crud.table_exists(db, table_name=name):
+                logger.warning(f"🗑️ Discarding uncommitted telemetry archive: {name}")
+                self.store.discard(name)
+            else:
+                self.publish(name)
+
+    def scan(self, **filters: Any) -> Iterator[Tuple[Any, ...]]:
+        """아카이브된 행을 EXPORT_COLUMNS 순서로 읽습니다. (조건은 TelemetryArchiveStore.scan 참고)"""
+        if not settings.TELEMETRY_ARCHIVE_READ_ENABLED:
+            return iter(())
+        return self.store.scan(**filters)
+
+    def scan_metadata(self, telemetry_data_ids: List[int], *, start_time: datetime, end_time: datetime) -> Dict[int, List[Tuple[Any, ...]]]:
+        """아카이브된 행들의 메타데이터 (telemetry_data_id → METADATA_COLUMNS 튜플 목록)"""
+        if not settings.TELEMETRY_ARCHIVE_READ_ENABLED:
+            return {}
+        return self.store.scan_metadata(telemetry_data_ids, start_time=start_time, end_time=end_time)
+
+    def archived_before(self) -> Optional[datetime]:
+        """DB에서 빠져 파일로만 남은 구간의 상한. (읽기 설정과 무관하게 DB 기준 조회의 하한 경계)"""
+        return self.store.archived_before()
+
+    def has_archive(self, *, start_time: Optional[datetime] = None) -> bool:
+        """start_time 이후 구간에 아카이브 파일이 있을 수 있는지. (없으면 조회 경로가 파일을 열지 않음)"""
+        if not settings.TELEMETRY_ARCHIVE_READ_ENABLED:
+            return False
+        archived_before = self.archived_before()
+        return archived_before is not None and (start_time is None or start_time < archived_before)
+
+telemetry_archive_service = TelemetryArchiveService(TelemetryArchiveStore(settings.TELEMETRY_ARCHIVE_DIR))
@@ -1,11 +1,15 @@
 # C:\vscode project files\Ares4\server2\app\domains\services\telemetry\services\telemetry_command_service.py
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any, Union, TYPE_CHECKING, cast
 from datetime import datetime, timezone
 
+from app.core.config import settings
 from app.models.events_logs.telemetry_data import TelemetryData
 from ..crud.telemetry_command_crud import telemetry_crud_command
+from ..crud.telemetry_latest_command_crud import telemetry_latest_crud_command
+from .telemetry_rollup_command_service import telemetry_rollup_command_service
 from ..schemas.telemetry_command import TelemetryCommandDataCreate
 
 if TYPE_CHECKING:
@@ -16,7 +20,9 @@ class TelemetryCommandService:
     def create_multiple_telemetry(self, db: Session, *, obj_in_list: List[TelemetryCommandDataCreate]) -> List[TelemetryData]:
         """여러 텔레메트리 데이터를 벌크로 생성합니다."""
         # [DESIGN PRINCIPLE] 트랜잭션 커밋은 Policy에서 제어하므로 CRUD만 호출
-        return telemetry_crud_command.create_multiple(db, obj_in_list=obj_in_list)
+        created = telemetry_crud_command.create_multiple(db, obj_in_list=obj_in_list)
+        self._apply_derived_tables(db, rows=created)
+        return created
     
     def bulk_upsert_telemetry(self, db: Session, *, device_id: int, telemetry_list: List[Dict]) -> int:
         """[Ares Aegis] 고속 벌크 업서트"""
@@ -27,7 +33,34 @@ class TelemetryCommandService:
         for data in telemetry_list:
             data['device_id'] = device_id
             
-        return telemetry_crud_command.bulk_upsert(db, obj_in_list=telemetry_list)
+        inserted = telemetry_crud_command.bulk_upsert(db, obj_in_list=telemetry_list)
+        self._apply_derived_tables(db, rows=inserted)
+        return len(inserted)
+
+    async def bulk_upsert_telemetry_async(self, db: AsyncSession, *, device_id: int, telemetry_list: List[Dict]) -> int:
+        """[Async] bulk_upsert_telemetry의 AsyncSession 버전. 파생 테이블 갱신도 같은 트랜잭션에서 수행합니다."""
+        if not telemetry_list:
+            return 0
+
+        for data in telemetry_list:
+            data['device_id'] = device_id
+            # asyncpg는 문자열을 timestamptz로 암묵 변환하지 않으므로 미리 datetime으로 바꿉니다.
+            if not isinstance(data.get('captured_at'), datetime):
+                data['captured_at'] = self._parse_timestamp(data.get('captured_at'))
+
+        inserted = await telemetry_crud_command.bulk_upsert_async(db, obj_in_list=telemetry_list)
+        # 파생 테이블 갱신은 동기 CRUD를 그대로 재사용합니다. (run_sync도 asyncpg 위에서 실행되어 루프를 막지 않음)
+        await db.run_sync(lambda sync_db: self._apply_derived_tables(sync_db, rows=inserted))
+        return len(inserted)
+
+    def _apply_derived_tables(self, db: Session, *, rows: List[Any]) -> None:
+        """원본과 같은 트랜잭션에서 파생 테이블(최신값, 시간 롤업)을 갱신합니다."""
+        if not rows:
+            return
+        if settings.TELEMETRY_LATEST_ENABLED:
+            telemetry_latest_crud_command.upsert_latest(db, rows=rows)
+        if settings.TELEMETRY_ROLLUP_ENABLED:
+            telemetry_rollup_command_service.apply_rows(db, rows=rows)
     
     def process_cluster_batch_ingestion(self, db: Session, *, system_unit: "SystemUnit", payload: Dict[str, Any]):
         """
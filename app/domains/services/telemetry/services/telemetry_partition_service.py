@@ -0,0 +1,79 @@
+import logging
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+
+from app.core.config import settings
+from ..crud.telemetry_partition_crud import telemetry_partition_crud
+from ..managers.partition_calendar import PARTITION_INTERVALS, expired, expired_default_table, overlapping, planned_ranges
+
+logger = logging.getLogger(__name__)
+
+class TelemetryPartitionService:
+    """
+    telemetry_data 파티션 유지보수:
+    - 현재 구간 + 미래 PREMAKE 구간의 파티션을 미리 생성 (수신 경로가 DEFAULT 파티션에 떨어지지 않도록)
+    - 보존 기간이 지난 파티션을 통째로 분리(detach) 또는 삭제(drop) — 행 단위 DELETE/VACUUM 비용이 없습니다.
+      DEFAULT 파티션에 남은 경과 행도 같은 모드를 따릅니다. (detach: 분리 테이블로 이동, drop: 삭제)
+    트랜잭션 커밋은 호출자(유지보수 작업)가 수행합니다.
+    """
+    def run_maintenance(self, db: Session, *, now: Optional[datetime] = None) -> Dict[str, Any]:
+        now = now or datetime.now(timezone.utc)
+        if not telemetry_partition_crud.try_lock(db, lock_timeout_ms=settings.TELEMETRY_PARTITION_LOCK_TIMEOUT_MS):
+            return {"skipped": True, "created": [], "detached": [], "dropped": [], "default_rows_detached": 0, "default_rows_deleted": 0}
+
+        report: Dict[str, Any] = {"skipped": False, "created": self.ensure_partitions(db, now=now)}
+        report.update(self.apply_retention(db, now=now))
+        return report
+
+    def ensure_partitions(self, db: Session, *, now: datetime) -> List[str]:
+        interval = settings.TELEMETRY_PARTITION_INTERVAL
+        if interval not in PARTITION_INTERVALS:
+            raise ValueError(f"TELEMETRY_PARTITION_INTERVAL must be one of {PARTITION_INTERVALS}, got '{interval}'.")
+
+        existing = telemetry_partition_crud.list_partitions(db)
+        created = []
+        for target in planned_ranges(now, interval, settings.TELEMETRY_PARTITION_PREMAKE):
+            conflicts = overlapping(target, existing)
+            if conflicts:
+                if not any(p.start <= target.start and target.end <= p.end for p in conflicts):
+                    # 주기 설정 변경 직후 등: 기존 파티션이 구간 일부만 덮으면 나머지는 DEFAULT로 들어갑니다.
+                    logger.warning(f"⚠️ Partition {target.name} skipped; overlaps {[p.name for p in conflicts]}.")
+                continue
+            telemetry_partition_crud.create_partition(db, target=target)
+            created.append(target.name)
+        if created:
+            logger.info(f"🧱 Telemetry partitions created: {created}")
+        return created
+
+    def apply_retention(self, db: Session, *, now: datetime) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"detached": [], "dropped": [], "default_rows_detached": 0, "default_rows_deleted": 0}
+        if settings.TELEMETRY_RETENTION_DAYS <= 0:
+            return result
+
+        cutoff = now - timedelta(days=settings.TELEMETRY_RETENTION_DAYS)
+        drop = settings.TELEMETRY_RETENTION_MODE == "drop"
+        for partition in expired(telemetry_partition_crud.list_partitions(db), cutoff):
+            if drop:
+                telemetry_partition_crud.delete_metadata_for(db, partition_name=partition.name)
+            telemetry_partition_crud.detach_partition(db, partition_name=partition.name)
+            if drop:
+                telemetry_partition_crud.drop_table(db, table_name=partition.name)
+                result["dropped"].append(partition.name)
+            else:
+                result["detached"].append(partition.name)
+
+        if drop:
+            result["default_rows_deleted"] = telemetry_partition_crud.delete_default_before(db, cutoff=cutoff)
+        else:
+            result["default_rows_detached"] = telemetry_partition_crud.detach_default_before(
+                db, cutoff=cutoff, table_name=expired_default_table(now)
+            )
+        if result["detached"] or result["dropped"]:
+            logger.info(
+                f"🗑️ Telemetry retention (cutoff {cutoff.isoformat()}): "
+                f"detached={result['detached']} dropped={result['dropped']}"
+            )
+        return result
+
+telemetry_partition_service = TelemetryPartitionService()
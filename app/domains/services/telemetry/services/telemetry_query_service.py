@@ -1,12 +1,30 @@
 # --- Query-related Service ---
 # 이 파일은 데이터의 상태를 변경하지 않는 'Query' 성격의 비즈니스 로직을 담당합니다.
 
+import asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime
+from itertools import islice
+from typing import Any, Iterator, List, Optional, Union
+from datetime import datetime, timedelta, timezone
+from app.core.config import settings
 from app.models.events_logs.telemetry_data import TelemetryData as DBTelemetryData
+from app.models.events_logs.telemetry_metadata import TelemetryMetadata as DBTelemetryMetadata
 from ..crud.telemetry_query_crud import telemetry_crud_query
-from ..schemas.telemetry_query import TelemetryFilter
+from ..crud.telemetry_latest_query_crud import telemetry_latest_crud_query
+from ..crud.telemetry_rollup_query_crud import telemetry_rollup_crud_query
+from ..managers.downsample import downsample_series
+from ..managers.export_encoders import ENCODERS, EXPORT_COLUMNS
+from ..managers.telemetry_archive import METADATA_COLUMNS
+from ..managers.rollup_levels import RAW_RESOLUTION, ROLLUP_LEVELS_BY_NAME, RollupLevel, bucket_start, plan_resolution
+from .telemetry_archive_service import telemetry_archive_service
+from ..schemas.telemetry_query import (
+    TelemetryFilter, TelemetryExportFilter, TelemetryLatestFilter, TelemetrySeriesPointRead, TelemetrySeriesRead,
+)
+from app.models.events_logs.device_metric_latest import DeviceMetricLatest
+
+_CAPTURED_AT = EXPORT_COLUMNS.index("captured_at")
+_ID = EXPORT_COLUMNS.index("id")
 
 class TelemetryQueryService:
     def get_telemetry_data(
@@ -18,21 +36,46 @@ class TelemetryQueryService:
         possession_end: Optional[datetime] = None    # Policy가 알려주는 소유 종료 시점
     ) -> List[DBTelemetryData]:
         """필터 조건을 사용하여 텔레메트리 데이터를 조회합니다."""
-        # 1. 사용자가 요청한 시작 시간이 소유 시작 시점보다 빠르면, 소유 시점으로 강제 보정
-        if possession_start:
-            if not filters.start_time or filters.start_time < possession_start:
-                filters.start_time = possession_start
-        
-        # 2. 소유권이 이미 종료된 기기라면, 해제 시점 이후 데이터는 조회 불가 처리
-        if possession_end:
-            if not filters.end_time or filters.end_time > possession_end:
-                filters.end_time = possession_end
+        # 1~2. 소유 기간으로 시간 필터 보정
+        self._clamp_to_possession(filters, possession_start, possession_end)
 
         # 3. 보정된 시간 필터를 가지고 자신의 CRUD 호출
-        return telemetry_crud_query.get_multiple_telemetry_data(
-            db=db,
-            skip=filters.skip,
-            limit=filters.limit,
+        query_kwargs = dict(
+            device_ids=filters.device_ids,
+            system_unit_ids=filters.system_unit_ids,
+            snapshot_id=filters.snapshot_id,
+            metric_names=filters.metric_names,
+            start_time=filters.start_time,
+            end_time=filters.end_time
+        )
+        rows = telemetry_crud_query.get_multiple_telemetry_data(db=db, skip=filters.skip, limit=filters.limit, **query_kwargs)
+        if len(rows) >= filters.limit or not telemetry_archive_service.has_archive(start_time=filters.start_time):
+            return rows
+
+        # 4. DB 결과가 페이지를 채우지 못하면, 나머지는 아카이브(DB에 남은 행보다 오래된 구간)에서 이어서 읽습니다.
+        archive_skip = 0
+        if not rows and filters.skip:
+            archive_skip = max(0, filters.skip - telemetry_crud_query.count_telemetry_data(db=db, **query_kwargs))
+        archived = islice(
+            telemetry_archive_service.scan(descending=True, **query_kwargs),
+            archive_skip,
+            archive_skip + filters.limit - len(rows),
+        )
+        rows.extend(self._from_archive(list(archived)))
+        return rows
+
+    async def get_telemetry_data_async(
+        self,
+        db: AsyncSession,
+        *,
+        filters: TelemetryFilter,
+        possession_start: Optional[datetime] = None,
+        possession_end: Optional[datetime] = None
+    ) -> List[DBTelemetryData]:
+        """[Async] get_telemetry_data의 AsyncSession 버전. 아카이브 파일 읽기는 스레드에서 수행합니다."""
+        self._clamp_to_possession(filters, possession_start, possession_end)
+
+        query_kwargs = dict(
             device_ids=filters.device_ids,
             system_unit_ids=filters.system_unit_ids,
             snapshot_id=filters.snapshot_id,
@@ -40,5 +83,237 @@ class TelemetryQueryService:
             start_time=filters.start_time,
             end_time=filters.end_time
         )
+        rows = await telemetry_crud_query.get_multiple_telemetry_data_async(
+            db, skip=filters.skip, limit=filters.limit, **query_kwargs
+        )
+        if len(rows) >= filters.limit or not telemetry_archive_service.has_archive(start_time=filters.start_time):
+            return rows
+
+        archive_skip = 0
+        if not rows and filters.skip:
+            archive_skip = max(0, filters.skip - await telemetry_crud_query.count_telemetry_data_async(db, **query_kwargs))
+        archived = await asyncio.to_thread(lambda: self._from_archive(list(islice(
+            telemetry_archive_service.scan(descending=True, **query_kwargs),
+            archive_skip,
+            archive_skip + filters.limit - len(rows),
+        ))))
+        rows.extend(archived)
+        return rows
+
+    def _from_archive(self, archived: List[tuple]) -> List[DBTelemetryData]:
+        """아카이브 튜플을 세션에 붙지 않은 모델로 바꾸고, 아카이브된 메타데이터를 metadata_items로 붙입니다."""
+        if not archived:
+            return []
+        captured = [row[_CAPTURED_AT] for row in archived]
+        metadata = telemetry_archive_service.scan_metadata(
+            [row[_ID] for row in archived], start_time=min(captured), end_time=max(captured)
+        )
+        # 아카이브는 서버 수신 시각(created_at)을 보관하지 않으므로 측정 시각으로 대신합니다.
+        return [
+            DBTelemetryData(
+                **dict(zip(EXPORT_COLUMNS, row)),
+                created_at=row[_CAPTURED_AT],
+                metadata_items=[DBTelemetryMetadata(**dict(zip(METADATA_COLUMNS, m))) for m in metadata.get(row[_ID], [])],
+            )
+            for row in archived
+        ]
+
+    def get_telemetry_series(
+        self,
+        db: Session,
+        *,
+        filters: TelemetryFilter,
+        possession_start: Optional[datetime] = None,
+        possession_end: Optional[datetime] = None
+    ) -> TelemetrySeriesRead:
+        """
+        [Query Planner] 차트용 시계열을 조회합니다.
+        구간과 포인트 예산(points)으로부터 raw/1m/1h/1d 중 가장 촘촘하면서 예산을 넘지 않는 해상도를 골라,
+        긴 구간 조회가 원본 테이블 전체를 훑지 않도록 합니다.
+        downsample이 지정되면 예산의 몇 배 해상도로 읽은 뒤 시리즈별로 LTTB/min-max 선택을 적용해
+        클라이언트 다운샘플링 없이 차트 폭에 맞는 점만 전송합니다.
+        """
+        if filters.end_time is None:
+            filters.end_time = datetime.now(timezone.utc)
+        if filters.start_time is None:
+            filters.start_time = filters.end_time - timedelta(hours=settings.TELEMETRY_SERIES_DEFAULT_RANGE_HOURS)
+        self._clamp_to_possession(filters, possession_start, possession_end)
+
+        start, end = filters.start_time, filters.end_time
+        budget = filters.points or settings.TELEMETRY_SERIES_DEFAULT_POINTS
+        resolution = plan_resolution(
+            start=start,
+            end=end,
+            points=budget * settings.TELEMETRY_DOWNSAMPLE_OVERSAMPLE if filters.downsample else budget,
+            requested=filters.resolution,
+            raw_interval_seconds=settings.TELEMETRY_RAW_INTERVAL_SECONDS,
+        )
+        if resolution == RAW_RESOLUTION:
+            bucket_seconds = settings.TELEMETRY_RAW_INTERVAL_SECONDS
+        else:
+            bucket_seconds = ROLLUP_LEVELS_BY_NAME[resolution].seconds
+
+        if start >= end:
+            return TelemetrySeriesRead(resolution=resolution, bucket_seconds=bucket_seconds, start_time=start, end_time=end)
+
+        max_rows = settings.TELEMETRY_SERIES_MAX_ROWS
+        series_filters = dict(
+            device_ids=filters.device_ids,
+            system_unit_ids=filters.system_unit_ids,
+            metric_names=filters.metric_names,
+        )
+        if resolution == RAW_RESOLUTION:
+            rows = telemetry_crud_query.get_raw_series(db, start_time=start, end_time=end, limit=max_rows + 1, **series_filters)
+        else:
+            rows = self._get_rollup_series(
+                db, level=ROLLUP_LEVELS_BY_NAME[resolution], start=start, end=end, limit=max_rows + 1, series_filters=series_filters
+            )
+
+        truncated = len(rows) > max_rows
+        rows = rows[:max_rows]
+        if filters.downsample:
+            rows = downsample_series(rows, method=filters.downsample, points=budget)
+
+        return TelemetrySeriesRead(
+            resolution=resolution,
+            bucket_seconds=bucket_seconds,
+            start_time=start,
+            end_time=end,
+            downsample=filters.downsample,
+            truncated=truncated,
+            points=[TelemetrySeriesPointRead.model_validate(r) for r in rows],
+        )
+
+    def _get_rollup_series(
+        self, db: Session, *, level: RollupLevel, start: datetime, end: datetime, limit: int, series_filters: dict
+    ) -> List[Any]:
+        """
+        구간 안에 완전히 들어가는 롤업 버킷만 읽고, 양 끝에 걸친 부분 버킷은 구간 안의 원본 행만으로 집계합니다.
+        (소유 기간 경계가 버킷 중간에 있을 때 경계 밖 데이터가 버킷 통계에 섞여 나가지 않도록)
+        """
+        inner_start = bucket_start(start, level.seconds)
+        if inner_start < start:
+            inner_start += timedelta(seconds=level.seconds)
+        inner_end = bucket_start(end, level.seconds)
+
+        if inner_start >= inner_end:
+            # 구간이 버킷 하나보다 짧아 완전한 버킷이 없습니다.
+            return telemetry_crud_query.get_raw_bucket(db, start_time=start, end_time=end, **series_filters)
+
+        rows = list(telemetry_rollup_crud_query.get_series(
+            db, level=level, start_time=inner_start, end_time=inner_end, limit=limit, **series_filters
+        ))
+        if start < inner_start:
+            rows.extend(telemetry_crud_query.get_raw_bucket(db, start_time=start, end_time=inner_start, **series_filters))
+        if inner_end < end:
+            rows.extend(telemetry_crud_query.get_raw_bucket(db, start_time=inner_end, end_time=end, **series_filters))
+        rows.sort(key=lambda r: (r.device_id, r.component_name, r.metric_name, r.bucket_start))
+        return rows[:limit]
+
+    def get_latest_values(
+        self,
+        db: Session,
+        *,
+        filters: TelemetryLatestFilter,
+        possession_start: Optional[datetime] = None,
+        possession_end: Optional[datetime] = None
+    ) -> List[DeviceMetricLatest]:
+        """
+        기기/부품/항목별 최신값을 device_metric_latest에서 한 번에 조회합니다.
+        소유 기간 밖에서 측정된 최신값은 제외합니다. (소유 종료 이후 값이 이전 소유자에게 노출되지 않도록)
+        """
+        return telemetry_latest_crud_query.get_latest(
+            db,
+            system_unit_ids=filters.system_unit_ids,
+            device_ids=filters.device_ids,
+            metric_names=filters.metric_names,
+            captured_from=possession_start,
+            captured_to=possession_end,
+        )
+
+    def export_telemetry(
+        self,
+        db: Session,
+        *,
+        filters: TelemetryExportFilter,
+        possession_start: Optional[datetime] = None,
+        possession_end: Optional[datetime] = None
+    ) -> Iterator[bytes]:
+        """
+        [Streaming Export] 필터에 맞는 원본 행을 (captured_at, id) 순으로 filters.format에 맞춰 인코딩해 흘려보냅니다.
+        반환된 이터레이터를 소비하는 동안 db 세션이 열려 있어야 합니다.
+        """
+        rows = self._iter_export_rows(
+            db, filters=filters, possession_start=possession_start, possession_end=possession_end
+        )
+        return ENCODERS[filters.format](rows, batch_rows=settings.TELEMETRY_EXPORT_FETCH_SIZE)
+
+    def _iter_export_rows(
+        self,
+        db: Session,
+        *,
+        filters: TelemetryExportFilter,
+        possession_start: Optional[datetime],
+        possession_end: Optional[datetime]
+    ) -> Iterator[tuple]:
+        self._clamp_to_possession(filters, possession_start, possession_end)
+        if filters.start_time and filters.end_time and filters.start_time > filters.end_time:
+            return
+
+        after = (filters.after_captured_at, filters.after_id) if filters.after_captured_at is not None else None
+        remaining = filters.max_rows
+
+        # 아카이브 구간은 DB에 남은 행보다 오래되었으므로 먼저 흘려보내고, 같은 커서로 DB 페이지를 이어 읽습니다.
+        if telemetry_archive_service.has_archive(start_time=filters.start_time):
+            for row in telemetry_archive_service.scan(
+                device_ids=filters.device_ids,
+                system_unit_ids=filters.system_unit_ids,
+                snapshot_id=filters.snapshot_id,
+                metric_names=filters.metric_names,
+                start_time=filters.start_time,
+                end_time=filters.end_time,
+                after=after,
+            ):
+                if remaining is not None:
+                    if remaining <= 0:
+                        return
+                    remaining -= 1
+                after = (row[1], row[0])
+                yield row
+
+        page_rows = settings.TELEMETRY_EXPORT_PAGE_ROWS
+        while remaining is None or remaining > 0:
+            limit = page_rows if remaining is None else min(page_rows, remaining)
+            count = 0
+            for row in telemetry_crud_query.stream_export_page(
+                db, filters=filters, after=after, limit=limit, fetch_size=settings.TELEMETRY_EXPORT_FETCH_SIZE
+            ):
+                count += 1
+                after = (row[1], row[0])  # (captured_at, id)
+                yield row
+            if remaining is not None:
+                remaining -= count
+            if count < limit:
+                return
+
+    def get_archived_before(self) -> Optional[datetime]:
+        """이 시각 이전의 텔레메트리는 telemetry_data에 없고 아카이브 파일에만 있습니다. (아카이브가 없으면 None)"""
+        return telemetry_archive_service.archived_before()
+
+    def _clamp_to_possession(
+        self,
+        filters: Union[TelemetryFilter, TelemetryExportFilter],
+        possession_start: Optional[datetime],
+        possession_end: Optional[datetime]
+    ) -> None:
+        # 1. 사용자가 요청한 시작 시간이 소유 시작 시점보다 빠르면, 소유 시점으로 강제 보정
+        if possession_start:
+            if not filters.start_time or filters.start_time < possession_start:
+                filters.start_time = possession_start
+
+        # 2. 소유권이 이미 종료된 기기라면, 해제 시점 이후 데이터는 조회 불가 처리
+        if possession_end:
+            if not filters.end_time or filters.end_time > possession_end:
+                filters.end_time = possession_end
 
 telemetry_query_service = TelemetryQueryService()
@@ -0,0 +1,29 @@
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Sequence
+from datetime import datetime
+
+from ..crud.telemetry_rollup_command_crud import telemetry_rollup_crud_command
+from ..managers.rollup_levels import ROLLUP_LEVELS, aggregate_rows, align_range_to_days
+
+class TelemetryRollupCommandService:
+    def apply_rows(self, db: Session, *, rows: Sequence[Any]) -> int:
+        """
+        [Incremental] 방금 저장된 원본 행을 1m/1h/1d 롤업에 누적합니다. 레벨당 SQL 1회.
+        원본 INSERT와 같은 트랜잭션에서 호출되어야 중복/누락 없이 원본과 일치합니다.
+        """
+        if not rows:
+            return 0
+        touched = 0
+        for level in ROLLUP_LEVELS:
+            touched += telemetry_rollup_crud_command.upsert_deltas(db, level=level, buckets=aggregate_rows(rows, level))
+        return touched
+
+    def rebuild_range(self, db: Session, *, start: datetime, end: datetime) -> Dict[str, int]:
+        """[Backfill] 원본에서 구간을 다시 집계합니다. 구간은 1일 경계로 넓혀 처리됩니다."""
+        start, end = align_range_to_days(start, end)
+        return {
+            level.name: telemetry_rollup_crud_command.rebuild_range(db, level=level, start=start, end=end)
+            for level in ROLLUP_LEVELS
+        }
+
+telemetry_rollup_command_service = TelemetryRollupCommandService()
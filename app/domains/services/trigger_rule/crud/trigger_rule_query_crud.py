@@ -0,0 +1,26 @@
+# --- Query-related CRUD ---
+# 이 파일은 데이터의 상태를 변경하지 않고 DB에서 트리거 규칙을 조회하는 'Query' CRUD 클래스를 정의합니다.
+
+from sqlalchemy.orm import Session
+from typing import List
+from datetime import datetime
+
+from app.models.relationships.trigger_rule import TriggerRule
+
+class CRUDTriggerRuleQuery:
+    def get_active(self, db: Session) -> List[TriggerRule]:
+        return db.query(TriggerRule).filter(TriggerRule.is_active.is_(True)).all()
+
+    def get_changed_since(self, db: Session, *, since: datetime) -> List[TriggerRule]:
+        """증분 리로드: 비활성화된 규칙도 색인에서 제거해야 하므로 is_active 필터를 걸지 않습니다."""
+        return (
+            db.query(TriggerRule)
+            .filter(TriggerRule.updated_at >= since)
+            .order_by(TriggerRule.updated_at.asc())
+            .all()
+        )
+
+    def get_active_ids(self, db: Session) -> List[int]:
+        return [row[0] for row in db.query(TriggerRule.id).filter(TriggerRule.is_active.is_(True)).all()]
+
+trigger_rule_crud_query = CRUDTriggerRuleQuery()
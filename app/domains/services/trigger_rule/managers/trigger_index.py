@@ -0,0 +1,211 @@
+import operator
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+# 색인 키: ("metric", "temp") 또는 ("event", "DEVICE_OFFLINE")
+IndexKey = Tuple[str, str]
+
+_OPERATORS: Dict[str, Callable[[float, float], bool]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+# TelemetryData 통계 컬럼과 조건식 stat 이름의 대응
+SUPPORTED_STATS = ("avg", "min", "max", "std", "slope")
+
+@dataclass
+class MetricSample:
+    """유닛별 최신값 캐시의 한 항목입니다. (captured_at은 epoch seconds)"""
+    stats: Dict[str, float]
+    captured_at: float
+    device_id: int
+    snapshot_id: Optional[str] = None
+
+@dataclass
+class EvaluationContext:
+    """
+    한 번의 조건 평가에 필요한 입력입니다.
+    - metrics: (metric, component) 및 (metric, None) → 최신 샘플
+    - event: 이번 평가를 유발한 이벤트 (텔레메트리 평가 시 None)
+    - hold_state: 규칙별 duration_sec 추적 상태 (leaf 번호 → 조건이 참이 된 시각)
+    """
+    metrics: Dict[Tuple[str, Optional[str]], MetricSample]
+    now: float
+    stale_after: float
+    event: Optional[Dict[str, Any]] = None
+    hold_state: Dict[int, float] = field(default_factory=dict)
+    # 조건을 만족시킨 근거 샘플 (ActionLog의 device/snapshot 귀속에 사용)
+    evidence: List[MetricSample] = field(default_factory=list)
+
+class _Node:
+    def keys(self) -> Set[IndexKey]:
+        raise NotImplementedError
+
+    def evaluate(self, ctx: EvaluationContext) -> bool:
+        raise NotImplementedError
+
+class _MetricLeaf(_Node):
+    def __init__(self, leaf_id: int, spec: Dict[str, Any]):
+        self.leaf_id = leaf_id
+        self.metric = str(spec["metric"])
+        self.component = spec.get("component")
+        self.stat = str(spec.get("stat", "avg")).lower()
+        if self.stat not in SUPPORTED_STATS:
+            raise ValueError(f"Unsupported stat '{self.stat}' in trigger condition.")
+        self.op = str(spec.get("op", ">"))
+        self.duration = float(spec.get("duration_sec") or 0)
+        if self.op == "between":
+            low, high = spec["value"]
+            self.bounds = (float(low), float(high))
+        elif self.op in _OPERATORS:
+            self.threshold = float(spec["value"])
+        else:
+            raise ValueError(f"Unsupported operator '{self.op}' in trigger condition.")
+
+    def keys(self) -> Set[IndexKey]:
+        return {("metric", self.metric)}
+
+    def _compare(self, value: float) -> bool:
+        if self.op == "between":
+            return self.bounds[0] <= value <= self.bounds[1]
+        return _OPERATORS[self.op](value, self.threshold)
+
+    def evaluate(self, ctx: EvaluationContext) -> bool:
+        sample = ctx.metrics.get((self.metric, self.component))
+        if sample is None or ctx.now - sample.captured_at > ctx.stale_after:
+            ctx.hold_state.pop(self.leaf_id, None)
+            return False
+        value = sample.stats.get(self.stat)
+        if value is None or not self._compare(value):
+            ctx.hold_state.pop(self.leaf_id, None)
+            return False
+        if self.duration > 0:
+            # 조건이 참으로 바뀐 시각을 기억하고, duration_sec 동안 유지된 뒤에만 참으로 판정합니다.
+            since = ctx.hold_state.setdefault(self.leaf_id, sample.captured_at)
+            if sample.captured_at - since < self.duration:
+                return False
+        ctx.evidence.append(sample)
+        return True
+
+class _EventLeaf(_Node):
+    def __init__(self, spec: Dict[str, Any]):
+        self.event_type = str(spec["event"])
+        self.match: Dict[str, Any] = spec.get("match") or {}
+
+    def keys(self) -> Set[IndexKey]:
+        return {("event", self.event_type)}
+
+    def evaluate(self, ctx: EvaluationContext) -> bool:
+        # 이벤트는 상태가 아니라 순간이므로, 해당 이벤트가 평가를 유발했을 때만 참입니다.
+        event = ctx.event
+        if not event or event.get("type") != self.event_type:
+            return False
+        details = event.get("details") or {}
+        return all(details.get(k) == v for k, v in self.match.items())
+
+class _AllNode(_Node):
+    def __init__(self, children: List[_Node]):
+        self.children = children
+
+    def keys(self) -> Set[IndexKey]:
+        return set().union(*(c.keys() for c in self.children))
+
+    def evaluate(self, ctx: EvaluationContext) -> bool:
+        # duration 추적 상태를 갱신해야 하므로 단락 평가하지 않습니다.
+        results = [c.evaluate(ctx) for c in self.children]
+        return all(results)
+
+class _AnyNode(_AllNode):
+    def evaluate(self, ctx: EvaluationContext) -> bool:
+        results = [c.evaluate(ctx) for c in self.children]
+        return any(results)
+
+class CompiledCondition:
+    """
+    TriggerRule.condition(JSON)을 한 번만 해석해 두고 재사용하는 평가 트리입니다.
+
+    지원 문법:
+    - 메트릭: {"metric": "temp", "op": ">", "value": 38, "duration_sec": 60, "component": "...", "stat": "avg"}
+      (op: >, >=, <, <=, ==, !=, between([low, high]) / stat: avg, min, max, std, slope)
+    - 이벤트: {"event": "DEVICE_OFFLINE", "match": {...}}
+    - 조합: {"all": [...]}, {"any": [...]}
+    """
+    def __init__(self, condition: Dict[str, Any]):
+        self._leaf_seq = 0
+        self.root = self._build(condition)
+        self.keys: Set[IndexKey] = self.root.keys()
+
+    def _build(self, spec: Any) -> _Node:
+        if not isinstance(spec, dict):
+            raise ValueError("Trigger condition node must be an object.")
+        if "all" in spec or "any" in spec:
+            children_spec = spec.get("all", spec.get("any"))
+            if not isinstance(children_spec, list) or not children_spec:
+                raise ValueError("'all'/'any' requires a non-empty list.")
+            children = [self._build(c) for c in children_spec]
+            return _AllNode(children) if "all" in spec else _AnyNode(children)
+        if "event" in spec:
+            return _EventLeaf(spec)
+        if "metric" in spec:
+            self._leaf_seq += 1
+            return _MetricLeaf(self._leaf_seq, spec)
+        raise ValueError(f"Unrecognized trigger condition node: {spec}")
+
+    def evaluate(self, ctx: EvaluationContext) -> bool:
+        return self.root.evaluate(ctx)
+
+class TriggerIndex:
+    """
+    [Reverse Index] (system_unit_id, 색인 키) → 규칙 ID 집합.
+    수신 이벤트가 건드린 키에 걸린 규칙만 꺼내 평가하므로, 평가 비용이 전체 규칙 수가 아니라
+    '해당 유닛에서 해당 메트릭을 참조하는 규칙 수'에 비례합니다.
+    """
+    def __init__(self):
+        self._postings: Dict[Tuple[int, IndexKey], Set[Hashable]] = {}
+        self._rule_keys: Dict[Hashable, Tuple[int, Set[IndexKey]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rule_keys)
+
+    def add(self, rule_id: Hashable, system_unit_id: int, keys: Iterable[IndexKey]) -> None:
+        self.remove(rule_id)
+        key_set = set(keys)
+        self._rule_keys[rule_id] = (system_unit_id, key_set)
+        for key in key_set:
+            self._postings.setdefault((system_unit_id, key), set()).add(rule_id)
+
+    def remove(self, rule_id: Hashable) -> bool:
+        entry = self._rule_keys.pop(rule_id, None)
+        if entry is None:
+            return False
+        system_unit_id, key_set = entry
+        for key in key_set:
+            posting = self._postings.get((system_unit_id, key))
+            if posting is not None:
+                posting.discard(rule_id)
+                if not posting:
+                    del self._postings[(system_unit_id, key)]
+        return True
+
+    def rule_ids(self) -> Set[Hashable]:
+        return set(self._rule_keys)
+
+    def lookup(self, system_unit_id: int, keys: Iterable[IndexKey]) -> Set[Hashable]:
+        matched: Set[Hashable] = set()
+        for key in keys:
+            posting = self._postings.get((system_unit_id, key))
+            if posting:
+                matched |= posting
+        return matched
+
+def validate_condition(condition: Optional[Dict[str, Any]]) -> List[str]:
+    """엔진 적재 전 조건식의 형식 오류를 수집합니다. (빈 리스트면 정상)"""
+    try:
+        CompiledCondition(condition or {})
+    except Exception as e:
+        return [str(e)]
+    return []
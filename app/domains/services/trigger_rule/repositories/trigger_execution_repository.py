@@ -0,0 +1,34 @@
+from typing import Iterable, Set
+
+from app.core.config import get_settings
+from app.core.redis_client import redis_client
+
+TRIGGER_EXECUTION_DONE_KEY_PREFIX = "trigger_execution_done:"
+
+class TriggerExecutionRepository:
+    """
+    [Cross-Process Handoff] 트리거 실행(슬롯)은 텔레메트리/이벤트를 평가한 프로세스의 엔진 메모리에 있고,
+    기기의 완료 응답은 리스너가 받습니다. 리스너는 완료 표식(trigger_execution_done:{action_log_id})만 남기고,
+    실행을 들고 있는 엔진이 다음 평가 때 자기 실행의 표식을 한 번의 파이프라인으로 회수해 슬롯을 반환합니다.
+    표식은 TTL로 만료되므로, 어느 엔진도 회수하지 않은(재시작으로 잃은) 실행의 표식은 저절로 정리됩니다.
+    """
+    def __init__(self, redis_client):
+        self.redis = redis_client
+
+    def mark_finished(self, action_log_id: int) -> None:
+        self.redis.set(
+            f"{TRIGGER_EXECUTION_DONE_KEY_PREFIX}{action_log_id}", 1,
+            ex=get_settings().TRIGGER_COMPLETION_MARKER_TTL_SECONDS
+        )
+
+    def pop_finished(self, action_log_ids: Iterable[int]) -> Set[int]:
+        """주어진 실행 중 완료 표식이 있는 것을 돌려주고 표식을 지웁니다."""
+        ids = list(action_log_ids)
+        if not ids:
+            return set()
+        pipe = self.redis.pipeline(transaction=False)
+        for action_log_id in ids:
+            pipe.delete(f"{TRIGGER_EXECUTION_DONE_KEY_PREFIX}{action_log_id}")
+        return {action_log_id for action_log_id, deleted in zip(ids, pipe.execute()) if deleted}
+
+trigger_execution_repository = TriggerExecutionRepository(redis_client)
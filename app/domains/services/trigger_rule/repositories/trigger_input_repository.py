@@ -0,0 +1,38 @@
+import logging
+from typing import List
+
+from app.core.config import get_settings
+from app.core.redis_client import redis_client
+from ..schemas.trigger_input import TriggerInput
+
+logger = logging.getLogger(__name__)
+
+TRIGGER_INPUT_KEY = "trigger_inputs"
+
+class TriggerInputRepository:
+    """
+    [Cross-Process Relay] 텔레메트리/이벤트는 여러 프로세스가 받지만, 슬롯/대기열/duration 추적 같은 트리거 상태는
+    리더 워커의 엔진 1곳에만 둡니다. 수신 프로세스는 커밋을 마친 입력을 Redis 리스트에 넣고(LPUSH),
+    리더의 엔진이 순서대로 꺼내(RPOP) 평가합니다.
+    리더가 멈춰 있는 동안 무한히 쌓이지 않도록 TRIGGER_INPUT_QUEUE_MAX_LENGTH로 상한을 두며, 넘치면 가장 오래된 입력부터 버려집니다.
+    """
+    def __init__(self, redis_client):
+        self.redis = redis_client
+
+    def push(self, trigger_input: TriggerInput) -> None:
+        pipe = self.redis.pipeline()
+        pipe.lpush(TRIGGER_INPUT_KEY, trigger_input.model_dump_json())
+        pipe.ltrim(TRIGGER_INPUT_KEY, 0, get_settings().TRIGGER_INPUT_QUEUE_MAX_LENGTH - 1)
+        pipe.execute()
+
+    def pop_many(self, *, limit: int) -> List[TriggerInput]:
+        raw = self.redis.rpop(TRIGGER_INPUT_KEY, limit) or []
+        inputs = []
+        for item in raw:
+            try:
+                inputs.append(TriggerInput.model_validate_json(item))
+            except ValueError as e:
+                logger.warning(f"⚠️ Dropped malformed trigger input: {e}")
+        return inputs
+
+trigger_input_repository = TriggerInputRepository(redis_client)
@@ -0,0 +1,26 @@
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field
+
+class TriggerMetricInput(BaseModel):
+    """평가 대기열에 실리는 텔레메트리 1행의 통계값입니다. (captured_at은 epoch seconds)"""
+    metric_name: str
+    component_name: Optional[str] = None
+    avg: float
+    min: float
+    max: float
+    std: float
+    slope: float
+    captured_at: float
+    device_id: int
+    snapshot_id: Optional[str] = None
+
+class TriggerInput(BaseModel):
+    """
+    수신 프로세스(API 워커/리스너/헬스체커)가 커밋 후 리더의 트리거 엔진으로 넘기는 평가 입력 1건입니다.
+    텔레메트리면 metrics가, 이산 이벤트면 event_type/device_id가 채워집니다.
+    """
+    system_unit_id: int
+    metrics: List[TriggerMetricInput] = Field(default_factory=list)
+    event_type: Optional[str] = None
+    device_id: Optional[int] = None
+    details: Dict[str, Any] = Field(default_factory=dict)
@@ -0,0 +1,30 @@
+import enum
+from typing import Optional
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+class TriggerRuleRuntimeRead(BaseModel):
+    """
+    트리거 엔진이 메모리 색인에 적재하는 실행 전용 스냅샷입니다.
+    """
+    id: int
+    system_unit_id: int
+    organization_id: Optional[int] = None
+    name: str
+    priority: int = Field(50, description="0: 최상위/긴급, 99: 최하위")
+    execution_mode: str
+    concurrency_policy: str
+    timeout_seconds: Optional[int] = None
+    condition: dict
+    action: dict
+    logic_version: str = "1.0.0"
+    is_active: bool = True
+    updated_at: datetime
+
+    @field_validator("execution_mode", "concurrency_policy", mode="before")
+    @classmethod
+    def _enum_to_value(cls, v):
+        # base_model의 Enum 값은 소문자이므로 대문자 문자열로 통일합니다.
+        return (v.value if isinstance(v, enum.Enum) else str(v)).upper()
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,21 @@
+# --- Query-related Service ---
+# 이 파일은 데이터의 상태를 변경하지 않는 'Query' 성격의 트리거 규칙 조회 로직을 담당합니다.
+
+from sqlalchemy.orm import Session
+from typing import List, Set
+from datetime import datetime
+
+from ..crud.trigger_rule_query_crud import trigger_rule_crud_query
+from ..schemas.trigger_rule_query import TriggerRuleRuntimeRead
+
+class TriggerRuleQueryService:
+    def get_active_rules(self, db: Session) -> List[TriggerRuleRuntimeRead]:
+        return [TriggerRuleRuntimeRead.model_validate(r) for r in trigger_rule_crud_query.get_active(db)]
+
+    def get_changed_rules(self, db: Session, *, since: datetime) -> List[TriggerRuleRuntimeRead]:
+        return [TriggerRuleRuntimeRead.model_validate(r) for r in trigger_rule_crud_query.get_changed_since(db, since=since)]
+
+    def get_active_rule_ids(self, db: Session) -> Set[int]:
+        return set(trigger_rule_crud_query.get_active_ids(db))
+
+trigger_rule_query_service = TriggerRuleQueryService()
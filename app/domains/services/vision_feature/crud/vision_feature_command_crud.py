@@ -0,0 +1,14 @@
+from sqlalchemy.orm import Session
+from typing import List
+
+from app.models.objects.vision_feature import VisionFeature
+from ..schemas.vision_feature_command import VisionFeatureCreate
+
+class CRUDVisionFeatureCommand:
+    def create_multiple(self, db: Session, *, obj_in_list: List[VisionFeatureCreate]) -> List[VisionFeature]:
+        db_objs = [VisionFeature(**obj_in.model_dump()) for obj_in in obj_in_list]
+        db.add_all(db_objs)
+        db.flush() # 색인에 id가 필요하므로 PK만 확보 (Commit은 Policy에서)
+        return db_objs
+
+vision_feature_crud_command = CRUDVisionFeatureCommand()
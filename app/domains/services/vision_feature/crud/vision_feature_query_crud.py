@@ -0,0 +1,58 @@
+# --- Query-related CRUD ---
+# 이 파일은 데이터의 상태를 변경하지 않고 DB에서 시각 특징값을 조회하는 'Query' CRUD 클래스를 정의합니다.
+
+from datetime import datetime
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from app.models.objects.vision_feature import VisionFeature
+
+class CRUDVisionFeatureQuery:
+    def get_model_versions(self, db: Session) -> List[str]:
+        return [row[0] for row in db.query(VisionFeature.model_version).distinct().all()]
+
+    def get_system_unit_id(self, db: Session, *, feature_id: int) -> Optional[int]:
+        return db.query(VisionFeature.system_unit_id).filter(VisionFeature.id == feature_id).scalar()
+
+    def filter_ids_in_windows(
+        self, db: Session, *, feature_ids: Sequence[int], windows: Dict[int, Tuple[datetime, Optional[datetime]]]
+    ) -> Set[int]:
+        """
+        feature_ids 중 유닛별 소유 기간 [start, end] 안에서 생성된 특징값의 id만 돌려줍니다.
+        windows: {system_unit_id: (start, end)} — end가 None이면 현재까지 소유 중입니다.
+        """
+        if not feature_ids or not windows:
+            return set()
+        conditions = []
+        for unit_id, (start, end) in windows.items():
+            clauses = [VisionFeature.system_unit_id == unit_id, VisionFeature.created_at >= start]
+            if end is not None:
+                clauses.append(VisionFeature.created_at <= end)
+            conditions.append(and_(*clauses))
+        rows = db.query(VisionFeature.id).filter(VisionFeature.id.in_(list(feature_ids)), or_(*conditions)).all()
+        return {row[0] for row in rows}
+
+    def stream_vectors(
+        self, db: Session, *, model_version: str, after_id: int = 0, batch_size: int = 5000
+    ) -> Iterator[List[Tuple[int, int, Any]]]:
+        """
+        (id, system_unit_id, vector_data) 튜플을 id 오름차순으로 batch_size씩 흘려보냅니다.
+        ORM 객체를 만들지 않고 서버 사이드 커서(yield_per)로 읽으므로 테이블 크기와 무관하게 메모리가 일정합니다.
+        """
+        query = (
+            db.query(VisionFeature.id, VisionFeature.system_unit_id, VisionFeature.vector_data)
+            .filter(VisionFeature.model_version == model_version, VisionFeature.id > after_id)
+            .order_by(VisionFeature.id.asc())
+            .execution_options(stream_results=True, yield_per=batch_size)
+        )
+        batch: List[Tuple[int, int, Any]] = []
+        for row in query:
+            batch.append((row.id, row.system_unit_id, row.vector_data))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+vision_feature_crud_query = CRUDVisionFeatureQuery()
@@ -0,0 +1,282 @@
+import fcntl
+import json
+import os
+import re
+import shutil
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# vector_data(JSONB) 안에서 임베딩 배열을 찾을 키 (앞에서부터 우선)
+VECTOR_KEYS = ("embedding", "vector", "features")
+
+_META_FILE = "meta.json"
+_VECTORS_FILE = "vectors.f32"
+_IDS_FILE = "ids.i64"
+_UNITS_FILE = "units.i64"
+
+def extract_vector(vector_data: Any) -> Optional[List[float]]:
+    """
+    VisionFeature.vector_data에서 임베딩 배열을 꺼냅니다.
+    BBox 목록 등 벡터가 아닌 특징값은 None을 반환하여 색인 대상에서 제외합니다.
+    """
+    if isinstance(vector_data, list):
+        candidate = vector_data
+    elif isinstance(vector_data, dict):
+        candidate = next((vector_data[k] for k in VECTOR_KEYS if isinstance(vector_data.get(k), list)), None)
+    else:
+        candidate = None
+    if not candidate or not all(isinstance(v, (int, float)) for v in candidate):
+        return None
+    return candidate
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
+
+class VectorIndex:
+    """
+    하나의 model_version에 대한 브루트포스 코사인 색인입니다.
+
+    디스크 구성 (`{base_dir}/{model_version}/`):
+    - vectors.f32: L2 정규화된 float32 행렬 (row-major, 행 = 특징 1건) → np.memmap으로 읽습니다.
+    - ids.i64 / units.i64: 각 행의 vision_features.id / system_unit_id 사이드카
+    - meta.json: dim, count, last_feature_id (색인된 최대 id)
+
+    id는 커밋 순서대로 들어오므로 행 순서가 id 오름차순이라는 보장은 없습니다. (늦게 커밋된 작은 id)
+    중복 여부는 last_feature_id가 아니라 색인된 id 집합으로 판단합니다.
+
+    append는 데이터 파일을 먼저 쓰고 meta.json을 원자적으로 교체(os.replace)하므로,
+    다른 프로세스의 리더는 meta의 count만큼만 매핑하여 쓰다 만 행을 보지 않습니다.
+    프로세스 간 쓰기는 파일 잠금(flock)으로 직렬화합니다.
+    """
+    def __init__(self, base_dir: str, model_version: str):
+        self.model_version = model_version
+        safe_name = re.sub(r"[^A-Za-z0-9._-]", "_", model_version)
+        self.path = os.path.join(base_dir, safe_name)
+        self._lock_path = os.path.join(base_dir, f".{safe_name}.lock")
+        self._thread_lock = threading.Lock()
+        self._cached_meta_mtime: Optional[float] = None
+        self._cached: Optional[Tuple[Dict[str, Any], Optional[np.memmap], Optional[np.memmap], Optional[np.memmap]]] = None
+
+    # --- 메타/잠금 ---
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        os.makedirs(os.path.dirname(self._lock_path), exist_ok=True)
+        with self._thread_lock, open(self._lock_path, "a+") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_meta(self, path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        meta_path = os.path.join(path or self.path, _META_FILE)
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_meta(self, meta: Dict[str, Any], path: Optional[str] = None) -> None:
+        target = os.path.join(path or self.path, _META_FILE)
+        tmp = f"{target}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, target)
+
+    def get_meta(self) -> Optional[Dict[str, Any]]:
+        return self._read_meta()
+
+    # --- 쓰기 ---
+
+    def _append_rows(self, path: str, meta: Optional[Dict[str, Any]], rows: Sequence[Tuple[int, int, Sequence[float]]]) -> Dict[str, Any]:
+        """행을 파일 끝에 덧붙이고 갱신된 meta를 반환합니다. (호출자가 잠금 보유)"""
+        dim = meta["dim"] if meta else len(rows[0][2])
+        count = meta["count"] if meta else 0
+        last_id = meta["last_feature_id"] if meta else 0
+
+        accepted = [r for r in rows if len(r[2]) == dim]
+        # last_feature_id 이하의 id만 이미 색인되었을 수 있으므로, 그런 행이 있을 때만 id 사이드카와 대조합니다.
+        if count and any(r[0] <= last_id for r in accepted):
+            indexed = np.fromfile(os.path.join(path, _IDS_FILE), dtype=np.int64, count=count)
+            candidate_ids = np.asarray([r[0] for r in accepted], dtype=np.int64)
+            fresh = ~np.isin(candidate_ids, indexed)
+            accepted = [r for r, keep in zip(accepted, fresh) if keep]
+        # 같은 묶음 안의 중복 id는 첫 행만 씁니다.
+        unique: Dict[int, Tuple[int, int, Sequence[float]]] = {}
+        for r in accepted:
+            unique.setdefault(r[0], r)
+        accepted = list(unique.values())
+        if not accepted:
+            return meta or {"model_version": self.model_version, "dim": dim, "count": 0, "last_feature_id": 0}
+
+        matrix = _normalize(np.asarray([r[2] for r in accepted], dtype=np.float32))
+        ids = np.asarray([r[0] for r in accepted], dtype=np.int64)
+        units = np.asarray([r[1] for r in accepted], dtype=np.int64)
+
+        os.makedirs(path, exist_ok=True)
+        for name, array, row_bytes in (
+            (_VECTORS_FILE, matrix, dim * 4),
+            (_IDS_FILE, ids, 8),
+            (_UNITS_FILE, units, 8),
+        ):
+            with open(os.path.join(path, name), "ab") as f:
+                # 이전 append가 meta 갱신 전에 중단되었다면 꼬리 부분을 잘라내고 이어 씁니다.
+                f.truncate(count * row_bytes)
+                f.seek(count * row_bytes)
+                f.write(array.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+        new_meta = {
+            "model_version": self.model_version,
+            "dim": dim,
+            "count": count + len(accepted),
+            "last_feature_id": max(last_id, int(ids.max())),
+        }
+        self._write_meta(new_meta, path)
+        return new_meta
+
+    def append(self, rows: Sequence[Tuple[int, int, Sequence[float]]]) -> int:
+        """
+        (feature_id, system_unit_id, vector) 행들을 증분 추가합니다.
+        이미 색인된 id나 차원이 다른 벡터는 무시합니다. 추가된 행 수를 반환합니다.
+        """
+        rows = sorted(rows, key=lambda r: r[0])
+        if not rows:
+            return 0
+        with self._write_lock():
+            before = self._read_meta()
+            after = self._append_rows(self.path, before, rows)
+        return after["count"] - (before["count"] if before else 0)
+
+    def rebuild(self, batches: Iterable[Sequence[Tuple[int, int, Sequence[float]]]]) -> Dict[str, Any]:
+        """
+        전체 재구축: 임시 디렉터리에 새로 쓴 뒤 교체합니다. 재구축 중에도 기존 색인으로 질의할 수 있습니다.
+        `batches`는 feature_id 오름차순이어야 합니다.
+        """
+        tmp_path = f"{self.path}.rebuild-{os.getpid()}"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        meta: Optional[Dict[str, Any]] = None
+        for batch in batches:
+            if batch:
+                meta = self._append_rows(tmp_path, meta, batch)
+
+        with self._write_lock():
+            old_path = f"{self.path}.old-{os.getpid()}"
+            if os.path.exists(self.path):
+                os.replace(self.path, old_path)
+            if meta is not None:
+                os.replace(tmp_path, self.path)
+            shutil.rmtree(old_path, ignore_errors=True)
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        return meta or {"model_version": self.model_version, "dim": 0, "count": 0, "last_feature_id": 0}
+
+    # --- 읽기 ---
+
+    def _open(self):
+        """meta가 바뀌었을 때만 memmap을 다시 엽니다."""
+        meta_path = os.path.join(self.path, _META_FILE)
+        try:
+            mtime = os.stat(meta_path).st_mtime_ns
+        except FileNotFoundError:
+            self._cached, self._cached_meta_mtime = None, None
+            return None
+        if self._cached is not None and mtime == self._cached_meta_mtime:
+            return self._cached
+
+        meta = self._read_meta()
+        count, dim = meta["count"], meta["dim"]
+        if count == 0:
+            opened = (meta, None, None, None)
+        else:
+            opened = (
+                meta,
+                np.memmap(os.path.join(self.path, _VECTORS_FILE), dtype=np.float32, mode="r", shape=(count, dim)),
+                np.memmap(os.path.join(self.path, _IDS_FILE), dtype=np.int64, mode="r", shape=(count,)),
+                np.memmap(os.path.join(self.path, _UNITS_FILE), dtype=np.int64, mode="r", shape=(count,)),
+            )
+        self._cached, self._cached_meta_mtime = opened, mtime
+        return opened
+
+    def search(
+        self,
+        query: Sequence[float],
+        *,
+        top_k: int,
+        system_unit_ids: Optional[Sequence[int]] = None,
+        exclude_ids: Optional[Sequence[int]] = None,
+        block_rows: int = 65536,
+    ) -> List[Tuple[int, int, float]]:
+        """
+        코사인 유사도 상위 k개의 (feature_id, system_unit_id, score)를 내림차순으로 반환합니다.
+        행렬을 block_rows 단위로 나누어 내적하므로 색인 크기와 무관하게 메모리 사용량이 일정합니다.
+        """
+        opened = self._open()
+        if opened is None or opened[1] is None or top_k <= 0:
+            return []
+        meta, vectors, ids, units = opened
+        q = np.asarray(query, dtype=np.float32)
+        if q.shape != (meta["dim"],):
+            raise ValueError(f"Query dimension {q.shape[0] if q.ndim else 0} does not match index dimension {meta['dim']}.")
+        norm = float(np.linalg.norm(q))
+        if norm == 0:
+            return []
+        q = q / norm
+
+        unit_filter = np.asarray(sorted(set(system_unit_ids)), dtype=np.int64) if system_unit_ids else None
+        excluded = np.asarray(sorted(set(exclude_ids)), dtype=np.int64) if exclude_ids else None
+
+        best_scores = np.empty(0, dtype=np.float32)
+        best_rows = np.empty(0, dtype=np.int64)
+        for start in range(0, meta["count"], block_rows):
+            end = min(start + block_rows, meta["count"])
+            mask = np.ones(end - start, dtype=bool)
+            if unit_filter is not None:
+                mask &= np.isin(units[start:end], unit_filter)
+            if excluded is not None:
+                mask &= ~np.isin(ids[start:end], excluded)
+            rows = np.nonzero(mask)[0]
+            if rows.size == 0:
+                continue
+            scores = vectors[start:end][rows] @ q
+
+            best_scores = np.concatenate([best_scores, scores])
+            best_rows = np.concatenate([best_rows, rows + start])
+            if best_scores.size > top_k:
+                keep = np.argpartition(-best_scores, top_k - 1)[:top_k]
+                best_scores, best_rows = best_scores[keep], best_rows[keep]
+
+        order = np.argsort(-best_scores)
+        return [(int(ids[r]), int(units[r]), float(s)) for r, s in zip(best_rows[order], best_scores[order])]
+
+    def get_vector(self, feature_id: int) -> Optional[np.ndarray]:
+        """이미 색인된 특징의 정규화 벡터를 반환합니다. (ids는 커밋 순서이므로 선형 탐색)"""
+        opened = self._open()
+        if opened is None or opened[1] is None:
+            return None
+        _, vectors, ids, _ = opened
+        positions = np.flatnonzero(ids == feature_id)
+        if positions.size:
+            return np.array(vectors[positions[0]])
+        return None
+
+class VectorIndexStore:
+    """model_version → VectorIndex 레지스트리 (프로세스당 1개)."""
+    def __init__(self, base_dir: str):
+        self.base_dir = base_dir
+        self._indexes: Dict[str, VectorIndex] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model_version: str) -> VectorIndex:
+        with self._lock:
+            index = self._indexes.get(model_version)
+            if index is None:
+                index = self._indexes[model_version] = VectorIndex(self.base_dir, model_version)
+            return index
@@ -0,0 +1,10 @@
+from pydantic import BaseModel, Field
+from typing import Dict, Any
+
+class VisionFeatureCreate(BaseModel):
+    image_id: int
+    snapshot_id: str
+    system_unit_id: int
+    device_id: int
+    vector_data: Dict[str, Any]
+    model_version: str = Field(..., max_length=50)
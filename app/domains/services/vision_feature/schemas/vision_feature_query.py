@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
+
+class VisionSimilarityQuery(BaseModel):
+    """
+    유사 특징 검색 조건. 기준 벡터(query_vector) 또는 이미 저장된 특징(feature_id) 중 하나를 지정합니다.
+    """
+    model_version: str
+    query_vector: Optional[List[float]] = None
+    feature_id: Optional[int] = None
+    top_k: int = Field(10, ge=1)
+    system_unit_ids: Optional[List[int]] = None
+
+    @model_validator(mode="after")
+    def _require_query_source(self):
+        if (self.query_vector is None) == (self.feature_id is None):
+            raise ValueError("Exactly one of 'query_vector' or 'feature_id' must be provided.")
+        return self
+
+class SimilarFeatureRead(BaseModel):
+    feature_id: int
+    system_unit_id: int
+    score: float
@@ -0,0 +1,15 @@
+from sqlalchemy.orm import Session
+from typing import List
+
+from app.models.objects.vision_feature import VisionFeature
+from ..crud.vision_feature_command_crud import vision_feature_crud_command
+from ..schemas.vision_feature_command import VisionFeatureCreate
+
+class VisionFeatureCommandService:
+    def create_features(self, db: Session, *, obj_in_list: List[VisionFeatureCreate]) -> List[VisionFeature]:
+        if not obj_in_list:
+            return []
+        # [DESIGN PRINCIPLE] 트랜잭션 커밋은 Policy에서 제어하므로 CRUD만 호출
+        return vision_feature_crud_command.create_multiple(db, obj_in_list=obj_in_list)
+
+vision_feature_command_service = VisionFeatureCommandService()
@@ -0,0 +1,133 @@
+# --- Query-related Service ---
+# 이 파일은 시각 특징값의 유사도 검색(벡터 색인 조회/동기화)을 담당합니다.
+
+import logging
+from datetime import datetime
+from sqlalchemy.orm import Session
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.core.exceptions import AccessDeniedError, NotFoundError, ValidationError
+from ..crud.vision_feature_query_crud import vision_feature_crud_query
+from ..managers.vector_index import VectorIndexStore, extract_vector
+from ..schemas.vision_feature_query import VisionSimilarityQuery, SimilarFeatureRead
+
+logger = logging.getLogger(__name__)
+
+def _to_rows(batch: Iterable[Tuple[int, int, Any]]) -> List[Tuple[int, int, List[float]]]:
+    rows = []
+    for feature_id, system_unit_id, vector_data in batch:
+        vector = extract_vector(vector_data)
+        if vector is not None:
+            rows.append((feature_id, system_unit_id, vector))
+    return rows
+
+class VisionFeatureQueryService:
+    """
+    model_version별 memmap 벡터 색인을 관리하고 코사인 top-k 검색을 제공합니다.
+    색인은 파생 데이터이므로 DB(vision_features)가 원본이며, 언제든 rebuild_index로 재구축할 수 있습니다.
+    색인 쓰기는 수집 경로(append_features)와 리더의 주기 동기화(sync_index)만 수행하고, 검색은 읽기만 합니다.
+    """
+    def __init__(self):
+        self.store = VectorIndexStore(settings.VECTOR_INDEX_DIR)
+
+    def append_features(self, rows: Sequence[Tuple[int, int, str, Any]]) -> int:
+        """
+        커밋이 끝난 특징값 (id, system_unit_id, model_version, vector_data)을 색인에 덧붙입니다.
+        롤백된 id가 색인에 남지 않도록 커밋 이후에 호출하되, 커밋으로 만료된 ORM 객체를 다시 읽지 않도록
+        값은 커밋 전에 튜플로 떠 두어야 합니다.
+        """
+        by_version: Dict[str, List[Tuple[int, int, Any]]] = {}
+        for feature_id, system_unit_id, model_version, vector_data in rows:
+            by_version.setdefault(model_version, []).append((feature_id, system_unit_id, vector_data))
+        appended = 0
+        for model_version, batch in by_version.items():
+            appended += self.store.get(model_version).append(_to_rows(batch))
+        return appended
+
+    def sync_index(self, db: Session, *, model_version: str) -> int:
+        """
+        색인의 last_feature_id 근처부터 DB에 생긴 특징값을 따라잡습니다.
+        id는 커밋 순서와 다르게 발급되므로(작은 id가 늦게 커밋), 워터마크 아래 VECTOR_INDEX_SYNC_TRAILING_IDS 구간을
+        다시 읽고 이미 색인된 id는 append가 걸러냅니다.
+        """
+        index = self.store.get(model_version)
+        meta = index.get_meta()
+        after_id = max(0, meta["last_feature_id"] - settings.VECTOR_INDEX_SYNC_TRAILING_IDS) if meta else 0
+        appended = 0
+        for batch in vision_feature_crud_query.stream_vectors(db, model_version=model_version, after_id=after_id):
+            appended += index.append(_to_rows(batch))
+        return appended
+
+    def rebuild_index(self, db: Session, *, model_version: str) -> Dict[str, Any]:
+        index = self.store.get(model_version)
+        batches = (_to_rows(b) for b in vision_feature_crud_query.stream_vectors(db, model_version=model_version))
+        meta = index.rebuild(batches)
+        logger.info(f"🧭 Vector index rebuilt for '{model_version}': {meta['count']} vector(s), dim={meta['dim']}")
+        return meta
+
+    def get_model_versions(self, db: Session) -> List[str]:
+        return vision_feature_crud_query.get_model_versions(db)
+
+    def get_feature_unit_id(self, db: Session, *, feature_id: int) -> Optional[int]:
+        return vision_feature_crud_query.get_system_unit_id(db, feature_id=feature_id)
+
+    def search_similar(
+        self,
+        db: Session,
+        *,
+        query: VisionSimilarityQuery,
+        possession_windows: Optional[Dict[int, Tuple[datetime, Optional[datetime]]]] = None
+    ) -> List[SimilarFeatureRead]:
+        """
+        색인에서 top-k를 검색합니다. 색인에 아직 반영되지 않은 최신 특징값은 다음 동기화 이후 검색됩니다.
+        possession_windows({유닛: (소유 시작, 소유 종료)})가 주어지면 그 기간에 생성된 특징값만 돌려주며,
+        걸러질 몫을 감안해 후보를 넉넉히 뽑고 부족하면 VECTOR_INDEX_MAX_CANDIDATES까지 늘려 다시 뽑습니다.
+        """
+        index = self.store.get(query.model_version)
+        top_k = min(query.top_k, settings.VECTOR_INDEX_MAX_TOP_K)
+
+        exclude_ids = None
+        if query.feature_id is not None:
+            vector = index.get_vector(query.feature_id)
+            if vector is None:
+                raise NotFoundError("VisionFeature", query.feature_id)
+            if possession_windows is not None and not vision_feature_crud_query.filter_ids_in_windows(
+                db, feature_ids=[query.feature_id], windows=possession_windows
+            ):
+                raise AccessDeniedError("기준 특징값이 소유 기간 밖에서 생성되었습니다.")
+            query_vector = vector
+            exclude_ids = [query.feature_id]
+        else:
+            query_vector = query.query_vector
+
+        system_unit_ids = query.system_unit_ids
+        if possession_windows is not None:
+            system_unit_ids = list(possession_windows)
+
+        fetch = top_k if possession_windows is None else top_k * settings.VECTOR_INDEX_POSSESSION_OVERFETCH
+        while True:
+            try:
+                hits = index.search(
+                    query_vector,
+                    top_k=fetch,
+                    system_unit_ids=system_unit_ids,
+                    exclude_ids=exclude_ids,
+                    block_rows=settings.VECTOR_INDEX_QUERY_BLOCK_ROWS,
+                )
+            except ValueError as e:
+                raise ValidationError(str(e))
+            if possession_windows is None:
+                break
+            allowed = vision_feature_crud_query.filter_ids_in_windows(
+                db, feature_ids=[f for f, _, _ in hits], windows=possession_windows
+            )
+            kept = [hit for hit in hits if hit[0] in allowed]
+            # 후보가 바닥났거나(요청보다 적게 나옴) 상한에 닿았으면 더 뽑아도 늘지 않습니다.
+            if len(kept) >= top_k or len(hits) < fetch or fetch >= settings.VECTOR_INDEX_MAX_CANDIDATES:
+                hits = kept
+                break
+            fetch = min(fetch * 2, settings.VECTOR_INDEX_MAX_CANDIDATES)
+        return [SimilarFeatureRead(feature_id=f, system_unit_id=u, score=s) for f, u, s in hits[:top_k]]
+
+vision_feature_query_service = VisionFeatureQueryService()
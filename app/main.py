@@ -7,14 +7,27 @@ from fastapi.responses import JSONResponse
 from typing import Optional
 
 from app.core.config import get_settings
-from app.database import SessionLocal
-from app.core.redis_client import get_redis_client 
+from app.database import SessionLocal, async_engine, async_replica_engines
+from app.core.db_pool import pool_monitor
+from app.core.query_stats import QueryStatsMiddleware, query_metrics
+from app.core.registry import app_registry
+from app.core.redis_client import redis_client
+from app.core.leader_election import LeaderElector
 from app.core.exceptions import ForbiddenError, AppLogicError
 
 # --- Domain Modules ---
 from app.domains.application.mqtt.orchestrator import MqttLifecycleOrchestrator
+from app.domains.application.scheduler.schedule_executor import ScheduleExecutor
+from app.domains.application.trigger.trigger_engine import TriggerEngine
+from app.domains.application.command_fanout.command_fanout_engine import CommandFanoutEngine
+from app.domains.services.command_dispatch.repositories.command_relay_repository import CommandRelayRepository
 from app.domains.inter_domain.governance.governance_query_provider import governance_query_provider
 from app.domains.inter_domain.governance.governance_command_provider import governance_command_provider
+from app.domains.inter_domain.telemetry.telemetry_command_provider import telemetry_command_provider
+from app.domains.inter_domain.batch_tracker.batch_status_command_provider import batch_status_command_provider
+from app.domains.inter_domain.vision_feature.vision_feature_query_provider import vision_feature_query_provider
+from app.domains.inter_domain.certificate_management.certificate_command_provider import device_certificate_pool
+from app.domains.services.realtime.managers.realtime_hub import realtime_hub
 
 # --- Routers ---
 from app.api.v1.api import api_router
@@ -25,7 +38,16 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 _mqtt_orchestrator: Optional[MqttLifecycleOrchestrator] = None
+_mqtt_startup_task: Optional[asyncio.Task] = None
+_leader_elector: Optional[LeaderElector] = None
+_command_relay: Optional[CommandRelayRepository] = None
 _governance_task: Optional[asyncio.Task] = None
+_partition_task: Optional[asyncio.Task] = None
+_batch_progress_task: Optional[asyncio.Task] = None
+_vector_index_task: Optional[asyncio.Task] = None
+_schedule_executor: Optional[ScheduleExecutor] = None
+_trigger_engine: Optional[TriggerEngine] = None
+_fanout_engine: Optional[CommandFanoutEngine] = None
 _background_tasks = set()
 
 async def _periodic_governance_check():
@@ -39,39 +61,217 @@ async def _periodic_governance_check():
             logger.error(f"Error during periodic governance check: {e}")
         await asyncio.sleep(600) # 10 minutes
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """서버의 시작과 종료 시 모든 핵심 인프라를 지휘합니다."""
-    logger.info("🚀Application starting up...")
-    
-    global _mqtt_orchestrator, _governance_task, _background_tasks
-    
+def _run_telemetry_partition_maintenance():
+    with SessionLocal() as db:
+        # 보존 정책보다 먼저 오래된 파티션을 콜드 스토리지로 옮깁니다. (파티션 1개 = 트랜잭션 1개)
+        while True:
+            archived = telemetry_command_provider.archive_next_partition(db)
+            db.commit()
+            if archived is None:
+                break
+            telemetry_command_provider.publish_archived_partition(archived["partition"])
+        report = telemetry_command_provider.maintain_partitions(db)
+        db.commit()
+        return report
+
+async def _periodic_telemetry_partition_maintenance():
+    """Periodically archives old telemetry_data partitions, creates upcoming ones and applies retention."""
+    while True:
+        try:
+            # DDL은 잠금을 기다릴 수 있으므로 이벤트 루프를 막지 않도록 스레드에서 수행합니다.
+            await asyncio.to_thread(_run_telemetry_partition_maintenance)
+        except Exception as e:
+            logger.error(f"Error during telemetry partition maintenance: {e}")
+        await asyncio.sleep(get_settings().TELEMETRY_PARTITION_MAINTENANCE_INTERVAL_SECONDS)
+
+def _run_batch_progress_flush() -> int:
+    """바뀐 배치 카운터를 묶음 단위로 batch_trackings에 반영합니다. 반영에 실패한 묶음은 다음 주기로 되돌립니다."""
+    limit = get_settings().BATCH_PROGRESS_FLUSH_MAX_BATCHES
+    flushed = 0
+    while True:
+        snapshots = batch_status_command_provider.collect_progress(limit=limit)
+        if not snapshots:
+            return flushed
+        try:
+            with SessionLocal() as db:
+                batch_status_command_provider.apply_progress(db, snapshots=snapshots)
+                db.commit()
+        except Exception:
+            batch_status_command_provider.requeue_progress([s.batch_id for s in snapshots])
+            raise
+        flushed += len(snapshots)
+        if len(snapshots) < limit:
+            return flushed
+
+async def _periodic_batch_progress_flush():
+    """Periodically flushes Redis batch progress counters to batch_trackings."""
+    while True:
+        try:
+            await asyncio.to_thread(_run_batch_progress_flush)
+        except Exception as e:
+            logger.error(f"Error during batch progress flush: {e}")
+        await asyncio.sleep(get_settings().BATCH_PROGRESS_FLUSH_INTERVAL_SECONDS)
+
+def _run_vector_index_sync() -> int:
+    """수집 경로의 색인 추가(append_to_index)가 놓친 특징값을 model_version별로 따라잡습니다."""
+    appended = 0
+    with SessionLocal() as db:
+        for model_version in vision_feature_query_provider.get_model_versions(db):
+            appended += vision_feature_query_provider.sync_index(db, model_version=model_version)
+    return appended
+
+async def _periodic_vector_index_sync():
+    """Periodically catches the vector index up with vision_features (search requests never write the index)."""
+    while True:
+        try:
+            appended = await asyncio.to_thread(_run_vector_index_sync)
+            if appended:
+                logger.info(f"🧭 Vector index sync appended {appended} feature(s)")
+        except Exception as e:
+            logger.error(f"Error during vector index sync: {e}")
+        await asyncio.sleep(get_settings().VECTOR_INDEX_SYNC_INTERVAL_SECONDS)
+
+async def _start_leader_tasks():
+    """싱글턴 백그라운드 루프(MQTT 퍼블리셔/인증서 로테이션, 거버넌스, 파티션 유지보수, 배치 진행률 반영, 벡터 색인 동기화, 스케줄러, 트리거 엔진, 명령 팬아웃)를 기동합니다."""
+    global _mqtt_orchestrator, _mqtt_startup_task, _governance_task, _schedule_executor, _trigger_engine, _partition_task, _fanout_engine, _batch_progress_task, _vector_index_task
+
     # 1. MQTT Orchestrator 초기화 및 기동
     _mqtt_orchestrator = MqttLifecycleOrchestrator(
         settings=get_settings(),
-        db_session_factory=SessionLocal
+        db_session_factory=SessionLocal,
+        command_relay=_command_relay
     )
-    mqtt_startup_task = asyncio.create_task(_mqtt_orchestrator.startup())
-    _background_tasks.add(mqtt_startup_task)
-    mqtt_startup_task.add_done_callback(_background_tasks.discard)
+    _mqtt_startup_task = asyncio.create_task(_mqtt_orchestrator.startup())
+    _background_tasks.add(_mqtt_startup_task)
+    _mqtt_startup_task.add_done_callback(_background_tasks.discard)
 
     # 2. 주기적 거버넌스 체크 백그라운드 태스크 시작
     _governance_task = asyncio.create_task(_periodic_governance_check())
-    
-    logger.info("✅ All background tasks and MQTT infrastructure are operational.")
-    yield # 서버가 요청을 처리하는 시점
 
-    logger.info("🛑Application shutting down...")
-    
-    # 3. 자원 정리 (Graceful Shutdown)
+    # 2-1. 텔레메트리 파티션 유지보수 (미래 파티션 생성 / 보존 기간 정리, 워커 간 advisory lock으로 1곳만 수행)
+    _partition_task = asyncio.create_task(_periodic_telemetry_partition_maintenance())
+
+    # 2-2. 배치 진행 카운터(Redis) -> batch_trackings 일괄 반영
+    _batch_progress_task = asyncio.create_task(_periodic_batch_progress_flush())
+
+    # 2-3. 벡터 색인 동기화 (검색 경로는 색인을 읽기만 하므로 누락분 보정은 여기서만 수행)
+    _vector_index_task = asyncio.create_task(_periodic_vector_index_sync())
+
+    # 3. 스케줄 실행기 기동 (활성 스케줄 적재 후 타이머 휠 루프 시작)
+    if get_settings().SCHEDULER_ENABLED:
+        _schedule_executor = ScheduleExecutor(settings=get_settings(), db_session_factory=SessionLocal)
+        await _schedule_executor.start()
+
+    # 3-1. 트리거 엔진 기동 (수신 프로세스들이 넘긴 평가 입력을 한 곳에서 평가/기록/발행)
+    if get_settings().TRIGGER_ENGINE_ENABLED:
+        _trigger_engine = TriggerEngine(settings=get_settings(), db_session_factory=SessionLocal)
+        await _trigger_engine.start()
+
+    # 4. 명령 팬아웃 엔진 기동 (대상 집합 명령을 속도/in-flight 한도에 맞춰 발행)
+    if get_settings().COMMAND_FANOUT_ENABLED:
+        _fanout_engine = CommandFanoutEngine(settings=get_settings(), db_session_factory=SessionLocal)
+        await _fanout_engine.start()
+
+async def _stop_leader_tasks():
+    """_start_leader_tasks로 기동한 루프를 정리합니다. (종료 또는 리더 강등 시)"""
+    global _mqtt_orchestrator, _mqtt_startup_task, _governance_task, _schedule_executor, _trigger_engine, _partition_task, _fanout_engine, _batch_progress_task, _vector_index_task
+
     if _governance_task:
         _governance_task.cancel()
+        _governance_task = None
         logger.info("Governance task cancelled.")
+
+    if _partition_task:
+        _partition_task.cancel()
+        _partition_task = None
+
+    # 반영되지 않은 카운터는 Redis에 남아 있으므로 다음 리더가 이어서 반영합니다.
+    if _batch_progress_task:
+        _batch_progress_task.cancel()
+        _batch_progress_task = None
+
+    if _vector_index_task:
+        _vector_index_task.cancel()
+        _vector_index_task = None
+
+    if _schedule_executor:
+        await _schedule_executor.stop()
+        _schedule_executor = None
+
+    if _trigger_engine:
+        await _trigger_engine.stop()
+        _trigger_engine = None
+
+    if _fanout_engine:
+        await _fanout_engine.stop()
+        _fanout_engine = None
+
+    if _mqtt_startup_task and not _mqtt_startup_task.done():
+        _mqtt_startup_task.cancel()
+    _mqtt_startup_task = None
         
     if _mqtt_orchestrator:
         await _mqtt_orchestrator.shutdown()
+        _mqtt_orchestrator = None
         logger.info("MQTT Orchestrator shut down successfully.")
 
+    # 직접 발행 경로를 내려놓고 (리더 선출 중이라면) 릴레이 경로로 되돌립니다.
+    app_registry.command_dispatch_repository = _command_relay
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버의 시작과 종료 시 모든 핵심 인프라를 지휘합니다."""
+    logger.info("🚀Application starting up...")
+    
+    global _leader_elector, _command_relay
+
+    # 0. 외부 서비스 클라이언트(Redis, Vault) 선생성. import 시점에는 연결하지 않으므로 여기서 미리 인증/연결합니다.
+    warm_up = [name.strip() for name in get_settings().REGISTRY_WARM_UP_COMPONENTS.split(",") if name.strip()]
+    if warm_up:
+        await asyncio.to_thread(app_registry.warm_up, warm_up)
+    
+    # 0-1. 공장 등록용 장치 인증서 선발급 풀 (DEVICE_CERT_POOL_SIZE > 0)
+    device_certificate_pool.start()
+
+    # 0-2. WebSocket 실시간 허브 (워커마다 1개, 리스너가 전파한 기기 상태를 구독자에게 전달)
+    if get_settings().REALTIME_WS_ENABLED:
+        await realtime_hub.start()
+
+    # 1. 싱글턴 루프 기동: 리더 선출이 켜져 있으면 Redis 락을 얻은 워커 1곳에서만 실행합니다.
+    #    리더가 아닌 워커의 MQTT 명령은 릴레이 큐를 거쳐 리더의 연결로 발행됩니다.
+    if get_settings().LEADER_ELECTION_ENABLED:
+        _command_relay = CommandRelayRepository(settings=get_settings(), redis_client=redis_client)
+        app_registry.command_dispatch_repository = _command_relay
+        _leader_elector = LeaderElector(
+            redis_client,
+            key=get_settings().LEADER_ELECTION_KEY,
+            lease_seconds=get_settings().LEADER_LEASE_SECONDS,
+            renew_interval_seconds=get_settings().LEADER_RENEW_INTERVAL_SECONDS,
+            on_elected=_start_leader_tasks,
+            on_demoted=_stop_leader_tasks,
+        )
+        await _leader_elector.start()
+    else:
+        await _start_leader_tasks()
+    
+    logger.info("✅ All background tasks and MQTT infrastructure are operational.")
+    yield # 서버가 요청을 처리하는 시점
+
+    logger.info("🛑Application shutting down...")
+    
+    # 4. 자원 정리 (Graceful Shutdown) - 리더였다면 락을 해제해 다른 워커가 바로 이어받습니다.
+    if _leader_elector:
+        await _leader_elector.stop()
+    else:
+        await _stop_leader_tasks()
+
+    await realtime_hub.stop()
+    device_certificate_pool.stop()
+    await async_engine.dispose()
+    for async_replica in async_replica_engines:
+        await async_replica.dispose()
+    app_registry.shutdown()
+
 app = FastAPI(
     title="Ares4 Server v2",
     lifespan=lifespan,
@@ -111,6 +311,10 @@ app.add_middleware(
     expose_headers=["DPoP-Nonce", "dpop-nonce"], 
 )
 
+# 요청별 쿼리 수/DB 시간/N+1 집계 (디버그 모드에서는 응답 헤더로도 노출)
+if get_settings().QUERY_STATS_ENABLED:
+    app.add_middleware(QueryStatsMiddleware, expose_headers=get_settings().QUERY_STATS_HEADERS)
+
 # 1. 기본 API 라우터 등록
 app.include_router(api_router, prefix="/api/v1")
 
@@ -127,9 +331,35 @@ async def read_root():
 async def health_check():
     return {"status": "ok"}
 
+@app.get("/health/db-pool")
+async def db_pool_health_check():
+    """
+    이 프로세스의 DB 커넥션 풀 지표 (primary / replica-N / async).
+    checked_out·overflow가 size+max_overflow에 붙어 있고 timeouts·wait_ms_p95가 오르면 풀 고갈 상태입니다.
+    """
+    return pool_monitor.snapshot()
+
+@app.get("/health/db-queries")
+async def db_queries_health_check():
+    """라우트/MQTT 토픽별 쿼리 수·DB 시간과 N+1 의심(같은 쿼리 반복) 횟수."""
+    return query_metrics.snapshot()
+
+@app.get("/health/components")
+async def components_health_check():
+    """레지스트리 컴포넌트(Redis, Vault, MQTT 퍼블리셔 등)별 생성 여부."""
+    return app_registry.snapshot()
+
+@app.get("/health/realtime")
+async def realtime_health_check():
+    """이 워커의 WebSocket 연결/구독 기기 수와 느린 연결 퇴출 횟수."""
+    return realtime_hub.snapshot()
+
 @app.get("/health/mqtt", status_code=status.HTTP_200_OK)
 async def mqtt_health_check():
     global _mqtt_orchestrator
+    if _leader_elector and not _leader_elector.is_leader:
+        # 리더가 아닌 워커는 자체 브로커 연결 없이 릴레이 큐로 발행합니다.
+        return {"status": "mqtt_relay", "leader": False}
     if _mqtt_orchestrator and _mqtt_orchestrator.is_publisher_connected():
         return {"status": "mqtt_connected"}
     else:
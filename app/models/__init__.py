@@ -46,10 +46,13 @@ from .events_logs.firmware_update import FirmwareUpdate
 from .events_logs.consumable_usage_log import ConsumableUsageLog
 from .events_logs.alert_event import AlertEvent
 from .events_logs.telemetry_metadata import TelemetryMetadata
+from .events_logs.telemetry_rollup import TelemetryRollupMinute, TelemetryRollupHour, TelemetryRollupDay
+from .events_logs.device_metric_latest import DeviceMetricLatest
 from .events_logs.unit_activity_log import UnitActivityLog
 from .events_logs.user_consumable import UserConsumable
 from .events_logs.observation_snapshot import ObservationSnapshot
 from .events_logs.batch_tracking import BatchTracking
+from .events_logs.command_delivery import CommandDispatch, CommandDelivery
 
 from .internal.internal_asset_definition import InternalAssetDefinition
 from .internal.internal_asset_inventory import InternalAssetInventory
@@ -110,6 +113,8 @@ __all__ = [
     "UnitActivityLog",
     "ObservationSnapshot",
     "BatchTracking",
+    "CommandDispatch",
+    "CommandDelivery",
 
     "InternalAssetDefinition",
     "InternalAssetInventory",
@@ -0,0 +1,82 @@
+import enum
+from sqlalchemy import BigInteger, String, DateTime, ForeignKey, Integer, Float, Enum, Index
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Mapped, mapped_column
+from typing import Optional, Dict
+from datetime import datetime
+
+from app.database import Base
+from ..base_model import TimestampMixin, DeviceFKMixin, NullableUserFKMixin
+
+class CommandTargetType(str, enum.Enum):
+    SYSTEM_UNIT = "SYSTEM_UNIT"
+    PRODUCT_LINE = "PRODUCT_LINE"
+    ORGANIZATION = "ORGANIZATION"
+
+class CommandDispatchStatus(str, enum.Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    CANCELLED = "CANCELLED"
+
+class CommandDeliveryStatus(str, enum.Enum):
+    QUEUED = "QUEUED"    # 발행 대기
+    SENT = "SENT"        # 브로커로 발행됨 (응답 대기 = in-flight)
+    ACKED = "ACKED"      # 기기가 성공 응답
+    FAILED = "FAILED"    # 기기가 실패 응답
+    TIMEOUT = "TIMEOUT"  # ack_timeout_seconds 안에 응답 없음
+
+class CommandDispatch(Base, TimestampMixin, NullableUserFKMixin):
+    """
+    [Event/Log] 대상 집합(유닛/제품군/조직)에 대한 명령 팬아웃 작업:
+    발행 속도·동시 in-flight 한도·응답 대기 시간과 전체 진행 상태를 관리합니다.
+    """
+    __tablename__ = "command_dispatches"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, index=True)
+
+    target_type: Mapped[CommandTargetType] = mapped_column(
+        Enum(CommandTargetType, name="command_target_type", create_type=False), nullable=False
+    )
+    target_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    action: Mapped[str] = mapped_column(String(100), nullable=False, comment="명령 종류 (예: FIRMWARE_UPDATE)")
+    parameters: Mapped[Optional[Dict]] = mapped_column(postgresql.JSONB, nullable=True)
+
+    status: Mapped[CommandDispatchStatus] = mapped_column(
+        Enum(CommandDispatchStatus, name="command_dispatch_status", create_type=False),
+        default=CommandDispatchStatus.PENDING,
+        nullable=False,
+        index=True
+    )
+    rate_per_second: Mapped[float] = mapped_column(Float, nullable=False, comment="초당 최대 발행 수")
+    max_in_flight: Mapped[int] = mapped_column(Integer, nullable=False, comment="응답 대기 중인 최대 명령 수")
+    ack_timeout_seconds: Mapped[int] = mapped_column(Integer, nullable=False)
+    total_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+class CommandDelivery(Base, DeviceFKMixin):
+    """
+    [Event/Log] 팬아웃 작업의 기기별 전달 상태:
+    correlation_id로 기기 응답(commands/response/{uuid})을 매칭하고 발행→응답 지연을 기록합니다.
+    """
+    __tablename__ = "command_deliveries"
+    __table_args__ = (
+        Index("idx_command_deliveries_dispatch_status", "dispatch_id", "status"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    dispatch_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("command_dispatches.id", ondelete="CASCADE"), nullable=False)
+    correlation_id: Mapped[str] = mapped_column(String(32), unique=True, nullable=False)
+
+    status: Mapped[CommandDeliveryStatus] = mapped_column(
+        Enum(CommandDeliveryStatus, name="command_delivery_status", create_type=False),
+        default=CommandDeliveryStatus.QUEUED,
+        nullable=False
+    )
+    sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    acked_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    latency_ms: Mapped[Optional[float]] = mapped_column(Float, nullable=True, comment="발행부터 응답 수신까지 (ms)")
+    response: Mapped[Optional[Dict]] = mapped_column(postgresql.JSONB, nullable=True)
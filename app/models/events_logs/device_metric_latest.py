@@ -0,0 +1,32 @@
+from sqlalchemy import BigInteger, String, Float, Integer, ForeignKey, DateTime, text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects import postgresql
+from typing import Optional
+from datetime import datetime
+
+from app.database import Base
+from ..base_model import SystemUnitFKMixin
+
+class DeviceMetricLatest(Base, SystemUnitFKMixin):
+    """
+    [State] 기기별 측정 항목의 최신값 테이블:
+    (device, component, metric)당 1행으로, 텔레메트리 수신 시 captured_at이 더 최신일 때만 덮어씁니다.
+    유닛 전체의 현재 상태를 telemetry_data 역정렬 스캔 없이 system_unit_id 인덱스 1회로 읽기 위한 파생 테이블입니다.
+    """
+    __tablename__ = "device_metric_latest"
+
+    device_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('devices.id'), primary_key=True)
+    component_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    metric_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    unit: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, comment="측정 단위")
+    avg_value: Mapped[float] = mapped_column(Float, nullable=False)
+    min_value: Mapped[float] = mapped_column(Float, nullable=False)
+    max_value: Mapped[float] = mapped_column(Float, nullable=False)
+    std_dev: Mapped[float] = mapped_column(Float, nullable=False)
+    slope: Mapped[float] = mapped_column(Float, nullable=False)
+    sample_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    captured_at: Mapped[datetime] = mapped_column(postgresql.TIMESTAMP(timezone=True), nullable=False, comment="최신값의 측정 시각")
+    snapshot_id: Mapped[str] = mapped_column(String(255), nullable=False, comment="최신값이 속한 스냅샷 ID")
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=text("now()"), onupdate=text("now()"), nullable=False)
@@ -1,11 +1,10 @@
-from sqlalchemy import BigInteger, String, Float, Index, Integer, ForeignKey, UniqueConstraint
+from sqlalchemy import BigInteger, String, Float, Index, Integer, ForeignKey, UniqueConstraint, DateTime, text
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from typing import Optional, Dict, List, TYPE_CHECKING
 from datetime import datetime
 from sqlalchemy.dialects import postgresql
 
 from app.database import Base
-from ..base_model import TimestampMixin, DeviceFKMixin, SystemUnitFKMixin
 
 if TYPE_CHECKING:
     from .telemetry_metadata import TelemetryMetadata
@@ -13,23 +12,32 @@ if TYPE_CHECKING:
     from ..objects.device import Device
     from ..objects.system_unit import SystemUnit
 
-class TelemetryData(Base, TimestampMixin, DeviceFKMixin, SystemUnitFKMixin):
+class TelemetryData(Base):
     """
     [Log] 텔레메트리 데이터 모델:
     장치에서 수집된 센서 데이터의 통계치를 저장하며, MLP 모델의 State 입력으로 사용됩니다.
+
+    captured_at 기준 RANGE 파티션 테이블입니다. (파티션 생성/보존 기간 정리는 TelemetryPartitionService 담당)
+    - 파티션 키가 모든 유니크 제약에 포함되어야 하므로 기본 키는 (id, captured_at)입니다.
+    - 삽입 비용을 줄이기 위해 인덱스는 조회 경로에 필요한 것만 두고, 시간 범위 탐색은 BRIN으로 처리합니다.
     """
     __tablename__ = "telemetry_data"
     __table_args__ = (
-        Index('idx_telemetry_device_time', 'device_id', 'created_at'),
-        Index('idx_telemetry_system_unit_time', 'system_unit_id', 'created_at'),
+        Index('idx_telemetry_device_time', 'device_id', 'captured_at'),
+        # 스트리밍 내보내기의 (captured_at, id) 키셋 페이지네이션용 (유닛 단위)
+        Index('idx_telemetry_system_unit_captured_at_id', 'system_unit_id', 'captured_at', 'id'),
         Index('idx_telemetry_snapshot_id', 'snapshot_id'),
+        Index('idx_telemetry_captured_at_brin', 'captured_at', postgresql_using='brin'),
         UniqueConstraint(
             'device_id', 'component_name', 'metric_name', 'captured_at', 
             name='_device_component_metric_time_uc'
         ),
+        {'postgresql_partition_by': 'RANGE (captured_at)'},
     )
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    device_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('devices.id'), nullable=False)
+    system_unit_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('system_units.id'), nullable=False)
     
     snapshot_id: Mapped[str] = mapped_column(
         String(255), 
@@ -39,8 +47,8 @@ class TelemetryData(Base, TimestampMixin, DeviceFKMixin, SystemUnitFKMixin):
     )
 
     # --- 데이터 종류 식별 ---
-    metric_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True, comment="측정 항목명 (temp, co2 등)")
-    component_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True, comment="데이터가 발생한 부품 인스턴스 명칭")
+    metric_name: Mapped[str] = mapped_column(String(100), nullable=False, comment="측정 항목명 (temp, co2 등)")
+    component_name: Mapped[str] = mapped_column(String(100), nullable=False, comment="데이터가 발생한 부품 인스턴스 명칭")
     unit: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, comment="측정 단위")
 
     # --- 10초간의 통계값 (AI State 입력 핵심) ---
@@ -53,11 +61,13 @@ class TelemetryData(Base, TimestampMixin, DeviceFKMixin, SystemUnitFKMixin):
     
     captured_at: Mapped[datetime] = mapped_column(
         postgresql.TIMESTAMP(timezone=True), 
-        nullable=False, 
-        index=True,
-        comment="센서에서 실제 측정된 시각"
+        primary_key=True,
+        comment="센서에서 실제 측정된 시각 (파티션 키)"
     )
 
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=text("now()"), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=text("now()"), onupdate=text("now()"), nullable=False)
+
     # --- 비정형 추가 데이터 (JSONB) ---
     extra_stats: Mapped[Optional[Dict]] = mapped_column(postgresql.JSONB, nullable=True)
 
@@ -73,6 +83,10 @@ class TelemetryData(Base, TimestampMixin, DeviceFKMixin, SystemUnitFKMixin):
     system_unit: Mapped["SystemUnit"] = relationship("SystemUnit", back_populates="telemetry_data")
     
     # 자식: 메타데이터 상세
+    # 파티션 테이블은 id 단독으로 참조될 수 없으므로 DB 외래 키 없이 ORM 조인 조건만 둡니다.
     metadata_items: Mapped[List["TelemetryMetadata"]] = relationship(
-        "TelemetryMetadata", back_populates="telemetry_data", cascade="all, delete-orphan"
+        "TelemetryMetadata",
+        primaryjoin="TelemetryData.id == foreign(TelemetryMetadata.telemetry_data_id)",
+        back_populates="telemetry_data",
+        cascade="all, delete-orphan"
     )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import BigInteger, String, Text, ForeignKey, UniqueConstraint, Enum
+from sqlalchemy import BigInteger, String, Text, UniqueConstraint, Enum
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from typing import Optional, TYPE_CHECKING
 
@@ -22,9 +22,9 @@ class TelemetryMetadata(Base, TimestampMixin):
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, index=True)
     
-    # 외래 키: TelemetryData와 1:N 관계
+    # TelemetryData와 1:N 관계 (telemetry_data가 파티션 테이블이므로 DB 외래 키는 두지 않음)
     telemetry_data_id: Mapped[int] = mapped_column(
-        BigInteger, ForeignKey("telemetry_data.id"), nullable=False
+        BigInteger, nullable=False
     )
     
     meta_key: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -42,5 +42,7 @@ class TelemetryMetadata(Base, TimestampMixin):
     # --- Relationships (Mapped 적용 완료) ---
     # 이 메타데이터가 속한 텔레메트리 데이터 정보
     telemetry_data: Mapped["TelemetryData"] = relationship(
-        "TelemetryData", back_populates="metadata_items"
+        "TelemetryData",
+        primaryjoin="foreign(TelemetryMetadata.telemetry_data_id) == TelemetryData.id",
+        back_populates="metadata_items"
     )
\ No newline at end of file
@@ -0,0 +1,82 @@
+from sqlalchemy import BigInteger, String, Float, Integer, Index, ForeignKey, DateTime, text
+from sqlalchemy.ext.declarative import declared_attr
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+
+from app.database import Base
+
+class TelemetryRollupMixin:
+    """
+    텔레메트리 시간 버킷 롤업의 공통 컬럼입니다.
+    평균/표준편차 대신 합계(sum)와 제곱합(sum_sq)을 저장하므로, 버킷끼리 단순 덧셈으로 병합할 수 있습니다.
+    - avg = sum_value / sample_count
+    - std = sqrt(sum_sq_value / sample_count - avg^2)  (원본 10초 행들의 가중 평균/결합 표준편차)
+    """
+    @declared_attr
+    def device_id(cls) -> Mapped[int]:
+        return mapped_column(BigInteger, ForeignKey('devices.id'), primary_key=True)
+
+    @declared_attr
+    def metric_name(cls) -> Mapped[str]:
+        return mapped_column(String(100), primary_key=True)
+
+    @declared_attr
+    def component_name(cls) -> Mapped[str]:
+        return mapped_column(String(100), primary_key=True)
+
+    @declared_attr
+    def bucket_start(cls) -> Mapped[datetime]:
+        return mapped_column(DateTime(timezone=True), primary_key=True, comment="버킷 시작 시각 (UTC 기준 절삭)")
+
+    @declared_attr
+    def system_unit_id(cls) -> Mapped[int]:
+        return mapped_column(BigInteger, ForeignKey('system_units.id'), nullable=False)
+
+    @declared_attr
+    def row_count(cls) -> Mapped[int]:
+        return mapped_column(Integer, nullable=False, comment="병합된 원본 텔레메트리 행 수")
+
+    @declared_attr
+    def sample_count(cls) -> Mapped[int]:
+        return mapped_column(BigInteger, nullable=False, comment="원본 행 sample_count의 합 (가중치)")
+
+    @declared_attr
+    def min_value(cls) -> Mapped[float]:
+        return mapped_column(Float, nullable=False)
+
+    @declared_attr
+    def max_value(cls) -> Mapped[float]:
+        return mapped_column(Float, nullable=False)
+
+    @declared_attr
+    def sum_value(cls) -> Mapped[float]:
+        return mapped_column(Float, nullable=False, comment="Σ sample_count × avg_value")
+
+    @declared_attr
+    def sum_sq_value(cls) -> Mapped[float]:
+        return mapped_column(Float, nullable=False, comment="Σ sample_count × (std_dev² + avg_value²)")
+
+    @declared_attr
+    def updated_at(cls) -> Mapped[datetime]:
+        return mapped_column(DateTime(timezone=True), server_default=text("now()"), onupdate=text("now()"), nullable=False)
+
+class TelemetryRollupMinute(Base, TelemetryRollupMixin):
+    """[Log] 1분 단위 텔레메트리 롤업 (원본 10초 행 약 6개 → 1행)"""
+    __tablename__ = "telemetry_rollup_1m"
+    __table_args__ = (
+        Index('idx_telemetry_rollup_1m_unit_metric_bucket', 'system_unit_id', 'metric_name', 'bucket_start'),
+    )
+
+class TelemetryRollupHour(Base, TelemetryRollupMixin):
+    """[Log] 1시간 단위 텔레메트리 롤업"""
+    __tablename__ = "telemetry_rollup_1h"
+    __table_args__ = (
+        Index('idx_telemetry_rollup_1h_unit_metric_bucket', 'system_unit_id', 'metric_name', 'bucket_start'),
+    )
+
+class TelemetryRollupDay(Base, TelemetryRollupMixin):
+    """[Log] 1일 단위 텔레메트리 롤업"""
+    __tablename__ = "telemetry_rollup_1d"
+    __table_args__ = (
+        Index('idx_telemetry_rollup_1d_unit_metric_bucket', 'system_unit_id', 'metric_name', 'bucket_start'),
+    )
@@ -1,5 +1,5 @@
 import enum
-from sqlalchemy import BigInteger, String, DateTime, Text, JSON, Boolean, Enum, Integer
+from sqlalchemy import BigInteger, String, DateTime, Text, JSON, Boolean, Enum, Integer, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime
@@ -27,6 +27,7 @@ class ConcurrencyPolicy(str, enum.Enum):
     이전 작업이 끝나지 않았을 때의 처리 정책입니다.
     """
     SKIP = "SKIP"       # 이번 차례 건너뜀
+    QUEUE = "QUEUE"     # 이전 작업이 끝난 뒤 순서대로 실행
     FORCED = "FORCED"   # 중복 실행 허용
     REPLACE = "REPLACE" # 기존 작업 종료 후 새로 시작
 
@@ -37,6 +38,10 @@ class Schedule(Base, TimestampMixin, SystemUnitFKMixin, UserFKMixin, NullableOrg
     시간 기반 반복뿐만 아니라, 무한 루프 상주 작업 및 1회성 시퀀스 실행을 모두 관리합니다.
     """
     __tablename__ = "schedules"
+    __table_args__ = (
+        # 스케줄 실행기의 증분 리로드(updated_at >= watermark)용 인덱스
+        Index('idx_schedules_updated_at', 'updated_at'),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, index=True)
     
@@ -1,4 +1,4 @@
-from sqlalchemy import BigInteger, String, Text, JSON, Boolean, Integer, Enum
+from sqlalchemy import BigInteger, String, Text, JSON, Boolean, Integer, Enum, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from typing import Optional, TYPE_CHECKING
 from app.database import Base
@@ -16,6 +16,10 @@ class TriggerRule(Base, TimestampMixin, SystemUnitFKMixin, UserFKMixin, Nullable
     정의된 작업(Action)을 즉각 실행하는 '이벤트 기반 제어' 모델입니다.
     """
     __tablename__ = "trigger_rules"
+    __table_args__ = (
+        # 트리거 엔진의 증분 리로드(updated_at 이후 변경분 조회)용
+        Index('idx_trigger_rules_updated_at', 'updated_at'),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
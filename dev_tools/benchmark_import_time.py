@@ -0,0 +1,97 @@
+"""
+프로세스 진입점별 import 시간 측정 도구.
+
+`python -X importtime`으로 API(app.main), MQTT 리스너(scripts/run_listener.py), 이미지 워커
+(scripts/worker/image_worker.py)의 모듈 로드 시간을 각각 새 인터프리터에서 측정합니다.
+import 시점에 외부 서비스(Vault 로그인, 브로커 접속 등)에 연결하는 모듈이 생기면
+해당 모듈의 self 시간이 튀므로 상위 목록에서 바로 드러납니다.
+
+    python dev_tools/benchmark_import_time.py --runs 5 --top 15
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+_LOAD_SCRIPT = (
+    "import importlib.util, sys; "
+    "spec = importlib.util.spec_from_file_location({name!r}, {path!r}); "
+    "module = importlib.util.module_from_spec(spec); "
+    "sys.modules[{name!r}] = module; "
+    "spec.loader.exec_module(module)"
+)
+
+# 이름 -> python -c 코드. 스크립트는 __main__이 아닌 이름으로 로드해 main()은 실행하지 않습니다.
+TARGETS: Dict[str, str] = {
+    "api": "import app.main",
+    "listener": _LOAD_SCRIPT.format(name="run_listener", path=os.path.join(PROJECT_ROOT, "scripts", "run_listener.py")),
+    "image_worker": _LOAD_SCRIPT.format(name="image_worker", path=os.path.join(PROJECT_ROOT, "scripts", "worker", "image_worker.py")),
+}
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)")
+
+def measure(code: str) -> Tuple[float, float, List[Tuple[str, int, int]]]:
+    """새 인터프리터에서 code를 실행하고 (import 합계 ms, 프로세스 wall ms, [(모듈, self us, cumulative us)])를 반환합니다."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [PROJECT_ROOT, os.environ.get("PYTHONPATH")]))}
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    if result.returncode != 0:
+        tail = "\n".join(line for line in result.stderr.splitlines() if not line.startswith("import time:"))
+        raise RuntimeError(tail.strip()[-2000:] or f"exit code {result.returncode}")
+
+    modules: List[Tuple[str, int, int]] = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            modules.append((match.group(3), int(match.group(1)), int(match.group(2))))
+    total_ms = sum(self_us for _, self_us, _ in modules) / 1000
+    return total_ms, wall_ms, modules
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import time of process entry points")
+    parser.add_argument("targets", nargs="*", help=f"측정 대상 (기본: 전부 - {', '.join(TARGETS)})")
+    parser.add_argument("--runs", type=int, default=3, help="대상별 반복 횟수 (중앙값 보고)")
+    parser.add_argument("--top", type=int, default=10, help="self 시간 상위 모듈 출력 개수")
+    args = parser.parse_args()
+    unknown = set(args.targets) - set(TARGETS)
+    if unknown:
+        parser.error(f"unknown targets: {', '.join(sorted(unknown))}")
+
+    failed = False
+    for name in args.targets or list(TARGETS):
+        totals, walls = [], []
+        slowest: Dict[str, int] = {}
+        try:
+            for _ in range(max(1, args.runs)):
+                total_ms, wall_ms, modules = measure(TARGETS[name])
+                totals.append(total_ms)
+                walls.append(wall_ms)
+                for module, self_us, _ in modules:
+                    slowest[module] = max(slowest.get(module, 0), self_us)
+        except RuntimeError as e:
+            print(f"❌ {name}: import failed\n{e}\n")
+            failed = True
+            continue
+
+        print(
+            f"📦 {name}: import {statistics.median(totals):.1f}ms (median of {len(totals)}, "
+            f"min {min(totals):.1f}ms) / process {statistics.median(walls):.1f}ms / {len(slowest)} modules"
+        )
+        for module, self_us in sorted(slowest.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+            print(f"    {self_us / 1000:8.1f}ms  {module}")
+        print()
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+
+@pytest.mark.anyio
+async def test_my_permissions_query_budget(client: AsyncClient, dpop_headers, query_budget):
+    """
+    Resolving the current user's permissions must not lazy-load roles/permissions per assignment (N+1).
+    """
+    url = "/api/v1/users/me/permissions"
+    with query_budget(max_queries=10, max_repeats=2):
+        response = await client.get(url, headers=dpop_headers("GET", url))
+    assert response.status_code == 200, response.text
+    assert isinstance(response.json(), list)
+
+def test_query_budget_passes_within_limits(db_session, query_budget):
+    with query_budget(max_queries=3, max_repeats=2) as stats:
+        db_session.execute(text("SELECT 1"))
+        db_session.execute(text("SELECT 2"))
+    assert stats.count == 2
+
+def test_query_budget_fails_when_total_is_exceeded(db_session, query_budget):
+    with pytest.raises(pytest.fail.Exception, match="3 queries executed, budget is 2"):
+        with query_budget(max_queries=2):
+            for i in range(3):
+                db_session.execute(text(f"SELECT {i}"))
+
+def test_query_budget_fails_on_repeated_statements(db_session, query_budget):
+    """The same statement with different parameters is one fingerprint, so an N+1 loop trips max_repeats."""
+    with pytest.raises(pytest.fail.Exception, match=r"3x \(max 2\)"):
+        with query_budget(max_queries=10, max_repeats=2):
+            for i in range(3):
+                db_session.execute(text("SELECT :i"), {"i": i})
@@ -0,0 +1,129 @@
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.main import app
+from app.dependencies import get_async_db, get_active_context
+from app.models.events_logs.observation_snapshot import ObservationSnapshot
+from app.models.events_logs.telemetry_data import TelemetryData
+from app.models.objects.device import Device
+from app.models.objects.permission import Permission
+from app.models.objects.product_line import ProductLine
+from app.models.objects.role import Role
+from app.models.objects.system_unit import SystemUnit
+from app.models.objects.user import User as DBUser
+from app.models.relationships.role_permission import RolePermission
+from app.domains.services.telemetry.managers.telemetry_archive import TelemetryArchiveStore
+from app.domains.services.telemetry.services import telemetry_query_service as query_module
+from app.domains.services.telemetry.services.telemetry_archive_service import TelemetryArchiveService
+
+# DB에는 최근 행 1개, 그보다 오래된 구간은 아카이브에만 있는 행 3개
+ARCHIVED_AT = datetime(2020, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+async def async_db():
+    """/data가 쓰는 asyncpg 세션. 테스트 하나를 트랜잭션 하나로 감싸고 끝나면 롤백합니다."""
+    url = make_url(os.environ["TEST_DATABASE_URL"]).set(drivername="postgresql+asyncpg")
+    engine = create_async_engine(url, poolclass=NullPool)
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False)
+        yield session
+        await session.close()
+        await transaction.rollback()
+    await engine.dispose()
+
+
+@pytest.fixture
+async def privileged_role(async_db):
+    def _create(db):
+        permission = db.execute(select(Permission).where(Permission.name == "telemetry:read_all")).scalar_one_or_none()
+        if permission is None:
+            permission = Permission(name="telemetry:read_all")
+            db.add(permission)
+        role = Role(name="Telemetry Reader")
+        db.add(role)
+        db.flush()
+        db.add(RolePermission(role_id=role.id, permission_id=permission.id))
+        db.flush()
+        return role.id
+
+    return await async_db.run_sync(_create)
+
+
+@pytest.fixture
+async def device_id(async_db):
+    def _create(db):
+        product_line = ProductLine(name="Async Data Line")
+        db.add(product_line)
+        db.flush()
+        unit = SystemUnit(name="Async Data Unit", product_line_id=product_line.id)
+        device = Device(cpu_serial="async-data-device", current_uuid=uuid.uuid4())
+        db.add_all([unit, device])
+        db.flush()
+        db.add(ObservationSnapshot(id="async-data-snap", system_unit_id=unit.id, observation_type="SENSOR"))
+        db.add(TelemetryData(
+            id=200, device_id=device.id, system_unit_id=unit.id, snapshot_id="async-data-snap",
+            metric_name="temp", component_name="cpu", captured_at=datetime.now(timezone.utc),
+            avg_value=9.0, min_value=9.0, max_value=9.0, std_dev=0.0, slope=0.0, sample_count=10,
+        ))
+        db.flush()
+        return device.id
+
+    return await async_db.run_sync(_create)
+
+
+@pytest.fixture
+def archived(tmp_path, monkeypatch, device_id):
+    store = TelemetryArchiveStore(str(tmp_path))
+    rows = [
+        (100 + i, ARCHIVED_AT + timedelta(minutes=i), device_id, None, f"snap-{i}", "cpu", "temp", "C",
+         float(i), float(i), float(i), 0.0, 0.0, 10, None)
+        for i in range(3)
+    ]
+    metadata = [(101, "k", "v1", "STRING", None, ARCHIVED_AT)]
+    store.write_partition(
+        "telemetry_data_p20200101", start=ARCHIVED_AT.replace(hour=0), end=ARCHIVED_AT.replace(hour=0) + timedelta(days=1),
+        rows=rows, metadata_rows=metadata, batch_rows=2, compression="zstd",
+    )
+    store.publish("telemetry_data_p20200101")
+    monkeypatch.setattr(query_module, "telemetry_archive_service", TelemetryArchiveService(store))
+    return rows
+
+
+@pytest.mark.anyio
+async def test_data_endpoint_falls_through_to_the_archive(async_db, privileged_role, device_id, archived):
+    async def override_get_async_db():
+        yield async_db
+
+    # ActiveContext 대신 엔드포인트가 읽는 속성만 가진 컨텍스트를 넘깁니다. (인증 경로는 이 테스트의 대상이 아님)
+    context = SimpleNamespace(user=DBUser(id=1, username="reader"), active_role_id=privileged_role)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_active_context] = lambda: context
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            first_page = await client.get("/api/v1/telemetry/data", params={"device_ids": device_id, "limit": 3})
+            second_page = await client.get(
+                "/api/v1/telemetry/data", params={"device_ids": device_id, "limit": 3, "skip": 3}
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert first_page.status_code == 200, first_page.text
+    # 최신순: DB에 남은 행 다음에 아카이브 행이 이어지고, 아카이브된 메타데이터도 함께 읽힌다.
+    body = first_page.json()
+    assert [row["id"] for row in body] == [200, 102, 101]
+    assert body[0]["metadata_items"] == []
+    assert [m["meta_value"] for m in body[2]["metadata_items"]] == ["v1"]
+    assert body[1]["created_at"].startswith("2020-01-01T12:02:00")
+    # DB 행을 모두 지난 페이지는 DB 행 수만큼 건너뛴 위치부터 아카이브를 읽는다.
+    assert [row["id"] for row in second_page.json()] == [100]
@@ -0,0 +1,80 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from app.core import db_pool
+from app.core.db_pool import PoolMonitor, engine_options, monitored_pool_class, pool_size_for_role
+
+
+@pytest.fixture
+def monitor(monkeypatch):
+    monitor = PoolMonitor(slow_checkout_ms=0)
+    monkeypatch.setattr(db_pool, "pool_monitor", monitor)
+    return monitor
+
+
+def _engine(tmp_path, name):
+    return create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=monitored_pool_class(QueuePool, name),
+        pool_size=1, max_overflow=0, pool_timeout=0.05,
+    )
+
+
+def test_pool_size_follows_role_defaults_and_overrides(monkeypatch):
+    monkeypatch.setattr(db_pool.settings, "DB_POOL_SIZE", None)
+    monkeypatch.setattr(db_pool.settings, "DB_MAX_OVERFLOW", None)
+    assert pool_size_for_role("api") == db_pool.ROLE_POOL_DEFAULTS["api"]
+    assert pool_size_for_role("unknown-role") == db_pool.ROLE_POOL_DEFAULTS["script"]
+
+    monkeypatch.setattr(db_pool.settings, "DB_POOL_SIZE", 3)
+    monkeypatch.setattr(db_pool.settings, "DB_MAX_OVERFLOW", 0)
+    assert pool_size_for_role("api") == (3, 0)
+
+
+def test_engine_options_move_statement_timeout_out_of_startup_params_under_pgbouncer(monkeypatch):
+    monkeypatch.setattr(db_pool.settings, "DB_STATEMENT_TIMEOUT_MS", 1500)
+    url = "postgresql://u@h/db"
+
+    monkeypatch.setattr(db_pool.settings, "DB_PGBOUNCER_MODE", False)
+    assert engine_options("primary", url)["connect_args"] == {"options": "-c statement_timeout=1500"}
+    assert engine_options("primary_async", url, is_async=True)["connect_args"] == {"server_settings": {"statement_timeout": "1500"}}
+
+    monkeypatch.setattr(db_pool.settings, "DB_PGBOUNCER_MODE", True)
+    assert engine_options("primary", url)["connect_args"] == {}
+    async_args = engine_options("primary_async", url, is_async=True)["connect_args"]
+    assert async_args["statement_cache_size"] == 0 and async_args["prepared_statement_cache_size"] == 0
+    assert async_args["prepared_statement_name_func"]() != async_args["prepared_statement_name_func"]()
+
+    # Postgres가 아닌 드라이버에는 연결 옵션을 넘기지 않는다.
+    assert engine_options("primary", "sqlite:///x.db")["connect_args"] == {}
+
+
+def test_monitor_records_checkouts_slow_waits_and_exhaustion(tmp_path, monitor):
+    engine = _engine(tmp_path, "test")
+    monitor.register("test", engine)
+
+    held = engine.connect()
+    held.execute(text("SELECT 1"))
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    held.close()
+
+    stats = monitor.snapshot()["pools"]["test"]
+    assert stats["checkouts"] == 1 and stats["connects"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["slow_checkouts"] == 1  # slow_checkout_ms=0이므로 모든 체크아웃이 느린 것으로 집계
+    assert stats["peak_checked_out"] == 1 and stats["checked_out"] == 0 and stats["size"] == 1
+    assert stats["wait_ms_p50"] is not None
+
+
+def test_dispose_keeps_the_new_pool_instrumented(tmp_path, monitor):
+    engine = _engine(tmp_path, "test")
+    monitor.register("test", engine)
+    engine.dispose()
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert monitor._pools["test"] is engine.pool
+    assert monitor.snapshot()["pools"]["test"]["checkouts"] == 1
@@ -0,0 +1,136 @@
+import asyncio
+
+import fakeredis
+import pytest
+
+from app.core import leader_election as module
+from app.core.leader_election import LeaderElector
+
+LEASE = 0.3
+RENEW = 0.05
+
+
+class _Clock:
+    """time.monotonic 대체. 테스트가 직접 시간을 옮깁니다."""
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(module.time, "monotonic", clock)
+    return clock
+
+
+def _elector(redis, events, name):
+    async def on_elected():
+        events.append(f"{name}:elected")
+
+    async def on_demoted():
+        events.append(f"{name}:demoted")
+
+    return LeaderElector(
+        redis, key="test:leader", lease_seconds=LEASE, renew_interval_seconds=RENEW,
+        on_elected=on_elected, on_demoted=on_demoted,
+    )
+
+
+async def _tick():
+    """선출 루프가 한 바퀴(to_thread 호출 + sleep 진입) 돌 시간."""
+    await asyncio.sleep(RENEW * 1.5)
+
+
+@pytest.mark.anyio
+async def test_only_one_worker_is_elected_and_shutdown_hands_over():
+    redis = fakeredis.FakeRedis()
+    events = []
+    first, second = _elector(redis, events, "a"), _elector(redis, events, "b")
+
+    await first.start()
+    await _tick()
+    await second.start()
+    await _tick()
+    assert first.is_leader and not second.is_leader
+    assert redis.get("test:leader").decode() == first.identity
+
+    # 정상 종료는 락을 바로 해제하므로 다음 폴링에 인계된다.
+    await first.stop()
+    for _ in range(10):
+        await _tick()
+        if second.is_leader:
+            break
+    assert second.is_leader
+    assert events == ["a:elected", "a:demoted", "b:elected"]
+    await second.stop()
+    assert redis.get("test:leader") is None
+
+
+@pytest.mark.anyio
+async def test_leader_steps_down_when_the_lease_was_taken():
+    redis = fakeredis.FakeRedis()
+    events = []
+    elector = _elector(redis, events, "a")
+    await elector.start()
+    await _tick()
+    assert elector.is_leader
+
+    redis.set("test:leader", "someone-else")
+    await _tick()
+    assert not elector.is_leader and events == ["a:elected", "a:demoted"]
+    assert redis.get("test:leader") == b"someone-else"
+    await elector.stop()
+
+
+@pytest.mark.anyio
+async def test_unreachable_redis_demotes_before_the_lease_expires(clock):
+    redis = fakeredis.FakeRedis()
+    events = []
+    elector = _elector(redis, events, "a")
+    await elector.start()
+    await _tick()
+    assert elector.is_leader
+    renewed_at = elector._last_renewed
+
+    def unreachable(*args, **kwargs):
+        raise ConnectionError("redis down")
+
+    redis.eval = unreachable
+    # 마지막 연장 후 lease - renew_interval 전까지는 일시적인 장애로 보고 리더를 유지한다.
+    clock.now = renewed_at + LEASE - RENEW - 0.01
+    await _tick()
+    assert elector.is_leader
+
+    # 그 시각을 넘기면 임대(lease)가 끝나기 전에 싱글턴 루프를 멈춘다.
+    clock.now = renewed_at + LEASE - RENEW
+    await _tick()
+    assert not elector.is_leader and events == ["a:elected", "a:demoted"]
+    assert clock.now < renewed_at + LEASE
+    await elector.stop()
+
+
+@pytest.mark.anyio
+async def test_hanging_renewal_is_cut_off_at_the_demote_deadline(clock):
+    redis = fakeredis.FakeRedis()
+    events = []
+    elector = _elector(redis, events, "a")
+    await elector.start()
+    await _tick()
+    assert elector.is_leader
+
+    def hanging(*args, **kwargs):
+        import time
+        time.sleep(RENEW * 4)
+        return 1
+
+    # 남은 시간이 거의 없는 상태에서 연장 호출이 멈추면 결과를 기다리지 않고 강등한다.
+    redis.eval = hanging
+    clock.now = elector._last_renewed + LEASE - RENEW - 0.0001
+    await asyncio.sleep(RENEW * 3)
+    clock.now += 0.001
+    await asyncio.sleep(RENEW * 5)
+    assert not elector.is_leader and events == ["a:elected", "a:demoted"]
+    await elector.stop()
@@ -0,0 +1,136 @@
+import pytest
+from sqlalchemy import Integer, String, create_engine, insert, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from app import database
+from app.database import (
+    AsyncRoutingSession, AsyncSessionLocal, ReplicaRouter, ReplicaSessionLocal, RoutingSession, SessionLocal, replica_reads,
+)
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class Marker(_Base):
+    """각 DB 파일에 자신이 어느 쪽인지 적어 두는 테이블. (조회가 어디로 갔는지 확인용)"""
+    __tablename__ = "routing_marker"
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(20))
+
+
+@pytest.fixture
+def routed(tmp_path, monkeypatch):
+    """primary/replica를 서로 다른 SQLite 파일로 두고 RoutingSession이 보는 엔진을 교체합니다."""
+    engines = {}
+    for name in ("primary", "replica"):
+        engines[name] = create_engine(f"sqlite:///{tmp_path / f'{name}.db'}")
+        _Base.metadata.create_all(engines[name])
+        with engines[name].begin() as conn:
+            conn.execute(insert(Marker).values(id=1, name=name))
+    router = ReplicaRouter(engines["primary"], [engines["replica"]], max_lag_seconds=5, check_interval_seconds=60)
+    monkeypatch.setattr(database, "engine", engines["primary"])
+    monkeypatch.setattr(database, "replica_router", router)
+    yield router
+    for e in engines.values():
+        e.dispose()
+
+
+def _source(session) -> str:
+    return session.execute(select(Marker.name).where(Marker.id == 1)).scalar()
+
+
+def test_reads_go_to_primary_unless_marked_for_replica(routed):
+    with SessionLocal() as session:
+        assert _source(session) == "primary"
+        with replica_reads():
+            assert _source(session) == "replica"
+            # 잠금 조회는 복제본에서 할 수 없으므로 primary
+            assert session.execute(select(Marker.name).with_for_update()).scalar() == "primary"
+
+    with ReplicaSessionLocal() as session:
+        assert _source(session) == "replica"
+
+
+def test_writes_and_flushes_go_to_primary_and_pin_the_session(routed):
+    with SessionLocal() as session, replica_reads():
+        assert _source(session) == "replica"
+        session.add(Marker(id=2, name="written"))
+        session.flush()
+        # read-your-writes: 쓰기 이후 같은 세션의 조회는 primary에 고정된다.
+        assert _source(session) == "primary"
+        assert session.get(Marker, 2).name == "written"
+        session.commit()
+
+    with routed.primary.connect() as conn:
+        assert conn.execute(text("SELECT name FROM routing_marker WHERE id = 2")).scalar() == "written"
+    with routed.replicas[0].connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM routing_marker")).scalar() == 1
+
+    with SessionLocal() as session, replica_reads():
+        session.execute(insert(Marker).values(id=3, name="dml"))
+        assert _source(session) == "primary"
+
+
+@pytest.mark.parametrize("lag", [30.0, None], ids=["lagging", "unreachable"])
+def test_lagging_or_failed_replica_falls_back_to_primary(routed, monkeypatch, lag):
+    monkeypatch.setattr(routed, "_measure_lag", lambda replica: lag)
+    with SessionLocal() as session, replica_reads():
+        assert _source(session) == "primary"
+    # 측정 결과는 check_interval 동안 재사용되므로, 복구돼도 바로 돌아가지 않는다.
+    monkeypatch.setattr(routed, "_measure_lag", lambda replica: 0.0)
+    assert routed.pick() is routed.primary
+
+
+def test_replica_reads_and_write_pin_reset_after_the_request(routed):
+    @replica_reads()
+    def query_provider(session):
+        return _source(session)
+
+    session = SessionLocal()
+    assert isinstance(session, RoutingSession)
+    assert query_provider(session) == "replica"
+    # 데코레이터 범위를 벗어나면 같은 세션이라도 primary로 돌아간다.
+    assert _source(session) == "primary"
+
+    with pytest.raises(RuntimeError):
+        with replica_reads():
+            raise RuntimeError("request failed")
+    assert _source(session) == "primary"
+
+    session.add(Marker(id=4, name="pinned"))
+    session.flush()
+    assert query_provider(session) == "primary"
+    session.rollback()
+    session.close()
+    # 요청이 끝나 세션이 닫히면 쓰기 고정도 풀린다.
+    assert query_provider(session) == "replica"
+
+
+def test_async_sessions_route_to_the_matching_async_engine(routed, monkeypatch):
+    # asyncpg 엔진은 연결 전까지 서버에 접속하지 않으므로, 고른 bind만 확인합니다.
+    async_primary = create_async_engine("postgresql+asyncpg://u@primary/db")
+    async_replica = create_async_engine("postgresql+asyncpg://u@replica/db")
+    monkeypatch.setattr(database, "async_engine", async_primary)
+    monkeypatch.setattr(database, "async_replica_binds", {routed.replicas[0]: async_replica.sync_engine})
+
+    session = AsyncSessionLocal().sync_session
+    assert isinstance(session, AsyncRoutingSession)
+    read = select(Marker.name)
+    assert session.get_bind(clause=read) is async_primary.sync_engine
+    with replica_reads():
+        assert session.get_bind(clause=read) is async_replica.sync_engine
+        assert session.get_bind(clause=insert(Marker).values(id=5, name="x")) is async_primary.sync_engine
+        # 쓰기 이후에는 같은 세션의 조회도 primary에 고정된다.
+        assert session.get_bind(clause=read) is async_primary.sync_engine
+
+
+@pytest.mark.anyio
+async def test_replica_reads_reaches_the_async_session_greenlet():
+    # AsyncSession은 동기 세션 코드를 greenlet에서 실행하므로, 범위 표시가 그쪽까지 전달되는지 확인합니다.
+    session = AsyncSessionLocal()
+    with replica_reads():
+        assert await session.run_sync(lambda sync_session: database._replica_reads.get()) is True
+    assert await session.run_sync(lambda sync_session: database._replica_reads.get()) is False
+    await session.close()
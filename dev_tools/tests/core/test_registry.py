@@ -0,0 +1,98 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from app.core.redis_client import get_redis_client, redis_client
+from app.core.registry import AppRegistry, app_registry
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+
+
+class _Client:
+    def __init__(self):
+        self.pool = object()
+        self.closed = False
+
+
+def test_lazy_proxy_resolves_to_the_single_eager_instance():
+    registry = AppRegistry()
+    created = []
+    proxy = registry.register("client", lambda: created.append(_Client()) or created[-1])
+
+    assert registry.register("client", lambda: pytest.fail("두 번째 등록은 팩토리를 바꾸지 않는다")) is proxy
+    assert created == [] and registry.snapshot() == {"client": False}
+
+    # 프록시를 통한 접근과 get()이 같은 인스턴스를 본다.
+    assert proxy.pool is registry.get("client").pool
+    proxy.closed = True
+    assert registry.get("client").closed is True
+    assert len(created) == 1 and registry.snapshot() == {"client": True}
+
+
+def test_failed_factory_is_retried_on_next_use():
+    registry = AppRegistry()
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError("vault down")
+        return _Client()
+
+    registry.register("vault", flaky)
+    assert registry.warm_up() == {"vault": False}
+    assert not registry.is_initialized("vault")
+    assert registry.get("vault") is registry.get("vault")
+    assert len(attempts) == 2
+    with pytest.raises(KeyError):
+        registry.get("missing")
+
+
+def test_shutdown_closes_in_reverse_creation_order_and_allows_recreation():
+    registry = AppRegistry()
+    closed = []
+    registry.register("redis", _Client, close=lambda c: closed.append("redis"))
+    registry.register("vault", lambda: registry.get("redis") and _Client(), close=lambda c: closed.append("vault"))
+
+    first = registry.get("vault")
+    registry.shutdown()
+    assert closed == ["vault", "redis"]
+    assert registry.snapshot() == {"redis": False, "vault": False}
+    assert registry.get("vault") is not first
+
+
+def test_shared_redis_proxy_matches_get_redis_client():
+    # redis-py는 생성 시 연결하지 않으므로 실제 클라이언트로 확인할 수 있다.
+    assert redis_client.connection_pool is get_redis_client().connection_pool
+    assert app_registry.get("redis") is get_redis_client()
+
+
+def test_importing_the_api_opens_no_network_connections():
+    code = textwrap.dedent("""
+        import socket
+
+        attempts = []
+
+        def _blocked(name):
+            def _call(*args, **kwargs):
+                attempts.append(name)
+                raise OSError(f"network access during import: {name}")
+            return _call
+
+        socket.socket.connect = _blocked("connect")
+        socket.socket.connect_ex = _blocked("connect_ex")
+        socket.create_connection = _blocked("create_connection")
+        socket.getaddrinfo = _blocked("getaddrinfo")
+
+        import app.main
+        from app.core.registry import app_registry
+
+        assert not attempts, attempts
+        assert not any(app_registry.snapshot().values()), app_registry.snapshot()
+    """)
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [PROJECT_ROOT, os.environ.get("PYTHONPATH")]))}
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr[-2000:]
@@ -0,0 +1,84 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import fakeredis
+import pytest
+from sqlalchemy import select
+
+from app.models.objects.device import Device
+from app.models.events_logs.batch_tracking import BatchStatus, BatchTracking
+from app.domains.services.batch_tracking.crud.batch_tracking_command_crud import batch_tracking_command_crud
+from app.domains.services.batch_tracking.repositories.batch_progress_repository import BatchProgressRepository
+from app.domains.services.batch_tracking.schemas.batch_tracking_command_schema import BatchProgressSnapshot, BatchTrackingCreate
+
+
+@pytest.fixture
+def repo():
+    return BatchProgressRepository(fakeredis.FakeRedis())
+
+
+def test_increment_script_marks_completion_exactly_once(repo):
+    repo.seed("b1", total_count=3)
+    assert repo.increment("b1") == (1, 3, False)
+    assert repo.increment("b1") == (2, 3, False)
+    assert repo.increment("b1") == (3, 3, True)
+    # 재시도 등으로 total을 넘겨도 완료 시각은 처음 한 번만 기록됩니다.
+    assert repo.increment("b1") == (4, 3, False)
+
+    snapshot = repo.read("b1")
+    assert (snapshot.processed_count, snapshot.total_count) == (4, 3)
+    assert snapshot.completed_at is not None
+
+
+def test_missing_counter_falls_back_and_dirty_set_tracks_changes(repo):
+    assert repo.increment("unknown") is None
+    assert repo.pop_dirty(10) == []
+
+    repo.seed("b1", total_count=5)
+    repo.seed("b2", total_count=5)
+    repo.increment("b1")
+    repo.increment("b1")
+    repo.increment("b2")
+    assert sorted(repo.pop_dirty(10)) == ["b1", "b2"]
+    assert repo.pop_dirty(10) == []
+
+    repo.requeue(["b2"])
+    assert repo.pop_dirty(10) == ["b2"]
+    assert [s.processed_count if s else None for s in repo.read_many(["b1", "b2", "unknown"])] == [2, 1, None]
+
+
+def _batch(db_session, batch_id, total):
+    device = Device(cpu_serial=f"batch-{batch_id}", current_uuid=uuid.uuid4())
+    db_session.add(device)
+    db_session.flush()
+    batch_tracking_command_crud.create(db_session, obj_in=BatchTrackingCreate(batch_id=batch_id, device_id=device.id, total_count=total))
+
+
+def _rows(db_session):
+    db_session.expire_all()
+    return {b.batch_id: b for b in db_session.scalars(select(BatchTracking).where(BatchTracking.batch_id.in_(["f1", "f2"])))}
+
+
+def test_bulk_flush_only_moves_counts_forward_and_keeps_first_completion(db_session):
+    _batch(db_session, "f1", 3)
+    _batch(db_session, "f2", 10)
+    done_at = datetime.now(timezone.utc).replace(microsecond=0)
+
+    batch_tracking_command_crud.bulk_apply_progress(db_session, snapshots=[
+        BatchProgressSnapshot(batch_id="f1", total_count=3, processed_count=3, completed_at=done_at),
+        BatchProgressSnapshot(batch_id="f2", total_count=10, processed_count=4),
+    ])
+    rows = _rows(db_session)
+    assert (rows["f1"].processed_count, rows["f1"].status, rows["f1"].completed_at) == (3, BatchStatus.COMPLETED, done_at)
+    assert (rows["f2"].processed_count, rows["f2"].status, rows["f2"].completed_at) == (4, BatchStatus.PROCESSING, None)
+
+    # 늦게 도착한(더 작은) 스냅샷과 다른 완료 시각은 반영되지 않습니다.
+    batch_tracking_command_crud.bulk_apply_progress(db_session, snapshots=[
+        BatchProgressSnapshot(batch_id="f1", total_count=3, processed_count=2, completed_at=done_at + timedelta(minutes=5)),
+        BatchProgressSnapshot(batch_id="f2", total_count=10, processed_count=2),
+    ])
+    rows = _rows(db_session)
+    assert (rows["f1"].processed_count, rows["f1"].completed_at) == (3, done_at)
+    assert rows["f2"].processed_count == 4
+
+    batch_tracking_command_crud.bulk_apply_progress(db_session, snapshots=[])
@@ -0,0 +1,126 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+
+from app.models.objects.device import Device
+from app.models.events_logs.command_delivery import CommandDelivery, CommandDeliveryStatus, CommandTargetType
+from app.domains.application.command_fanout import command_fanout_engine as engine_module
+from app.domains.application.command_fanout.command_ack_collector import CommandAckCollector
+from app.domains.application.command_fanout.command_fanout_engine import CommandFanoutEngine, _TokenBucket
+from app.domains.services.command_fanout.crud.command_fanout_command_crud import command_fanout_command_crud
+from app.domains.services.command_fanout.schemas.command_fanout_command import CommandAck, CommandDispatchCreate
+from app.domains.inter_domain.command_fanout.command_fanout_query_provider import command_fanout_query_provider
+
+
+def test_token_bucket_refills_at_rate_and_caps_at_one_second():
+    bucket = _TokenBucket(rate=4, now=0.0)
+    assert bucket.available(0.0) == 0
+    assert bucket.available(0.5) == 2
+    bucket.consume(2)
+    assert bucket.available(0.75) == 1
+    assert bucket.available(60.0) == 4  # 오래 쉬어도 1초치까지만
+
+    slow = _TokenBucket(rate=0.5, now=0.0)
+    assert slow.available(1.0) == 0
+    assert slow.available(10.0) == 1  # 최소 용량 1
+
+
+@pytest.fixture
+def dispatch(db_session):
+    devices = [Device(cpu_serial=f"fanout-{i}", current_uuid=uuid.uuid4()) for i in range(4)]
+    db_session.add_all(devices)
+    db_session.flush()
+    obj = command_fanout_command_crud.create_dispatch(db_session, obj_in=CommandDispatchCreate(
+        target_type=CommandTargetType.SYSTEM_UNIT, target_id=1, action="REBOOT",
+        rate_per_second=100, max_in_flight=2, ack_timeout_seconds=30, total_count=len(devices),
+    ))
+    command_fanout_command_crud.bulk_create_deliveries(db_session, dispatch_id=obj.id, device_ids=[d.id for d in devices])
+    db_session.flush()
+    return obj
+
+
+def _deliveries(db_session, dispatch_id):
+    db_session.expire_all()
+    return list(db_session.scalars(
+        select(CommandDelivery).where(CommandDelivery.dispatch_id == dispatch_id).order_by(CommandDelivery.id)
+    ))
+
+
+def test_engine_publishes_within_token_and_in_flight_budgets(db_session, dispatch, monkeypatch):
+    clock = [0.0]
+    published = []
+    monkeypatch.setattr(engine_module.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(engine_module, "publish_commands", lambda messages: published.extend(messages) or len(messages))
+
+    engine = CommandFanoutEngine(SimpleNamespace(COMMAND_FANOUT_GLOBAL_RATE_PER_SECOND=1000), db_session_factory=None)
+    runtime = lambda: next(d for d in command_fanout_query_provider.get_runnable_dispatches(db_session) if d.id == dispatch.id)
+
+    engine._advance(db_session, runtime())  # 버킷이 비어 있어 첫 틱은 발행 없음
+    assert published == []
+
+    clock[0] = 1.0
+    engine._advance(db_session, runtime())  # 토큰은 충분하지만 max_in_flight=2
+    assert len(published) == 2
+    assert [d.status for d in _deliveries(db_session, dispatch.id)].count(CommandDeliveryStatus.SENT) == 2
+    assert published[0][1]["correlation_id"] == _deliveries(db_session, dispatch.id)[0].correlation_id
+
+    clock[0] = 2.0
+    engine._advance(db_session, runtime())  # 응답이 없으면 더 보내지 않음
+    assert len(published) == 2
+
+
+def test_publisher_shortfall_requeues_the_rest(db_session, dispatch, monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr(engine_module.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(engine_module, "publish_commands", lambda messages: 1)
+
+    engine = CommandFanoutEngine(SimpleNamespace(COMMAND_FANOUT_GLOBAL_RATE_PER_SECOND=1000), db_session_factory=None)
+    runtime = next(d for d in command_fanout_query_provider.get_runnable_dispatches(db_session) if d.id == dispatch.id)
+    engine._advance(db_session, runtime)
+    clock[0] = 1.0
+    engine._advance(db_session, runtime)
+
+    statuses = [d.status for d in _deliveries(db_session, dispatch.id)]
+    assert statuses.count(CommandDeliveryStatus.SENT) == 1
+    assert statuses.count(CommandDeliveryStatus.QUEUED) == 3
+
+
+def test_acks_match_on_correlation_id_and_device_uuid(db_session, dispatch):
+    rows = _deliveries(db_session, dispatch.id)
+    sent_at = datetime.now(timezone.utc) - timedelta(seconds=2)
+    command_fanout_command_crud.mark_sent(db_session, delivery_ids=[r.id for r in rows[:3]], sent_at=sent_at)
+    command_fanout_command_crud.expire_timeouts(db_session, dispatch_id=dispatch.id, ack_timeout_seconds=1, now=datetime.now(timezone.utc))
+    uuids = {d.id: str(d.current_uuid) for d in db_session.scalars(select(Device).where(Device.id.in_([r.device_id for r in rows])))}
+    now = datetime.now(timezone.utc)
+
+    command_fanout_command_crud.apply_acks(db_session, acks=[
+        # 정상 응답 (TIMEOUT 이후 늦게 도착해도 반영)
+        CommandAck(correlation_id=rows[0].correlation_id, device_uuid=uuids[rows[0].device_id], status=CommandDeliveryStatus.ACKED, acked_at=now, response={"status": "ok"}),
+        # 실패 응답
+        CommandAck(correlation_id=rows[1].correlation_id, device_uuid=uuids[rows[1].device_id], status=CommandDeliveryStatus.FAILED, acked_at=now),
+        # 다른 기기가 남의 correlation_id로 응답 -> 무시
+        CommandAck(correlation_id=rows[2].correlation_id, device_uuid=uuids[rows[0].device_id], status=CommandDeliveryStatus.ACKED, acked_at=now),
+        # 아직 발행되지 않은 전달 -> 무시
+        CommandAck(correlation_id=rows[3].correlation_id, device_uuid=uuids[rows[3].device_id], status=CommandDeliveryStatus.ACKED, acked_at=now),
+    ])
+
+    after = _deliveries(db_session, dispatch.id)
+    assert [d.status for d in after] == [
+        CommandDeliveryStatus.ACKED, CommandDeliveryStatus.FAILED, CommandDeliveryStatus.TIMEOUT, CommandDeliveryStatus.QUEUED,
+    ]
+    assert after[0].latency_ms == pytest.approx((now - sent_at).total_seconds() * 1000, abs=1)
+    assert after[0].response == {"status": "ok"}
+
+
+def test_collector_ignores_replies_without_correlation_or_valid_uuid():
+    collector = CommandAckCollector(db_session_factory=None, flush_interval=1, max_batch=2)
+    device_uuid = str(uuid.uuid4())
+    assert collector.submit(device_uuid, {"status": "ok"}) is False
+    assert collector.submit("not-a-uuid", {"correlation_id": "abc"}) is False
+    assert collector.submit(device_uuid, {"correlation_id": "abc", "status": "OK"}) is True
+    assert collector.submit(device_uuid, {"correlation_id": "def", "status": "error"}) is True
+    assert [a.status for a in collector._buffer] == [CommandDeliveryStatus.ACKED, CommandDeliveryStatus.FAILED]
+    assert collector._full.is_set()
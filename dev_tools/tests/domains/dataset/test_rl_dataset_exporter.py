@@ -0,0 +1,137 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from app.domains.application.dataset import rl_dataset_exporter as exporter_module
+from app.domains.application.dataset.rl_dataset_exporter import RLDatasetExporter
+from app.domains.services.observation.schemas.observation_export_query import ObservationExportFilter
+
+BASE = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+# 스냅샷 id 순서와 생성 시각 순서가 엇갈린다. (여러 유닛이 동시에 기록)
+SNAPSHOTS = [
+    ("snap-1", 10, BASE + timedelta(seconds=30), "SENSOR"),
+    ("snap-2", 20, BASE + timedelta(seconds=5), "SENSOR"),
+    ("snap-3", 10, BASE + timedelta(seconds=50), "IMAGE"),
+    ("snap-4", 20, BASE + timedelta(seconds=10), "SENSOR"),
+    ("snap-5", 10, BASE + timedelta(seconds=70), "SENSOR"),
+]
+TELEMETRY = [
+    ("snap-0", "cpu", "temp", 99.0, 0, 0, 0, 0),  # 스냅샷이 없는 고아 행
+    ("snap-1", "cpu", "temp", 41.0, 40.0, 42.0, 0.5, 0.1),
+    ("snap-1", "fan", "rpm", 1200.0, 1100.0, 1300.0, 10.0, 0.0),
+    ("snap-1", "gpu", "temp", 77.0, 0, 0, 0, 0),  # 레이아웃에 없는 열
+    # snap-2, snap-3: 텔레메트리 없음 (공백)
+    ("snap-4", "fan", "rpm", 900.0, 850.0, 950.0, 5.0, -1.0),
+    ("snap-5", "cpu", "temp", 45.0, 44.0, 46.0, 0.2, 0.3),
+]
+IMAGES = [("snap-3", "images/a.jpg"), ("snap-3", "images/b.jpg")]
+ACTIONS = [
+    ("snap-1", "FAN_ON", {"speed": 2}, "USER", "COMPLETED"),
+    ("snap-5", "FAN_OFF", None, "SYSTEM", "REQUESTED"),
+    ("snap-5", "REBOOT", None, "SYSTEM", "REQUESTED"),
+]
+COLUMNS = [("cpu", "temp"), ("fan", "rpm")]
+
+
+def _after(rows, filters):
+    return iter([r for r in rows if filters.after_snapshot_id is None or r[0] > filters.after_snapshot_id])
+
+
+@pytest.fixture
+def fake_streams(monkeypatch):
+    provider = exporter_module.observation_export_query_provider
+    opened = []
+
+    def stream(rows, name):
+        def _stream(db, *, filters, fetch_size):
+            opened.append((name, filters.after_snapshot_id))
+            return _after(rows, filters)
+        return _stream
+
+    monkeypatch.setattr(provider, "stream_snapshots", stream(SNAPSHOTS, "snapshots"))
+    monkeypatch.setattr(provider, "stream_telemetry", stream(TELEMETRY, "telemetry"))
+    monkeypatch.setattr(provider, "stream_images", stream(IMAGES, "images"))
+    monkeypatch.setattr(provider, "stream_actions", stream(ACTIONS, "actions"))
+    monkeypatch.setattr(exporter_module.telemetry_query_provider, "get_archived_before", lambda: None)
+    return opened
+
+
+def _load(output_dir, shard, key):
+    return np.load(output_dir / shard / f"{key}.npy", allow_pickle=False)
+
+
+def test_merge_join_aligns_streams_by_snapshot_and_shards_rows(tmp_path, fake_streams):
+    exporter = RLDatasetExporter(str(tmp_path), shard_rows=2)
+    result = exporter.export(None, filters=ObservationExportFilter(), stats=["avg", "max"], columns=COLUMNS)
+
+    assert result["completed"] and result["rows_written"] == 5
+    assert [s["rows"] for s in result["shards"]] == [2, 2, 1]
+    assert [s["last_snapshot_id"] for s in result["shards"]] == ["snap-2", "snap-4", "snap-5"]
+
+    shards = [s["name"] for s in result["shards"]]
+    state = np.concatenate([_load(tmp_path, s, "state") for s in shards])
+    snapshot_ids = np.concatenate([_load(tmp_path, s, "snapshot_ids") for s in shards])
+    timestamps = np.concatenate([_load(tmp_path, s, "timestamps_ms") for s in shards])
+
+    assert snapshot_ids.tolist() == [s[0] for s in SNAPSHOTS]
+    # 시각은 스냅샷 순서를 따르지 않으며, 각 행은 자기 스냅샷의 생성 시각을 그대로 가진다.
+    assert timestamps.tolist() == [int(s[2].timestamp() * 1000) for s in SNAPSHOTS]
+
+    # 열 배치: [cpu.temp.avg, cpu.temp.max, fan.rpm.avg, fan.rpm.max]
+    np.testing.assert_array_equal(state[0], [41.0, 42.0, 1200.0, 1300.0])
+    assert np.isnan(state[1]).all() and np.isnan(state[2]).all()  # 공백 스냅샷
+    assert np.isnan(state[3][:2]).all()
+    np.testing.assert_array_equal(state[3][2:], [900.0, 950.0])
+    np.testing.assert_array_equal(state[4][:2], [45.0, 46.0])
+
+    image_counts = np.concatenate([_load(tmp_path, s, "image_counts") for s in shards])
+    action_counts = np.concatenate([_load(tmp_path, s, "action_counts") for s in shards])
+    commands = np.concatenate([_load(tmp_path, s, "action_commands") for s in shards])
+    assert image_counts.tolist() == [0, 0, 2, 0, 0]
+    assert _load(tmp_path, shards[1], "image_paths").tolist() == ["images/a.jpg", ""]
+    assert action_counts.tolist() == [1, 0, 0, 0, 2]
+    assert commands.tolist() == ["FAN_ON", "", "", "", "FAN_OFF"]
+    assert _load(tmp_path, shards[0], "action_parameters").tolist()[0] == json.dumps({"speed": 2})
+
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    assert manifest["state_columns"] == ["cpu.temp.avg", "cpu.temp.max", "fan.rpm.avg", "fan.rpm.max"]
+    assert manifest["rows"] == 5 and manifest["telemetry_archived_before"] is None
+
+
+def test_resume_continues_after_the_last_flushed_shard(tmp_path, fake_streams, monkeypatch):
+    exporter = RLDatasetExporter(str(tmp_path), shard_rows=2)
+    real_flush = exporter._flush_shard
+    flushed = []
+
+    def crash_after_first_shard(buffer, checkpoint):
+        if flushed:
+            raise RuntimeError("interrupted")
+        real_flush(buffer, checkpoint)
+        flushed.append(checkpoint["last_snapshot_id"])
+
+    monkeypatch.setattr(exporter, "_flush_shard", crash_after_first_shard)
+    with pytest.raises(RuntimeError):
+        exporter.export(None, filters=ObservationExportFilter(), columns=COLUMNS)
+    assert exporter.load_checkpoint()["last_snapshot_id"] == "snap-2"
+
+    fake_streams.clear()
+    result = RLDatasetExporter(str(tmp_path), shard_rows=2).export(None, filters=ObservationExportFilter())
+    assert {after for _, after in fake_streams} == {"snap-2"}
+    assert result["rows_written"] == 5 and [s["name"] for s in result["shards"]] == ["shard-00000", "shard-00001", "shard-00002"]
+    assert not any(p.name.endswith(".tmp") for p in tmp_path.iterdir())
+
+    with pytest.raises(ValueError):
+        RLDatasetExporter(str(tmp_path)).export(None, filters=ObservationExportFilter(system_unit_ids=[10]))
+
+
+def test_archived_telemetry_cutoff_is_recorded(tmp_path, fake_streams, monkeypatch):
+    archived_before = BASE + timedelta(seconds=20)
+    monkeypatch.setattr(exporter_module.telemetry_query_provider, "get_archived_before", lambda: archived_before)
+
+    RLDatasetExporter(str(tmp_path), shard_rows=10).export(None, filters=ObservationExportFilter(), columns=COLUMNS)
+
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    assert manifest["telemetry_archived_before"] == archived_before.isoformat()
@@ -0,0 +1,45 @@
+from app.domains.services.device_component_management.services import device_component_instance_command_service as service_module
+from app.domains.inter_domain.audit import audit_command_provider as audit_provider_module
+from app.domains.services.hardware_blueprint.schemas.hardware_blueprint_query import BlueprintPinMappingRead
+
+
+def _recipe():
+    return [
+        BlueprintPinMappingRead(id=1, supported_component_id=1, pin_name="LED", pin_number=2, pin_mode="OUTPUT"),
+        BlueprintPinMappingRead(id=2, supported_component_id=2, pin_name="TEMP", pin_number=3, pin_mode="INPUT"),
+    ]
+
+
+def test_bulk_reinitialize_reports_progress_and_skips_devices_without_spare_pins(monkeypatch):
+    crud_q = service_module.device_component_instance_query_crud
+    crud_c = service_module.device_component_instance_command_crud
+    # 기기 2: 고장 핀 1개 -> 풀의 9번으로 우회 / 기기 3: 고장 핀 2개인데 여분은 1개뿐 -> 건너뜀
+    monkeypatch.setattr(crud_q, "get_faulty_pin_numbers", lambda db, *, device_ids: {2: {2}, 3: {2, 3}})
+    deleted, instances, mappings = [], [], []
+    monkeypatch.setattr(crud_c, "delete_wiring_for_devices", lambda db, *, device_ids: deleted.extend(device_ids))
+    monkeypatch.setattr(crud_c, "bulk_create_instances", lambda db, *, rows: instances.extend(rows) or list(range(len(instances) - len(rows), len(instances))))
+    monkeypatch.setattr(crud_c, "bulk_create_pin_mappings", lambda db, *, rows: mappings.extend(rows))
+    audited = []
+    monkeypatch.setattr(audit_provider_module.audit_command_service, "log", lambda **kw: audited.append(kw))
+
+    class _Db:
+        def flush(self):
+            pass
+
+    progress = []
+    summary = service_module.DeviceComponentInstanceCommandService().bulk_reinitialize_by_recipe(
+        _Db(), device_ids=[1, 2, 3], recipe=_recipe(), pin_pool=[2, 3, 9], actor_user=None,
+        on_progress=lambda done, total: progress.append((done, total)), chunk_size=2
+    )
+
+    assert progress == [(2, 3), (3, 3)]
+    assert summary == {
+        "device_count": 3, "rewired_device_count": 2, "failed_device_ids": [3],
+        "pin_mapping_count": 4, "rerouted_pin_count": 1,
+    }
+    assert deleted == [1, 2]
+    assert audited[0]["event_type"] == "DEVICE_COMPONENTS_BULK_REINITIALIZED"
+    assert audited[0]["details"]["failed_device_ids"] == [3]
+    assert {(m["device_id"], m["pin_name"], m["pin_number"]) for m in mappings} == {
+        (1, "LED", 2), (1, "TEMP", 3), (2, "LED", 9), (2, "TEMP", 3),
+    }
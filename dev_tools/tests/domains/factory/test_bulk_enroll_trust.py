@@ -0,0 +1,28 @@
+from starlette.requests import Request
+
+from app.api.v1.endpoints import factory
+from app.dependencies import PermissionChecker
+
+
+def _request(peer, forwarded=None):
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return Request({"type": "http", "method": "POST", "path": "/", "headers": headers, "client": (peer, 50000)})
+
+
+def test_client_ip_comes_from_the_connection_not_the_body(monkeypatch):
+    monkeypatch.setattr(factory.settings, "FACTORY_TRUSTED_PROXY_IPS", "")
+    # 프록시가 아닌 상대가 보낸 X-Forwarded-For는 무시합니다.
+    assert factory.resolve_client_ip(_request("203.0.113.5", "10.1.1.63")) == "203.0.113.5"
+
+
+def test_forwarded_for_is_trusted_only_behind_a_configured_proxy(monkeypatch):
+    monkeypatch.setattr(factory.settings, "FACTORY_TRUSTED_PROXY_IPS", "172.18.0.2, 172.18.0.3")
+    # 가장 오른쪽의 프록시가 아닌 주소가 요청자입니다. (왼쪽 값은 클라이언트가 임의로 넣을 수 있음)
+    assert factory.resolve_client_ip(_request("172.18.0.2", "127.0.0.1, 10.1.1.63, 172.18.0.3")) == "10.1.1.63"
+    assert factory.resolve_client_ip(_request("172.18.0.2")) == "172.18.0.2"
+
+
+def test_bulk_enroll_requires_factory_permission():
+    route = next(r for r in factory.router.routes if r.path == "/bulk-enroll")
+    checkers = [d.call for d in route.dependant.dependencies if isinstance(d.call, PermissionChecker)]
+    assert [c.required_permission for c in checkers] == ["factory:enroll"]
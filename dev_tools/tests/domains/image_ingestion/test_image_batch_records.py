@@ -0,0 +1,79 @@
+import uuid
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.objects.device import Device
+from app.models.objects.image_registry import ImageRegistry
+from app.models.objects.system_unit import SystemUnit
+from app.models.events_logs.observation_snapshot import ObservationSnapshot
+from app.domains.inter_domain.image_registry.image_command_provider import image_command_provider
+from app.domains.inter_domain.observation.observation_snapshot_command_provider import observation_snapshot_command_provider
+from app.domains.services.image_registry.schemas.image_registry_command import ImageRegistryCreate
+from app.domains.services.observation.schemas.observation_snapshot_command import ObservationSnapshotCreate
+
+
+@pytest.fixture
+def unit_and_device(db_session, test_product_line):
+    unit = SystemUnit(name="Image Batch Unit", product_line_id=test_product_line.id)
+    device = Device(cpu_serial="image-batch-device", current_uuid=uuid.uuid4())
+    db_session.add_all([unit, device])
+    db_session.flush()
+    return unit, device
+
+
+def _snapshot_count(db_session, *ids):
+    return db_session.scalar(select(func.count()).select_from(ObservationSnapshot).where(ObservationSnapshot.id.in_(ids)))
+
+
+def test_ensure_snapshots_merges_duplicates_and_keeps_existing_rows(db_session, unit_and_device):
+    unit, _ = unit_and_device
+    observation_snapshot_command_provider.ensure_snapshots(db_session, snapshots=[
+        ObservationSnapshotCreate(id="snap-a", system_unit_id=unit.id, observation_type="IMAGE"),
+    ])
+    # 같은 묶음 안의 중복 ID와 이미 있는 ID가 섞여 있어도 한 문장으로 끝나야 합니다.
+    observation_snapshot_command_provider.ensure_snapshots(db_session, snapshots=[
+        ObservationSnapshotCreate(id="snap-a", system_unit_id=unit.id, observation_type="SENSOR"),
+        ObservationSnapshotCreate(id="snap-b", system_unit_id=unit.id, observation_type="IMAGE"),
+        ObservationSnapshotCreate(id="snap-b", system_unit_id=unit.id, observation_type="IMAGE"),
+    ])
+    observation_snapshot_command_provider.ensure_snapshots(db_session, snapshots=[])
+
+    assert _snapshot_count(db_session, "snap-a", "snap-b") == 2
+    assert db_session.get(ObservationSnapshot, "snap-a").observation_type == "IMAGE"
+
+
+def test_get_or_create_snapshot_returns_the_existing_row(db_session, unit_and_device):
+    unit, _ = unit_and_device
+    first = observation_snapshot_command_provider.get_or_create_snapshot(
+        db_session, snapshot_id="snap-c", system_unit_id=unit.id, observation_type="IMAGE"
+    )
+    second = observation_snapshot_command_provider.get_or_create_snapshot(
+        db_session, snapshot_id="snap-c", system_unit_id=unit.id, observation_type="SENSOR"
+    )
+
+    assert first.id == second.id == "snap-c"
+    assert second.observation_type == "IMAGE"
+    assert _snapshot_count(db_session, "snap-c") == 1
+
+
+def test_create_image_records_returns_ids_in_input_order(db_session, unit_and_device, query_budget):
+    unit, device = unit_and_device
+    observation_snapshot_command_provider.ensure_snapshots(db_session, snapshots=[
+        ObservationSnapshotCreate(id=f"snap-{i}", system_unit_id=unit.id, observation_type="IMAGE") for i in range(3)
+    ])
+    records = [
+        ImageRegistryCreate(
+            snapshot_id=f"snap-{i % 3}", device_id=device.id, system_unit_id=unit.id,
+            storage_path=f"images/{i:02d}.jpg", image_metadata={"seq": i},
+        )
+        for i in range(12)
+    ]
+
+    with query_budget(max_queries=1):
+        ids = image_command_provider.create_image_records(db_session, records=records)
+
+    assert len(ids) == len(set(ids)) == len(records)
+    paths = dict(db_session.execute(select(ImageRegistry.id, ImageRegistry.storage_path).where(ImageRegistry.id.in_(ids))).all())
+    assert [paths[image_id] for image_id in ids] == [record.storage_path for record in records]
+    assert image_command_provider.create_image_records(db_session, records=[]) == []
@@ -0,0 +1,84 @@
+import hashlib
+import hmac
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.domains.application.ingestion import ingestion_dispatcher as dispatcher_module
+from app.domains.action_authorization.validators.hmac_integrity.validator import HmacIntegrityValidator
+from app.domains.services.mqtt_gateway.services.mqtt_message_router import MqttMessageRouter, extract_signature
+
+SECRET = "device-secret"
+DEVICE_UUID = "3f2a8c1e-0000-4000-8000-000000000001"
+
+
+class _Session:
+    def __init__(self):
+        self.committed = self.rolled_back = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def commit(self):
+        self.committed += 1
+
+    def rollback(self):
+        self.rolled_back += 1
+
+
+@pytest.fixture
+def verified_ingest(monkeypatch):
+    """디스패처가 넘긴 인자를 그대로 HMAC 검증기에 넣어 결과를 돌려줍니다."""
+    validator = HmacIntegrityValidator()
+    device = SimpleNamespace(id=1, hmac_secret_key=SECRET, current_uuid=DEVICE_UUID)
+    calls = []
+
+    def ingest(db, *, device_uuid_str, topic, payload, raw_payload=None, signature=None):
+        calls.append({"device_uuid_str": device_uuid_str, "raw_payload": raw_payload, "signature": signature})
+        return validator.validate(db, device=device, payload=payload, raw_payload=raw_payload, signature=signature)
+
+    monkeypatch.setattr(dispatcher_module.telemetry_ingestion_policy_provider, "ingest", ingest)
+    return calls
+
+
+def _sign(message: bytes) -> str:
+    return hmac.new(SECRET.encode(), message, hashlib.sha256).hexdigest()
+
+
+@pytest.mark.anyio
+async def test_signed_mqtt_message_is_verified_over_received_bytes(verified_ingest):
+    # 키 순서/공백이 정규화 규격과 다른 원문: 재직렬화했다면 서명이 맞지 않습니다.
+    raw = b'{"nodes": [], "ts":1700000000.5, "b":1}'
+    session = _Session()
+    router = MqttMessageRouter(lambda: session, redis_client=None)
+
+    await router.handle_message(None, f"telemetry/{DEVICE_UUID}/data", raw, 1, {"user_property": [("trace", "x"), ("hmac", _sign(raw))]})
+
+    assert verified_ingest == [{"device_uuid_str": DEVICE_UUID, "raw_payload": raw, "signature": _sign(raw)}]
+    assert session.committed == 1 and session.rolled_back == 0
+
+
+@pytest.mark.anyio
+async def test_tampered_bytes_fail_raw_mode_verification(verified_ingest):
+    raw = b'{"nodes":[],"value":1}'
+    session = _Session()
+    router = MqttMessageRouter(lambda: session, redis_client=None)
+
+    await router.handle_message(None, f"telemetry/{DEVICE_UUID}/data", b'{"nodes":[],"value":2}', 1, {"user_property": [("hmac", _sign(raw))]})
+
+    assert session.committed == 0 and session.rolled_back == 1
+
+
+def test_unsigned_message_falls_back_to_payload_signature():
+    assert extract_signature({}) is None
+    assert extract_signature({"user_property": [("other", "v")]}) is None
+
+    validator = HmacIntegrityValidator()
+    device = SimpleNamespace(id=2, hmac_secret_key=SECRET, current_uuid=DEVICE_UUID)
+    body = {"b": 1, "a": "x"}
+    signed = {**body, "hmac": _sign(json.dumps(body, sort_keys=True, separators=(",", ":")).encode())}
+    assert validator.validate(None, device=device, payload=signed, raw_payload=b"{}", signature=None) == (True, None)
@@ -0,0 +1,88 @@
+import fakeredis
+import pytest
+
+from app.domains.services.realtime.managers.device_state_codec import (
+    VERSION_FIELD, build_state, decode_value, encode_value, split_payload,
+)
+from app.domains.services.realtime.repositories.device_state_repository import DEVICE_STATE_KEY_PREFIX, DeviceStateRepository
+
+
+@pytest.mark.parametrize("value", [
+    None, True, False, 0, -7, 2**31, -2**63, 2**70, 23.456, 0.1, -1.5e-3, 1e300,
+    1700000000.123456, 1700000000.0, 123456789.5, "한글 ✓", [1, "a"], {"k": [1.5]},
+])
+def test_codec_round_trips_values_exactly(value):
+    assert decode_value(encode_value(value)) == value
+
+
+def test_floats_use_float32_only_when_lossless():
+    assert encode_value(23.456)[:1] == b"r" and len(encode_value(23.456)) == 5
+    # epoch 타임스탬프는 float32로는 초 단위도 보존되지 않으므로 float64로 저장합니다.
+    assert encode_value(1700000000.123)[:1] == b"d"
+    assert decode_value(encode_value(1700000000.123)) == 1700000000.123
+    assert encode_value(float("inf"))[:1] == b"r"
+
+
+def test_split_and_build_restore_nested_payload():
+    payload = {
+        "device_status": "ONLINE", "ts": 1700000000.25,
+        "nodes": [{"device_uuid": "n1", "metrics": [{"name": "temp", "value": 21.5}]}, {"device_uuid": "n2", "metrics": []}],
+    }
+    headers, leaves = split_payload(payload)
+    assert headers == {"device_status": "ONLINE"}
+    assert build_state(headers, leaves) == payload
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeRedis()
+
+
+def _write(repo, redis, device_uuid, payload):
+    pipe = redis.pipeline(transaction=False)
+    written = repo.stage_write(pipe, device_uuid, payload)
+    (created,) = pipe.execute()
+    repo.confirm_write(device_uuid, created)
+    return written
+
+
+def test_delta_writes_skip_unchanged_metrics_and_always_carry_version(redis):
+    repo = DeviceStateRepository(redis, delta_cache_size=10)
+    payload = {"device_status": "ONLINE", "temp": 21.5, "nodes": [{"v": 1}, {"v": 2}]}
+    assert _write(repo, redis, "dev", payload) == 4  # temp, nodes 길이, nodes[0].v, nodes[1].v
+
+    assert _write(repo, redis, "dev", {**payload, "temp": 22.0}) == 1
+    assert repo.stats["fields_skipped"] == 3
+
+    # 목록이 줄면 길이 필드가 바뀌어 예전 꼬리는 읽히지 않습니다.
+    assert _write(repo, redis, "dev", {**payload, "temp": 22.0, "nodes": [{"v": 1}]}) == 1
+    assert repo.read("dev") == {"device_status": "ONLINE", "temp": 22.0, "nodes": [{"v": 1}]}
+
+    # 다른 프로세스(읽기 전용 인스턴스)도 사전을 불러 같은 상태로 복원합니다.
+    assert DeviceStateRepository(redis).read("dev") == repo.read("dev")
+
+
+def test_wiped_hash_is_detected_and_followed_by_full_write(redis):
+    repo = DeviceStateRepository(redis, delta_cache_size=10)
+    payload = {"device_status": "ONLINE", "temp": 21.5, "hum": 40}
+    _write(repo, redis, "dev", payload)
+
+    redis.delete(f"{DEVICE_STATE_KEY_PREFIX}dev")  # Redis 재시작/수동 삭제
+    _write(repo, redis, "dev", {**payload, "temp": 21.6})
+    # 델타 쓰기라 hum은 빠졌지만 버전 필드는 있으므로 포맷은 읽힙니다.
+    assert redis.hget(f"{DEVICE_STATE_KEY_PREFIX}dev", VERSION_FIELD) == b"1"
+    assert repo.read("dev") == {"device_status": "ONLINE", "temp": 21.6}
+    assert repo.stats["resets"] == 1
+
+    # 다음 쓰기는 전체 쓰기로 빠진 필드를 되살립니다.
+    _write(repo, redis, "dev", {**payload, "temp": 21.6})
+    assert repo.read("dev") == {"device_status": "ONLINE", "temp": 21.6, "hum": 40}
+
+
+def test_health_checker_header_edits_do_not_trigger_reset(redis):
+    repo = DeviceStateRepository(redis, delta_cache_size=10)
+    _write(repo, redis, "dev", {"device_status": "ONLINE", "temp": 1.5})
+    redis.hset(f"{DEVICE_STATE_KEY_PREFIX}dev", mapping={"device_status": "TIMEOUT", "timeout_at": "x"})
+    _write(repo, redis, "dev", {"device_status": "ONLINE", "temp": 1.5})
+    assert repo.stats["resets"] == 0
+    assert repo.read("dev")["device_status"] == "ONLINE"
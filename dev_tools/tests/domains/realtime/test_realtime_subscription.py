@@ -0,0 +1,65 @@
+import asyncio
+import json
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.v1.endpoints import realtime as realtime_endpoint
+from app.models.objects.device import Device
+from app.domains.action_authorization.policies.realtime_subscription import realtime_subscription_policy as policy_module
+from app.domains.services.realtime.managers.realtime_hub import RealtimeConnection
+
+
+def test_authorize_devices_loads_all_devices_in_one_query(db_session, query_budget, test_hardware_blueprint, monkeypatch):
+    devices = [
+        Device(cpu_serial=f"rt-{i}", current_uuid=uuid.uuid4(), hardware_blueprint_id=test_hardware_blueprint.id)
+        for i in range(5)
+    ]
+    db_session.add_all(devices)
+    db_session.flush()
+    owned = {str(d.current_uuid) for d in devices[:3]}
+
+    monkeypatch.setattr(policy_module.user_identity_query_provider, "get_user_by_id", lambda db, *, user_id: SimpleNamespace(id=user_id, is_active=True))
+    monkeypatch.setattr(
+        policy_module.device_ownership_validator_provider, "validate_access_many",
+        lambda *, user, devices, access: [(str(d.current_uuid) in owned, None) for d in devices]
+    )
+
+    unknown = str(uuid.uuid4())
+    requested = [str(d.current_uuid) for d in devices] + [str(devices[0].current_uuid).upper(), unknown, "not-a-uuid"]
+    with query_budget(max_queries=1):
+        allowed, denied = policy_module.realtime_subscription_policy.authorize_devices(db_session, user_id=1, device_uuids=requested)
+
+    assert set(allowed) == owned and len(allowed) == 3
+    assert set(denied) == {str(d.current_uuid) for d in devices[3:]} | {unknown, "not-a-uuid"}
+
+
+def test_inactive_user_is_denied_everything(monkeypatch):
+    monkeypatch.setattr(policy_module.user_identity_query_provider, "get_user_by_id", lambda db, *, user_id: SimpleNamespace(id=user_id, is_active=False))
+    assert policy_module.realtime_subscription_policy.authorize_devices(None, user_id=1, device_uuids=["a", "b"]) == ([], ["a", "b"])
+
+
+@pytest.mark.anyio
+async def test_reauthorize_loop_unsubscribes_revoked_devices(monkeypatch):
+    connection = RealtimeConnection(websocket=None, user_id=7)
+    connection.devices = {"dev-a", "dev-b"}
+    revoked_calls = []
+
+    async def unsubscribe(conn, device_uuids):
+        revoked_calls.append(list(device_uuids))
+        for device_uuid in device_uuids:
+            conn.devices.discard(device_uuid)
+
+    monkeypatch.setattr(realtime_endpoint.settings, "REALTIME_REAUTHORIZE_INTERVAL_SECONDS", 0.01)
+    monkeypatch.setattr(realtime_endpoint, "_authorize", lambda user_id, device_uuids: (["dev-a"], [d for d in device_uuids if d != "dev-a"]))
+    monkeypatch.setattr(realtime_endpoint.realtime_hub, "unsubscribe", unsubscribe)
+
+    task = asyncio.create_task(realtime_endpoint._reauthorize_loop(connection, 7))
+    await asyncio.sleep(0.05)
+    connection.closed = True
+    await asyncio.wait_for(task, timeout=1)
+
+    assert revoked_calls == [["dev-b"]]
+    assert connection.devices == {"dev-a"}
+    assert json.loads(connection._control[0]) == {"type": "revoked", "devices": ["dev-b"]}
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from app.domains.services.realtime.managers.state_single_flight import StateSingleFlight
+
+
+class _Loader:
+    """호출마다 게이트를 만들어, 테스트가 로드 완료 시점을 직접 정합니다."""
+    def __init__(self):
+        self.calls = 0
+        self.gates = []
+
+    async def __call__(self, key):
+        self.calls += 1
+        version = self.calls
+        gate = asyncio.Event()
+        self.gates.append(gate)
+        await gate.wait()
+        return f"{key}:v{version}"
+
+
+@pytest.mark.anyio
+async def test_concurrent_requests_share_one_load_and_reuse_window():
+    loader = _Loader()
+    flight = StateSingleFlight(loader, window_seconds=60)
+
+    tasks = [asyncio.create_task(flight.get("dev")) for _ in range(5)]
+    await asyncio.sleep(0)
+    loader.gates[0].set()
+    assert await asyncio.gather(*tasks) == ["dev:v1"] * 5
+    assert await flight.get("dev") == "dev:v1"
+
+    assert loader.calls == 1
+    assert flight.stats["collapsed"] == 4 and flight.stats["window_hits"] == 1
+
+
+@pytest.mark.anyio
+async def test_invalidate_during_load_is_not_cached_and_next_request_reloads():
+    loader = _Loader()
+    flight = StateSingleFlight(loader, window_seconds=60)
+
+    first = asyncio.create_task(flight.get("dev"))
+    await asyncio.sleep(0)
+    flight.invalidate("dev")  # 로드 중에 새 텔레메트리가 도착
+
+    # 무효화 이후 요청은 진행 중인(낡은) 로드에 합류하지 않고 새로 읽습니다.
+    second = asyncio.create_task(flight.get("dev"))
+    await asyncio.sleep(0)
+    assert loader.calls == 2
+
+    loader.gates[0].set()
+    assert await first == "dev:v1"
+    loader.gates[1].set()
+    assert await second == "dev:v2"
+
+    # 낡은 v1은 재사용 창에 남지 않고, 새 로드의 값만 재사용됩니다.
+    assert await flight.get("dev") == "dev:v2"
+    assert loader.calls == 2
+    assert flight.snapshot()["inflight"] == 0
+
+
+@pytest.mark.anyio
+async def test_invalidate_after_load_drops_window_value():
+    loader = _Loader()
+    flight = StateSingleFlight(loader, window_seconds=60)
+    task = asyncio.create_task(flight.get("dev"))
+    await asyncio.sleep(0)
+    loader.gates[0].set()
+    await task
+
+    flight.invalidate("dev")
+    task = asyncio.create_task(flight.get("dev"))
+    await asyncio.sleep(0)
+    loader.gates[1].set()
+    assert await task == "dev:v2"
+
+
+@pytest.mark.anyio
+async def test_load_failure_reaches_waiters_and_is_not_cached():
+    calls = []
+
+    async def failing(key):
+        calls.append(key)
+        await asyncio.sleep(0)
+        raise RuntimeError("redis down")
+
+    flight = StateSingleFlight(failing, window_seconds=60)
+    results = await asyncio.gather(flight.get("dev"), flight.get("dev"), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(calls) == 1 and flight.stats["load_failures"] == 1
+
+    with pytest.raises(RuntimeError):
+        await flight.get("dev")
+    assert len(calls) == 2
@@ -0,0 +1,198 @@
+import time
+import uuid
+from datetime import datetime, timezone
+
+import fakeredis
+import pytest
+
+from app.core.config import get_settings
+from app.models.objects.device import Device
+from app.models.objects.system_unit import SystemUnit
+from app.models.objects.user import User
+from app.models.relationships.schedule import Schedule
+from app.domains.application.scheduler.schedule_executor import ScheduleExecutor
+from app.domains.inter_domain.schedule.schedule_run_provider import schedule_run_provider
+from app.domains.services.schedule.repositories.schedule_run_completion_repository import schedule_run_completion_repository
+from app.domains.services.schedule.schemas.schedule_query import ScheduleRuntimeRead
+from app.domains.services.schedule.schemas.schedule_run import ScheduleRunCompletion
+
+
+def _schedule(policy: str, *, schedule_id: int = 1, timeout_seconds=300) -> ScheduleRuntimeRead:
+    now = datetime.now(timezone.utc)
+    return ScheduleRuntimeRead(
+        id=schedule_id,
+        system_unit_id=7,
+        name=f"schedule-{schedule_id}",
+        execution_mode="INTERVAL",
+        concurrency_policy=policy,
+        timeout_seconds=timeout_seconds,
+        start_time=now,
+        recurrence_pattern={"type": "seconds", "value": 60},
+        action_details=[{"cmd": "START"}],
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def executor():
+    executor = ScheduleExecutor(settings=get_settings(), db_session_factory=None)
+    executor.published = []
+
+    def _publish_batch(pending):
+        executor.published.extend(item.command for item in pending)
+        return [True] * len(pending)
+
+    executor._publish_batch = _publish_batch
+    return executor
+
+
+async def _fire(executor, schedule):
+    executor._schedules[schedule.id] = schedule
+    now = time.time()
+    await executor._handle_due([(("fire", schedule.id), now, None)], now)
+
+
+def _types(commands):
+    return [command["type"] for command in commands]
+
+
+@pytest.mark.anyio
+async def test_skip_drops_fires_while_a_run_is_active(executor):
+    schedule = _schedule("SKIP")
+    await _fire(executor, schedule)
+    await _fire(executor, schedule)
+    assert _types(executor.published) == ["SCHEDULE_RUN"]
+    assert executor.stats.skipped == 1
+
+    run_id = executor.published[0]["run_id"]
+    assert executor.complete_run(schedule.id, run_id) == []
+    await _fire(executor, schedule)
+    assert _types(executor.published) == ["SCHEDULE_RUN", "SCHEDULE_RUN"]
+
+
+@pytest.mark.anyio
+async def test_queue_starts_the_waiting_fire_when_the_run_completes(executor):
+    schedule = _schedule("QUEUE")
+    await _fire(executor, schedule)
+    await _fire(executor, schedule)
+    assert _types(executor.published) == ["SCHEDULE_RUN"]
+    assert executor.stats.queued == 1
+
+    follow_up = executor.complete_run(schedule.id, executor.published[0]["run_id"])
+    assert len(follow_up) == 1 and follow_up[0].command["type"] == "SCHEDULE_RUN"
+    assert follow_up[0].command["run_id"] != executor.published[0]["run_id"]
+    # 늦게 도착한 중복 응답은 무시됩니다.
+    assert executor.complete_run(schedule.id, executor.published[0]["run_id"]) == []
+
+
+@pytest.mark.anyio
+async def test_replace_cancels_the_active_run_before_starting_a_new_one(executor):
+    schedule = _schedule("REPLACE")
+    await _fire(executor, schedule)
+    first_run = executor.published[0]["run_id"]
+    await _fire(executor, schedule)
+
+    assert _types(executor.published) == ["SCHEDULE_RUN", "SCHEDULE_CANCEL", "SCHEDULE_RUN"]
+    assert executor.published[1] == {
+        "type": "SCHEDULE_CANCEL", "schedule_id": schedule.id, "run_id": first_run, "reason": "REPLACED"
+    }
+    assert list(executor._active_runs[schedule.id]) == [executor.published[2]["run_id"]]
+
+
+@pytest.mark.anyio
+async def test_timeout_cancels_the_run_and_releases_the_queue(executor):
+    schedule = _schedule("QUEUE")
+    await _fire(executor, schedule)
+    await _fire(executor, schedule)
+    run_id = executor.published[0]["run_id"]
+
+    await executor._handle_due([(("timeout", schedule.id, run_id), time.time(), None)], time.time())
+    assert _types(executor.published) == ["SCHEDULE_RUN", "SCHEDULE_CANCEL", "SCHEDULE_RUN"]
+    assert executor.published[1]["reason"] == "TIMEOUT"
+    assert executor.stats.timed_out == 1
+
+
+@pytest.mark.anyio
+async def test_runs_without_timeout_are_fire_and_forget(executor):
+    schedule = _schedule("SKIP", timeout_seconds=None)
+    await _fire(executor, schedule)
+    await _fire(executor, schedule)
+    assert _types(executor.published) == ["SCHEDULE_RUN", "SCHEDULE_RUN"]
+    assert not executor._active_runs
+
+
+@pytest.mark.anyio
+async def test_completion_reported_by_listener_is_drained_and_releases_queue(executor, monkeypatch):
+    monkeypatch.setattr(schedule_run_completion_repository, "redis", fakeredis.FakeRedis())
+    schedule = _schedule("QUEUE")
+    await _fire(executor, schedule)
+    await _fire(executor, schedule)
+
+    schedule_run_completion_repository.push(ScheduleRunCompletion(schedule_id=schedule.id, run_id="unknown", status="ok"))
+    schedule_run_completion_repository.push(
+        ScheduleRunCompletion(schedule_id=schedule.id, run_id=executor.published[0]["run_id"], status="ok")
+    )
+    await executor._drain_completions()
+
+    assert _types(executor.published) == ["SCHEDULE_RUN", "SCHEDULE_RUN"]
+    assert executor.stats.completed == 1
+    assert schedule_run_provider.pop_completions(limit=10) == []
+
+
+@pytest.mark.anyio
+async def test_queue_is_capped_by_dropping_the_oldest_fire(executor, monkeypatch):
+    monkeypatch.setattr(executor.settings, "SCHEDULER_MAX_QUEUED_FIRES", 2)
+    schedule = _schedule("QUEUE")
+    for _ in range(4):
+        await _fire(executor, schedule)
+
+    assert len(executor._queued_fires[schedule.id]) == 2
+    assert executor.stats.queue_overflows == 1
+
+
+@pytest.mark.anyio
+async def test_queued_fire_is_returned_to_the_queue_when_its_dispatch_fails(executor):
+    schedule = _schedule("QUEUE")
+    await _fire(executor, schedule)
+    await _fire(executor, schedule)
+    queued_at = executor._queued_fires[schedule.id][0]
+
+    executor._publish_batch = lambda pending: [False] * len(pending)
+    await executor._dispatch(executor.complete_run(schedule.id, executor.published[0]["run_id"]), time.time())
+    assert list(executor._queued_fires[schedule.id]) == [queued_at]
+    assert executor.stats.dispatch_failures == 1
+
+    executor._publish_batch = lambda pending: executor.published.extend(item.command for item in pending) or [True] * len(pending)
+    due = executor.wheel.advance(time.time() + executor.settings.SCHEDULER_QUEUE_RETRY_SECONDS + 1)
+    assert [key for key, _, _ in due] == [("release", schedule.id)]
+    await executor._handle_due(due, time.time())
+    assert _types(executor.published) == ["SCHEDULE_RUN", "SCHEDULE_RUN"]
+    assert not executor._queued_fires[schedule.id]
+
+
+def test_completion_is_accepted_only_from_a_device_of_the_schedule_unit(db_session, test_product_line, monkeypatch):
+    monkeypatch.setattr(schedule_run_completion_repository, "redis", fakeredis.FakeRedis())
+    owner = User(username="schedule-owner", email="schedule-owner@example.com", password_hash="x")
+    unit, other_unit = (SystemUnit(name=name, product_line_id=test_product_line.id) for name in ("unit-a", "unit-b"))
+    db_session.add_all([owner, unit, other_unit])
+    db_session.flush()
+    member = Device(cpu_serial="schedule-member", current_uuid=uuid.uuid4(), system_unit_id=unit.id)
+    outsider = Device(cpu_serial="schedule-outsider", current_uuid=uuid.uuid4(), system_unit_id=other_unit.id)
+    schedule = Schedule(
+        name="pump", system_unit_id=unit.id, user_id=owner.id,
+        start_time=datetime.now(timezone.utc), action_details=[{"cmd": "START"}],
+    )
+    db_session.add_all([member, outsider, schedule])
+    db_session.flush()
+
+    def report(device_uuid):
+        return schedule_run_provider.report_completion(
+            db_session, device_uuid=device_uuid, schedule_id=schedule.id, run_id="run-1", status="ok"
+        )
+
+    assert report(str(outsider.current_uuid)) is False
+    assert report("not-a-uuid") is False
+    assert schedule_run_provider.pop_completions(limit=10) == []
+
+    assert report(str(member.current_uuid)) is True
+    assert [c.run_id for c in schedule_run_provider.pop_completions(limit=10)] == ["run-1"]
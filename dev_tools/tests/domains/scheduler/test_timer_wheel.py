@@ -0,0 +1,50 @@
+from app.domains.services.schedule.managers.timer_wheel import HierarchicalTimerWheel
+
+
+def _keys(expired):
+    return [key for key, _, _ in expired]
+
+
+def test_advance_returns_due_timers_in_fire_order():
+    wheel = HierarchicalTimerWheel(start_time=0.0, tick_seconds=1.0)
+    wheel.schedule("b", 3.0)
+    wheel.schedule("a", 2.0)
+    wheel.schedule("c", 10.0)
+
+    assert wheel.advance(1.0) == []
+    assert _keys(wheel.advance(5.0)) == ["a", "b"]
+    assert "c" in wheel and len(wheel) == 1
+
+
+def test_cancel_and_reschedule_replace_previous_entry():
+    wheel = HierarchicalTimerWheel(start_time=0.0, tick_seconds=1.0)
+    wheel.schedule("job", 2.0)
+    wheel.schedule("job", 8.0)
+    wheel.schedule("gone", 3.0)
+    assert wheel.cancel("gone") is True
+    assert wheel.cancel("gone") is False
+
+    assert wheel.advance(5.0) == []
+    assert wheel.get_fire_at("job") == 8.0
+    assert _keys(wheel.advance(8.0)) == ["job"]
+
+
+def test_far_future_timers_cascade_down_through_levels_and_overflow():
+    # span = 4 ** 2 = 16 ticks, so 100 starts in the overflow heap and 10 on level 1.
+    wheel = HierarchicalTimerWheel(start_time=0.0, tick_seconds=1.0, slots_per_level=4, levels=2)
+    wheel.schedule("level1", 10.0)
+    wheel.schedule("overflow", 100.0)
+
+    fired = {}
+    for second in range(1, 120):
+        for key, fire_at, _ in wheel.advance(float(second)):
+            fired[key] = second
+    assert fired == {"level1": 10, "overflow": 100}
+    assert len(wheel) == 0
+
+
+def test_timer_scheduled_in_the_past_fires_on_next_advance():
+    wheel = HierarchicalTimerWheel(start_time=0.0, tick_seconds=1.0)
+    wheel.advance(50.0)
+    wheel.schedule("late", 10.0, payload={"x": 1})
+    assert wheel.advance(50.0) == [("late", 10.0, {"x": 1})]
@@ -0,0 +1,153 @@
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.objects.device import Device
+from app.models.objects.system_unit import SystemUnit
+from app.models.events_logs.observation_snapshot import ObservationSnapshot
+from app.models.events_logs.telemetry_data import TelemetryData
+from app.models.events_logs.telemetry_metadata import TelemetryMetadata
+from app.domains.services.telemetry.crud.telemetry_archive_crud import telemetry_archive_crud
+from app.domains.services.telemetry.crud.telemetry_partition_crud import telemetry_partition_crud
+from app.domains.services.telemetry.managers.telemetry_archive import TelemetryArchiveStore
+from app.domains.services.telemetry.schemas.telemetry_query import TelemetryFilter
+from app.domains.services.telemetry.services import telemetry_archive_service as archive_module
+from app.domains.services.telemetry.services import telemetry_query_service as query_module
+from app.domains.services.telemetry.services.telemetry_archive_service import TelemetryArchiveService
+from app.domains.services.telemetry.services.telemetry_partition_service import telemetry_partition_service
+from app.domains.services.telemetry.services.telemetry_query_service import telemetry_query_service
+
+# 마이그레이션이 만든 파티션과 겹치지 않는 먼 미래 구간에서 검증합니다.
+NOW = datetime(2031, 3, 10, 12, 0, tzinfo=timezone.utc)
+TARGET = "telemetry_data_p20310310"
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive_module.settings, "TELEMETRY_ARCHIVE_AFTER_DAYS", 1)
+    monkeypatch.setattr(archive_module.settings, "TELEMETRY_ARCHIVE_BATCH_ROWS", 2)
+    monkeypatch.setattr(archive_module.settings, "TELEMETRY_PARTITION_INTERVAL", "day")
+    monkeypatch.setattr(archive_module.settings, "TELEMETRY_PARTITION_PREMAKE", 2)
+    service = TelemetryArchiveService(TelemetryArchiveStore(str(tmp_path)))
+    monkeypatch.setattr(query_module, "telemetry_archive_service", service)
+    return service
+
+
+@pytest.fixture
+def archived_rows(db_session, test_product_line, archive):
+    """대상 파티션(03-10)에 5행, 그중 2행에 메타데이터."""
+    telemetry_partition_service.ensure_partitions(db_session, now=NOW)
+    unit = SystemUnit(name="Archive Unit", product_line_id=test_product_line.id)
+    device = Device(cpu_serial="archive-device", current_uuid=uuid.uuid4())
+    db_session.add_all([unit, device])
+    db_session.flush()
+    db_session.add(ObservationSnapshot(id="archive-snap", system_unit_id=unit.id, observation_type="SENSOR"))
+    rows = [
+        TelemetryData(
+            device_id=device.id, system_unit_id=unit.id, snapshot_id="archive-snap",
+            metric_name="temp", component_name="cpu", captured_at=NOW + timedelta(minutes=i),
+            avg_value=float(i), min_value=float(i), max_value=float(i), std_dev=0.0, slope=0.0, sample_count=10,
+            extra_stats={"i": i} if i == 0 else None,
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(rows)
+    db_session.flush()
+    db_session.add_all([
+        TelemetryMetadata(telemetry_data_id=rows[i].id, meta_key="k", meta_value=f"v{i}", meta_value_type="STRING")
+        for i in (1, 3)
+    ])
+    db_session.flush()
+    return device, rows
+
+
+def _archive_target(db_session, archive):
+    """03-10 파티션이 나올 때까지 archive_next를 돌립니다. (마이그레이션이 만든 더 오래된 빈 파티션이 먼저 처리됨)"""
+    for _ in range(64):
+        result = archive.archive_next(db_session, now=NOW + timedelta(days=2))
+        assert result is not None
+        if result["partition"] == TARGET:
+            return result
+        archive.publish(result["partition"])
+    raise AssertionError(f"{TARGET} was never archived")
+
+
+def test_archive_publishes_manifest_only_after_commit(db_session, archive, archived_rows):
+    device, rows = archived_rows
+
+    result = _archive_target(db_session, archive)
+
+    assert result == {"partition": TARGET, "rows": 5, "metadata_rows": 2, "detached": False}
+    assert not telemetry_archive_crud.table_exists(db_session, table_name=TARGET)
+    # 커밋 전: 파일과 pending 항목만 있고 조회 경로(manifest)에는 보이지 않는다.
+    assert TARGET in archive.store.pending()
+    assert TARGET not in archive.store.manifest()["partitions"]
+    assert list(archive.store.scan(device_ids=[device.id])) == []
+
+    archive.publish(TARGET)
+
+    entry = archive.store.manifest()["partitions"][TARGET]
+    assert archive.store.pending() == [] and archive.store.verify(TARGET)
+    assert entry["rows"] == 5 and entry["metadata_rows"] == 2
+    assert [b[2] for b in entry["batches"]] == [2, 2, 1]
+    assert entry["start"] == NOW.replace(hour=0).isoformat()
+    scanned = list(archive.store.scan(device_ids=[device.id]))
+    assert [r[0] for r in scanned] == [r.id for r in rows]
+
+
+def test_failed_detach_leaves_no_manifest_entry_and_recovery_discards_it(db_session, archive, archived_rows, monkeypatch):
+    device, rows = archived_rows
+    real_detach = telemetry_partition_crud.detach_partition
+
+    def failing_detach(db, *, partition_name):
+        if partition_name == TARGET:
+            raise RuntimeError("lock timeout")
+        real_detach(db, partition_name=partition_name)
+
+    monkeypatch.setattr(telemetry_partition_crud, "detach_partition", failing_detach)
+    with pytest.raises(RuntimeError):
+        _archive_target(db_session, archive)
+    assert TARGET not in archive.store.manifest()["partitions"]
+
+    # 원본이 DB에 남아 있으므로(롤백된 아카이브) 다음 실행은 pending 항목과 파일을 버린다.
+    archive._recover_pending(db_session)
+    assert archive.store.pending() == []
+    assert not [f for f in os.listdir(archive.store.base_dir) if f.startswith(TARGET)]
+    assert list(archive.store.scan(device_ids=[device.id])) == []
+
+
+def test_recovery_publishes_pending_entry_whose_table_is_gone(db_session, archive, archived_rows):
+    device, rows = archived_rows
+    _archive_target(db_session, archive)
+
+    # 커밋 후 publish 전에 프로세스가 죽은 경우: 원본 테이블이 없으므로 다음 실행이 등록한다.
+    archive._recover_pending(db_session)
+
+    assert TARGET in archive.store.manifest()["partitions"]
+    assert len(list(archive.store.scan(device_ids=[device.id]))) == 5
+
+
+def test_query_reads_archived_rows_with_metadata(db_session, archive, archived_rows):
+    device, rows = archived_rows
+    _archive_target(db_session, archive)
+    archive.publish(TARGET)
+
+    result = telemetry_query_service.get_telemetry_data(
+        db_session, filters=TelemetryFilter(device_ids=[device.id], limit=10)
+    )
+
+    # 최신순: DB에 남은 행이 없으므로 전부 아카이브에서 읽힌다.
+    assert [r.id for r in result] == [r.id for r in reversed(rows)]
+    by_id = {r.id: r for r in result}
+    assert [(m.meta_key, m.meta_value) for m in by_id[rows[1].id].metadata_items] == [("k", "v1")]
+    assert [m.meta_value for m in by_id[rows[3].id].metadata_items] == ["v3"]
+    assert by_id[rows[2].id].metadata_items == []
+    assert by_id[rows[0].id].extra_stats == {"i": 0}
+
+
+def test_archive_is_disabled_by_default(db_session, archive, monkeypatch):
+    monkeypatch.setattr(archive_module.settings, "TELEMETRY_ARCHIVE_AFTER_DAYS", 0)
+    assert archive.archive_next(db_session, now=NOW) is None
+    assert archive.store.manifest() == {"partitions": {}}
@@ -0,0 +1,109 @@
+import csv
+import io
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.objects.device import Device
+from app.models.objects.system_unit import SystemUnit
+from app.models.events_logs.observation_snapshot import ObservationSnapshot
+from app.models.events_logs.telemetry_data import TelemetryData
+from app.domains.services.telemetry.managers.export_encoders import EXPORT_COLUMNS
+from app.domains.services.telemetry.schemas.telemetry_query import TelemetryExportFilter
+from app.domains.services.telemetry.services import telemetry_query_service as service_module
+from app.domains.services.telemetry.services.telemetry_query_service import telemetry_query_service
+
+BASE = datetime(2024, 7, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def exported_rows(db_session, test_product_line, monkeypatch):
+    """같은 captured_at을 공유하는 행이 섞인 10행. (키셋 커서가 id로 순서를 가려야 하는 경우)"""
+    monkeypatch.setattr(service_module.telemetry_archive_service, "has_archive", lambda **kw: False)
+    monkeypatch.setattr(service_module.settings, "TELEMETRY_EXPORT_PAGE_ROWS", 3)
+    monkeypatch.setattr(service_module.settings, "TELEMETRY_EXPORT_FETCH_SIZE", 2)
+
+    unit = SystemUnit(name="Export Unit", product_line_id=test_product_line.id)
+    device = Device(cpu_serial="export-device", current_uuid=uuid.uuid4())
+    db_session.add_all([unit, device])
+    db_session.flush()
+    db_session.add(ObservationSnapshot(id="export-snap", system_unit_id=unit.id, observation_type="SENSOR"))
+    rows = [
+        TelemetryData(
+            device_id=device.id, system_unit_id=unit.id, snapshot_id="export-snap",
+            metric_name="temp", component_name=f"cpu{i % 2}", unit="C",
+            captured_at=BASE + timedelta(seconds=10 * (i // 2)),
+            avg_value=float(i), min_value=float(i), max_value=float(i), std_dev=0.0, slope=0.0, sample_count=10,
+            extra_stats={"i": i} if i % 3 == 0 else None,
+        )
+        for i in range(10)
+    ]
+    db_session.add_all(rows)
+    db_session.flush()
+    return unit, sorted(rows, key=lambda r: (r.captured_at, r.id))
+
+
+def _ndjson(db_session, **filters):
+    body = b"".join(telemetry_query_service.export_telemetry(db_session, filters=TelemetryExportFilter(**filters)))
+    return [json.loads(line) for line in body.decode().splitlines()]
+
+
+def test_keyset_pages_cover_every_row_once_and_resume_after_the_cursor(db_session, exported_rows):
+    unit, rows = exported_rows
+
+    records = _ndjson(db_session, system_unit_ids=[unit.id])
+    assert [r["id"] for r in records] == [r.id for r in rows]
+    assert records[0]["captured_at"] == rows[0].captured_at.isoformat()
+
+    # 첫 응답이 3행에서 끊긴 뒤, 마지막으로 받은 행을 커서로 이어받는다. (3번째 행은 4번째와 같은 시각)
+    first = _ndjson(db_session, system_unit_ids=[unit.id], max_rows=3)
+    cursor = first[-1]
+    rest = _ndjson(
+        db_session, system_unit_ids=[unit.id],
+        after_captured_at=datetime.fromisoformat(cursor["captured_at"]), after_id=cursor["id"],
+    )
+    assert [r["id"] for r in first + rest] == [r.id for r in rows]
+
+
+def test_export_is_clamped_to_the_possession_window(db_session, exported_rows):
+    unit, rows = exported_rows
+    start, end = BASE + timedelta(seconds=10), BASE + timedelta(seconds=30)
+
+    body = b"".join(telemetry_query_service.export_telemetry(
+        db_session,
+        filters=TelemetryExportFilter(system_unit_ids=[unit.id], start_time=BASE - timedelta(days=1)),
+        possession_start=start,
+        possession_end=end,
+    ))
+    ids = [json.loads(line)["id"] for line in body.decode().splitlines()]
+    assert ids == [r.id for r in rows if start <= r.captured_at <= end]
+
+
+def test_csv_and_arrow_encode_the_same_rows(db_session, exported_rows):
+    pyarrow = pytest.importorskip("pyarrow")
+    unit, rows = exported_rows
+
+    body = b"".join(telemetry_query_service.export_telemetry(
+        db_session, filters=TelemetryExportFilter(system_unit_ids=[unit.id], format="csv")
+    ))
+    table = list(csv.reader(io.StringIO(body.decode())))
+    assert tuple(table[0]) == EXPORT_COLUMNS
+    assert [int(r[0]) for r in table[1:]] == [r.id for r in rows]
+    extra = EXPORT_COLUMNS.index("extra_stats")
+    assert json.loads(table[1][extra]) == {"i": 0} and table[2][extra] == ""
+
+    body = b"".join(telemetry_query_service.export_telemetry(
+        db_session, filters=TelemetryExportFilter(system_unit_ids=[unit.id], format="arrow")
+    ))
+    arrow = pyarrow.ipc.open_stream(body).read_all()
+    assert arrow.column_names == list(EXPORT_COLUMNS)
+    assert arrow.column("id").to_pylist() == [r.id for r in rows]
+    assert arrow.column("captured_at").to_pylist()[0] == rows[0].captured_at
+
+    # 결과가 없어도 헤더/스키마만 있는 문서가 나온다.
+    empty = b"".join(telemetry_query_service.export_telemetry(
+        db_session, filters=TelemetryExportFilter(system_unit_ids=[unit.id], format="arrow", start_time=BASE + timedelta(days=1))
+    ))
+    assert pyarrow.ipc.open_stream(empty).read_all().num_rows == 0
@@ -0,0 +1,80 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from app.models.objects.device import Device
+from app.models.objects.system_unit import SystemUnit
+from app.models.events_logs.device_metric_latest import DeviceMetricLatest
+from app.models.events_logs.observation_snapshot import ObservationSnapshot
+from app.domains.services.telemetry.schemas.telemetry_command import TelemetryCommandDataCreate
+from app.domains.services.telemetry.schemas.telemetry_query import TelemetryLatestFilter
+from app.domains.services.telemetry.services import telemetry_command_service as command_module
+from app.domains.services.telemetry.services.telemetry_command_service import telemetry_command_service
+from app.domains.services.telemetry.services.telemetry_query_service import telemetry_query_service
+
+BASE = datetime(2024, 8, 1, 9, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def unit_and_device(db_session, test_product_line, monkeypatch):
+    monkeypatch.setattr(command_module.settings, "TELEMETRY_LATEST_ENABLED", True)
+    monkeypatch.setattr(command_module.settings, "TELEMETRY_ROLLUP_ENABLED", False)
+    unit = SystemUnit(name="Latest Unit", product_line_id=test_product_line.id)
+    device = Device(cpu_serial="latest-device", current_uuid=uuid.uuid4())
+    db_session.add_all([unit, device])
+    db_session.flush()
+    db_session.add(ObservationSnapshot(id="latest-snap", system_unit_id=unit.id, observation_type="SENSOR"))
+    db_session.flush()
+    return unit, device
+
+
+def _ingest(db_session, unit, device, samples):
+    telemetry_command_service.create_multiple_telemetry(db_session, obj_in_list=[
+        TelemetryCommandDataCreate(
+            device_id=device.id, system_unit_id=unit.id, snapshot_id="latest-snap", captured_at=captured_at,
+            component_name=component, metric_name="temp", avg_value=value, min_value=value, max_value=value,
+            std_dev=0.0, slope=0.0,
+        )
+        for component, captured_at, value in samples
+    ])
+    db_session.flush()
+    db_session.expire_all()
+
+
+def _latest(db_session, device):
+    rows = db_session.scalars(select(DeviceMetricLatest).where(DeviceMetricLatest.device_id == device.id)).all()
+    return {r.component_name: (r.captured_at, r.avg_value) for r in rows}
+
+
+def test_ingestion_keeps_the_newest_value_per_metric(db_session, unit_and_device):
+    unit, device = unit_and_device
+    # 한 배치 안에 같은 키가 여러 번 나온다.
+    _ingest(db_session, unit, device, [
+        ("cpu", BASE, 1.0), ("cpu", BASE + timedelta(seconds=20), 3.0), ("cpu", BASE + timedelta(seconds=10), 2.0),
+        ("gpu", BASE, 7.0),
+    ])
+    assert _latest(db_session, device) == {"cpu": (BASE + timedelta(seconds=20), 3.0), "gpu": (BASE, 7.0)}
+
+    # 늦게 도착한 과거 값은 최신값을 덮지 않고, 더 새로운 값만 반영된다.
+    _ingest(db_session, unit, device, [("cpu", BASE + timedelta(seconds=5), 99.0), ("gpu", BASE + timedelta(minutes=1), 8.0)])
+    assert _latest(db_session, device) == {
+        "cpu": (BASE + timedelta(seconds=20), 3.0),
+        "gpu": (BASE + timedelta(minutes=1), 8.0),
+    }
+
+
+def test_latest_values_hide_readings_outside_the_possession_window(db_session, unit_and_device):
+    unit, device = unit_and_device
+    _ingest(db_session, unit, device, [("cpu", BASE, 1.0), ("gpu", BASE + timedelta(hours=2), 2.0)])
+    filters = TelemetryLatestFilter(system_unit_ids=[unit.id])
+
+    assert [r.component_name for r in telemetry_query_service.get_latest_values(db_session, filters=filters)] == ["cpu", "gpu"]
+    # 소유 종료(1시간 뒤) 이후의 최신값은 이전 소유자에게 보이지 않는다.
+    owned = telemetry_query_service.get_latest_values(
+        db_session, filters=filters, possession_start=BASE - timedelta(days=1), possession_end=BASE + timedelta(hours=1)
+    )
+    assert [r.component_name for r in owned] == ["cpu"]
+    later = telemetry_query_service.get_latest_values(db_session, filters=filters, possession_start=BASE + timedelta(hours=1))
+    assert [r.component_name for r in later] == ["gpu"]
@@ -0,0 +1,142 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import text
+
+from app.models.objects.device import Device
+from app.models.objects.system_unit import SystemUnit
+from app.models.events_logs.observation_snapshot import ObservationSnapshot
+from app.models.events_logs.telemetry_data import TelemetryData
+from app.models.events_logs.telemetry_metadata import TelemetryMetadata
+from app.domains.services.telemetry.crud.telemetry_archive_crud import telemetry_archive_crud
+from app.domains.services.telemetry.crud.telemetry_partition_crud import telemetry_partition_crud
+from app.domains.services.telemetry.services import telemetry_partition_service as service_module
+from app.domains.services.telemetry.services.telemetry_partition_service import telemetry_partition_service
+
+# 마이그레이션이 만든 파티션(현재 시각 기준)과 겹치지 않는 먼 미래 구간에서 검증합니다.
+NOW = datetime(2031, 3, 10, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def partition_settings(monkeypatch):
+    monkeypatch.setattr(service_module.settings, "TELEMETRY_PARTITION_INTERVAL", "day")
+    monkeypatch.setattr(service_module.settings, "TELEMETRY_PARTITION_PREMAKE", 2)
+    monkeypatch.setattr(service_module.settings, "TELEMETRY_RETENTION_DAYS", 3)
+    return service_module.settings
+
+
+@pytest.fixture
+def unit_and_device(db_session, test_product_line):
+    unit = SystemUnit(name="Partition Unit", product_line_id=test_product_line.id)
+    device = Device(cpu_serial="partition-device", current_uuid=uuid.uuid4())
+    db_session.add_all([unit, device])
+    db_session.flush()
+    db_session.add(ObservationSnapshot(id="partition-snap", system_unit_id=unit.id, observation_type="SENSOR"))
+    db_session.flush()
+    return unit, device
+
+
+def _add_row(db_session, unit, device, captured_at, *, with_metadata=False):
+    row = TelemetryData(
+        device_id=device.id, system_unit_id=unit.id, snapshot_id="partition-snap",
+        metric_name="temp", component_name="cpu", captured_at=captured_at,
+        avg_value=1.0, min_value=1.0, max_value=1.0, std_dev=0.0, slope=0.0, sample_count=10,
+    )
+    db_session.add(row)
+    db_session.flush()
+    if with_metadata:
+        db_session.add(TelemetryMetadata(telemetry_data_id=row.id, meta_key="k", meta_value="v", meta_value_type="STRING"))
+        db_session.flush()
+    return row
+
+
+def _table_of(db_session, row_id):
+    return db_session.execute(text("SELECT tableoid::regclass::text FROM telemetry_data WHERE id = :id"), {"id": row_id}).scalar()
+
+
+def _partition_names(db_session):
+    return {p.name for p in telemetry_partition_crud.list_partitions(db_session)}
+
+
+def _metadata_count(db_session, row_id):
+    return db_session.execute(text("SELECT count(*) FROM telemetry_metadata WHERE telemetry_data_id = :id"), {"id": row_id}).scalar()
+
+
+def test_migration_partitions_telemetry_data_by_captured_at(db_session):
+    key = db_session.execute(text(
+        "SELECT pg_get_partkeydef('telemetry_data'::regclass)"
+    )).scalar()
+    assert key == "RANGE (captured_at)"
+    partitions = telemetry_partition_crud.list_partitions(db_session)
+    assert any(p.name == "telemetry_data_default" and p.start is None for p in partitions)
+    assert any(p.start is not None for p in partitions)
+
+    pk = db_session.execute(text("""
+        SELECT array_agg(a.attname ORDER BY a.attname) FROM pg_index i
+        JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+        WHERE i.indrelid = 'telemetry_data'::regclass AND i.indisprimary
+    """)).scalar()
+    assert pk == ["captured_at", "id"]
+    # 파티션 테이블의 id는 단독 유니크가 아니므로 메타데이터의 외래 키는 제거되어 있어야 한다.
+    assert not db_session.execute(text("""
+        SELECT 1 FROM pg_constraint WHERE conrelid = 'telemetry_metadata'::regclass AND contype = 'f'
+    """)).first()
+
+
+def test_ensure_partitions_premakes_ranges_and_moves_stray_default_rows(db_session, partition_settings, unit_and_device):
+    unit, device = unit_and_device
+    # 시계가 앞선 기기가 보낸 행: 파티션이 없으므로 DEFAULT에 떨어진다.
+    early = _add_row(db_session, unit, device, NOW + timedelta(days=1, hours=3))
+    assert _table_of(db_session, early.id) == "telemetry_data_default"
+
+    created = telemetry_partition_service.ensure_partitions(db_session, now=NOW)
+    assert created == ["telemetry_data_p20310310", "telemetry_data_p20310311", "telemetry_data_p20310312"]
+    assert _table_of(db_session, early.id) == "telemetry_data_p20310311"
+    # 새 파티션에도 부모의 인덱스가 전파된다.
+    indexes = db_session.execute(text(
+        "SELECT count(*) FROM pg_indexes WHERE tablename = 'telemetry_data_p20310311'"
+    )).scalar()
+    assert indexes >= 5
+
+    assert telemetry_partition_service.ensure_partitions(db_session, now=NOW) == []
+    later = _add_row(db_session, unit, device, NOW + timedelta(days=2))
+    assert _table_of(db_session, later.id) == "telemetry_data_p20310312"
+
+
+def test_drop_retention_removes_expired_partitions_and_default_rows(db_session, partition_settings, unit_and_device):
+    unit, device = unit_and_device
+    partition_settings.TELEMETRY_RETENTION_MODE = "drop"
+    telemetry_partition_service.ensure_partitions(db_session, now=NOW)
+    kept = _add_row(db_session, unit, device, NOW + timedelta(days=2), with_metadata=True)
+    stray = _add_row(db_session, unit, device, datetime(2000, 1, 1, tzinfo=timezone.utc), with_metadata=True)
+
+    result = telemetry_partition_service.apply_retention(db_session, now=NOW + timedelta(days=4))
+
+    # cutoff = 03-11 12:00: 상한이 cutoff 이하인 03-10 파티션만 통째로 삭제된다.
+    assert "telemetry_data_p20310310" in result["dropped"]
+    assert {"telemetry_data_p20310311", "telemetry_data_p20310312"} <= _partition_names(db_session)
+    assert result["default_rows_deleted"] == 1 and result["default_rows_detached"] == 0
+    assert _metadata_count(db_session, stray.id) == 0
+    assert _table_of(db_session, kept.id) == "telemetry_data_p20310312" and _metadata_count(db_session, kept.id) == 1
+
+
+def test_detach_retention_keeps_expired_default_rows_for_the_archive(db_session, partition_settings, unit_and_device):
+    unit, device = unit_and_device
+    partition_settings.TELEMETRY_RETENTION_MODE = "detach"
+    telemetry_partition_service.ensure_partitions(db_session, now=NOW)
+    expired_row = _add_row(db_session, unit, device, NOW + timedelta(hours=1))
+    stray = _add_row(db_session, unit, device, datetime(2000, 1, 1, tzinfo=timezone.utc), with_metadata=True)
+    fresh_default = _add_row(db_session, unit, device, NOW + timedelta(days=30))
+
+    result = telemetry_partition_service.apply_retention(db_session, now=NOW + timedelta(days=4))
+
+    assert "telemetry_data_p20310310" in result["detached"] and not result["dropped"]
+    assert result["default_rows_deleted"] == 0 and result["default_rows_detached"] == 1
+    # DEFAULT의 경과 행은 삭제되지 않고, 분리 파티션과 함께 아카이브 대상으로 잡힌다.
+    detached = {name: (start, end) for name, start, end in telemetry_archive_crud.list_detached_partitions(db_session)}
+    default_table = "telemetry_data_p20310314120000_default"
+    assert detached[default_table] == (stray.captured_at, stray.captured_at)
+    assert detached["telemetry_data_p20310310"][0] == expired_row.captured_at
+    assert _metadata_count(db_session, stray.id) == 1
+    assert _table_of(db_session, fresh_default.id) == "telemetry_data_default"
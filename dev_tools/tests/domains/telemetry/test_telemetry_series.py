@@ -0,0 +1,191 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from app.models.objects.device import Device
+from app.models.objects.system_unit import SystemUnit
+from app.models.events_logs.observation_snapshot import ObservationSnapshot
+from app.models.events_logs.telemetry_data import TelemetryData
+from app.models.events_logs.telemetry_rollup import TelemetryRollupHour
+from app.domains.services.telemetry.managers.downsample import downsample_series, lttb_indices, minmax_indices
+from app.domains.services.telemetry.managers.rollup_levels import ROLLUP_LEVELS_BY_NAME, aggregate_rows
+from app.domains.services.telemetry.schemas.telemetry_query import TelemetryFilter
+from app.domains.services.telemetry.services import telemetry_query_service as service_module
+from app.domains.services.telemetry.services.telemetry_query_service import telemetry_query_service
+
+HOUR = datetime(2024, 6, 3, 10, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def unit_and_device(db_session, test_product_line):
+    unit = SystemUnit(name="Series Unit", product_line_id=test_product_line.id)
+    device = Device(cpu_serial="series-device", current_uuid=uuid.uuid4())
+    db_session.add_all([unit, device])
+    db_session.flush()
+    db_session.add(ObservationSnapshot(id="series-snap", system_unit_id=unit.id, observation_type="SENSOR"))
+    db_session.flush()
+    return unit, device
+
+
+def _seed(db_session, unit, device, samples):
+    """원본 행과, 그 행들로 만든 1h 롤업 버킷을 함께 기록합니다. (롤업 워커가 만든 상태와 동일)"""
+    rows = [
+        TelemetryData(
+            device_id=device.id, system_unit_id=unit.id, snapshot_id="series-snap",
+            metric_name="temp", component_name="cpu", captured_at=captured_at,
+            avg_value=value, min_value=value, max_value=value, std_dev=0.0, slope=0.0, sample_count=10,
+        )
+        for captured_at, value in samples
+    ]
+    db_session.add_all(rows)
+    db_session.flush()
+    for bucket in aggregate_rows(rows, ROLLUP_LEVELS_BY_NAME["1h"]):
+        db_session.add(TelemetryRollupHour(**bucket))
+    db_session.flush()
+
+
+def test_rollup_series_excludes_data_outside_a_mid_bucket_possession_boundary(db_session, unit_and_device):
+    unit, device = unit_and_device
+    _seed(db_session, unit, device, [
+        (HOUR + timedelta(minutes=10), 100.0),  # 이전 소유자 구간 (같은 10시 버킷)
+        (HOUR + timedelta(minutes=40), 1.0),
+        (HOUR + timedelta(minutes=50), 3.0),
+        (HOUR + timedelta(hours=1, minutes=20), 2.0),
+        (HOUR + timedelta(hours=2, minutes=30), 50.0),  # 소유 종료 이후 (같은 12시 버킷)
+        (HOUR + timedelta(hours=2, minutes=5), 4.0),
+    ])
+    possession_start = HOUR + timedelta(minutes=30)
+    possession_end = HOUR + timedelta(hours=2, minutes=15)
+
+    series = telemetry_query_service.get_telemetry_series(
+        db_session,
+        filters=TelemetryFilter(
+            system_unit_ids=[unit.id], resolution="1h",
+            start_time=HOUR - timedelta(hours=1), end_time=HOUR + timedelta(hours=4),
+        ),
+        possession_start=possession_start,
+        possession_end=possession_end,
+    )
+
+    assert series.start_time == possession_start and series.end_time == possession_end
+    points = [(p.bucket_start, p.sample_count, p.min_value, p.max_value, p.avg_value) for p in series.points]
+    assert points == [
+        # 10시 버킷의 뒷부분만 원본으로 다시 집계
+        (possession_start, 20, 1.0, 3.0, pytest.approx(2.0)),
+        # 완전히 들어가는 11시 버킷은 롤업 그대로
+        (HOUR + timedelta(hours=1), 10, 2.0, 2.0, pytest.approx(2.0)),
+        # 12시 버킷의 앞부분만
+        (HOUR + timedelta(hours=2), 10, 4.0, 4.0, pytest.approx(4.0)),
+    ]
+    assert all(p.max_value < 50.0 for p in series.points)
+
+
+def test_rollup_series_shorter_than_one_bucket_reads_only_raw_rows(db_session, unit_and_device):
+    unit, device = unit_and_device
+    _seed(db_session, unit, device, [
+        (HOUR + timedelta(minutes=5), 9.0),
+        (HOUR + timedelta(minutes=25), 1.0),
+        (HOUR + timedelta(minutes=35), 3.0),
+    ])
+
+    series = telemetry_query_service.get_telemetry_series(
+        db_session,
+        filters=TelemetryFilter(
+            system_unit_ids=[unit.id], resolution="1h",
+            start_time=HOUR + timedelta(minutes=20), end_time=HOUR + timedelta(minutes=40),
+        ),
+    )
+
+    assert [(p.bucket_start, p.min_value, p.max_value) for p in series.points] == [
+        (HOUR + timedelta(minutes=20), 1.0, 3.0),
+    ]
+    assert series.points[0].std_dev == pytest.approx(1.0)
+
+
+def test_lttb_keeps_endpoints_and_the_peak():
+    x = np.arange(100, dtype=np.float64)
+    y = np.sin(x / 10.0)
+    y[57] = 10.0
+
+    picked = lttb_indices(x, y, 10)
+    assert len(picked) == 10
+    assert picked[0] == 0 and picked[-1] == 99
+    assert 57 in picked
+    assert np.all(np.diff(picked) > 0)
+    # 예산이 점 수 이상이면 그대로 둔다.
+    assert lttb_indices(x[:5], y[:5], 10).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_minmax_keeps_spikes_in_both_directions():
+    x = np.arange(60, dtype=np.float64)
+    y = np.zeros(60)
+    y[13], y[41] = 9.0, -9.0
+
+    picked = minmax_indices(x, y, 6)
+    assert len(picked) <= 6
+    assert 13 in picked and 41 in picked
+    assert np.all(np.diff(picked) > 0)
+
+
+class _Row:
+    def __init__(self, device_id, i, value):
+        self.device_id, self.component_name, self.metric_name = device_id, "cpu", "temp"
+        self.bucket_start = HOUR + timedelta(seconds=10 * i)
+        self.avg_value = value
+
+
+def test_downsample_series_limits_each_series_independently():
+    rows = [_Row(1, i, float(i % 7)) for i in range(40)] + [_Row(2, i, 1.0) for i in range(3)]
+
+    for method in ("lttb", "minmax"):
+        result = downsample_series(rows, method=method, points=8)
+        first = [r for r in result if r.device_id == 1]
+        second = [r for r in result if r.device_id == 2]
+        assert 2 <= len(first) <= 8
+        assert [r.bucket_start for r in first] == sorted(r.bucket_start for r in first)
+        # 예산 안의 시리즈는 건드리지 않는다.
+        assert second == rows[40:]
+
+
+def test_series_downsample_respects_points_and_max_rows(db_session, unit_and_device, monkeypatch):
+    unit, device = unit_and_device
+    samples = [(HOUR + timedelta(seconds=10 * i), 0.0) for i in range(30)]
+    samples[12] = (samples[12][0], 99.0)
+    samples[25] = (samples[25][0], 77.0)
+    _seed(db_session, unit, device, samples)
+    filters = dict(
+        system_unit_ids=[unit.id], resolution="raw", downsample="minmax", points=4,
+        start_time=HOUR, end_time=HOUR + timedelta(minutes=10),
+    )
+
+    series = telemetry_query_service.get_telemetry_series(db_session, filters=TelemetryFilter(**filters))
+    assert not series.truncated and series.downsample == "minmax"
+    assert 2 <= len(series.points) <= 4
+    assert 99.0 in [p.avg_value for p in series.points]
+
+    # 최대 행 수를 넘으면 앞부분만 다운샘플링하고 잘렸음을 알린다.
+    monkeypatch.setattr(service_module.settings, "TELEMETRY_SERIES_MAX_ROWS", 20)
+    series = telemetry_query_service.get_telemetry_series(db_session, filters=TelemetryFilter(**filters))
+    assert series.truncated
+    assert len(series.points) <= 4
+    assert max(p.bucket_start for p in series.points) < samples[20][0]
+    assert 77.0 not in [p.avg_value for p in series.points]
+
+
+def test_series_downsample_runs_after_the_possession_clamp(db_session, unit_and_device):
+    unit, device = unit_and_device
+    _seed(db_session, unit, device, [(HOUR + timedelta(minutes=m), 500.0 if m < 30 else float(m)) for m in range(0, 240, 5)])
+
+    series = telemetry_query_service.get_telemetry_series(
+        db_session,
+        filters=TelemetryFilter(
+            system_unit_ids=[unit.id], resolution="1h", downsample="lttb", points=3,
+            start_time=HOUR, end_time=HOUR + timedelta(hours=4),
+        ),
+        possession_start=HOUR + timedelta(minutes=30),
+    )
+    assert len(series.points) == 3
+    assert all(p.max_value < 500.0 for p in series.points)
+    assert series.points[0].bucket_start == HOUR + timedelta(minutes=30)
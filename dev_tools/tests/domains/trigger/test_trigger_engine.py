@@ -0,0 +1,257 @@
+import itertools
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import fakeredis
+import pytest
+
+from app.core.config import get_settings
+from app.models.objects.action_log import ActionLog, ActionStatus, ActorType
+from app.models.objects.device import Device
+from app.models.objects.system_unit import SystemUnit
+from app.domains.application.trigger import trigger_engine as trigger_engine_module
+from app.domains.application.trigger.trigger_engine import TriggerEngine
+from app.domains.inter_domain.trigger_rule.trigger_engine_provider import trigger_engine_provider
+from app.domains.services.trigger_rule.repositories.trigger_execution_repository import trigger_execution_repository
+from app.domains.services.trigger_rule.repositories.trigger_input_repository import trigger_input_repository
+from app.domains.services.trigger_rule.schemas.trigger_input import TriggerInput, TriggerMetricInput
+from app.domains.services.trigger_rule.schemas.trigger_rule_query import TriggerRuleRuntimeRead
+
+UNIT_ID = 10
+
+
+def _rule(rule_id, *, condition, policy="SKIP", priority=50, timeout_seconds=300, target="pump"):
+    return TriggerRuleRuntimeRead(
+        id=rule_id,
+        system_unit_id=UNIT_ID,
+        name=f"rule-{rule_id}",
+        priority=priority,
+        execution_mode="ONCE",
+        concurrency_policy=policy,
+        timeout_seconds=timeout_seconds,
+        condition=condition,
+        action={"target": target, "cmd": "START"},
+        updated_at=datetime.now(timezone.utc),
+    )
+
+
+def _telemetry(metric, avg):
+    return TriggerInput(system_unit_id=UNIT_ID, metrics=[TriggerMetricInput(
+        metric_name=metric, avg=avg, min=avg, max=avg, std=0.0, slope=0.0, captured_at=time.time(), device_id=1,
+    )])
+
+
+class _FakeActionLogs:
+    """ActionLog 기록을 메모리에 흉내 냅니다. (id -> status)"""
+    def __init__(self):
+        self.status = {}
+        self._ids = itertools.count(1)
+
+    def create_logs(self, db, *, obj_in_list):
+        logs = []
+        for obj_in in obj_in_list:
+            log = SimpleNamespace(id=next(self._ids))
+            self.status[log.id] = obj_in.status
+            logs.append(log)
+        return logs
+
+    def update_status(self, db, *, action_log_id, status, execution_result=None, expected_status=None, expected_system_unit_id=None):
+        if expected_status is not None and self.status.get(action_log_id) != expected_status:
+            return None
+        self.status[action_log_id] = status
+        return SimpleNamespace(id=action_log_id)
+
+
+@pytest.fixture
+def rules():
+    return []
+
+
+@pytest.fixture
+def published(monkeypatch, rules):
+    events = []
+    action_logs = _FakeActionLogs()
+    query = trigger_engine_module.trigger_rule_query_provider
+    monkeypatch.setattr(query, "get_active_rules", lambda db: list(rules))
+    monkeypatch.setattr(query, "get_changed_rules", lambda db, since: [])
+    monkeypatch.setattr(query, "get_active_rule_ids", lambda db: {r.id for r in rules})
+    monkeypatch.setattr(trigger_engine_module, "action_log_command_provider", action_logs)
+    monkeypatch.setattr(
+        trigger_engine_module, "publish_command",
+        lambda db, topic, command, actor_user: events.append(("publish", command))
+    )
+    monkeypatch.setattr(trigger_execution_repository, "redis", fakeredis.FakeRedis())
+    monkeypatch.setattr(trigger_input_repository, "redis", fakeredis.FakeRedis())
+    return SimpleNamespace(
+        events=events,
+        action_logs=action_logs,
+        commands=lambda: [command for kind, command in events if kind == "publish"],
+    )
+
+
+def _engine(published):
+    session = MagicMock()
+    session.commit.side_effect = lambda: published.events.append(("commit", None))
+
+    @contextmanager
+    def session_factory():
+        yield session
+
+    return TriggerEngine(get_settings(), db_session_factory=session_factory)
+
+
+def _types(commands):
+    return [(c["type"], c["rule_id"]) for c in commands]
+
+
+def test_telemetry_fires_matching_rule_once_per_edge(rules, published):
+    rules.append(_rule(1, condition={"metric": "temp", "op": ">", "value": 30}, timeout_seconds=None))
+    engine = _engine(published)
+
+    assert engine.process_inputs([_telemetry("humidity", 99)]) == 0
+    assert engine.process_inputs([_telemetry("temp", 31)]) == 1
+    assert engine.process_inputs([_telemetry("temp", 32)]) == 0
+    assert engine.process_inputs([_telemetry("temp", 20), _telemetry("temp", 35)]) == 1
+    assert _types(published.commands()) == [("TRIGGER_RUN", 1), ("TRIGGER_RUN", 1)]
+
+
+def test_commands_are_published_only_after_the_action_log_commit(rules, published):
+    rules.append(_rule(1, condition={"metric": "temp", "op": ">", "value": 30}))
+    engine = _engine(published)
+
+    engine.process_inputs([_telemetry("temp", 31)])
+    assert [kind for kind, _ in published.events] == ["commit", "publish", "commit"]
+
+
+def test_failed_record_releases_the_slot_without_publishing(rules, published, monkeypatch):
+    rules.append(_rule(1, condition={"metric": "temp", "op": ">", "value": 30}))
+    engine = _engine(published)
+    monkeypatch.setattr(published.action_logs, "create_logs", MagicMock(side_effect=RuntimeError("db down")))
+
+    assert engine.process_inputs([_telemetry("temp", 31)]) == 0
+    assert published.commands() == []
+    assert engine.active_executions() == []
+
+
+def test_device_offline_event_fires_event_rule(rules, published):
+    rules.append(_rule(2, condition={"event": "DEVICE_OFFLINE"}, timeout_seconds=None))
+    engine = _engine(published)
+
+    event = TriggerInput(system_unit_id=UNIT_ID, event_type="DEVICE_OFFLINE", device_id=1)
+    assert engine.process_inputs([event]) == 1
+    assert _types(published.commands()) == [("TRIGGER_RUN", 2)]
+
+
+def test_inputs_submitted_by_other_processes_are_consumed_in_order(rules, published):
+    rules.append(_rule(1, condition={"metric": "temp", "op": ">", "value": 30}, timeout_seconds=None))
+    engine = _engine(published)
+
+    for value in (31, 20, 35):
+        trigger_engine_provider.submit(_telemetry("temp", value))
+    engine.process_inputs(trigger_input_repository.pop_many(limit=10))
+    assert _types(published.commands()) == [("TRIGGER_RUN", 1), ("TRIGGER_RUN", 1)]
+    assert trigger_input_repository.pop_many(limit=10) == []
+
+
+def test_completion_marker_releases_the_slot_and_the_queued_rule(rules, published):
+    rules.append(_rule(1, condition={"metric": "temp", "op": ">", "value": 30}, policy="QUEUE", priority=10))
+    rules.append(_rule(2, condition={"metric": "humidity", "op": ">", "value": 80}, policy="QUEUE", priority=20))
+    engine = _engine(published)
+
+    engine.process_inputs([_telemetry("temp", 31), _telemetry("humidity", 90)])
+    assert _types(published.commands()) == [("TRIGGER_RUN", 1)]
+    execution_id = published.commands()[0]["execution_id"]
+
+    # 리스너가 ActionLog를 확정하고 남긴 표식을 엔진이 다음 주기에 회수합니다. (입력이 없어도)
+    trigger_engine_provider.release_execution(execution_id)
+    engine.process_inputs([])
+    assert _types(published.commands()) == [("TRIGGER_RUN", 1), ("TRIGGER_RUN", 2)]
+    assert engine.stats.completed == 1
+    assert [e.rule_id for e in engine.active_executions(UNIT_ID)] == [2]
+
+
+def test_timeouts_expire_on_the_idle_sweep(rules, published):
+    rules.append(_rule(1, condition={"metric": "temp", "op": ">", "value": 30}, policy="SKIP", timeout_seconds=1))
+    engine = _engine(published)
+
+    engine.process_inputs([_telemetry("temp", 31)])
+    execution_id = published.commands()[0]["execution_id"]
+    engine.active_executions()[0].deadline = time.time() - 1
+
+    engine.process_inputs([])
+    assert [c["type"] for c in published.commands()] == ["TRIGGER_RUN", "TRIGGER_CANCEL"]
+    assert published.action_logs.status[execution_id] == ActionStatus.TIMEOUT
+    assert engine.active_executions() == []
+
+
+def test_replace_cancels_lower_priority_execution(rules, published):
+    rules.append(_rule(1, condition={"metric": "temp", "op": ">", "value": 30}, policy="REPLACE", priority=50))
+    rules.append(_rule(2, condition={"metric": "smoke", "op": ">", "value": 0}, policy="REPLACE", priority=0))
+    engine = _engine(published)
+
+    engine.process_inputs([_telemetry("temp", 31)])
+    engine.process_inputs([_telemetry("smoke", 1)])
+    assert [c["type"] for c in published.commands()] == ["TRIGGER_RUN", "TRIGGER_CANCEL", "TRIGGER_RUN"]
+    assert published.commands()[1]["reason"] == "REPLACED"
+    assert [e.rule_id for e in engine.active_executions(UNIT_ID)] == [2]
+
+
+def test_rule_reload_queries_run_outside_the_engine_lock(rules, published, monkeypatch):
+    engine = _engine(published)
+    engine.process_inputs([_telemetry("temp", 1)])
+    engine._last_reload = 0.0
+
+    lock_free = []
+    def get_changed_rules(db, since):
+        # 다른 스레드가 조회 중에도 엔진 잠금을 잡을 수 있어야 합니다.
+        result = []
+        thread = threading.Thread(target=lambda: result.append(engine._lock.acquire(timeout=1) and engine._lock.release() is None))
+        thread.start()
+        thread.join()
+        lock_free.extend(result)
+        return [_rule(3, condition={"metric": "temp", "op": ">", "value": 0}, timeout_seconds=None)]
+
+    monkeypatch.setattr(trigger_engine_module.trigger_rule_query_provider, "get_changed_rules", get_changed_rules)
+    engine.process_inputs([_telemetry("temp", 5)])
+    assert lock_free == [True]
+    assert _types(published.commands()) == [("TRIGGER_RUN", 3)]
+
+
+def test_execution_result_is_accepted_only_from_a_device_of_the_same_unit(db_session, test_product_line, test_hardware_blueprint):
+    unit, other_unit = (SystemUnit(name=name, product_line_id=test_product_line.id) for name in ("trigger-a", "trigger-b"))
+    db_session.add_all([unit, other_unit])
+    db_session.flush()
+    member, outsider = (
+        Device(cpu_serial=serial, current_uuid=uuid.uuid4(), system_unit_id=unit_id, hardware_blueprint_id=test_hardware_blueprint.id)
+        for serial, unit_id in (("trigger-member", unit.id), ("trigger-outsider", other_unit.id))
+    )
+    db_session.add_all([member, outsider])
+    db_session.flush()
+    log = ActionLog(
+        device_id=member.id, system_unit_id=unit.id, actor_type=ActorType.SYSTEM,
+        command="START", status=ActionStatus.REQUESTED,
+    )
+    db_session.add(log)
+    db_session.flush()
+
+    def report(device, success=True):
+        accepted = trigger_engine_provider.complete_execution(
+            db_session, device_uuid=str(device.current_uuid), action_log_id=log.id, success=success
+        )
+        db_session.flush()
+        return accepted
+
+    assert report(outsider) is False
+    db_session.refresh(log)
+    assert log.status == ActionStatus.REQUESTED
+
+    assert report(member) is True
+    db_session.refresh(log)
+    assert log.status == ActionStatus.SUCCESS
+    # 이미 확정된 실행의 늦은 응답은 무시됩니다.
+    assert report(member, success=False) is False
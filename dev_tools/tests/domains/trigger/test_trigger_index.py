@@ -0,0 +1,74 @@
+import pytest
+
+from app.domains.services.trigger_rule.managers.trigger_index import (
+    CompiledCondition, EvaluationContext, MetricSample, TriggerIndex, validate_condition,
+)
+
+
+def _ctx(metrics, now=100.0, event=None, hold_state=None):
+    return EvaluationContext(metrics=metrics, now=now, stale_after=60, event=event, hold_state=hold_state if hold_state is not None else {})
+
+
+def _sample(avg, captured_at=100.0):
+    return MetricSample(stats={"avg": avg, "min": avg, "max": avg}, captured_at=captured_at, device_id=1)
+
+
+def test_index_returns_only_rules_referencing_touched_keys_of_the_unit():
+    index = TriggerIndex()
+    index.add(1, 10, {("metric", "temp")})
+    index.add(2, 10, {("metric", "humidity"), ("event", "DEVICE_OFFLINE")})
+    index.add(3, 20, {("metric", "temp")})
+
+    assert index.lookup(10, {("metric", "temp")}) == {1}
+    assert index.lookup(10, {("event", "DEVICE_OFFLINE"), ("metric", "temp")}) == {1, 2}
+    assert index.lookup(30, {("metric", "temp")}) == set()
+
+    index.add(1, 10, {("metric", "pressure")})
+    assert index.lookup(10, {("metric", "temp")}) == set()
+    assert index.remove(2) is True and index.remove(2) is False
+    assert index.lookup(10, {("event", "DEVICE_OFFLINE")}) == set()
+    assert index.rule_ids() == {1, 3}
+
+
+def test_compiled_condition_collects_keys_from_nested_nodes():
+    condition = CompiledCondition({"all": [
+        {"metric": "temp", "op": ">", "value": 30},
+        {"any": [{"metric": "humidity", "op": "between", "value": [40, 60]}, {"event": "DOOR_OPEN"}]},
+    ]})
+    assert condition.keys == {("metric", "temp"), ("metric", "humidity"), ("event", "DOOR_OPEN")}
+
+    assert condition.evaluate(_ctx({("temp", None): _sample(31), ("humidity", None): _sample(50)})) is True
+    assert condition.evaluate(_ctx({("temp", None): _sample(31), ("humidity", None): _sample(70)})) is False
+
+
+def test_metric_leaf_ignores_stale_samples_and_enforces_duration():
+    condition = CompiledCondition({"metric": "temp", "op": ">=", "value": 30, "duration_sec": 60})
+    hold = {}
+    assert condition.evaluate(_ctx({("temp", None): _sample(30, captured_at=100)}, now=100, hold_state=hold)) is False
+    assert condition.evaluate(_ctx({("temp", None): _sample(35, captured_at=150)}, now=150, hold_state=hold)) is False
+    assert condition.evaluate(_ctx({("temp", None): _sample(35, captured_at=160)}, now=160, hold_state=hold)) is True
+    # 조건이 한 번 깨지면 duration을 처음부터 다시 셉니다.
+    assert condition.evaluate(_ctx({("temp", None): _sample(20, captured_at=170)}, now=170, hold_state=hold)) is False
+    assert hold == {}
+    # 오래된 최신값은 조건 평가에서 무시합니다.
+    assert CompiledCondition({"metric": "temp", "op": ">", "value": 0}).evaluate(
+        _ctx({("temp", None): _sample(10, captured_at=0)}, now=100)
+    ) is False
+
+
+def test_event_leaf_is_true_only_for_the_triggering_event():
+    condition = CompiledCondition({"event": "DEVICE_OFFLINE", "match": {"zone": "A"}})
+    offline = {"type": "DEVICE_OFFLINE", "device_id": 1, "details": {"zone": "A"}}
+    assert condition.evaluate(_ctx({}, event=offline)) is True
+    assert condition.evaluate(_ctx({}, event={**offline, "details": {"zone": "B"}})) is False
+    assert condition.evaluate(_ctx({})) is False
+
+
+@pytest.mark.parametrize("condition", [
+    {"metric": "temp", "op": "~", "value": 1},
+    {"metric": "temp", "stat": "median", "value": 1},
+    {"all": []},
+    {"unknown": 1},
+])
+def test_validate_condition_reports_malformed_conditions(condition):
+    assert validate_condition(condition)
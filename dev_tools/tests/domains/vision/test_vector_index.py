@@ -0,0 +1,188 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.core.exceptions import AccessDeniedError
+from app.dependencies import ActiveContext
+from app.models.objects.device import Device
+from app.models.objects.image_registry import ImageRegistry
+from app.models.objects.system_unit import SystemUnit
+from app.models.objects.user import User
+from app.models.objects.vision_feature import VisionFeature
+from app.models.events_logs.observation_snapshot import ObservationSnapshot
+from app.domains.services.vision_feature.crud.vision_feature_query_crud import vision_feature_crud_query
+from app.domains.services.vision_feature.managers.vector_index import VectorIndex, VectorIndexStore
+from app.domains.services.vision_feature.schemas.vision_feature_query import VisionSimilarityQuery
+from app.domains.services.vision_feature.services import vision_feature_query_service as service_module
+from app.domains.action_authorization.policies.vision_query import policy as policy_module
+
+
+def test_out_of_order_ids_below_watermark_are_indexed_once(tmp_path):
+    index = VectorIndex(str(tmp_path), "clip/v1")
+    assert index.append([(1, 10, [1.0, 0.0]), (3, 10, [0.0, 1.0])]) == 2
+    assert index.get_meta()["last_feature_id"] == 3
+
+    # id 2는 3보다 늦게 커밋되었다: 워터마크 아래지만 색인에 없으므로 추가되어야 한다.
+    assert index.append([(2, 20, [1.0, 1.0])]) == 1
+    # 같은 id의 재전송, 묶음 안 중복, 차원이 다른 벡터는 모두 무시된다.
+    assert index.append([(1, 10, [1.0, 0.0]), (2, 20, [1.0, 1.0]), (4, 10, [0.5, 0.5]), (4, 10, [0.5, 0.5]), (5, 10, [1.0])]) == 1
+
+    meta = index.get_meta()
+    assert meta["count"] == 4 and meta["last_feature_id"] == 4
+    assert np.allclose(index.get_vector(2), [2 ** -0.5, 2 ** -0.5])
+    assert index.get_vector(99) is None
+
+
+def test_search_ranks_by_cosine_and_applies_filters(tmp_path):
+    index = VectorIndex(str(tmp_path), "clip/v1")
+    index.append([(1, 10, [1.0, 0.0]), (2, 20, [1.0, 1.0]), (3, 10, [0.0, 1.0])])
+
+    results = index.search([1.0, 0.1], top_k=2, block_rows=1)
+    assert [r[0] for r in results] == [1, 2]
+
+    assert [r[0] for r in index.search([1.0, 0.1], top_k=3, system_unit_ids=[10], exclude_ids=[1])] == [3]
+    with pytest.raises(ValueError):
+        index.search([1.0, 0.0, 0.0], top_k=1)
+
+
+def test_sync_index_rescans_trailing_window_below_watermark(tmp_path, monkeypatch):
+    service = service_module.VisionFeatureQueryService()
+    service.store = VectorIndexStore(str(tmp_path))
+    monkeypatch.setattr(service_module.settings, "VECTOR_INDEX_SYNC_TRAILING_IDS", 5)
+
+    committed = {1: [1.0, 0.0], 3: [0.0, 1.0]}
+    requested_after = []
+
+    def stream_vectors(db, *, model_version, after_id=0):
+        requested_after.append(after_id)
+        yield [(fid, 10, {"embedding": vec}) for fid, vec in sorted(committed.items()) if fid > after_id]
+
+    monkeypatch.setattr(service_module.vision_feature_crud_query, "stream_vectors", stream_vectors)
+
+    assert service.sync_index(None, model_version="m") == 2
+    committed[2] = [1.0, 1.0]  # 늦게 커밋된 작은 id
+    assert service.sync_index(None, model_version="m") == 1
+    assert service.sync_index(None, model_version="m") == 0
+    assert requested_after == [0, 0, 0]
+    assert service.store.get("m").get_meta()["count"] == 3
+
+
+def _context(type_="ORGANIZATION_MEMBER"):
+    return ActiveContext(user=User(id=7), org_id=1, type=type_)
+
+
+def test_policy_limits_unprivileged_search_to_assigned_units(monkeypatch):
+    searched = []
+    monkeypatch.setattr(policy_module.permission_query_provider, "get_permissions_for_user_in_context", lambda db, **kw: set())
+    monkeypatch.setattr(policy_module.system_unit_assignment_query_provider, "is_user_assigned_to_unit", lambda db, *, user_id, unit_id: unit_id == 10)
+    monkeypatch.setattr(policy_module.vision_feature_query_provider, "get_feature_unit_id", lambda db, *, feature_id: 20)
+    assigned_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    monkeypatch.setattr(
+        policy_module.system_unit_assignment_query_provider, "get_assignment_period",
+        lambda db, *, unit_id, user_id: SimpleNamespace(created_at=assigned_at, unassigned_at=None),
+    )
+    monkeypatch.setattr(
+        policy_module.vision_feature_query_provider, "search_similar",
+        lambda db, *, query, possession_windows: searched.append(possession_windows) or [],
+    )
+
+    policy = policy_module.VisionQueryPolicy()
+    with pytest.raises(AccessDeniedError):
+        policy.search_similar(None, active_context=_context(), query=VisionSimilarityQuery(model_version="m", query_vector=[1.0]))
+    with pytest.raises(AccessDeniedError):
+        policy.search_similar(None, active_context=_context(), query=VisionSimilarityQuery(model_version="m", query_vector=[1.0], system_unit_ids=[10, 20]))
+    with pytest.raises(AccessDeniedError):
+        policy.search_similar(None, active_context=_context(), query=VisionSimilarityQuery(model_version="m", feature_id=5, system_unit_ids=[10]))
+
+    policy.search_similar(None, active_context=_context(), query=VisionSimilarityQuery(model_version="m", query_vector=[1.0], system_unit_ids=[10]))
+    policy.search_similar(None, active_context=_context("SYSTEM_ADMINISTRATOR"), query=VisionSimilarityQuery(model_version="m", feature_id=5))
+    # 일반 사용자는 유닛별 소유 기간으로 한정되고, 관리자는 기간 제한이 없다.
+    assert searched == [{10: (assigned_at, None)}, None]
+
+
+def _indexed_service(tmp_path, rows):
+    service = service_module.VisionFeatureQueryService()
+    service.store = VectorIndexStore(str(tmp_path))
+    service.store.get("m").append(rows)
+    return service
+
+
+def test_search_reads_the_index_without_syncing_it(tmp_path, monkeypatch):
+    service = _indexed_service(tmp_path, [(1, 10, [1.0, 0.0]), (2, 10, [0.0, 1.0])])
+    before = service.store.get("m").get_meta()
+
+    def stream_vectors(db, **kwargs):
+        raise AssertionError("검색 경로에서 색인 동기화가 일어나면 안 됩니다.")
+
+    monkeypatch.setattr(service_module.vision_feature_crud_query, "stream_vectors", stream_vectors)
+
+    hits = service.search_similar(None, query=VisionSimilarityQuery(model_version="m", query_vector=[1.0, 0.1], top_k=1))
+    assert [h.feature_id for h in hits] == [1]
+    assert service.store.get("m").get_meta() == before
+
+
+def test_search_clamps_candidates_to_possession_windows(tmp_path, monkeypatch):
+    # id가 작을수록 질의와 가깝다. 1~4는 소유 기간 밖(이전 소유자), 5~6만 기간 안.
+    service = _indexed_service(tmp_path, [(i, 10, [1.0, 0.1 * i]) for i in range(1, 7)] + [(7, 20, [1.0, 0.0])])
+    in_window = {5, 6}
+    filter_calls = []
+
+    def filter_ids_in_windows(db, *, feature_ids, windows):
+        filter_calls.append(list(feature_ids))
+        return {f for f in feature_ids if f in in_window}
+
+    monkeypatch.setattr(service_module.vision_feature_crud_query, "filter_ids_in_windows", filter_ids_in_windows)
+    monkeypatch.setattr(service_module.settings, "VECTOR_INDEX_POSSESSION_OVERFETCH", 1)
+    monkeypatch.setattr(service_module.settings, "VECTOR_INDEX_MAX_CANDIDATES", 100)
+    windows = {10: (datetime(2024, 1, 1, tzinfo=timezone.utc), None)}
+
+    hits = service.search_similar(
+        None, query=VisionSimilarityQuery(model_version="m", query_vector=[1.0, 0.0], top_k=2), possession_windows=windows
+    )
+    # 다른 유닛(7)은 후보에서 빠지고, 기간 밖 후보만 나오면 후보 수를 늘려 다시 뽑는다.
+    assert [h.feature_id for h in hits] == [5, 6]
+    assert [len(c) for c in filter_calls] == [2, 4, 6]
+
+    # 기간 밖의 특징을 기준으로 한 검색도 거부된다.
+    with pytest.raises(AccessDeniedError):
+        service.search_similar(
+            None, query=VisionSimilarityQuery(model_version="m", feature_id=1, top_k=2), possession_windows=windows
+        )
+
+
+def test_filter_ids_in_windows_uses_each_units_possession_period(db_session, test_product_line):
+    unit_a = SystemUnit(name="Vision Unit A", product_line_id=test_product_line.id)
+    unit_b = SystemUnit(name="Vision Unit B", product_line_id=test_product_line.id)
+    device = Device(cpu_serial="vision-window-device", current_uuid=uuid.uuid4())
+    db_session.add_all([unit_a, unit_b, device])
+    db_session.flush()
+
+    start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    end = start + timedelta(days=10)
+    features = {}
+    for label, unit, created_at in [
+        ("before", unit_a, start - timedelta(seconds=1)),
+        ("start", unit_a, start),
+        ("end", unit_a, end),
+        ("after", unit_a, end + timedelta(seconds=1)),
+        ("open", unit_b, start + timedelta(days=400)),
+    ]:
+        snapshot = ObservationSnapshot(id=f"vision-{label}", system_unit_id=unit.id, observation_type="IMAGE")
+        image = ImageRegistry(snapshot=snapshot, device_id=device.id, system_unit_id=unit.id, storage_path=f"images/{label}.jpg")
+        feature = VisionFeature(
+            image_registry=image, snapshot=snapshot, device_id=device.id, system_unit_id=unit.id,
+            vector_data={"embedding": [1.0]}, model_version="m", created_at=created_at,
+        )
+        db_session.add(feature)
+        features[label] = feature
+    db_session.flush()
+
+    allowed = vision_feature_crud_query.filter_ids_in_windows(
+        db_session,
+        feature_ids=[f.id for f in features.values()],
+        windows={unit_a.id: (start, end), unit_b.id: (start, None)},
+    )
+    assert allowed == {features["start"].id, features["end"].id, features["open"].id}
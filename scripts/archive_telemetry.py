@@ -0,0 +1,49 @@
+import sys
+import os
+import logging
+
+# [경로 설정]
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if os.path.exists('/app/app'):
+    project_root = '/app'
+else:
+    project_root = os.path.abspath(os.path.join(current_dir, '../'))
+
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+os.environ.setdefault("DB_PROCESS_ROLE", "script")
+
+from app.database import SessionLocal
+from app.domains.inter_domain.telemetry.telemetry_command_provider import telemetry_command_provider
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def main():
+    """
+    TELEMETRY_ARCHIVE_AFTER_DAYS가 지난 telemetry_data 파티션(및 보존 정책으로 분리된 테이블)을
+    TELEMETRY_ARCHIVE_DIR의 압축 Arrow 파일로 옮기고 DB에서 삭제합니다. (cron 또는 수동 실행용)
+    파티션마다 커밋하므로 중단되어도 이미 옮긴 파티션은 유지되고, 다음 실행에서 나머지를 이어서 처리합니다.
+    """
+    db = SessionLocal()
+    archived = []
+    try:
+        while True:
+            result = telemetry_command_provider.archive_next_partition(db)
+            db.commit()
+            if result is None:
+                break
+            telemetry_command_provider.publish_archived_partition(result["partition"])
+            archived.append(result)
+            logger.info(f"🧊 Archived {result['partition']} ({result['rows']} rows)")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    logger.info(f"✅ Telemetry archive done: {len(archived)} partition(s).")
+
+if __name__ == "__main__":
+    main()
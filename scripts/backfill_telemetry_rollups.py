@@ -0,0 +1,59 @@
+import sys
+import os
+import argparse
+import logging
+from datetime import datetime, timedelta, timezone
+
+# [경로 설정]
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if os.path.exists('/app/app'):
+    project_root = '/app'
+else:
+    project_root = os.path.abspath(os.path.join(current_dir, '../'))
+
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+os.environ.setdefault("DB_PROCESS_ROLE", "script")
+
+from app.database import SessionLocal
+from app.domains.inter_domain.telemetry.telemetry_command_provider import telemetry_command_provider
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def _parse_date(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def main():
+    """
+    telemetry_data 원본으로부터 1m/1h/1d 롤업 테이블을 재집계합니다.
+    롤업 도입 이전 데이터의 백필이나, 롤업과 원본이 어긋났을 때의 복구에 사용합니다.
+    구간은 1일 경계로 넓혀 처리되며, 하루 단위로 나누어 커밋하므로 중단 후 재실행해도 안전합니다.
+    """
+    parser = argparse.ArgumentParser(description="Backfill telemetry rollup tables")
+    parser.add_argument("--start", required=True, help="시작 시각 (ISO 8601, 타임존 생략 시 UTC)")
+    parser.add_argument("--end", help="종료 시각 (ISO 8601, 생략 시 현재)")
+    args = parser.parse_args()
+
+    start = _parse_date(args.start)
+    end = _parse_date(args.end) if args.end else datetime.now(timezone.utc)
+
+    db = SessionLocal()
+    try:
+        cursor = start
+        while cursor < end:
+            chunk_end = min(cursor + timedelta(days=1), end)
+            counts = telemetry_command_provider.rebuild_rollups(db, start=cursor, end=chunk_end)
+            db.commit()
+            logger.info(f"✅ {cursor.date()} rollups rebuilt: {counts}")
+            cursor = chunk_end
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
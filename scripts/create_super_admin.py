@@ -45,6 +45,9 @@ ESSENTIAL_PERMISSIONS = {
     # Telemetry Data Access Control
     "telemetry:read_all": {"description": "Access all telemetry history across all users", "ui_group": "Telemetry"},
     
+    # Factory
+    "factory:enroll": {"description": "Bulk-enroll production lots and issue device credentials", "ui_group": "Factory"},
+    
     # System
     "system:context_switch": {"description": "Allows switching to an organization context from the system context.", "ui_group": "System"},
 }
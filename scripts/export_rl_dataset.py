@@ -0,0 +1,54 @@
+import sys
+import os
+import argparse
+import logging
+from datetime import datetime
+
+# [경로 설정]
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if os.path.exists('/app/app'):
+    project_root = '/app'
+else:
+    project_root = os.path.abspath(os.path.join(current_dir, '../'))
+
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+os.environ.setdefault("DB_PROCESS_ROLE", "script")
+
+from app.database import ReplicaSessionLocal
+from app.core.config import settings
+from app.domains.application.dataset.rl_dataset_exporter import RLDatasetExporter
+from app.domains.services.observation.schemas.observation_export_query import ObservationExportFilter
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def main():
+    """
+    스냅샷 기준으로 텔레메트리/이미지/액션을 묶어 RL 학습용 `.npy` 샤드를 추출합니다.
+    같은 --name으로 다시 실행하면 마지막 체크포인트부터 이어서 진행합니다.
+    """
+    parser = argparse.ArgumentParser(description="Export RL training dataset")
+    parser.add_argument("--name", required=True, help="출력 디렉터리 이름 (RL_EXPORT_DIR 하위)")
+    parser.add_argument("--unit", type=int, action="append", dest="system_unit_ids", help="대상 시스템 유닛 ID (반복 지정 가능)")
+    parser.add_argument("--start", type=datetime.fromisoformat, help="스냅샷 생성 시각 하한 (ISO 8601)")
+    parser.add_argument("--end", type=datetime.fromisoformat, help="스냅샷 생성 시각 상한 (ISO 8601, 미포함)")
+    parser.add_argument("--stats", default="avg", help="상태 벡터에 포함할 통계 (쉼표 구분: avg,min,max,std,slope)")
+    args = parser.parse_args()
+
+    exporter = RLDatasetExporter(
+        os.path.join(settings.RL_EXPORT_DIR, args.name),
+        shard_rows=settings.RL_EXPORT_SHARD_ROWS,
+        fetch_size=settings.RL_EXPORT_FETCH_SIZE,
+    )
+    filters = ObservationExportFilter(system_unit_ids=args.system_unit_ids, start_time=args.start, end_time=args.end)
+
+    db = ReplicaSessionLocal()
+    try:
+        exporter.export(db, filters=filters, stats=[s.strip() for s in args.stats.split(",") if s.strip()])
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
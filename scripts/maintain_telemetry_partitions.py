@@ -0,0 +1,44 @@
+import sys
+import os
+import logging
+
+# [경로 설정]
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if os.path.exists('/app/app'):
+    project_root = '/app'
+else:
+    project_root = os.path.abspath(os.path.join(current_dir, '../'))
+
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+os.environ.setdefault("DB_PROCESS_ROLE", "script")
+
+from app.database import SessionLocal
+from app.domains.inter_domain.telemetry.telemetry_command_provider import telemetry_command_provider
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def main():
+    """
+    telemetry_data 파티션 유지보수를 1회 수행합니다. (cron 또는 수동 실행용)
+    API 서버도 TELEMETRY_PARTITION_MAINTENANCE_INTERVAL_SECONDS마다 같은 작업을 수행하며,
+    advisory lock으로 동시에 한 곳에서만 실행됩니다.
+    """
+    db = SessionLocal()
+    try:
+        report = telemetry_command_provider.maintain_partitions(db)
+        db.commit()
+        if report["skipped"]:
+            logger.info("⏭️ Another worker is running partition maintenance. Skipped.")
+        else:
+            logger.info(f"✅ Partition maintenance done: {report}")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import sys
+import os
+import argparse
+import logging
+
+# [경로 설정]
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if os.path.exists('/app/app'):
+    project_root = '/app'
+else:
+    project_root = os.path.abspath(os.path.join(current_dir, '../'))
+
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+os.environ.setdefault("DB_PROCESS_ROLE", "script")
+
+from app.database import SessionLocal
+from app.domains.inter_domain.vision_feature.vision_feature_query_provider import vision_feature_query_provider
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def main():
+    """
+    vision_features 테이블로부터 model_version별 memmap 벡터 색인을 재구축(또는 증분 동기화)합니다.
+    기본값은 전체 재구축이며, 재구축 중에도 기존 색인으로 검색이 가능합니다.
+    """
+    parser = argparse.ArgumentParser(description="Rebuild VisionFeature vector index")
+    parser.add_argument("--model-version", action="append", help="대상 model_version (생략 시 전체)")
+    parser.add_argument("--sync-only", action="store_true", help="마지막 색인 id 이후 변경분만 추가")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        versions = args.model_version or vision_feature_query_provider.get_model_versions(db)
+        for model_version in versions:
+            if args.sync_only:
+                added = vision_feature_query_provider.sync_index(db, model_version=model_version)
+                logger.info(f"✅ [{model_version}] {added} vector(s) appended.")
+            else:
+                meta = vision_feature_query_provider.rebuild_index(db, model_version=model_version)
+                logger.info(f"✅ [{model_version}] rebuilt with {meta['count']} vector(s).")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
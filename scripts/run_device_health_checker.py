@@ -1,9 +1,12 @@
+import os
 import logging
 import asyncio
 import uuid
 from datetime import datetime, timezone, timedelta
 from sqlalchemy.orm import Session
 
+os.environ.setdefault("DB_PROCESS_ROLE", "health_checker")
+
 from app.database import SessionLocal
 from app.core.config import settings
 from app.core.redis_client import get_redis_client # [개선] 공통 모듈 사용
@@ -13,6 +16,8 @@ from app.models.objects.device import DeviceStatusEnum
 from app.domains.inter_domain.device_management.device_query_provider import device_management_query_provider
 from app.domains.inter_domain.device_log.device_log_command_provider import device_log_command_provider
 from app.domains.inter_domain.mqtt_gateway.mqtt_command_provider import mqtt_command_provider
+from app.domains.inter_domain.realtime.device_state_provider import device_state_provider
+from app.domains.inter_domain.trigger_rule.trigger_engine_provider import trigger_engine_provider
 from app.domains.inter_domain.policies.server_certificate_acquisition.server_certificate_acquisition_policy import server_certificate_acquisition_policy
 
 logger = logging.getLogger(__name__)
@@ -30,14 +35,8 @@ async def check_device_health():
                 key = key.decode('utf-8')
                 
             device_uuid_str = key.split(':')[1]
-            cached_state = redis_client.hgetall(key)
-            
-            # [수정] Redis 필드값들도 문자열로 변환하여 에러를 방지합니다.
-            state = {
-                (k.decode('utf-8') if isinstance(k, bytes) else k): 
-                (v.decode('utf-8') if isinstance(v, bytes) else v) 
-                for k, v in cached_state.items()
-            }
+            # 압축 포맷의 상태를 복원합니다. (device_status 등 헤더 필드는 평문 그대로입니다)
+            state = device_state_provider.read(device_uuid_str) or {}
             
             # ONLINE 상태인 기기만 검사
             if state.get("device_status") == DeviceStatusEnum.ONLINE.value:
@@ -68,6 +67,14 @@ async def check_device_health():
                                 description=f"Device timed out. Last seen at {last_seen_at.isoformat()}."
                             )
                             db.commit()
+                            # 기기 오프라인 이벤트({"event": "DEVICE_OFFLINE"})를 참조하는 트리거 규칙 평가 (커밋 후 리더 엔진으로 전달)
+                            if db_device.system_unit_id is not None:
+                                trigger_engine_provider.submit(trigger_engine_provider.build_event_input(
+                                    system_unit_id=db_device.system_unit_id,
+                                    event_type="DEVICE_OFFLINE",
+                                    device_id=db_device.id,
+                                    details={"device_uuid": device_uuid_str, "last_seen_at": last_seen_at.isoformat()}
+                                ))
 
                         # 3. [핵심] 헬스체커가 직접 MQTT 명령 발행 (HTTP 대신 Provider 호출)
                         if user_email := state.get("user_email"):
@@ -8,10 +8,14 @@ import signal  # <-- 추가: 시스템 신호 처리
 # 프로젝트 루트 경로 추가
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+# 앱 모듈(엔진 생성) 임포트 전에 프로세스 역할을 정해 역할별 커넥션 풀 크기를 사용합니다.
+os.environ.setdefault("DB_PROCESS_ROLE", "listener")
+
 from app.core.config import get_settings
 from app.database import SessionLocal
 from app.domains.services.mqtt_gateway.managers.mqtt_listener_manager import MqttListenerManager
 from app.domains.application.mqtt_gateway.mqtt_handler import MqttHandler
+from app.domains.application.command_fanout.command_ack_collector import CommandAckCollector
 from app.domains.inter_domain.policies.server_certificate_acquisition.server_certificate_acquisition_policy import server_certificate_acquisition_policy_provider
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -55,10 +59,23 @@ async def rotation_monitoring_loop(manager, settings):
             logger.error(f"❌ Error in rotation monitor: {e}")
             await asyncio.sleep(60)
 
+async def stats_reporting_loop(mqtt_handler, interval):
+    """상태 요청 single-flight(조회/합침/재사용), 상태 델타 쓰기, 명령 응답 수집 카운터를 주기적으로 남깁니다."""
+    while not shutdown_event.is_set():
+        try:
+            await asyncio.sleep(interval)
+            logger.info(f"📊 State requests: {mqtt_handler.realtime_service.state_reads.snapshot()}")
+            logger.info(f"📊 State writes: {mqtt_handler.realtime_service.device_states.snapshot()}")
+            if mqtt_handler.ack_collector:
+                logger.info(f"📊 Command acks: {mqtt_handler.ack_collector.stats}")
+        except asyncio.CancelledError:
+            break
+
 async def main():
     logger.info("Starting MQTT listener application with survival features...")
     
     manager = None
+    ack_collector = None
     settings = get_settings()
 
     # 1. 시그널 핸들러 등록 (Windows 환경 고려하여 예외 처리)
@@ -74,9 +91,15 @@ async def main():
         # 2. Redis 및 핸들러 초기화
         redis_client = redis.Redis(
             host=settings.REDIS_HOST, port=settings.REDIS_PORT,
-            db=settings.REDIS_DB, decode_responses=True
+            db=settings.REDIS_DB, decode_responses=False  # 기기 상태는 바이너리 포맷으로 저장합니다.
+        )
+        ack_collector = CommandAckCollector(
+            SessionLocal,
+            flush_interval=settings.COMMAND_FANOUT_ACK_FLUSH_INTERVAL_SECONDS,
+            max_batch=settings.COMMAND_FANOUT_ACK_FLUSH_MAX_BATCH
         )
-        mqtt_handler = MqttHandler(redis_client=redis_client)
+        await ack_collector.start()
+        mqtt_handler = MqttHandler(redis_client=redis_client, ack_collector=ack_collector, db_session_factory=SessionLocal)
         manager = MqttListenerManager(settings=settings, client_id=settings.MQTT_LISTENER_CLIENT_ID)
 
         # 3. 초기 인증서 획득
@@ -94,6 +117,7 @@ async def main():
         
         # 5. 로테이션 감시 루프를 백그라운드에서 실행
         rotation_task = asyncio.create_task(rotation_monitoring_loop(manager, settings))
+        stats_task = asyncio.create_task(stats_reporting_loop(mqtt_handler, settings.REALTIME_STATS_LOG_INTERVAL_SECONDS))
 
         logger.info("MQTT listener is active. Watching for messages and certificate health...")
         
@@ -102,13 +126,17 @@ async def main():
         
         # 6. 정리 작업
         rotation_task.cancel()
-        await asyncio.gather(rotation_task, return_exceptions=True)
+        stats_task.cancel()
+        await asyncio.gather(rotation_task, stats_task, return_exceptions=True)
 
     except Exception as e:
         logger.error(f"Critical error in listener: {e}", exc_info=True)
     finally:
         if manager:
             await manager.disconnect()
+        # 연결을 끊은 뒤 남은 명령 응답을 마지막으로 반영합니다.
+        if ack_collector:
+            await ack_collector.stop()
         logger.info("MQTT listener application has shut down safely.")
 
 if __name__ == "__main__":
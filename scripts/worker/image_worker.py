@@ -1,9 +1,14 @@
+import os
 import time
 import json
 import logging
 import redis
 from sqlalchemy.orm import Session
+
+os.environ.setdefault("DB_PROCESS_ROLE", "image_worker")
+
 from app.database import SessionLocal
+from app.core.config import settings
 from app.domains.inter_domain.observation.observation_snapshot_command_provider import observation_snapshot_command_provider
 # --- 이전에 만들었던 이미지 처리 로직들 재사용 ---
 # image_ingestion_provider 내부의 실제 가공 로직만 호출합니다.
@@ -19,41 +24,47 @@ IMAGE_QUEUE_NAME = "ares4_image_jobs"
 
 client = redis.from_url(REDIS_URL)
 
-def process_image_job():
-    """Redis 큐에서 일감을 하나 꺼내서 처리합니다."""
+def _pop_jobs(batch_size: int) -> list:
+    """큐에서 작업을 꺼냅니다. 첫 건은 올 때까지 기다리고, 이미 쌓여 있는 나머지는 batch_size까지 한 번에 가져옵니다."""
     # 1. 큐에서 데이터 하나 팝 (Blocking Pop: 일감이 올 때까지 대기)
     job_data = client.blpop(IMAGE_QUEUE_NAME, timeout=30)
-    
     if not job_data:
+        return []
+
+    messages = [job_data[1]]
+    if batch_size > 1:
+        messages.extend(client.lpop(IMAGE_QUEUE_NAME, batch_size - 1) or [])
+
+    jobs = []
+    for message in messages:
+        try:
+            jobs.append(json.loads(message))
+        except json.JSONDecodeError as e:
+            logger.error(f"❌ [Job Dropped] Malformed job ticket: {e}")
+    return jobs
+
+def process_image_job():
+    """Redis 큐에서 일감을 묶음으로 꺼내서 처리합니다."""
+    jobs = _pop_jobs(settings.IMAGE_WORKER_BATCH_SIZE)
+    if not jobs:
         return
 
-    _, message = job_data
     try:
-        job = json.loads(message)
-        device_uuid = job.get("device_uuid")
-        temp_file_path = job.get("temp_file_path")
-        payload = job.get("payload")
-        
-        logger.info(f"🚀 [Job Received] Processing image for device: {device_uuid}")
+        logger.info(f"🚀 [Job Received] Processing {len(jobs)} image jobs")
 
         # 2. DB 세션 생성
         db = SessionLocal()
         try:
             # 3. [핵심] 기존 이미지 정책의 가공 로직 호출
-            # 이 메서드는 내부적으로 S3 업로드, 썸네일 생성, DB 기록을 수행해야 함
-            success, error = image_ingestion_policy_provider.process_async_job(
-                db=db,
-                device_uuid=device_uuid,
-                temp_file_path=temp_file_path,
-                payload=payload
-            )
+            # 업로드는 건별로, 스냅샷/이미지/특징값 기록은 묶음 전체를 한 트랜잭션으로 처리합니다.
+            results = image_ingestion_policy_provider.process_async_jobs(db=db, jobs=jobs)
 
-            if success:
-                logger.info(f"✅ [Job Success] Device: {device_uuid} | Path: {temp_file_path}")
-                # 작업 완료 후 임시 파일 삭제 로직 추가 가능
-            else:
-                logger.error(f"❌ [Job Failed] Reason: {error}")
-                # 실패 시 재시도 큐로 던지거나 에러 로그 기록
+            for job, (success, error) in zip(jobs, results):
+                if success:
+                    logger.info(f"✅ [Job Success] Device: {job.get('device_uuid')} | Path: {job.get('temp_file_path')}")
+                else:
+                    logger.error(f"❌ [Job Failed] Device: {job.get('device_uuid')} | Reason: {error}")
+                    # 실패 시 재시도 큐로 던지거나 에러 로그 기록
 
         finally:
             db.close()